@@ -16,6 +16,7 @@ from cihub.output import get_renderer
 from cihub.output.events import set_event_sink
 from cihub.types import CommandResult
 from cihub.utils.env import env_bool
+from cihub.utils.tracing import finish_tracing, span, start_tracing, trace_path, tracing_enabled
 
 
 def is_debug_enabled(env: Mapping[str, str] | None = None) -> bool:
@@ -341,6 +342,10 @@ def main(argv: list[str] | None = None) -> int:
 
     emit_debug(f"command={command} json={json_mode} ai={ai_requested} ai_output={ai_output_mode}")
 
+    tracing = tracing_enabled()
+    if tracing:
+        start_tracing()
+
     event_sink_set = False
     if not json_mode and not ai_output_mode:
 
@@ -359,7 +364,8 @@ def main(argv: list[str] | None = None) -> int:
 
     try:
         try:
-            result = args.func(args)
+            with span("command", command=command):
+                result = args.func(args)
         except (FileNotFoundError, ValueError, PermissionError, OSError, ConfigParseError) as exc:
             # Expected user errors - show friendly message, return failure
             if debug and not json_mode:
@@ -425,6 +431,13 @@ def main(argv: list[str] | None = None) -> int:
         if not command_result.summary:
             command_result.summary = "OK" if exit_code == EXIT_SUCCESS else "Command failed"
 
+        if tracing:
+            trace = finish_tracing(trace_path(command))
+            if trace:
+                command_result.data["trace"] = trace
+                if trace["file"]:
+                    command_result.artifacts["trace"] = trace["file"]
+
         # Use renderer pattern for all output
         duration_ms = int((time.perf_counter() - start) * 1000)
         renderer = get_renderer(json_mode=json_mode, ai_mode=ai_output_mode)
@@ -440,6 +453,9 @@ def main(argv: list[str] | None = None) -> int:
 
         return exit_code
     finally:
+        if tracing:
+            # Still active only when the command raised; keep what was recorded
+            finish_tracing(trace_path(command))
         if event_sink_set:
             set_event_sink(None)
 
@@ -143,6 +143,12 @@ def add_core_commands(
         action="store_true",
         help="Keep generated fixtures on disk",
     )
+    smoke.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Run up to N cases at once, each in its own process (default: one per CPU; 1 runs serially)",
+    )
     smoke.set_defaults(func=handlers.cmd_smoke)
 
     smoke_validate = subparsers.add_parser(
@@ -190,6 +196,17 @@ def add_core_commands(
         action="store_true",
         help="Fail if optional tools are missing",
     )
+    check.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Run up to N checks at once (default: CIHUB_CHECK_JOBS or one per CPU; 1 runs serially)",
+    )
+    check.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rerun every check (ignore cached results for unchanged inputs)",
+    )
     # Tiered check modes
     check.add_argument(
         "--audit",
@@ -256,6 +273,17 @@ def add_core_commands(
         action="store_true",
         help="Keep cloned repos on disk (integration mode)",
     )
+    verify.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Run cihub ci in up to N repos at once (integration mode; default: one per CPU)",
+    )
+    verify.add_argument(
+        "--no-mirror-cache",
+        action="store_true",
+        help="Shallow-clone from GitHub instead of reusing local mirrors in .cihub/cache/mirrors",
+    )
     verify.set_defaults(func=handlers.cmd_verify)
 
     ci = subparsers.add_parser("ci", help="Run CI based on .ci-hub.yml", epilog=see_also_epilog("ci"))
@@ -98,6 +98,10 @@ def add_report_commands(
         default=None,
         help="Include per-repo details in the summary output",
     )
+    report_aggregate.add_argument(
+        "--metrics-store",
+        help="Columnar metrics store file; unchanged reports are not re-parsed (reports-dir mode)",
+    )
     report_aggregate.add_argument(
         "--defaults-file",
         default="config/defaults.yaml",
@@ -192,6 +196,10 @@ def add_report_commands(
         default="warn",
         help="Schema validation: 'warn' includes non-2.0, 'strict' skips them",
     )
+    report_dashboard.add_argument(
+        "--metrics-store",
+        help="Columnar metrics store file; unchanged reports are not re-parsed",
+    )
     report_dashboard.set_defaults(func=handlers.cmd_report)
 
     report_security_summary = report_sub.add_parser("security-summary", help="Render hub security summaries")
@@ -33,6 +33,17 @@ def add_secrets_commands(
         action="store_true",
         help="Verify token with GitHub API before setting secrets",
     )
+    setup_secrets.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Set secrets on up to N repos at once (default: 4; 1 runs serially)",
+    )
+    setup_secrets.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Start over instead of resuming an interrupted run",
+    )
     setup_secrets.set_defaults(func=handlers.cmd_setup_secrets)
 
     setup_nvd = subparsers.add_parser("setup-nvd", help="Set NVD_API_KEY on Java repos for OWASP Dependency Check")
@@ -43,4 +54,15 @@ def add_secrets_commands(
         action="store_true",
         help="Verify NVD API key before setting secrets",
     )
+    setup_nvd.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Set secrets on up to N repos at once (default: 4; 1 runs serially)",
+    )
+    setup_nvd.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Start over instead of resuming an interrupted run",
+    )
     setup_nvd.set_defaults(func=handlers.cmd_setup_nvd)
@@ -65,4 +65,15 @@ def add_templates_commands(
         action="store_true",
         help="Skip confirmation prompts (for force-push operations)",
     )
+    sync_templates.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Sync up to N repos at once (default: 4; 1 runs serially)",
+    )
+    sync_templates.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Start over instead of resuming an interrupted sync",
+    )
     sync_templates.set_defaults(func=handlers.cmd_sync_templates)
@@ -10,19 +10,24 @@ from typing import Any
 
 from cihub.exit_codes import EXIT_FAILURE, EXIT_SUCCESS
 from cihub.types import CommandResult
+from cihub.utils.docs_corpus import (
+    DocFile,
+    DocsCorpus,
+    extract_markdown_links,
+    extract_reference_defs,
+    load_docs_corpus,
+    strip_fenced_blocks,
+)
 from cihub.utils.paths import project_root
 
 ADR_DIR = "docs/adr"
 ADR_PATTERN = re.compile(r"^(\d{4})-(.+)\.md$")
 STATUS_PATTERN = re.compile(r"^\*\*Status:?\*\*:?\s*(.+)$", re.MULTILINE | re.IGNORECASE)
 DATE_PATTERN = re.compile(r"^\*\*Date:?\*\*:?\s*(\S+)", re.MULTILINE)
-MARKDOWN_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
-FENCED_BLOCK_RE = re.compile(r"```.*?```|~~~.*?~~~", re.DOTALL)
-REFERENCE_DEF_RE = re.compile(r"^\s*\[([^\]]+)\]:\s*(\S+)", re.MULTILINE)
 
 
 def _strip_fenced_blocks(content: str) -> str:
-    return FENCED_BLOCK_RE.sub("", content)
+    return strip_fenced_blocks(content)
 
 
 def _link_is_external(link_target: str) -> bool:
@@ -69,9 +74,10 @@ def _slugify(title: str) -> str:
     return slug.strip("-")
 
 
-def _parse_adr(path: Path) -> dict[str, Any]:
-    """Parse ADR metadata from a file."""
-    content = path.read_text(encoding="utf-8")
+def _parse_adr(path: Path, content: str | None = None) -> dict[str, Any]:
+    """Parse ADR metadata from a file (or its pre-read content)."""
+    if content is None:
+        content = path.read_text(encoding="utf-8")
 
     status_match = STATUS_PATTERN.search(content)
     date_match = DATE_PATTERN.search(content)
@@ -90,15 +96,20 @@ def _parse_adr(path: Path) -> dict[str, Any]:
     }
 
 
-def _check_adr_links(adr_path: Path) -> list[dict[str, Any]]:
-    """Check that all internal links in an ADR are valid."""
+def _check_adr_links(adr_path: Path, doc: DocFile | None = None) -> list[dict[str, Any]]:
+    """Check that all internal links in an ADR are valid.
+
+    Uses the pre-parsed links from a docs corpus entry when one is given.
+    """
     problems: list[dict[str, Any]] = []
     repo_root = adr_path.parents[2]
-    content = adr_path.read_text(encoding="utf-8")
-    content = _strip_fenced_blocks(content)
+    if doc is not None:
+        reference_defs, links = doc.reference_defs, doc.links
+    else:
+        content = adr_path.read_text(encoding="utf-8")
+        reference_defs, links = extract_reference_defs(content), extract_markdown_links(content)
 
-    for match in REFERENCE_DEF_RE.finditer(content):
-        ref_id, link_target = match.groups()
+    for ref_id, link_target in reference_defs:
         if link_target.startswith("#") or _link_is_external(link_target):
             continue
         target_path = _normalize_link_target(link_target)
@@ -116,9 +127,7 @@ def _check_adr_links(adr_path: Path) -> list[dict[str, Any]]:
                 }
             )
 
-    for match in MARKDOWN_LINK_RE.finditer(content):
-        link_text, link_target = match.groups()
-
+    for link_text, link_target in links:
         # Skip external links, anchors-only, and mailto
         if link_target.startswith("#") or _link_is_external(link_target):
             continue
@@ -307,14 +316,20 @@ def cmd_adr_check(args: argparse.Namespace) -> CommandResult:
     problems: list[dict[str, Any]] = []
     checked = 0
 
-    for f in sorted(adr_dir.glob("*.md")):
+    repo_root = adr_dir.parents[1]
+    corpus = getattr(args, "docs_corpus", None)
+    if not isinstance(corpus, DocsCorpus) or corpus.repo_root != repo_root:
+        corpus = load_docs_corpus(repo_root)
+
+    for doc in corpus.iter_docs(adr_dir, recursive=False):
+        f = doc.path
         if f.name == "README.md":
             continue
         if not ADR_PATTERN.match(f.name):
             continue
 
         checked += 1
-        adr = _parse_adr(f)
+        adr = _parse_adr(f, doc.content)
 
         # Check required fields
         if adr["status"] == "unknown":
@@ -338,7 +353,7 @@ def cmd_adr_check(args: argparse.Namespace) -> CommandResult:
             )
 
         # Check internal links
-        link_problems = _check_adr_links(f)
+        link_problems = _check_adr_links(f, doc)
         problems.extend(link_problems)
 
     # Check README.md exists
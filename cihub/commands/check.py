@@ -9,19 +9,25 @@ Tiered check modes:
 - --all: Everything (unique set, no duplicates)
 - --install-missing: Prompt to install missing optional tools
 - --require-optional: Fail if optional tools are missing
+- --jobs N: Run up to N independent checks at once (output order is unchanged)
+- --no-cache: Rerun every step (by default, passing steps whose inputs are
+  unchanged are skipped and shown as "cached"; see STEP_CACHE_SPECS)
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import os
 import shutil
 import sys
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from cihub.commands.adr import cmd_adr
+from cihub.commands.check_cache import PYTHON_ENVIRONMENT, CheckStepCache
 from cihub.commands.docs import cmd_docs, cmd_docs_links
 from cihub.commands.docs_audit import cmd_docs_audit
 from cihub.commands.preflight import cmd_preflight
@@ -30,6 +36,7 @@ from cihub.commands.smoke import cmd_smoke
 from cihub.exit_codes import EXIT_FAILURE, EXIT_SUCCESS
 from cihub.output.events import emit_event, get_event_sink
 from cihub.types import CommandResult
+from cihub.utils.docs_corpus import load_docs_corpus
 from cihub.utils.exec_utils import (
     TIMEOUT_BUILD,
     TIMEOUT_EXTENDED,
@@ -38,8 +45,42 @@ from cihub.utils.exec_utils import (
     CommandTimeoutError,
     safe_run,
 )
+from cihub.utils.parallel import default_workers
 from cihub.utils.paths import hub_root, project_root
 
+# Job limit override for `cihub check` (the --jobs flag wins).
+JOBS_ENV = "CIHUB_CHECK_JOBS"
+
+# Result cache: files each cacheable step reads (fnmatch patterns relative to the
+# project root; "*" also matches "/") and the tools whose versions affect it.
+# Steps that depend on the network, vulnerability databases or the installed
+# environment (preflight, smoke, pip-audit, trivy, zizmor, license-check, ...)
+# are not listed and always run.
+_PY_INPUTS = ("*.py", "*.pyi", "pyproject.toml", "setup.cfg", "tox.ini")
+_TREE_INPUTS = ("*",)
+STEP_CACHE_SPECS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "ruff-lint": (_PY_INPUTS + ("ruff.toml", ".ruff.toml"), ("ruff",)),
+    "ruff-format": (_PY_INPUTS + ("ruff.toml", ".ruff.toml"), ("ruff",)),
+    "black": (_PY_INPUTS, ("black",)),
+    "isort": (_PY_INPUTS + (".isort.cfg",), ("isort",)),
+    "typecheck": (_PY_INPUTS + ("mypy.ini", ".mypy.ini"), ("mypy",)),
+    "yamllint": (("*.yml", "*.yaml", ".yamllint*"), ("yamllint",)),
+    "test": (_TREE_INPUTS, (PYTHON_ENVIRONMENT,)),
+    "actionlint": ((".github/*",), ("actionlint",)),
+    "docs-check": (_TREE_INPUTS, ()),
+    "docs-links": (_TREE_INPUTS, ()),
+    "docs-audit": (_TREE_INPUTS, ()),
+    "adr-check": (_TREE_INPUTS, ()),
+    "validate-configs": (_TREE_INPUTS, ()),
+    "validate-profiles": (_TREE_INPUTS, ()),
+    "schema-alignment": (_TREE_INPUTS, ()),
+    "bandit": (_PY_INPUTS + (".bandit",), ("bandit",)),
+    "validate-templates": (_TREE_INPUTS, (PYTHON_ENVIRONMENT,)),
+    "verify-contracts": (_TREE_INPUTS, ()),
+    "verify-matrix-keys": (_TREE_INPUTS, ()),
+    "mutmut": (_TREE_INPUTS, (PYTHON_ENVIRONMENT,)),
+}
+
 # Longer timeout for pytest (full suite can exceed 10 minutes locally).
 TIMEOUT_TEST = TIMEOUT_EXTENDED * 3
 
@@ -70,6 +111,7 @@ class CheckStep:
     exit_code: int
     summary: str
     problems: list[dict[str, Any]]
+    cached: bool = False
 
 
 def _as_command_result(result: int | CommandResult) -> CommandResult:
@@ -273,6 +315,107 @@ def _run_optional(
     return _run_process(name, cmd, cwd)
 
 
+@dataclass(frozen=True)
+class _PlannedStep:
+    name: str
+    run: Callable[[], int | CommandResult]
+    exclusive: bool = False  # Runs alone (e.g. mutates the working tree)
+    cached: bool = False  # Result replayed from the step cache
+
+
+def _resolve_jobs(jobs: int | None) -> int:
+    """Job limit for check steps: --jobs, else CIHUB_CHECK_JOBS, else one per CPU (capped)."""
+    if jobs is None:
+        env_jobs = os.environ.get(JOBS_ENV, "").strip()
+        jobs = int(env_jobs) if env_jobs.isdigit() else default_workers()
+    return max(1, jobs)
+
+
+def _cached_result() -> CommandResult:
+    return CommandResult(exit_code=EXIT_SUCCESS, summary="cached")
+
+
+def _step_identity() -> str:
+    """Digest of this module: step commands and flags live here, so editing it invalidates cached results."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _apply_step_cache(
+    plan: list[_PlannedStep],
+    cache: CheckStepCache,
+) -> tuple[list[_PlannedStep], dict[str, str]]:
+    """Swap steps whose inputs are unchanged since they last passed for cached results.
+
+    Returns:
+        (plan with cached steps replaced, fingerprints of the steps that will run)
+    """
+    identity = (_step_identity(),)
+    fingerprints: dict[str, str] = {}
+    updated: list[_PlannedStep] = []
+    for planned in plan:
+        spec = STEP_CACHE_SPECS.get(planned.name)
+        if spec is None:
+            updated.append(planned)
+            continue
+        fingerprint = cache.fingerprint(planned.name, spec[0], spec[1], identity)
+        if cache.is_fresh(planned.name, fingerprint):
+            updated.append(replace(planned, run=_cached_result, exclusive=False, cached=True))
+        else:
+            fingerprints[planned.name] = fingerprint
+            updated.append(planned)
+    return updated, fingerprints
+
+
+def _record_step_cache(cache: CheckStepCache, steps: list[CheckStep], fingerprints: dict[str, str]) -> None:
+    """Record passing steps whose inputs did not change while they ran; drop failing ones."""
+    cache.refresh()
+    identity = (_step_identity(),)
+    for step in steps:
+        if step.cached or step.name not in fingerprints:
+            continue
+        if step.exit_code != EXIT_SUCCESS or step.summary.startswith("skipped"):
+            cache.forget(step.name)
+            continue
+        inputs, tools = STEP_CACHE_SPECS[step.name]
+        if cache.fingerprint(step.name, inputs, tools, identity) == fingerprints[step.name]:
+            cache.record(step.name, fingerprints[step.name])
+    cache.save()
+
+
+def _run_plan(
+    plan: list[_PlannedStep],
+    jobs: int,
+    on_result: Callable[[_PlannedStep, int | CommandResult], None],
+) -> None:
+    """Run planned steps with up to jobs at a time; report results in plan order.
+
+    Steps are mostly subprocesses (linters, pytest, scanners), so threads are
+    enough to overlap them. Each step's result is buffered until every step
+    before it has been reported, which keeps human and JSON output identical to
+    a serial run. Exclusive steps wait for earlier steps and run alone.
+    """
+    if jobs <= 1:
+        for planned in plan:
+            on_result(planned, planned.run())
+        return
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        pending: list[tuple[_PlannedStep, Future[int | CommandResult]]] = []
+
+        def drain() -> None:
+            for planned, future in pending:
+                on_result(planned, future.result())
+            pending.clear()
+
+        for planned in plan:
+            if planned.exclusive:
+                drain()
+                on_result(planned, planned.run())
+                continue
+            pending.append((planned, pool.submit(planned.run)))
+        drain()
+
+
 def _format_line(step: CheckStep) -> str:
     status = "OK" if step.exit_code == EXIT_SUCCESS else "FAIL"
     summary = f": {step.summary}" if step.summary else ""
@@ -291,6 +434,8 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
     - --all: Everything (unique set)
     - --install-missing: Prompt to install missing optional tools
     - --require-optional: Fail if optional tools are missing
+    - --jobs N: Job limit for running steps concurrently (1 runs serially)
+    - --no-cache: Ignore the step result cache under .cihub/cache/
     """
     json_mode = getattr(args, "json", False)
     cli_test_mode = bool(getattr(args, "_cli_test_mode", False))
@@ -322,8 +467,11 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
     steps: list[CheckStep] = []
     problems: list[dict[str, Any]] = []
     output_lines: list[str] = []
-    completed_checks: set[str] = set()  # Track to avoid duplicates
+    plan: list[_PlannedStep] = []
+    planned_names: set[str] = set()  # Track to avoid duplicates
     streaming = get_event_sink() is not None and not json_mode
+    # Interactive install prompts read stdin, so they must not overlap
+    jobs = 1 if interactive else _resolve_jobs(getattr(args, "jobs", None))
 
     def emit_line(line: str) -> None:
         if streaming:
@@ -331,17 +479,20 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         else:
             output_lines.append(line)
 
-    def add_step(name: str, result: int | CommandResult) -> None:
-        if name in completed_checks:
+    def add_step(name: str, run: Callable[[], int | CommandResult], *, exclusive: bool = False) -> None:
+        if name in planned_names:
             return  # Skip duplicates
-        completed_checks.add(name)
+        planned_names.add(name)
+        plan.append(_PlannedStep(name, run, exclusive))
 
+    def record_step(planned: _PlannedStep, result: int | CommandResult) -> None:
         outcome = _as_command_result(result)
         step = CheckStep(
-            name=name,
+            name=planned.name,
             exit_code=outcome.exit_code,
             summary=outcome.summary,
             problems=outcome.problems,
+            cached=planned.cached,
         )
         steps.append(step)
         if outcome.exit_code != 0:
@@ -361,32 +512,32 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
 
     # ========== FAST MODE (always runs) ==========
     preflight_args = argparse.Namespace(json=True, full=True)
-    add_step("preflight", cmd_preflight(preflight_args))
+    add_step("preflight", lambda: cmd_preflight(preflight_args))
 
     # Lint
     add_step(
         "ruff-lint",
-        _run_process("ruff-lint", ["ruff", "check", "."], project_root_path),
+        lambda: _run_process("ruff-lint", ["ruff", "check", "."], project_root_path),
     )
     add_step(
         "ruff-format",
-        _run_process("ruff-format", ["ruff", "format", "--check", "."], project_root_path),
+        lambda: _run_process("ruff-format", ["ruff", "format", "--check", "."], project_root_path),
     )
 
     # Black and isort for CI parity (optional but run if available)
     add_step(
         "black",
-        _run_process("black", ["black", "--check", "."], project_root_path),
+        lambda: _run_process("black", ["black", "--check", "."], project_root_path),
     )
     add_step(
         "isort",
-        _run_process("isort", ["isort", "--check-only", "."], project_root_path),
+        lambda: _run_process("isort", ["isort", "--check-only", "."], project_root_path),
     )
 
     # Type check
     add_step(
         "typecheck",
-        _run_process(
+        lambda: _run_process(
             "typecheck",
             [sys.executable, "-m", "mypy", "cihub/", "scripts/"],
             project_root_path,
@@ -396,7 +547,7 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
     # YAML lint (optional tool)
     add_step(
         "yamllint",
-        run_optional(
+        lambda: run_optional(
             "yamllint",
             [
                 "yamllint",
@@ -408,11 +559,11 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
 
     # Tests (with coverage gate matching CI)
     if cli_test_mode:
-        add_step("test", _skipped_result("CLI test mode"))
+        add_step("test", lambda: _skipped_result("CLI test mode"))
     else:
         add_step(
             "test",
-            _run_process(
+            lambda: _run_process(
                 "test",
                 [sys.executable, "-m", "pytest", "tests/", "--cov=cihub", "--cov=scripts", "--cov-fail-under=70"],
                 project_root_path,
@@ -423,7 +574,7 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
     # Workflow lint (actionlint auto-discovers .github/workflows when run from repo root)
     add_step(
         "actionlint",
-        run_optional("actionlint", ["actionlint"]),
+        lambda: run_optional("actionlint", ["actionlint"]),
     )
 
     # Docs check
@@ -432,7 +583,7 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         output="docs/reference",
         json=True,
     )
-    add_step("docs-check", cmd_docs(docs_args))
+    add_step("docs-check", lambda: cmd_docs(docs_args))
 
     # Smoke test
     smoke_args = argparse.Namespace(
@@ -448,15 +599,18 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         json=True,
     )
     if cli_test_mode:
-        add_step("smoke", _skipped_result("CLI test mode"))
+        add_step("smoke", lambda: _skipped_result("CLI test mode"))
     else:
-        add_step("smoke", cmd_smoke(smoke_args))
+        add_step("smoke", lambda: cmd_smoke(smoke_args))
 
     # ========== AUDIT MODE (--audit or --all) ==========
     if run_audit:
+        # Docs links, docs audit and ADR check share one parsed docs corpus
+        docs_corpus = load_docs_corpus(project_root())
+
         # Docs links check
-        links_args = argparse.Namespace(json=True, external=False)
-        add_step("docs-links", cmd_docs_links(links_args))
+        links_args = argparse.Namespace(json=True, external=False, docs_corpus=docs_corpus)
+        add_step("docs-links", lambda: cmd_docs_links(links_args))
 
         # Docs audit (lifecycle + ADR metadata)
         # NOTE: --skip-references and --skip-consistency are intentional for fast CI.
@@ -472,17 +626,18 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
             skip_references=True,  # Fast mode; run full audit separately if needed
             skip_consistency=True,  # Part 13 checks can be noisy; run explicitly if needed
             github_summary=False,
+            docs_corpus=docs_corpus,
         )
-        add_step("docs-audit", cmd_docs_audit(audit_args))
+        add_step("docs-audit", lambda: cmd_docs_audit(audit_args))
 
         # ADR check
-        adr_args = argparse.Namespace(subcommand="check", json=True)
-        add_step("adr-check", cmd_adr(adr_args))
+        adr_args = argparse.Namespace(subcommand="check", json=True, docs_corpus=docs_corpus)
+        add_step("adr-check", lambda: cmd_adr(adr_args))
 
         # Config validation
         add_step(
             "validate-configs",
-            _run_process(
+            lambda: _run_process(
                 "validate-configs",
                 [sys.executable, "-m", "cihub", "hub-ci", "validate-configs"],
                 project_root_path,
@@ -490,7 +645,7 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         )
         add_step(
             "validate-profiles",
-            _run_process(
+            lambda: _run_process(
                 "validate-profiles",
                 [sys.executable, "-m", "cihub", "hub-ci", "validate-profiles"],
                 project_root_path,
@@ -502,7 +657,7 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         if report_path.exists():
             add_step(
                 "report-validate",
-                _run_process(
+                lambda: _run_process(
                     "report-validate",
                     [sys.executable, "-m", "cihub", "report", "validate", "--report", str(report_path), "--strict"],
                     project_root_path,
@@ -510,13 +665,13 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
             )
 
         # Schema-defaults alignment check (defaults.yaml + fallbacks.py)
-        add_step("schema-alignment", check_schema_alignment())
+        add_step("schema-alignment", lambda: check_schema_alignment())
 
     # ========== SECURITY MODE (--security or --all) ==========
     if run_security:
         add_step(
             "bandit",
-            _run_process(
+            lambda: _run_process(
                 "bandit",
                 [
                     "bandit",
@@ -536,7 +691,7 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         )
         add_step(
             "pip-audit",
-            _run_process(
+            lambda: _run_process(
                 "pip-audit",
                 [
                     "pip-audit",
@@ -550,14 +705,14 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         )
         add_step(
             "gitleaks",
-            run_optional(
+            lambda: run_optional(
                 "gitleaks",
                 ["gitleaks", "detect", "--source", ".", "--no-git"],
             ),
         )
         add_step(
             "trivy",
-            run_optional(
+            lambda: run_optional(
                 "trivy",
                 ["trivy", "fs", ".", "--severity", "CRITICAL,HIGH", "--exit-code", "1"],
             ),
@@ -568,7 +723,7 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         # Zizmor workflow security (with severity filtering + auto-fix hints)
         add_step(
             "zizmor",
-            (
+            lambda: (
                 _run_zizmor(project_root_path)
                 if shutil.which("zizmor")
                 else _missing_tool_result("zizmor", required=require_optional)
@@ -577,11 +732,11 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
 
         # Template validation
         if cli_test_mode:
-            add_step("validate-templates", _skipped_result("CLI test mode"))
+            add_step("validate-templates", lambda: _skipped_result("CLI test mode"))
         else:
             add_step(
                 "validate-templates",
-                _run_process(
+                lambda: _run_process(
                     "validate-templates",
                     [sys.executable, "-m", "pytest", "tests/integration/test_templates.py", "-v", "--tb=short"],
                     project_root_path,
@@ -591,7 +746,7 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         # Template/workflow contract verification
         add_step(
             "verify-contracts",
-            _run_process(
+            lambda: _run_process(
                 "verify-contracts",
                 [sys.executable, "-m", "cihub", "verify"],
                 project_root_path,
@@ -601,7 +756,7 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         # Matrix key verification
         add_step(
             "verify-matrix-keys",
-            _run_process(
+            lambda: _run_process(
                 "verify-matrix-keys",
                 [sys.executable, "-m", "cihub", "hub-ci", "verify-matrix-keys"],
                 project_root_path,
@@ -611,7 +766,7 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         # License check
         add_step(
             "license-check",
-            _run_process(
+            lambda: _run_process(
                 "license-check",
                 [sys.executable, "-m", "cihub", "hub-ci", "license-check"],
                 project_root_path,
@@ -622,7 +777,7 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         if os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN") or os.environ.get("HUB_DISPATCH_TOKEN"):
             add_step(
                 "sync-templates-check",
-                _run_process(
+                lambda: _run_process(
                     "sync-templates-check",
                     [sys.executable, "-m", "cihub", "sync-templates", "--check"],
                     project_root_path,
@@ -631,7 +786,7 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
         else:
             add_step(
                 "sync-templates-check",
-                _missing_tool_result(
+                lambda: _missing_tool_result(
                     "sync-templates-check",
                     required=require_optional,
                     detail=(
@@ -642,15 +797,27 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
 
     # ========== MUTATION MODE (--mutation or --all) ==========
     if run_mutation:
+        # mutmut rewrites source files while it runs, so nothing may overlap it
         add_step(
             "mutmut",
-            _run_process(
+            lambda: _run_process(
                 "mutmut",
                 [sys.executable, "-m", "cihub", "hub-ci", "mutmut", "--min-score", "70"],
                 project_root_path,
             ),
+            exclusive=True,
         )
 
+    # ========== RUN ==========
+    use_cache = not getattr(args, "no_cache", False)
+    step_cache = CheckStepCache.load(project_root_path) if use_cache else None
+    fingerprints: dict[str, str] = {}
+    if step_cache is not None:
+        plan, fingerprints = _apply_step_cache(plan, step_cache)
+    _run_plan(plan, jobs, record_step)
+    if step_cache is not None:
+        _record_step_cache(step_cache, steps, fingerprints)
+
     # ========== SUMMARY ==========
     failed = [step for step in steps if step.exit_code != 0]
     exit_code = EXIT_FAILURE if failed else EXIT_SUCCESS
@@ -677,9 +844,11 @@ def cmd_check(args: argparse.Namespace) -> CommandResult:
                 "exit_code": step.exit_code,
                 "summary": step.summary,
                 "problems": step.problems,
+                "cached": step.cached,
             }
             for step in steps
         ],
+        "jobs": jobs,
         "modes": {
             "audit": run_audit,
             "security": run_security,
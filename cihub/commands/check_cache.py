@@ -0,0 +1,186 @@
+"""Persistent result cache for `cihub check` steps.
+
+Each cacheable step declares the files it reads (fnmatch patterns relative to
+the project root, where ``*`` also matches ``/``) and the tools it runs. Its
+fingerprint covers the step command, the tool versions, the Python version
+and the content hash of every matching file. Steps that import arbitrary
+installed packages (pytest plugins, the project's own dependencies) list
+PYTHON_ENVIRONMENT as a tool, which stands for every installed distribution. A passing result is recorded
+under that fingerprint; the next run with the same fingerprint reports the
+step as ``cached`` instead of running it.
+
+The project's file list comes from git (tracked plus untracked, non-ignored
+files) with an os.walk fallback. File hashes are kept in the cache keyed by
+mtime and size, so unchanged files are stat'ed, not re-read.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from cihub import __version__
+from cihub.services.ci_engine.dependency_cache import python_environment_digest
+from cihub.utils.exec_utils import CommandNotFoundError, CommandTimeoutError, safe_run
+from cihub.utils.json_cache import load_json_cache, save_json_cache
+
+# Raise when the step fingerprint recipe changes.
+CHECK_CACHE_VERSION = 1
+CHECK_CACHE_PATH = Path(".cihub") / "cache" / "check-steps.json"
+# Pseudo tool whose version is the set of distributions installed in this interpreter.
+PYTHON_ENVIRONMENT = "<python-environment>"
+
+# Outputs that steps themselves write; they must not invalidate fingerprints.
+_VOLATILE_PATTERNS = (".cihub/*", ".coverage", ".coverage.*", "*.pyc")
+_PRUNE_DIRS = frozenset(
+    {
+        ".git",
+        ".cihub",
+        ".hypothesis",
+        ".mypy_cache",
+        ".nox",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+        "venv",
+    }
+)
+
+
+def _list_project_files(root: Path) -> list[str]:
+    """Relative POSIX paths of the project's files (git view when available)."""
+    try:
+        proc = safe_run(["git", "ls-files", "-z", "-co", "--exclude-standard"], cwd=root)
+    except (CommandNotFoundError, CommandTimeoutError):
+        proc = None
+    if proc is not None and proc.returncode == 0:
+        files = {name for name in proc.stdout.split("\0") if name}
+    else:
+        files = set()
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in _PRUNE_DIRS and not d.endswith(".egg-info")]
+            rel_dir = Path(dirpath).relative_to(root).as_posix()
+            for name in filenames:
+                files.add(name if rel_dir == "." else f"{rel_dir}/{name}")
+    return sorted(
+        name for name in files if not any(fnmatch.fnmatchcase(name, pattern) for pattern in _VOLATILE_PATTERNS)
+    )
+
+
+def tool_version(tool: str) -> str:
+    """Version identity of a tool: its Python distribution version, else its executable's stat."""
+    if tool == PYTHON_ENVIRONMENT:
+        return f"{tool}:{python_environment_digest()}"
+    try:
+        return f"{tool}=={metadata.version(tool)}"
+    except metadata.PackageNotFoundError:
+        pass
+    path = shutil.which(tool)
+    if path is None:
+        return f"{tool}:missing"
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return f"{tool}:{path}"
+    return f"{tool}:{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+class CheckStepCache:
+    """Fingerprints and recorded passing results for check steps."""
+
+    def __init__(self, root: Path, path: Path | None = None, payload: dict[str, Any] | None = None) -> None:
+        self.root = root
+        self.path = path
+        payload = payload or {}
+        file_hashes = payload.get("files")
+        steps = payload.get("steps")
+        self._file_hashes: dict[str, list[Any]] = file_hashes if isinstance(file_hashes, dict) else {}
+        self.steps: dict[str, str] = steps if isinstance(steps, dict) else {}
+        self._files: list[str] | None = None
+        self._versions: dict[str, str] = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, root: Path, path: Path | None = None) -> CheckStepCache:
+        """Load the cache for a project root (default location: root/CHECK_CACHE_PATH)."""
+        path = path if path is not None else root / CHECK_CACHE_PATH
+        return cls(root, path, load_json_cache(path, CHECK_CACHE_VERSION))
+
+    def refresh(self) -> None:
+        """Forget the file list so the next fingerprint sees files added or removed since."""
+        self._files = None
+
+    def _file_hash(self, rel_path: str) -> str:
+        try:
+            stat = (self.root / rel_path).stat()
+        except OSError:
+            return "<missing>"
+        cached = self._file_hashes.get(rel_path)
+        if isinstance(cached, list) and len(cached) == 3 and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+            return str(cached[2])
+        try:
+            digest = hashlib.sha256((self.root / rel_path).read_bytes()).hexdigest()
+        except OSError:
+            return "<unreadable>"
+        self._file_hashes[rel_path] = [stat.st_mtime_ns, stat.st_size, digest]
+        self._dirty = True
+        return digest
+
+    def fingerprint(self, name: str, inputs: tuple[str, ...], tools: tuple[str, ...], command: tuple[str, ...]) -> str:
+        """Fingerprint of a step from its command, tool versions and input file contents.
+
+        Args:
+            name: Step name
+            inputs: fnmatch patterns of the files the step reads (relative to the root)
+            tools: Tools whose versions affect the result
+            command: Command line (or other identity) of the step
+
+        Returns:
+            Hex digest that changes whenever any of those change
+        """
+        if self._files is None:
+            self._files = _list_project_files(self.root)
+        h = hashlib.sha256()
+        h.update(json.dumps([name, list(command), sys.version, __version__]).encode("utf-8"))
+        for tool in tools:
+            if tool not in self._versions:
+                self._versions[tool] = tool_version(tool)
+            h.update(self._versions[tool].encode("utf-8"))
+        for rel_path in self._files:
+            if any(fnmatch.fnmatchcase(rel_path, pattern) for pattern in inputs):
+                h.update(f"\0{rel_path}\0{self._file_hash(rel_path)}".encode())
+        return h.hexdigest()
+
+    def is_fresh(self, name: str, fingerprint: str) -> bool:
+        """True when the step last passed with this exact fingerprint."""
+        return self.steps.get(name) == fingerprint
+
+    def record(self, name: str, fingerprint: str) -> None:
+        if self.steps.get(name) != fingerprint:
+            self.steps[name] = fingerprint
+            self._dirty = True
+
+    def forget(self, name: str) -> None:
+        if self.steps.pop(name, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist file hashes for files still tracked, plus the step fingerprints."""
+        if self.path is None or not self._dirty:
+            return
+        known = set(self._files) if self._files is not None else None
+        files = {rel: entry for rel, entry in self._file_hashes.items() if known is None or rel in known}
+        save_json_cache(self.path, CHECK_CACHE_VERSION, {"files": files, "steps": self.steps})
+
+
+__all__ = ["CHECK_CACHE_PATH", "CHECK_CACHE_VERSION", "PYTHON_ENVIRONMENT", "CheckStepCache", "tool_version"]
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import argparse
 import json
-import re
+import os
 import shutil
 from pathlib import Path
 from typing import Any
+from urllib.parse import unquote
 
 from cihub.exit_codes import EXIT_FAILURE, EXIT_SUCCESS
 from cihub.types import CommandResult
+from cihub.utils.docs_corpus import DocFile, DocsCorpus, load_docs_corpus
 from cihub.utils.exec_utils import (
     TIMEOUT_BUILD,
     CommandNotFoundError,
@@ -19,26 +21,11 @@ from cihub.utils.exec_utils import (
 )
 from cihub.utils.paths import project_root
 
-# Regex to match markdown links: [text](path) or [text](path#anchor)
-MARKDOWN_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
-FENCED_BLOCK_RE = re.compile(r"```.*?```|~~~.*?~~~", re.DOTALL)
-REFERENCE_DEF_RE = re.compile(r"^\s*\[([^\]]+)\]:\s*(\S+)", re.MULTILINE)
-
-
-def _strip_fenced_blocks(content: str) -> str:
-    return FENCED_BLOCK_RE.sub("", content)
-
 
 def _link_is_external(link_target: str) -> bool:
     return link_target.startswith(("http://", "https://", "mailto:", "tel:"))
 
 
-def _resolve_link(md_file: Path, repo_root: Path, link_target: str) -> Path:
-    if link_target.startswith("/"):
-        return (repo_root / link_target.lstrip("/")).resolve()
-    return (md_file.parent / link_target).resolve()
-
-
 def _format_doc_path(md_file: Path, docs_dir: Path, repo_root: Path) -> str:
     try:
         return str(md_file.relative_to(docs_dir))
@@ -54,85 +41,133 @@ def _normalize_link_target(link_target: str) -> str:
     return cleaned.split("?", 1)[0]
 
 
-def _check_internal_links(docs_dir: Path) -> list[dict[str, Any]]:
+def _link_anchor(link_target: str) -> str:
+    if "#" not in link_target:
+        return ""
+    return unquote(link_target.split("#", 1)[1]).lower()
+
+
+class _PathIndex:
+    """In-memory existence checks for link targets.
+
+    Each directory is listed at most once and kept as a set of entry names,
+    so thousands of links to the same targets cost set lookups instead of
+    repeated resolve()/stat() calls.
+    """
+
+    def __init__(self) -> None:
+        self._listings: dict[str, frozenset[str]] = {}
+        self._exists: dict[str, bool] = {}
+
+    def _listing(self, directory: str) -> frozenset[str]:
+        listing = self._listings.get(directory)
+        if listing is None:
+            try:
+                listing = frozenset(os.listdir(directory))
+            except OSError:
+                listing = frozenset()
+            self._listings[directory] = listing
+        return listing
+
+    def exists(self, path: str) -> bool:
+        cached = self._exists.get(path)
+        if cached is None:
+            parent, name = os.path.split(path)
+            if not name or parent == path:
+                cached = os.path.isdir(path)
+            elif name not in self._listing(parent):
+                cached = False
+            else:
+                # Present in its parent listing; symlinks still need a real check
+                cached = not os.path.islink(path) or os.path.exists(path)
+            self._exists[path] = cached
+        return cached
+
+    def resolve(self, md_file: Path, repo_root: Path, target: str) -> str:
+        if target.startswith("/"):
+            joined = os.path.join(repo_root, target.lstrip("/"))
+        else:
+            joined = os.path.join(md_file.parent, target)
+        return os.path.normpath(joined)
+
+
+def _check_internal_links(docs_dir: Path, corpus: DocsCorpus | None = None) -> list[dict[str, Any]]:
     """Check internal markdown links without external tools.
 
     Scans all .md files for relative links and verifies targets exist.
+    Links, reference definitions and heading anchors come pre-parsed from the
+    docs corpus; target existence is answered from a per-run path index.
+    Fragments pointing at a Markdown file in the corpus must match one of its
+    heading slugs or explicit HTML anchors.
     """
     problems: list[dict[str, Any]] = []
     repo_root = docs_dir.parent
-    md_files = list(docs_dir.rglob("*.md"))
-    root_readme = repo_root / "README.md"
-    if docs_dir.name == "docs" and root_readme.exists():
-        md_files.append(root_readme)
+    if corpus is None or corpus.docs_dir != docs_dir:
+        corpus = DocsCorpus.load(repo_root, docs_dir)
+    docs = list(corpus.iter_docs(docs_dir))
+    root_readme = corpus.get(repo_root / "README.md")
+    if docs_dir.name == "docs" and root_readme is not None:
+        docs.append(root_readme)
+
+    paths = _PathIndex()
+    docs_by_path = {os.path.normpath(doc.path): doc for doc in corpus.files.values()}
+
+    def _check(doc: DocFile, kind: str, shown: str, link_target: str) -> None:
+        md_file = doc.path
+        if _link_is_external(link_target):
+            return
+        anchor = _link_anchor(link_target)
+        target_path = _normalize_link_target(link_target)
+        if not target_path:
+            # Same-document fragment
+            if anchor and anchor not in doc.anchors:
+                problems.append(_broken_anchor(md_file, docs_dir, repo_root, shown, link_target))
+            return
+
+        # Resolve relative to the markdown file's directory
+        resolved = paths.resolve(md_file, repo_root, target_path)
+        if not paths.exists(resolved):
+            problems.append(
+                {
+                    "severity": "error",
+                    "message": f"Broken {kind} in {_format_doc_path(md_file, docs_dir, repo_root)}: {shown}",
+                    "code": "CIHUB-DOCS-BROKEN-LINK",
+                    "file": str(md_file),
+                    "target": link_target,
+                }
+            )
+            return
+        target_doc = docs_by_path.get(resolved)
+        if anchor and target_doc is not None and anchor not in target_doc.anchors:
+            problems.append(_broken_anchor(md_file, docs_dir, repo_root, shown, link_target))
 
-    for md_file in md_files:
+    for doc in docs:
         # Archived docs are historical; they are excluded from link checking to avoid
         # requiring churn to keep old/superseded docs up to date.
         try:
-            rel = md_file.relative_to(docs_dir).as_posix()
+            rel = doc.path.relative_to(docs_dir).as_posix()
             if rel.startswith("development/archive/"):
                 continue
         except ValueError:
             # Root README.md is checked too; keep it in scope.
             pass
 
-        content = md_file.read_text(encoding="utf-8")
-        content = _strip_fenced_blocks(content)
-
-        for match in REFERENCE_DEF_RE.finditer(content):
-            ref_id, link_target = match.groups()
-            if link_target.startswith("#") or _link_is_external(link_target):
-                continue
-            target_path = _normalize_link_target(link_target)
-            if not target_path:
-                continue
-            resolved = _resolve_link(md_file, repo_root, target_path)
-            if not resolved.exists():
-                problems.append(
-                    {
-                        "severity": "error",
-                        "message": (
-                            f"Broken reference link in "
-                            f"{_format_doc_path(md_file, docs_dir, repo_root)}: "
-                            f"[{ref_id}]: {link_target}"
-                        ),
-                        "code": "CIHUB-DOCS-BROKEN-LINK",
-                        "file": str(md_file),
-                        "target": link_target,
-                    }
-                )
-        for match in MARKDOWN_LINK_RE.finditer(content):
-            link_text, link_target = match.groups()
-
-            # Skip external links, anchors-only, and mailto
-            if link_target.startswith("#") or _link_is_external(link_target):
-                continue
+        for ref_id, link_target in doc.reference_defs:
+            _check(doc, "reference link", f"[{ref_id}]: {link_target}", link_target)
+        for link_text, link_target in doc.links:
+            _check(doc, "link", f"[{link_text}]({link_target})", link_target)
 
-            # Handle anchor in link
-            target_path = _normalize_link_target(link_target)
-            if not target_path:
-                continue
+    return problems
 
-            # Resolve relative to the markdown file's directory
-            resolved = _resolve_link(md_file, repo_root, target_path)
-
-            if not resolved.exists():
-                problems.append(
-                    {
-                        "severity": "error",
-                        "message": (
-                            f"Broken link in "
-                            f"{_format_doc_path(md_file, docs_dir, repo_root)}: "
-                            f"[{link_text}]({link_target})"
-                        ),
-                        "code": "CIHUB-DOCS-BROKEN-LINK",
-                        "file": str(md_file),
-                        "target": link_target,
-                    }
-                )
 
-    return problems
+def _broken_anchor(md_file: Path, docs_dir: Path, repo_root: Path, shown: str, link_target: str) -> dict[str, Any]:
+    return {
+        "severity": "error",
+        "message": f"Broken anchor in {_format_doc_path(md_file, docs_dir, repo_root)}: {shown}",
+        "code": "CIHUB-DOCS-BROKEN-ANCHOR",
+        "file": str(md_file),
+        "target": link_target,
+    }
 
 
 def _run_lychee(docs_dir: Path, external: bool) -> tuple[int, list[dict[str, Any]]]:
@@ -238,7 +273,8 @@ def cmd_docs_links(args: argparse.Namespace) -> CommandResult:
     Always returns CommandResult for consistent output handling.
     """
     external = getattr(args, "external", False)
-    docs_dir = project_root() / "docs"
+    repo_root = project_root()
+    docs_dir = repo_root / "docs"
 
     # Try lychee first
     has_lychee = shutil.which("lychee") is not None
@@ -261,7 +297,10 @@ def cmd_docs_links(args: argparse.Namespace) -> CommandResult:
                     "code": "CIHUB-DOCS-NO-LYCHEE",
                 }
             )
-        problems = _check_internal_links(docs_dir)
+        corpus = getattr(args, "docs_corpus", None)
+        if not isinstance(corpus, DocsCorpus) or corpus.docs_dir != docs_dir:
+            corpus = load_docs_corpus(repo_root, docs_dir)
+        problems = _check_internal_links(docs_dir, corpus)
         exit_code = EXIT_FAILURE if problems else EXIT_SUCCESS
         tool_used = "internal"
 
@@ -29,6 +29,7 @@ from pathlib import Path
 
 from cihub.exit_codes import EXIT_FAILURE, EXIT_SUCCESS
 from cihub.types import CommandResult
+from cihub.utils.docs_corpus import DocsCorpus, load_docs_corpus
 from cihub.utils.github_context import OutputContext
 from cihub.utils.paths import project_root
 
@@ -175,41 +176,46 @@ def cmd_docs_audit(args: argparse.Namespace) -> CommandResult:
     output_dir = getattr(args, "output_dir", None)
     github_summary = getattr(args, "github_summary", False)
 
+    # Walk and parse docs/ once; every pass below shares the same corpus.
+    corpus = getattr(args, "docs_corpus", None)
+    if not isinstance(corpus, DocsCorpus) or corpus.repo_root != repo_root:
+        corpus = load_docs_corpus(repo_root)
+
     # Run all validations
     report = AuditReport()
 
     # 1. Lifecycle validation (active/ ↔ STATUS.md sync)
-    lifecycle_findings, active_docs, status_entries, archive_docs = validate_lifecycle(repo_root)
+    lifecycle_findings, active_docs, status_entries, archive_docs = validate_lifecycle(repo_root, corpus)
     report.findings.extend(lifecycle_findings)
     report.active_docs = active_docs
     report.status_entries = status_entries
     report.archive_docs = archive_docs
 
     # 2. ADR metadata validation
-    adr_files = get_adr_files(repo_root)
+    adr_files = get_adr_files(repo_root, corpus)
     report.adr_files = adr_files
-    adr_findings = validate_adr_metadata(adr_files, repo_root)
+    adr_findings = validate_adr_metadata(adr_files, repo_root, corpus)
     report.findings.extend(adr_findings)
 
     # 3. Universal header validation (Part 12.Q)
     skip_headers = getattr(args, "skip_headers", False)
     if not skip_headers:
-        header_findings = validate_doc_headers(repo_root)
+        header_findings = validate_doc_headers(repo_root, corpus)
         report.findings.extend(header_findings)
 
     # 4. Reference validation (optional, can be slow)
     if not skip_references:
-        ref_findings = validate_doc_references(repo_root)
+        ref_findings = validate_doc_references(repo_root, corpus)
         report.findings.extend(ref_findings)
 
     # 5. Consistency validation (Part 13: duplicates, timestamps, placeholders)
     if not skip_consistency:
-        consistency_findings = validate_consistency(repo_root)
+        consistency_findings = validate_consistency(repo_root, corpus)
         report.findings.extend(consistency_findings)
 
     # 6. Inventory summary (optional)
     if include_inventory:
-        report.inventory_summary = build_doc_inventory(repo_root)
+        report.inventory_summary = build_doc_inventory(repo_root, corpus)
 
     # Prepare output context for artifacts
     ctx = OutputContext.from_args(args)
@@ -11,6 +11,8 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+from cihub.utils.docs_corpus import DocsCorpus
+
 from .types import (
     ADR_DIR,
     ADR_VALID_STATUSES,
@@ -21,13 +23,14 @@ from .types import (
 )
 
 
-def get_adr_files(repo_root: Path) -> list[str]:
+def get_adr_files(repo_root: Path, corpus: DocsCorpus | None = None) -> list[str]:
     """Get all ADR files in docs/adr/.
 
     ADRs follow the pattern: NNNN-title.md
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (directory is globbed if not provided)
 
     Returns:
         List of relative ADR file paths
@@ -40,14 +43,17 @@ def get_adr_files(repo_root: Path) -> list[str]:
     # Match ADR pattern: 4 digits followed by title
     adr_pattern = re.compile(r"^\d{4}-.*\.md$")
 
-    for md_file in adr_dir.glob("*.md"):
+    candidates = (
+        [doc.path for doc in corpus.iter_docs(adr_dir, recursive=False)] if corpus is not None else adr_dir.glob("*.md")
+    )
+    for md_file in candidates:
         if adr_pattern.match(md_file.name):
             files.append(str(md_file.relative_to(repo_root)))
 
     return sorted(files)
 
 
-def parse_adr_metadata(file_path: Path) -> ADRMetadata:
+def parse_adr_metadata(file_path: Path, content: str | None = None) -> ADRMetadata:
     """Parse ADR file to extract metadata.
 
     Looks for metadata in the first 30 lines:
@@ -57,11 +63,13 @@ def parse_adr_metadata(file_path: Path) -> ADRMetadata:
 
     Args:
         file_path: Path to ADR file
+        content: Pre-read file content (read from file_path if None)
 
     Returns:
         Parsed ADR metadata
     """
-    content = file_path.read_text(encoding="utf-8")
+    if content is None:
+        content = file_path.read_text(encoding="utf-8")
     lines = content.split("\n")[:30]
 
     metadata = ADRMetadata(file=str(file_path))
@@ -112,7 +120,11 @@ def parse_adr_metadata(file_path: Path) -> ADRMetadata:
     return metadata
 
 
-def validate_adr_metadata(adr_files: list[str], repo_root: Path) -> list[AuditFinding]:
+def validate_adr_metadata(
+    adr_files: list[str],
+    repo_root: Path,
+    corpus: DocsCorpus | None = None,
+) -> list[AuditFinding]:
     """Validate ADR metadata for all ADR files.
 
     Part 12.L requirements:
@@ -123,6 +135,7 @@ def validate_adr_metadata(adr_files: list[str], repo_root: Path) -> list[AuditFi
     Args:
         adr_files: List of ADR file paths
         repo_root: Repository root path
+        corpus: Shared docs corpus (files are read directly if not provided)
 
     Returns:
         List of findings for ADR metadata issues
@@ -131,10 +144,11 @@ def validate_adr_metadata(adr_files: list[str], repo_root: Path) -> list[AuditFi
 
     for adr_path in adr_files:
         full_path = repo_root / adr_path
-        if not full_path.exists():
+        doc = corpus.get(full_path) if corpus is not None else None
+        if doc is None and not full_path.exists():
             continue
 
-        metadata = parse_adr_metadata(full_path)
+        metadata = parse_adr_metadata(full_path, doc.content if doc is not None else None)
 
         # Report missing required fields
         for field in metadata.missing_fields:
@@ -17,9 +17,11 @@ import re
 from collections import defaultdict
 from collections.abc import Callable
 from datetime import date
-from difflib import SequenceMatcher
 from pathlib import Path
 
+from cihub.utils.docs_corpus import DocsCorpus
+from cihub.utils.similarity import SimilarityIndex, similarity_ratio
+
 from .guides import validate_guide_commands
 from .types import (
     DUPLICATE_SIMILARITY_THRESHOLD,
@@ -69,10 +71,29 @@ def _similarity(s1: str, s2: str) -> float:
     Returns:
         Float between 0 and 1 indicating similarity
     """
-    return SequenceMatcher(None, s1, s2).ratio()
+    return similarity_ratio(s1, s2)
+
+
+def _read_doc(path: Path, corpus: DocsCorpus | None) -> str | None:
+    """Return doc content from the shared corpus, falling back to disk.
+
+    Returns None when the file is missing or unreadable.
+    """
+    doc = corpus.get(path) if corpus is not None else None
+    if doc is not None:
+        content = doc.content
+        return content if doc.readable else None
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
 
 
-def parse_checklist_items(doc_path: Path, repo_root: Path | None = None) -> list[TaskEntry]:
+def parse_checklist_items(
+    doc_path: Path,
+    repo_root: Path | None = None,
+    corpus: DocsCorpus | None = None,
+) -> list[TaskEntry]:
     """Parse all checklist items from a planning doc.
 
     Finds markdown checklist items like:
@@ -83,6 +104,7 @@ def parse_checklist_items(doc_path: Path, repo_root: Path | None = None) -> list
     Args:
         doc_path: Path to the markdown file
         repo_root: Optional repo root for computing relative paths
+        corpus: Shared docs corpus; its pre-parsed checklist items are used when it has the doc
 
     Returns:
         List of TaskEntry objects
@@ -91,10 +113,24 @@ def parse_checklist_items(doc_path: Path, repo_root: Path | None = None) -> list
         return []
 
     entries: list[TaskEntry] = []
-    content = doc_path.read_text(encoding="utf-8")
     # Use repo-relative path if repo_root provided
     rel_path = str(doc_path.relative_to(repo_root)) if repo_root else str(doc_path)
 
+    doc = corpus.get(doc_path) if corpus is not None else None
+    if doc is not None:
+        return [
+            TaskEntry(
+                file=rel_path,
+                line=line_num,
+                text=text,
+                normalized=_normalize_task_text(text),
+                completed=completed,
+            )
+            for line_num, completed, text in doc.checklist_items
+        ]
+
+    content = doc_path.read_text(encoding="utf-8")
+
     # Match: - [ ] task or - [x] task or * [ ] task
     pattern = re.compile(r"^[-*]\s*\[([ xX])\]\s*(.+)$")
 
@@ -117,7 +153,10 @@ def parse_checklist_items(doc_path: Path, repo_root: Path | None = None) -> list
     return entries
 
 
-def find_duplicate_tasks(repo_root: Path) -> tuple[list[DuplicateTaskGroup], list[AuditFinding]]:
+def find_duplicate_tasks(
+    repo_root: Path,
+    corpus: DocsCorpus | None = None,
+) -> tuple[list[DuplicateTaskGroup], list[AuditFinding]]:
     """Detect duplicate checklist items across planning docs.
 
     Part 13.S: Finds tasks that appear multiple times, which creates
@@ -125,6 +164,7 @@ def find_duplicate_tasks(repo_root: Path) -> tuple[list[DuplicateTaskGroup], lis
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (optional)
 
     Returns:
         Tuple of (duplicate groups, findings)
@@ -134,12 +174,15 @@ def find_duplicate_tasks(repo_root: Path) -> tuple[list[DuplicateTaskGroup], lis
     # Parse all planning docs
     for doc_rel in PLANNING_DOCS:
         doc_path = repo_root / doc_rel
-        tasks = parse_checklist_items(doc_path, repo_root=repo_root)
+        tasks = parse_checklist_items(doc_path, repo_root=repo_root, corpus=corpus)
         all_tasks.extend(tasks)
 
-    # Group by normalized text using fuzzy matching
+    # Group by normalized text using fuzzy matching. The similarity index only
+    # yields tasks that can still reach the threshold, so the exact ratio is
+    # computed for candidate pairs instead of every pair.
     groups: dict[str, list[TaskEntry]] = defaultdict(list)
     processed: set[int] = set()  # Track processed task indices
+    index = SimilarityIndex([task.normalized for task in all_tasks], DUPLICATE_SIMILARITY_THRESHOLD)
 
     for i, task in enumerate(all_tasks):
         if i in processed:
@@ -149,9 +192,10 @@ def find_duplicate_tasks(repo_root: Path) -> tuple[list[DuplicateTaskGroup], lis
         similar_tasks = [task]
         processed.add(i)
 
-        for j, other in enumerate(all_tasks):
+        for j in index.candidates(task.normalized):
             if j in processed:
                 continue
+            other = all_tasks[j]
             if _similarity(task.normalized, other.normalized) >= DUPLICATE_SIMILARITY_THRESHOLD:
                 similar_tasks.append(other)
                 processed.add(j)
@@ -190,6 +234,7 @@ def check_timestamp_freshness(
     warn_days: int = TIMESTAMP_WARN_DAYS,
     error_days: int = TIMESTAMP_ERROR_DAYS,
     repo_root: Path | None = None,
+    content: str | None = None,
 ) -> list[AuditFinding]:
     """Validate timestamp headers are reasonably fresh.
 
@@ -201,15 +246,17 @@ def check_timestamp_freshness(
         warn_days: Days old before warning (default 7)
         error_days: Days old before error (default 30)
         repo_root: Optional repo root for computing relative paths
+        content: Pre-read doc content (read from doc_path if None)
 
     Returns:
         List of findings for stale timestamps
     """
-    if not doc_path.exists():
-        return []
+    if content is None:
+        if not doc_path.exists():
+            return []
+        content = doc_path.read_text(encoding="utf-8")
 
     findings: list[AuditFinding] = []
-    content = doc_path.read_text(encoding="utf-8")
     # Use repo-relative path if repo_root provided
     rel_path = str(doc_path.relative_to(repo_root)) if repo_root else str(doc_path)
     today = date.today()
@@ -278,7 +325,7 @@ def check_timestamp_freshness(
     return findings
 
 
-def validate_timestamps(repo_root: Path) -> list[AuditFinding]:
+def validate_timestamps(repo_root: Path, corpus: DocsCorpus | None = None) -> list[AuditFinding]:
     """Validate timestamps across all relevant docs.
 
     Scans development/ and active/ docs for timestamp freshness.
@@ -286,6 +333,7 @@ def validate_timestamps(repo_root: Path) -> list[AuditFinding]:
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (loaded on demand if not provided)
 
     Returns:
         List of findings for stale timestamps
@@ -295,16 +343,18 @@ def validate_timestamps(repo_root: Path) -> list[AuditFinding]:
     # Scan development/ docs (except archive/)
     dev_dir = repo_root / "docs" / "development"
     if dev_dir.exists():
-        for md_file in dev_dir.rglob("*.md"):
+        if corpus is None:
+            corpus = DocsCorpus.load(repo_root)
+        for doc in corpus.iter_docs(dev_dir):
             # Skip archive - historical docs are expected to have old dates
-            if "archive" in str(md_file):
+            if "archive" in str(doc.path):
                 continue
-            findings.extend(check_timestamp_freshness(md_file, repo_root=repo_root))
+            findings.extend(check_timestamp_freshness(doc.path, repo_root=repo_root, content=doc.content))
 
     return findings
 
 
-def find_placeholders(repo_root: Path) -> list[AuditFinding]:
+def find_placeholders(repo_root: Path, corpus: DocsCorpus | None = None) -> list[AuditFinding]:
     """Detect hardcoded placeholders in docs.
 
     Part 13.V: Finds placeholder markers and hardcoded local paths.
@@ -315,6 +365,7 @@ def find_placeholders(repo_root: Path) -> list[AuditFinding]:
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (loaded on demand if not provided)
 
     Returns:
         List of findings for placeholder issues
@@ -333,14 +384,17 @@ def find_placeholders(repo_root: Path) -> list[AuditFinding]:
     if not docs_dir.exists():
         return findings
 
-    for md_file in docs_dir.rglob("*.md"):
+    if corpus is None:
+        corpus = DocsCorpus.load(repo_root)
+
+    for doc in corpus.iter_docs(docs_dir):
+        md_file = doc.path
         # Skip archive - may have historical references
         if "archive" in str(md_file):
             continue
 
-        try:
-            content = md_file.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
+        content = doc.content
+        if not doc.readable:
             continue
 
         rel_path = str(md_file.relative_to(repo_root))
@@ -556,7 +610,7 @@ def _is_local_context(line: str) -> bool:
     return any(kw in line_lower for kw in METRICS_LOCAL_CONTEXT_KEYWORDS)
 
 
-def find_stale_metrics(repo_root: Path) -> list[AuditFinding]:
+def find_stale_metrics(repo_root: Path, corpus: DocsCorpus | None = None) -> list[AuditFinding]:
     """Find numeric claims in docs that don't match reality (Part 13.R).
 
     Scans docs for current-state numeric claims like "we have 80 tests"
@@ -565,6 +619,7 @@ def find_stale_metrics(repo_root: Path) -> list[AuditFinding]:
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (optional)
 
     Returns:
         List of findings for stale metrics
@@ -585,9 +640,8 @@ def find_stale_metrics(repo_root: Path) -> list[AuditFinding]:
         if not doc_path.exists():
             continue
 
-        try:
-            content = doc_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
+        content = _read_doc(doc_path, corpus)
+        if content is None:
             continue
 
         for line_num, line in enumerate(content.split("\n"), 1):
@@ -712,13 +766,14 @@ def _file_contains(path: Path, pattern: str) -> bool:
         return False
 
 
-def verify_checklist_reality(repo_root: Path) -> list[AuditFinding]:
+def verify_checklist_reality(repo_root: Path, corpus: DocsCorpus | None = None) -> list[AuditFinding]:
     """Check if unchecked items in design docs have completed implementations.
 
     Part 13.U: Finds `[ ]` items that actually correspond to completed work.
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (optional)
 
     Returns:
         List of findings for mismatched checklist items
@@ -731,10 +786,14 @@ def verify_checklist_reality(repo_root: Path) -> list[AuditFinding]:
     if not active_docs_dir.exists():
         return findings
 
-    for doc_path in active_docs_dir.glob("*.md"):
-        try:
-            content = doc_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
+    doc_paths = (
+        [doc.path for doc in corpus.iter_docs(active_docs_dir, recursive=False)]
+        if corpus is not None
+        else list(active_docs_dir.glob("*.md"))
+    )
+    for doc_path in doc_paths:
+        content = _read_doc(doc_path, corpus)
+        if content is None:
             continue
 
         doc_rel_path = str(doc_path.relative_to(repo_root))
@@ -781,7 +840,7 @@ def verify_checklist_reality(repo_root: Path) -> list[AuditFinding]:
 # =============================================================================
 
 
-def validate_changelog(repo_root: Path) -> list[AuditFinding]:
+def validate_changelog(repo_root: Path, corpus: DocsCorpus | None = None) -> list[AuditFinding]:
     """Validate CHANGELOG.md format and ordering (Part 13.X).
 
     Checks:
@@ -791,6 +850,7 @@ def validate_changelog(repo_root: Path) -> list[AuditFinding]:
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (optional)
 
     Returns:
         List of findings for changelog issues
@@ -812,9 +872,8 @@ def validate_changelog(repo_root: Path) -> list[AuditFinding]:
     if changelog_path is None:
         return findings
 
-    try:
-        content = changelog_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    content = _read_doc(changelog_path, corpus)
+    if content is None:
         return findings
 
     rel_path = str(changelog_path.relative_to(repo_root))
@@ -880,13 +939,14 @@ def validate_changelog(repo_root: Path) -> list[AuditFinding]:
 # =============================================================================
 
 
-def parse_readme_active_docs(repo_root: Path) -> list[str]:
+def parse_readme_active_docs(repo_root: Path, corpus: DocsCorpus | None = None) -> list[str]:
     """Parse docs/README.md to extract Active Design Docs list.
 
     Looks for the "Active Design Docs" section and extracts file references.
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (optional)
 
     Returns:
         List of doc filenames (relative to active/ dir) mentioned in README.md
@@ -895,7 +955,9 @@ def parse_readme_active_docs(repo_root: Path) -> list[str]:
     if not readme_path.exists():
         return []
 
-    content = readme_path.read_text(encoding="utf-8")
+    content = _read_doc(readme_path, corpus)
+    if content is None:
+        return []
     active_docs: list[str] = []
 
     # Find the "Active Design Docs" section
@@ -922,11 +984,12 @@ def parse_readme_active_docs(repo_root: Path) -> list[str]:
     return active_docs
 
 
-def check_docs_index_consistency(repo_root: Path) -> list[AuditFinding]:
+def check_docs_index_consistency(repo_root: Path, corpus: DocsCorpus | None = None) -> list[AuditFinding]:
     """Check docs/README.md Active Design Docs matches actual files (Part 13.W).
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (optional)
 
     Returns:
         List of findings for inconsistencies
@@ -937,11 +1000,13 @@ def check_docs_index_consistency(repo_root: Path) -> list[AuditFinding]:
     active_dir = repo_root / "docs" / "development" / "active"
     actual_files: set[str] = set()
     if active_dir.exists():
-        for md_file in active_dir.glob("*.md"):
-            actual_files.add(md_file.name)
+        if corpus is not None:
+            actual_files.update(doc.path.name for doc in corpus.iter_docs(active_dir, recursive=False))
+        else:
+            actual_files.update(md_file.name for md_file in active_dir.glob("*.md"))
 
     # Get files listed in README.md
-    readme_files = set(parse_readme_active_docs(repo_root))
+    readme_files = set(parse_readme_active_docs(repo_root, corpus))
 
     # Find files missing from README.md
     missing_from_readme = actual_files - readme_files
@@ -976,41 +1041,44 @@ def check_docs_index_consistency(repo_root: Path) -> list[AuditFinding]:
     return findings
 
 
-def validate_consistency(repo_root: Path) -> list[AuditFinding]:
+def validate_consistency(repo_root: Path, corpus: DocsCorpus | None = None) -> list[AuditFinding]:
     """Run all Part 13 consistency checks.
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (loaded once here if not provided)
 
     Returns:
         Combined findings from all consistency checks
     """
     findings: list[AuditFinding] = []
+    if corpus is None:
+        corpus = DocsCorpus.load(repo_root)
 
     # Part 13.S: Duplicate task detection
     # TODO: Re-enable once duplicate tasks are cleaned up (see BACKLOG.md)
-    # _, duplicate_findings = find_duplicate_tasks(repo_root)
+    # _, duplicate_findings = find_duplicate_tasks(repo_root, corpus)
     # findings.extend(duplicate_findings)
 
     # Part 13.T: Timestamp freshness
-    findings.extend(validate_timestamps(repo_root))
+    findings.extend(validate_timestamps(repo_root, corpus))
 
     # Part 13.V: Placeholder detection
-    findings.extend(find_placeholders(repo_root))
+    findings.extend(find_placeholders(repo_root, corpus))
 
     # Part 13.R: Metrics drift detection
-    findings.extend(find_stale_metrics(repo_root))
+    findings.extend(find_stale_metrics(repo_root, corpus))
 
     # Part 13.U: Checklist vs reality sync
-    findings.extend(verify_checklist_reality(repo_root))
+    findings.extend(verify_checklist_reality(repo_root, corpus))
 
     # Part 13.W: Cross-doc consistency (README.md ↔ active/)
-    findings.extend(check_docs_index_consistency(repo_root))
+    findings.extend(check_docs_index_consistency(repo_root, corpus))
 
     # Guide command validation (docs/guides/)
-    findings.extend(validate_guide_commands(repo_root))
+    findings.extend(validate_guide_commands(repo_root, corpus))
 
     # Part 13.X: CHANGELOG format validation
-    findings.extend(validate_changelog(repo_root))
+    findings.extend(validate_changelog(repo_root, corpus))
 
     return findings
@@ -8,6 +8,7 @@ import shlex
 from pathlib import Path
 
 from cihub.cli_parsers.builder import build_parser
+from cihub.utils.docs_corpus import DocsCorpus
 
 from .types import AuditFinding, FindingCategory, FindingSeverity
 
@@ -135,19 +136,22 @@ def _iter_guide_snippets(content: str) -> list[tuple[int, str]]:
     return snippets
 
 
-def validate_guide_commands(repo_root: Path) -> list[AuditFinding]:
+def validate_guide_commands(repo_root: Path, corpus: DocsCorpus | None = None) -> list[AuditFinding]:
     """Validate cihub command mentions in docs/guides."""
     guides_dir = repo_root / "docs" / "guides"
     if not guides_dir.exists():
         return []
 
+    if corpus is None:
+        corpus = DocsCorpus.load(repo_root)
+
     command_tree = _build_command_tree(build_parser())
     findings: list[AuditFinding] = []
 
-    for guide_path in guides_dir.rglob("*.md"):
-        try:
-            content = guide_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
+    for doc in corpus.iter_docs(guides_dir):
+        guide_path = doc.path
+        content = doc.content
+        if not doc.readable:
             continue
 
         rel_path = str(guide_path.relative_to(repo_root))
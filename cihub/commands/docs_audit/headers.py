@@ -19,6 +19,8 @@ import re
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from cihub.utils.docs_corpus import DocsCorpus
+
 from .types import (
     DOC_HEADER_FIELDS,
     DOC_HEADER_OPTIONAL,
@@ -291,7 +293,7 @@ def validate_header_value(field: str, value: str, file_path: str) -> list[AuditF
     return findings
 
 
-def validate_doc_headers(repo_root: Path) -> list[AuditFinding]:
+def validate_doc_headers(repo_root: Path, corpus: DocsCorpus | None = None) -> list[AuditFinding]:
     """Validate universal headers on manual docs.
 
     Scans docs/ directory for manual docs and validates they have
@@ -299,6 +301,7 @@ def validate_doc_headers(repo_root: Path) -> list[AuditFinding]:
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (loaded on demand if not provided)
 
     Returns:
         List of audit findings
@@ -309,8 +312,12 @@ def validate_doc_headers(repo_root: Path) -> list[AuditFinding]:
     if not docs_dir.exists():
         return findings
 
+    if corpus is None:
+        corpus = DocsCorpus.load(repo_root)
+
     # Scan all markdown files in docs/
-    for md_file in docs_dir.rglob("*.md"):
+    for doc in corpus.iter_docs("docs"):
+        md_file = doc.path
         rel_path = str(md_file.relative_to(repo_root))
 
         # Check if exempt
@@ -318,10 +325,8 @@ def validate_doc_headers(repo_root: Path) -> list[AuditFinding]:
         if is_exempt:
             continue
 
-        # Read content
-        try:
-            content = md_file.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
+        content = doc.content
+        if not doc.readable:
             continue
 
         # Skip if has superseded header (uses different format)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from cihub.utils.docs_corpus import DocsCorpus
+
 from .types import DocInventoryCategory, DocInventorySummary
 
 CATEGORY_ORDER = (
@@ -42,28 +44,20 @@ def _classify_doc_path(rel_path: Path) -> str:
     return "other"
 
 
-def _count_lines(path: Path) -> int:
-    """Return a line count for a markdown file."""
-    try:
-        content = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        return 0
-    return len(content.splitlines())
-
-
-def build_doc_inventory(repo_root: Path) -> DocInventorySummary:
+def build_doc_inventory(repo_root: Path, corpus: DocsCorpus | None = None) -> DocInventorySummary:
     """Build a markdown inventory for docs/."""
     summary = DocInventorySummary(categories={name: DocInventoryCategory() for name in CATEGORY_ORDER})
     docs_dir = repo_root / "docs"
     if not docs_dir.exists():
         return summary
 
-    for md_file in docs_dir.rglob("*.md"):
-        if not md_file.is_file():
-            continue
-        rel_path = md_file.relative_to(repo_root)
+    if corpus is None:
+        corpus = DocsCorpus.load(repo_root)
+
+    for doc in corpus.iter_docs("docs"):
+        rel_path = doc.path.relative_to(repo_root)
         category = _classify_doc_path(rel_path)
-        line_count = _count_lines(md_file)
+        line_count = doc.line_count
 
         summary.total_files += 1
         summary.total_lines += line_count
@@ -12,6 +12,8 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+from cihub.utils.docs_corpus import DocsCorpus
+
 from .types import (
     ACTIVE_DOCS_DIR,
     ARCHIVE_DOCS_DIR,
@@ -24,11 +26,12 @@ from .types import (
 )
 
 
-def get_active_docs(repo_root: Path) -> list[str]:
+def get_active_docs(repo_root: Path, corpus: DocsCorpus | None = None) -> list[str]:
     """Get all markdown files in docs/development/active/.
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (directory is globbed if not provided)
 
     Returns:
         List of relative file paths
@@ -37,17 +40,21 @@ def get_active_docs(repo_root: Path) -> list[str]:
     if not active_dir.exists():
         return []
 
+    if corpus is not None:
+        return sorted(str(doc.path.relative_to(repo_root)) for doc in corpus.iter_docs(active_dir, recursive=False))
+
     files = []
     for md_file in active_dir.glob("*.md"):
         files.append(str(md_file.relative_to(repo_root)))
     return sorted(files)
 
 
-def get_archive_docs(repo_root: Path) -> list[str]:
+def get_archive_docs(repo_root: Path, corpus: DocsCorpus | None = None) -> list[str]:
     """Get all markdown files in docs/development/archive/.
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (directory is walked if not provided)
 
     Returns:
         List of relative file paths
@@ -56,6 +63,9 @@ def get_archive_docs(repo_root: Path) -> list[str]:
     if not archive_dir.exists():
         return []
 
+    if corpus is not None:
+        return sorted(str(doc.path.relative_to(repo_root)) for doc in corpus.iter_docs(archive_dir))
+
     files = []
     for md_file in archive_dir.rglob("*.md"):
         files.append(str(md_file.relative_to(repo_root)))
@@ -264,6 +274,7 @@ def check_active_status_sync(
 def check_archive_superseded_headers(
     archive_docs: list[str],
     repo_root: Path,
+    corpus: DocsCorpus | None = None,
 ) -> list[AuditFinding]:
     """Check that archived docs have Superseded headers with explicit references.
 
@@ -274,6 +285,7 @@ def check_archive_superseded_headers(
     Args:
         archive_docs: Files found in archive/ directory
         repo_root: Repository root path
+        corpus: Shared docs corpus (files are read directly if not provided)
 
     Returns:
         List of findings for missing superseded headers
@@ -302,10 +314,14 @@ def check_archive_superseded_headers(
 
     for doc_path in archive_docs:
         full_path = repo_root / doc_path
-        if not full_path.exists():
+        doc = corpus.get(full_path) if corpus is not None else None
+        if doc is not None:
+            content = doc.content
+        elif full_path.exists():
+            content = full_path.read_text(encoding="utf-8")
+        else:
             continue
 
-        content = full_path.read_text(encoding="utf-8")
         # Check first 50 lines for superseded header
         lines = content.split("\n")[:50]
         header_text = "\n".join(lines)
@@ -348,11 +364,15 @@ def check_archive_superseded_headers(
     return findings
 
 
-def validate_lifecycle(repo_root: Path) -> tuple[list[AuditFinding], list[str], list[str], list[str]]:
+def validate_lifecycle(
+    repo_root: Path,
+    corpus: DocsCorpus | None = None,
+) -> tuple[list[AuditFinding], list[str], list[str], list[str]]:
     """Run all lifecycle validations.
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (optional)
 
     Returns:
         Tuple of (findings, active_docs, status_entries, archive_docs)
@@ -360,8 +380,8 @@ def validate_lifecycle(repo_root: Path) -> tuple[list[AuditFinding], list[str],
     findings: list[AuditFinding] = []
 
     # Gather inventory
-    active_docs = get_active_docs(repo_root)
-    archive_docs = get_archive_docs(repo_root)
+    active_docs = get_active_docs(repo_root, corpus)
+    archive_docs = get_archive_docs(repo_root, corpus)
     status_entries = parse_status_md_entries(repo_root)
 
     # Check STATUS.md exists
@@ -398,7 +418,7 @@ def validate_lifecycle(repo_root: Path) -> tuple[list[AuditFinding], list[str],
         )
 
     # Check archive headers
-    findings.extend(check_archive_superseded_headers(archive_docs, repo_root))
+    findings.extend(check_archive_superseded_headers(archive_docs, repo_root, corpus))
 
     # Check specs hygiene (Part 12.J)
     findings.extend(check_specs_hygiene(repo_root))
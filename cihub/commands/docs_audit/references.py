@@ -10,6 +10,8 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
+from cihub.utils.docs_corpus import DocsCorpus
+
 from .types import (
     DOCS_PATH_PATTERN,
     AuditFinding,
@@ -177,7 +179,34 @@ def _is_valid_reference_start(line: str, match_start: int) -> bool:
     return True
 
 
-def validate_doc_references(repo_root: Path) -> list[AuditFinding]:
+def _iter_scan_files(repo_root: Path, corpus: DocsCorpus | None) -> list[tuple[Path, str | None]]:
+    """List (path, preloaded content) pairs to scan.
+
+    Markdown under docs/ comes from the shared corpus when available so it is
+    not read a second time; everything else is globbed per SCAN_PATTERNS.
+    """
+    files: list[tuple[Path, str | None]] = []
+    for scan_dir in SCAN_DIRS:
+        dir_path = repo_root / scan_dir
+        if not dir_path.exists():
+            continue
+
+        for pattern in SCAN_PATTERNS:
+            if corpus is not None and scan_dir == "docs" and pattern == "*.md":
+                for doc in corpus.iter_docs(dir_path):
+                    if should_exclude(doc.path):
+                        continue
+                    content = doc.content
+                    if doc.readable:
+                        files.append((doc.path, content))
+                continue
+            for file_path in dir_path.rglob(pattern):
+                if not should_exclude(file_path):
+                    files.append((file_path, None))
+    return files
+
+
+def validate_doc_references(repo_root: Path, corpus: DocsCorpus | None = None) -> list[AuditFinding]:
     """Scan codebase for docs/ references and validate they exist.
 
     Part 12.N requirement:
@@ -187,6 +216,7 @@ def validate_doc_references(repo_root: Path) -> list[AuditFinding]:
 
     Args:
         repo_root: Repository root path
+        corpus: Shared docs corpus (optional; avoids re-reading docs/ Markdown)
 
     Returns:
         List of findings for broken doc references
@@ -194,56 +224,48 @@ def validate_doc_references(repo_root: Path) -> list[AuditFinding]:
     findings: list[AuditFinding] = []
     checked_refs: set[tuple[str, str]] = set()  # (file, ref) to avoid duplicates
 
-    for scan_dir in SCAN_DIRS:
-        dir_path = repo_root / scan_dir
-        if not dir_path.exists():
-            continue
-
-        for pattern in SCAN_PATTERNS:
-            for file_path in dir_path.rglob(pattern):
-                if should_exclude(file_path):
-                    continue
-
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                except (OSError, UnicodeDecodeError):
-                    continue
+    for file_path, content in _iter_scan_files(repo_root, corpus):
+        if content is None:
+            try:
+                content = file_path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
 
-                rel_path = str(file_path.relative_to(repo_root))
-                references = extract_doc_references(content, rel_path)
+        rel_path = str(file_path.relative_to(repo_root))
+        references = extract_doc_references(content, rel_path)
 
-                for line_num, ref in references:
-                    # Skip if already checked this exact reference from this file
-                    check_key = (rel_path, ref)
-                    if check_key in checked_refs:
-                        continue
-                    checked_refs.add(check_key)
+        for line_num, ref in references:
+            # Skip if already checked this exact reference from this file
+            check_key = (rel_path, ref)
+            if check_key in checked_refs:
+                continue
+            checked_refs.add(check_key)
 
-                    # Strip anchors (#section) and query params before checking
-                    ref_clean = ref.split("#")[0].split("?")[0]
-                    if not ref_clean:
-                        continue
+            # Strip anchors (#section) and query params before checking
+            ref_clean = ref.split("#")[0].split("?")[0]
+            if not ref_clean:
+                continue
 
-                    # Check if the referenced path exists
-                    # Handle both with and without file extension
-                    ref_path = repo_root / ref_clean
-                    exists = ref_path.exists()
-
-                    # Also check if it might be a directory reference
-                    if not exists and not ref_clean.endswith(".md"):
-                        exists = (repo_root / ref_clean).is_dir()
-
-                    if not exists:
-                        findings.append(
-                            AuditFinding(
-                                severity=FindingSeverity.WARNING,
-                                category=FindingCategory.REFERENCE,
-                                message=f"Reference to non-existent path: {ref}",
-                                file=rel_path,
-                                line=line_num,
-                                code="CIHUB-AUDIT-BROKEN-REF",
-                                suggestion="Update reference to correct path or remove if obsolete",
-                            )
-                        )
+            # Check if the referenced path exists
+            # Handle both with and without file extension
+            ref_path = repo_root / ref_clean
+            exists = ref_path.exists()
+
+            # Also check if it might be a directory reference
+            if not exists and not ref_clean.endswith(".md"):
+                exists = (repo_root / ref_clean).is_dir()
+
+            if not exists:
+                findings.append(
+                    AuditFinding(
+                        severity=FindingSeverity.WARNING,
+                        category=FindingCategory.REFERENCE,
+                        message=f"Reference to non-existent path: {ref}",
+                        file=rel_path,
+                        line=line_num,
+                        code="CIHUB-AUDIT-BROKEN-REF",
+                        suggestion="Update reference to correct path or remove if obsolete",
+                    )
+                )
 
     return findings
@@ -29,6 +29,7 @@ from pathlib import Path
 
 from cihub.exit_codes import EXIT_FAILURE, EXIT_SUCCESS, EXIT_USAGE
 from cihub.types import CommandResult
+from cihub.utils.docs_corpus import load_docs_corpus
 from cihub.utils.github_context import OutputContext
 from cihub.utils.paths import project_root
 
@@ -39,14 +40,19 @@ from .comparison import (
     group_stale_by_file,
 )
 from .extraction import (
+    SYMBOL_CACHE_PATH,
+    SymbolCache,
     extract_doc_references,
     extract_python_symbols,
     extract_refs_from_file,
     extract_symbols_from_file,
 )
 from .git import (
+    DiffEntry,
+    GitBatchReader,
     compare_symbols,
     get_changed_files,
+    get_diff_entries,
     get_file_at_ref,
     get_file_status,
     get_merge_base,
@@ -110,10 +116,15 @@ __all__ = [
     "extract_symbols_from_file",
     "extract_doc_references",
     "extract_refs_from_file",
+    "SYMBOL_CACHE_PATH",
+    "SymbolCache",
     # Git
     "is_git_repo",
     "resolve_git_ref",
     "get_merge_base",
+    "DiffEntry",
+    "GitBatchReader",
+    "get_diff_entries",
     "get_changed_files",
     "get_file_status",
     "get_file_at_ref",
@@ -196,31 +207,36 @@ def cmd_docs_stale(args: argparse.Namespace) -> CommandResult:
     if not include_all:
         exclude_patterns.append("docs/development/archive/**")
 
-    # Compare symbols between base and head
-    removed, added, renamed = compare_symbols(since, root / code_path, root)
+    # One diff call feeds symbol comparison, file status and renames
+    diff_entries = get_diff_entries(since, root)
+
+    # Compare symbols between base and head (symbols cached per blob SHA across runs)
+    symbol_cache = SymbolCache.load(root / SYMBOL_CACHE_PATH)
+    removed, added, renamed = compare_symbols(since, root / code_path, root, diff_entries, symbol_cache)
+    symbol_cache.save()
 
     # Get file status (deleted, renamed)
-    file_status = get_file_status(since, root)
+    file_status = get_file_status(since, root, diff_entries)
     deleted_files = [f for f, s in file_status.items() if s == "D"]
-    renamed_file_pairs = get_renamed_files(since, root)
+    renamed_file_pairs = get_renamed_files(since, root, diff_entries)
 
-    # Collect doc references
+    # Collect doc references (docs tree walked and read once via the shared corpus)
     docs_dir = root / docs_path
+    corpus = load_docs_corpus(root, docs_dir)
     all_refs: list[DocReference] = []
 
-    for md_file in docs_dir.rglob("*.md"):
+    for doc in corpus.iter_docs(docs_dir):
         # Check exclusion patterns
-        rel_path = str(md_file.relative_to(root))
+        rel_path = str(doc.path.relative_to(root))
         if any(_matches_pattern(rel_path, pat) for pat in exclude_patterns):
             continue
 
-        refs = extract_refs_from_file(md_file, skip_fences)
-        all_refs.extend(refs)
+        all_refs.extend(extract_doc_references(doc.content, str(doc.path), skip_fences))
 
     # Also check root README.md
-    root_readme = root / "README.md"
-    if root_readme.exists():
-        all_refs.extend(extract_refs_from_file(root_readme, skip_fences))
+    root_readme = corpus.get(root / "README.md")
+    if root_readme is not None:
+        all_refs.extend(extract_doc_references(root_readme.content, str(root_readme.path), skip_fences))
 
     # Find stale references
     stale = find_stale_references(
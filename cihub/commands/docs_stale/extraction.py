@@ -3,14 +3,24 @@
 This module handles:
 1. Python symbol extraction via AST parsing (functions, classes, constants)
 2. Markdown reference extraction (backticks, CLI commands, file paths, etc.)
+
+Symbol extraction for many files goes through `SymbolCache`, which keys
+results by git blob SHA (persisted under .cihub/cache/) and parses cache
+misses in a process pool.
 """
 
 from __future__ import annotations
 
 import ast
+import hashlib
+import itertools
 import re
+import sys
 from pathlib import Path
 
+from cihub.utils.json_cache import load_json_cache, save_json_cache
+from cihub.utils.parallel import process_map
+
 from .types import (
     FALSE_POSITIVE_TOKENS,
     KIND_BACKTICK,
@@ -111,6 +121,116 @@ def extract_symbols_from_file(file_path: Path) -> list[CodeSymbol]:
         return []
 
 
+# Tracks the output of extract_python_symbols.
+SYMBOL_CACHE_VERSION = 1
+SYMBOL_CACHE_PATH = Path(".cihub") / "cache" / "docs-stale-symbols.json"
+# Upper bound on entries, in memory and on disk; least recently used blobs are dropped first.
+SYMBOL_CACHE_MAX_ENTRIES = 20000
+# Below this many cache misses, a process pool costs more than it saves.
+PARALLEL_MIN_FILES = 8
+
+SymbolRow = tuple[str, str, int]
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Return the git blob SHA-1 for raw file bytes (same as `git hash-object`)."""
+    header = f"blob {len(data)}\0".encode()
+    return hashlib.sha1(header + data, usedforsecurity=False).hexdigest()
+
+
+def _symbol_rows(content: str) -> list[SymbolRow]:
+    """Extract (name, kind, line) rows; top-level so process pools can pickle it."""
+    return [(s.name, s.kind, s.line) for s in extract_python_symbols(content)]
+
+
+class SymbolCache:
+    """Symbol extraction results keyed by git blob SHA.
+
+    Blobs are content-addressed, so a cached entry is valid for any ref or
+    path holding the same bytes. Entries are persisted as JSON when a path
+    is given; the cache is discarded if the version or Python minor version
+    (which decides what `ast.parse` accepts) differs.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self.entries: dict[str, list[SymbolRow]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> SymbolCache:
+        cache = cls(path)
+        payload = load_json_cache(path, SYMBOL_CACHE_VERSION, python=_python_tag()) or {}
+        blobs = payload.get("blobs")
+        if not isinstance(blobs, dict):
+            return cache
+        for sha, rows in blobs.items():
+            try:
+                cache.entries[sha] = [(str(name), str(kind), int(line)) for name, kind, line in rows]
+            except (TypeError, ValueError):
+                continue
+        return cache
+
+    def save(self) -> None:
+        """Persist the most recently used SYMBOL_CACHE_MAX_ENTRIES blobs."""
+        if self.path is None or not self._dirty:
+            return
+        blobs = dict(list(self.entries.items())[-SYMBOL_CACHE_MAX_ENTRIES:])
+        if save_json_cache(self.path, SYMBOL_CACHE_VERSION, {"blobs": blobs}, python=_python_tag()):
+            self._dirty = False
+
+    def __contains__(self, blob_sha: str) -> bool:
+        return blob_sha in self.entries
+
+    def has(self, blob_sha: str) -> bool:
+        """Return True if the blob is cached, counting it as a hit."""
+        if blob_sha in self.entries:
+            self.hits += 1
+            return True
+        return False
+
+    def get(self, blob_sha: str) -> list[SymbolRow] | None:
+        rows = self.entries.pop(blob_sha, None)
+        if rows is None:
+            return None
+        # Re-insert so recently used blobs survive the size cap on save
+        self.entries[blob_sha] = rows
+        return rows
+
+    def names(self, blob_sha: str) -> set[str]:
+        rows = self.get(blob_sha)
+        return {name for name, _, _ in rows} if rows else set()
+
+    def extract_many(self, sources: dict[str, str], max_workers: int | None = None) -> None:
+        """Parse every blob in `sources` (sha -> content) that is not cached yet.
+
+        Misses are parsed in a process pool when there are enough of them;
+        the pool falls back to serial parsing if it cannot start.
+        """
+        missing = {sha: content for sha, content in sources.items() if sha not in self.entries}
+        self.hits += len(sources) - len(missing)
+        self.misses += len(missing)
+        if not missing:
+            return
+
+        shas = list(missing)
+        contents = [missing[sha] for sha in shas]
+        results = process_map(_symbol_rows, contents, max_workers=max_workers, min_items=PARALLEL_MIN_FILES)
+        for sha, rows in zip(shas, results, strict=True):
+            self.entries[sha] = rows
+        self._dirty = True
+        # Never evict the blobs just parsed, even when they alone exceed the cap
+        excess = len(self.entries) - max(SYMBOL_CACHE_MAX_ENTRIES, len(missing))
+        for sha in list(itertools.islice(self.entries, max(excess, 0))):
+            del self.entries[sha]
+
+
+def _python_tag() -> str:
+    return f"{sys.version_info[0]}.{sys.version_info[1]}"
+
+
 # =============================================================================
 # Markdown Reference Extraction
 # =============================================================================
@@ -6,10 +6,20 @@ This module handles all git interactions needed for baseline comparison:
 3. Getting changed/deleted/renamed files
 4. Retrieving file content at specific refs
 5. Comparing symbols between base and head
+
+Status, renames and changed files all come from one `git diff --raw` call
+(`get_diff_entries`), and historical file content is read through a single
+long-lived `git cat-file --batch` process (`GitBatchReader`) instead of one
+`git show` per file. Symbols are memoized per blob SHA, so identical file
+content is only parsed once.
 """
 
 from __future__ import annotations
 
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
 from pathlib import Path
 
 from cihub.utils.exec_utils import (
@@ -18,8 +28,9 @@ from cihub.utils.exec_utils import (
     CommandTimeoutError,
     safe_run,
 )
+from cihub.utils.similarity import SimilarityIndex, similarity_ratio
 
-from .extraction import extract_python_symbols, extract_symbols_from_file
+from .extraction import SymbolCache, extract_python_symbols, git_blob_sha
 
 
 def _run_git(args: list[str], cwd: Path, timeout: int = TIMEOUT_QUICK) -> tuple[int, str, str]:
@@ -90,83 +101,281 @@ def get_merge_base(ref1: str, ref2: str, cwd: Path) -> str | None:
     return None
 
 
-def get_changed_files(since: str, cwd: Path) -> list[str]:
-    """Get list of Python files changed since a ref.
+# All-zero object name git uses for "no blob on this side" (added/deleted files).
+NULL_SHA = "0" * 40
+
+
+@dataclass(frozen=True)
+class DiffEntry:
+    """One file change from `git diff --raw`.
+
+    Attributes:
+        status: Status letter (A, C, D, M, R, T, U, X)
+        path: Path at head (new path for renames)
+        old_path: Path at base (differs from path only for renames/copies)
+        old_blob: Blob SHA at base (NULL_SHA if the file did not exist)
+    """
+
+    status: str
+    path: str
+    old_path: str
+    old_blob: str
+
+
+def get_diff_entries(since: str, cwd: Path) -> list[DiffEntry]:
+    """Get every file change since a ref with a single `git diff` call.
+
+    Uses `--raw --find-renames -z` so one process yields the status,
+    rename pairs and base blob SHAs needed by the other helpers.
 
     Args:
         since: Git reference to compare against
         cwd: Working directory
 
     Returns:
-        List of changed Python file paths (relative to cwd)
+        List of DiffEntry in git's output order (empty on error)
     """
     code, stdout, _ = _run_git(
-        ["diff", "--name-only", since, "--", "*.py"],
+        ["diff", "--raw", "--find-renames", "--no-abbrev", "-z", since],
         cwd,
     )
     if code != 0:
         return []
-    return [f for f in stdout.strip().split("\n") if f]
 
+    entries: list[DiffEntry] = []
+    fields = stdout.split("\0")
+    i = 0
+    while i < len(fields):
+        meta = fields[i]
+        i += 1
+        if not meta.startswith(":"):
+            continue
+        parts = meta[1:].split()
+        if len(parts) < 5:
+            continue
+        old_blob, status = parts[2], parts[4][0]
+        if status in ("R", "C"):
+            if i + 1 >= len(fields):
+                break
+            old_path, new_path = fields[i], fields[i + 1]
+            i += 2
+        else:
+            if i >= len(fields):
+                break
+            old_path = new_path = fields[i]
+            i += 1
+        entries.append(DiffEntry(status=status, path=new_path, old_path=old_path, old_blob=old_blob))
+    return entries
+
+
+def _changed_python_files(entries: list[DiffEntry]) -> list[str]:
+    return [e.path for e in entries if e.path.endswith(".py")]
+
+
+def _file_status(entries: list[DiffEntry]) -> dict[str, str]:
+    status: dict[str, str] = {}
+    for entry in entries:
+        if entry.status == "R":
+            # Renames: the old path is marked R and the new path A
+            status[entry.old_path] = "R"
+            status[entry.path] = "A"
+        else:
+            status[entry.path] = entry.status
+    return status
+
+
+def _renamed_files(entries: list[DiffEntry]) -> list[tuple[str, str]]:
+    return [(e.old_path, e.path) for e in entries if e.status == "R"]
 
-def get_file_status(since: str, cwd: Path) -> dict[str, str]:
+
+def get_changed_files(since: str, cwd: Path, entries: list[DiffEntry] | None = None) -> list[str]:
+    """Get list of Python files changed since a ref.
+
+    Args:
+        since: Git reference to compare against
+        cwd: Working directory
+        entries: Pre-fetched diff entries (avoids another git call)
+
+    Returns:
+        List of changed Python file paths (relative to cwd)
+    """
+    if entries is None:
+        entries = get_diff_entries(since, cwd)
+    return _changed_python_files(entries)
+
+
+def get_file_status(since: str, cwd: Path, entries: list[DiffEntry] | None = None) -> dict[str, str]:
     """Get file status (Added/Deleted/Modified/Renamed) since a ref.
 
-    Uses git diff --name-status to detect file changes including renames.
+    Uses git diff with rename detection to detect file changes including renames.
 
     Args:
         since: Git reference to compare against
         cwd: Working directory
+        entries: Pre-fetched diff entries (avoids another git call)
 
     Returns:
         Dict mapping file path to status (A/D/M/R)
     """
-    code, stdout, _ = _run_git(
-        ["diff", "--name-status", "--find-renames", since],
-        cwd,
-    )
-    if code != 0:
-        return {}
+    if entries is None:
+        entries = get_diff_entries(since, cwd)
+    return _file_status(entries)
 
-    status: dict[str, str] = {}
-    for line in stdout.strip().split("\n"):
-        if not line:
-            continue
-        parts = line.split("\t")
-        if len(parts) >= 2:
-            stat = parts[0][0]  # First char of status (A, D, M, R)
-            path = parts[1]
-            status[path] = stat
-            # Handle renames: "R100\told_path\tnew_path"
-            if stat == "R" and len(parts) >= 3:
-                old_path = parts[1]
-                new_path = parts[2]
-                status[old_path] = "R"
-                status[new_path] = "A"
 
-    return status
+# Longest wait for one object from `git cat-file --batch` before it is given up on
+BATCH_READ_TIMEOUT_SECONDS = TIMEOUT_QUICK
+
 
+class GitBatchReader:
+    """Reads git objects through one long-lived `git cat-file --batch` process.
 
-def get_file_at_ref(ref: str, file_path: str, cwd: Path) -> str | None:
+    Use as a context manager. If the batch process cannot be started, dies
+    or does not answer within BATCH_READ_TIMEOUT_SECONDS, it is killed and
+    reads fall back to one-shot `git show` calls.
+    """
+
+    def __init__(self, cwd: Path) -> None:
+        self.cwd = cwd
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._broken = False
+
+    def __enter__(self) -> GitBatchReader:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _process(self) -> subprocess.Popen[bytes] | None:
+        if self._proc is None and not self._broken:
+            try:
+                self._proc = subprocess.Popen(  # noqa: S603
+                    ["git", "cat-file", "--batch"],  # noqa: S607
+                    cwd=self.cwd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError:
+                self._broken = True
+        return self._proc
+
+    def read(self, object_name: str) -> str | None:
+        """Return blob content for an object name (SHA or `ref:path`), or None."""
+        if "\n" in object_name:
+            return None
+        proc = self._process()
+        if proc is None:
+            return self._show(object_name)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cihub-cat-file")
+        # Pipe reads cannot time out by themselves, so they run on a helper thread
+        pending = self._pool.submit(self._read_batch, proc, object_name)
+        try:
+            return pending.result(timeout=BATCH_READ_TIMEOUT_SECONDS)
+        except (OSError, ValueError, FutureTimeoutError):
+            # Killing git also ends a read that is still blocked on its pipe
+            proc.kill()
+            self.close()
+            self._broken = True
+            return self._show(object_name)
+
+    @staticmethod
+    def _read_batch(proc: subprocess.Popen[bytes], object_name: str) -> str | None:
+        if proc.stdin is None or proc.stdout is None:
+            raise OSError("cat-file pipes are not open")
+        proc.stdin.write(object_name.encode("utf-8") + b"\n")
+        proc.stdin.flush()
+        header = proc.stdout.readline().split()
+        if len(header) != 3:
+            # "<name> missing" / "<name> ambiguous"
+            return None
+        size = int(header[2])
+        data = proc.stdout.read(size)
+        proc.stdout.read(1)  # trailing newline
+        if header[1] != b"blob":
+            return None
+        return data.decode("utf-8", errors="replace")
+
+    def _show(self, object_name: str) -> str | None:
+        code, stdout, _ = _run_git(["show", object_name], self.cwd)
+        return stdout if code == 0 else None
+
+    def close(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait(timeout=TIMEOUT_QUICK)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        finally:
+            if proc.stdout is not None:
+                proc.stdout.close()
+
+
+def get_file_at_ref(ref: str, file_path: str, cwd: Path, reader: GitBatchReader | None = None) -> str | None:
     """Get file content at a specific git ref.
 
-    Uses `git show ref:path` to retrieve historical file content.
+    Uses the batch reader when given, otherwise `git show ref:path`.
 
     Args:
         ref: Git reference (commit hash, branch, tag, etc.)
         file_path: Path to the file (relative to repo root)
         cwd: Working directory
+        reader: Shared batch reader (optional)
 
     Returns:
         File content as string, or None if file doesn't exist at ref
     """
+    if reader is not None:
+        return reader.read(f"{ref}:{file_path}")
     code, stdout, _ = _run_git(["show", f"{ref}:{file_path}"], cwd)
     if code == 0:
         return stdout
     return None
 
 
-def get_symbols_at_ref(ref: str, file_path: str, cwd: Path) -> set[str]:
+# In-process symbol cache used when callers do not supply a persisted one
+# (bounded like every SymbolCache, see SYMBOL_CACHE_MAX_ENTRIES).
+_SYMBOL_CACHE = SymbolCache()
+
+
+def get_symbols_for_blob(
+    blob_sha: str,
+    file_path: str,
+    reader: GitBatchReader,
+    cache: SymbolCache | None = None,
+) -> set[str]:
+    """Get symbol names for a blob, parsing each distinct blob at most once.
+
+    Args:
+        blob_sha: Full blob SHA (NULL_SHA means the file does not exist)
+        file_path: Path used for symbol attribution
+        reader: Shared batch reader
+        cache: Symbol cache (defaults to an in-process cache)
+
+    Returns:
+        Set of symbol names found in the blob
+    """
+    if blob_sha == NULL_SHA:
+        return set()
+    cache = cache if cache is not None else _SYMBOL_CACHE
+    if not cache.has(blob_sha):
+        content = reader.read(blob_sha)
+        if content is None:
+            return set()
+        cache.extract_many({blob_sha: content})
+    return cache.names(blob_sha)
+
+
+def get_symbols_at_ref(ref: str, file_path: str, cwd: Path, reader: GitBatchReader | None = None) -> set[str]:
     """Get symbol names from a file at a specific git ref.
 
     Retrieves the file content at the given ref and parses it with AST
@@ -176,11 +385,12 @@ def get_symbols_at_ref(ref: str, file_path: str, cwd: Path) -> set[str]:
         ref: Git reference
         file_path: Path to the Python file
         cwd: Working directory
+        reader: Shared batch reader (optional)
 
     Returns:
         Set of symbol names found in the file
     """
-    content = get_file_at_ref(ref, file_path, cwd)
+    content = get_file_at_ref(ref, file_path, cwd, reader)
     if content is None:
         return set()
     symbols = extract_python_symbols(content, file_path)
@@ -207,15 +417,15 @@ def _similarity_ratio(s1: str, s2: str) -> float:
     if not s1 or not s2:
         return 0.0
 
-    from difflib import SequenceMatcher
-
-    return SequenceMatcher(None, s1, s2).ratio()
+    return similarity_ratio(s1, s2)
 
 
 def compare_symbols(
     since: str,
     code_path: Path,
     cwd: Path,
+    entries: list[DiffEntry] | None = None,
+    cache: SymbolCache | None = None,
 ) -> tuple[set[str], set[str], list[tuple[str, str]]]:
     """Compare symbols between base and head.
 
@@ -228,6 +438,8 @@ def compare_symbols(
         since: Git reference for the base
         code_path: Path to code directory (relative to cwd)
         cwd: Working directory
+        entries: Pre-fetched diff entries (avoids another git call)
+        cache: Blob-SHA keyed symbol cache (defaults to an in-process cache)
 
     Returns:
         Tuple of:
@@ -235,21 +447,50 @@ def compare_symbols(
         - added: Symbols that exist at head but not at base
         - renamed: List of (old_name, new_name) for likely renames
     """
-    changed_files = get_changed_files(since, cwd)
+    if entries is None:
+        entries = get_diff_entries(since, cwd)
 
+    cache = cache if cache is not None else _SYMBOL_CACHE
     base_symbols: set[str] = set()
-    head_symbols: set[str] = set()
+    base_blobs: list[str] = []
+    head_blobs: list[str] = []
+    sources: dict[str, str] = {}
+
+    with GitBatchReader(cwd) as reader:
+        for entry in entries:
+            file_path = entry.path
+            if not file_path.endswith(".py"):
+                continue
+
+            # Symbols at base: the file's blob at `since`, if it existed there
+            if entry.old_path != file_path:
+                base_symbols.update(get_symbols_at_ref(since, file_path, cwd, reader))
+            elif entry.old_blob != NULL_SHA:
+                base_blobs.append(entry.old_blob)
+                if entry.old_blob not in sources and not cache.has(entry.old_blob):
+                    content = reader.read(entry.old_blob)
+                    if content is not None:
+                        sources[entry.old_blob] = content
+
+            # Symbols at head (current working tree), keyed by the blob SHA of its bytes
+            full_path = cwd / file_path
+            try:
+                data = full_path.read_bytes()
+                head_sha = git_blob_sha(data)
+                if head_sha not in sources and not cache.has(head_sha):
+                    sources[head_sha] = data.decode("utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            head_blobs.append(head_sha)
 
-    for file_path in changed_files:
-        # Get symbols at base
-        base = get_symbols_at_ref(since, file_path, cwd)
-        base_symbols.update(base)
+    # Parse every cache miss in one (possibly parallel) batch
+    cache.extract_many(sources)
 
-        # Get symbols at head (current working tree)
-        full_path = cwd / file_path
-        if full_path.exists():
-            head = {s.name for s in extract_symbols_from_file(full_path)}
-            head_symbols.update(head)
+    for blob in base_blobs:
+        base_symbols.update(cache.names(blob))
+    head_symbols: set[str] = set()
+    for blob in head_blobs:
+        head_symbols.update(cache.names(blob))
 
     removed = base_symbols - head_symbols
     added = head_symbols - base_symbols
@@ -264,11 +505,17 @@ def compare_symbols(
     # 0.7 catches most renames while avoiding false positives
     MIN_SIMILARITY = 0.7
 
+    # Candidate generation skips added symbols that cannot reach the threshold;
+    # candidates keep the iteration order of `added`, so ties resolve the same way.
+    added_order = list(added)
+    index = SimilarityIndex(added_order, MIN_SIMILARITY)
+
     for old in list(removed):
         best_match: str | None = None
         best_score = 0.0
 
-        for new in added:
+        for idx in index.candidates(old):
+            new = added_order[idx]
             if new in used_added:
                 continue
 
@@ -290,31 +537,17 @@ def compare_symbols(
     return removed, added, renamed
 
 
-def get_renamed_files(since: str, cwd: Path) -> list[tuple[str, str]]:
+def get_renamed_files(since: str, cwd: Path, entries: list[DiffEntry] | None = None) -> list[tuple[str, str]]:
     """Get list of renamed files since a ref.
 
     Args:
         since: Git reference to compare against
         cwd: Working directory
+        entries: Pre-fetched diff entries (avoids another git call)
 
     Returns:
         List of (old_path, new_path) tuples for renamed files
     """
-    code, stdout, _ = _run_git(
-        ["diff", "--name-status", "--find-renames", since],
-        cwd,
-    )
-    if code != 0:
-        return []
-
-    renamed: list[tuple[str, str]] = []
-    for line in stdout.strip().split("\n"):
-        if not line:
-            continue
-        parts = line.split("\t")
-        if len(parts) >= 3 and parts[0].startswith("R"):
-            old_path = parts[1]
-            new_path = parts[2]
-            renamed.append((old_path, new_path))
-
-    return renamed
+    if entries is None:
+        entries = get_diff_entries(since, cwd)
+    return _renamed_files(entries)
@@ -529,7 +529,7 @@ def cmd_validate_triage(args: argparse.Namespace) -> CommandResult:
     """
     import json
 
-    import jsonschema
+    from cihub.utils.json_schema import error_path, get_validator
 
     triage_path = Path(getattr(args, "path", None) or ".cihub/triage.json")
     if not triage_path.is_absolute():
@@ -561,7 +561,7 @@ def cmd_validate_triage(args: argparse.Namespace) -> CommandResult:
         )
 
     try:
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        validator = get_validator(schema_path)
     except json.JSONDecodeError as e:
         return CommandResult(
             exit_code=EXIT_FAILURE,
@@ -570,17 +570,15 @@ def cmd_validate_triage(args: argparse.Namespace) -> CommandResult:
         )
 
     # Validate
-    validator = jsonschema.Draft7Validator(schema)
     errors = list(validator.iter_errors(triage_data))
 
     if errors:
         problems = []
         for err in errors[:10]:  # Limit to first 10 errors
-            path = ".".join(str(p) for p in err.path) or "<root>"
             problems.append(
                 {
                     "severity": "error",
-                    "message": f"{path}: {err.message}",
+                    "message": f"{error_path(err)}: {err.message}",
                     "code": "CIHUB-TRIAGE-SCHEMA-VIOLATION",
                 }
             )
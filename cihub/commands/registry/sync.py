@@ -7,6 +7,7 @@ from pathlib import Path
 
 from cihub.exit_codes import EXIT_FAILURE, EXIT_SUCCESS, EXIT_USAGE
 from cihub.services.registry_service import (
+    DIFF_CACHE_PATH,
     bootstrap_from_configs,
     compute_diff,
     load_registry,
@@ -120,6 +121,7 @@ def _cmd_diff(args: argparse.Namespace) -> CommandResult:
         configs_dir,
         hub_root_path=hub_root_for_target,
         repo_paths=repo_paths,
+        cache_path=hub_root_for_target / DIFF_CACHE_PATH,
     )
 
     if not diffs:
@@ -65,16 +65,18 @@ def _cmd_list(args: argparse.Namespace) -> CommandResult:
     tier_filter = getattr(args, "tier", None)
     with_overrides = getattr(args, "with_overrides", False)
 
-    from cihub.services.registry_service import list_repos, load_registry
+    from cihub.services.registry_service import RegistryIndex
 
-    registry = load_registry()
-    repos = list_repos(registry)
+    index = RegistryIndex.load()
 
-    # Apply filters
+    # Apply index filters first so effective thresholds are only computed for matching repos
+    names = index.names()
     if language:
-        repos = [r for r in repos if r.get("language") == language]
+        names = index.by_language(language)
     if tier_filter:
-        repos = [r for r in repos if r.get("tier") == tier_filter]
+        in_tier = set(index.by_tier(tier_filter))
+        names = [name for name in names if name in in_tier]
+    repos = [entry for entry in (index.entry(name) for name in names) if entry is not None]
     if with_overrides:
         repos = [r for r in repos if r.get("has_threshold_overrides", False)]
 
@@ -15,6 +15,7 @@ from cihub.ci_report import (
     build_java_report,
     build_python_report,
 )
+from cihub.core.aggregation.store import FleetMetricsStore
 from cihub.exit_codes import EXIT_FAILURE, EXIT_SUCCESS, EXIT_USAGE
 from cihub.reporting import render_summary_from_path
 from cihub.types import CommandResult
@@ -199,9 +200,13 @@ def cmd_report(args: argparse.Namespace) -> CommandResult:
         output_path = Path(args.output)
         output_format = getattr(args, "format", "html")
         schema_mode = getattr(args, "schema_mode", "warn")
+        metrics_store = getattr(args, "metrics_store", None)
+        store = FleetMetricsStore.load(Path(metrics_store)) if metrics_store else None
 
         # Load reports
-        reports, skipped, warnings = _load_dashboard_reports(reports_dir, schema_mode)
+        reports, skipped, warnings = _load_dashboard_reports(reports_dir, schema_mode, store)
+        if store is not None:
+            store.save()
 
         # Generate summary
         dashboard_summary = _generate_dashboard_summary(reports)
@@ -111,6 +111,7 @@ def _aggregate_report(args: argparse.Namespace) -> CommandResult:
             details_file=details_file,
             include_details=include_details,
             strict=bool(args.strict),
+            metrics_store=Path(args.metrics_store) if getattr(args, "metrics_store", None) else None,
         )
         _emit_aggregate_debug_context(
             args=args,
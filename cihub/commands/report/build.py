@@ -21,6 +21,7 @@ from cihub.utils.debug import emit_debug_context
 
 from .helpers import (
     _build_context,
+    _load_dependency_cache,
     _load_tool_outputs,
     _tool_enabled,
 )
@@ -123,6 +124,7 @@ def _build_report(args: argparse.Namespace) -> CommandResult:
 
     language = config.get("language") or ""
     tool_outputs = _load_tool_outputs(tool_dir)
+    dependency_cache = _load_dependency_cache(output_dir)
 
     if language == "python":
         # Include built-in and custom tools; custom tools default to enabled=True per schema
@@ -139,7 +141,9 @@ def _build_report(args: argparse.Namespace) -> CommandResult:
             tools_ran["hypothesis"] = tools_ran.get("pytest", False)
             tools_success["hypothesis"] = tools_success.get("pytest", False)
         thresholds = resolve_thresholds(config, "python")
-        context = _build_context(repo_path, config, args.workdir or ".", args.correlation_id)
+        context = _build_context(
+            repo_path, config, args.workdir or ".", args.correlation_id, dependency_cache=dependency_cache
+        )
         report = build_python_report(
             config,
             tool_outputs,
@@ -181,6 +185,7 @@ def _build_report(args: argparse.Namespace) -> CommandResult:
             project_type=project_type,
             docker_compose_file=docker_cfg.get("compose_file"),
             docker_health_endpoint=docker_cfg.get("health_endpoint"),
+            dependency_cache=dependency_cache,
         )
         report = build_java_report(
             config,
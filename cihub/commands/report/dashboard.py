@@ -3,20 +3,25 @@
 from __future__ import annotations
 
 import html
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from cihub.core.aggregation.store import FleetMetricsStore
+
 
 def _load_dashboard_reports(
-    reports_dir: Path, schema_mode: str = "warn"
+    reports_dir: Path, schema_mode: str = "warn", store: FleetMetricsStore | None = None
 ) -> tuple[list[dict[str, Any]], int, list[str]]:
     """Load all report JSON files from the reports directory.
 
+    Reports are projected down to the fields the dashboard reads, so large
+    fleets are never held in memory as full report payloads.
+
     Args:
         reports_dir: Directory containing report.json files
         schema_mode: "warn" to warn on non-2.0 schema, "strict" to skip them
+        store: Optional metrics store; unchanged reports reuse their stored rows
 
     Returns:
         Tuple of (reports list, skipped count, warnings)
@@ -28,25 +33,29 @@ def _load_dashboard_reports(
     if not reports_dir.exists():
         return reports, skipped, warnings
 
-    for report_file in reports_dir.glob("**/report.json"):
-        try:
-            with report_file.open(encoding="utf-8") as f:
-                report = json.load(f)
-                report["_source_file"] = str(report_file)
-
-                # Validate schema version
-                schema_version = report.get("schema_version")
-                if schema_version != "2.0":
-                    if schema_mode == "strict":
-                        warnings.append(f"Skipping {report_file}: schema_version={schema_version}, expected '2.0'")
-                        skipped += 1
-                        continue
-                    else:
-                        warnings.append(f"{report_file} has schema_version={schema_version}, expected '2.0'")
-
-                reports.append(report)
-        except (json.JSONDecodeError, OSError) as e:
-            warnings.append(f"Could not load {report_file}: {e}")
+    if store is None:
+        store = FleetMetricsStore()
+    store.ingest(reports_dir)
+
+    for run in store.runs(reports_dir):
+        report_file = run.path
+        if run.report is None:
+            warnings.append(f"Could not load {report_file}: {run.error}")
+            continue
+        report = dict(run.report)
+        report["_source_file"] = str(report_file)
+
+        # Validate schema version
+        schema_version = report.get("schema_version")
+        if schema_version != "2.0":
+            if schema_mode == "strict":
+                warnings.append(f"Skipping {report_file}: schema_version={schema_version}, expected '2.0'")
+                skipped += 1
+                continue
+            else:
+                warnings.append(f"{report_file} has schema_version={schema_version}, expected '2.0'")
+
+        reports.append(report)
 
     return reports, skipped, warnings
 
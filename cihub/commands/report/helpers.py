@@ -9,6 +9,7 @@ from typing import Any
 
 from cihub.ci_report import RunContext
 from cihub.config import tool_enabled as _tool_enabled_canonical
+from cihub.core.ci_report import DEPENDENCY_CACHE_FILE
 from cihub.utils import (
     _get_repo_name,
     get_git_branch,
@@ -39,6 +40,7 @@ def _build_context(
     project_type: str | None = None,
     docker_compose_file: str | None = None,
     docker_health_endpoint: str | None = None,
+    dependency_cache: dict[str, Any] | None = None,
 ) -> RunContext:
     repo_info = config.get("repo", {}) if isinstance(config.get("repo"), dict) else {}
     ctx = GitHubContext.from_env()
@@ -58,6 +60,7 @@ def _build_context(
         project_type=project_type,
         docker_compose_file=docker_compose_file,
         docker_health_endpoint=docker_health_endpoint,
+        dependency_cache=dependency_cache,
     )
 
 
@@ -74,6 +77,16 @@ def _load_tool_outputs(tool_dir: Path) -> dict[str, dict[str, Any]]:
     return outputs
 
 
+def _load_dependency_cache(output_dir: Path) -> dict[str, Any] | None:
+    """Dependency install cache outcome that `cihub ci` left in output_dir, if any."""
+    try:
+        with (output_dir / DEPENDENCY_CACHE_FILE).open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
 def _resolve_write_summary(flag: bool | None) -> bool:
     if flag is not None:
         return flag
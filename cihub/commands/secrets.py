@@ -7,6 +7,7 @@ import json
 import os
 import urllib.error
 import urllib.request
+from functools import partial
 from typing import Any
 
 from cihub.exit_codes import EXIT_FAILURE, EXIT_SUCCESS, EXIT_USAGE
@@ -19,6 +20,17 @@ from cihub.utils.exec_utils import (
     CommandTimeoutError,
     safe_run,
 )
+from cihub.utils.fleet import (
+    FLEET_DEFAULT_WORKERS,
+    FLEET_JOURNAL_DIR,
+    FleetJournal,
+    RateBudget,
+    budgeted_call,
+    fleet_map,
+    is_rate_limited,
+    journal_key,
+    secret_digest,
+)
 from cihub.utils.net import safe_urlopen
 
 
@@ -115,6 +127,51 @@ def _set_secret(gh_bin: str, repo: str, secret_name: str, secret_value: str) ->
     return True, ""
 
 
+def _set_secret_on_repos(
+    gh_bin: str,
+    repos: list[str],
+    secret_name: str,
+    secret_value: str,
+    *,
+    jobs: int | None = None,
+    resume: bool = True,
+) -> list[tuple[str, bool, str]]:
+    """Set one secret on many repos concurrently within a shared rate budget.
+
+    Progress is journaled per repo, so an interrupted run with the same secret
+    and repos only revisits the repos that did not succeed.
+
+    Returns:
+        (repo, ok, error) per repo, in input order
+    """
+    budget = RateBudget()
+    journal = FleetJournal(None, "")
+    digest = secret_digest(secret_value) if resume and repos else None
+    if digest is not None:
+        key = journal_key("setup-secrets", secret_name, digest, repos)
+        journal = FleetJournal.load(FLEET_JOURNAL_DIR / f"secret-{secret_name.lower()}.jsonl", key)
+
+    def attempt(repo: str) -> tuple[bool, str]:
+        ok, error = _set_secret(gh_bin, repo, secret_name, secret_value)
+        if not ok and is_rate_limited(error):
+            raise RuntimeError(error)
+        return ok, error
+
+    def set_one(repo: str) -> tuple[str, bool, str]:
+        if journal.completed(repo) is not None:
+            return repo, True, ""
+        try:
+            ok, error = budgeted_call(budget, partial(attempt, repo))
+        except RuntimeError as exc:
+            ok, error = False, str(exc)
+        journal.record(repo, ok, {})
+        return repo, ok, error
+
+    outcomes = fleet_map(set_one, repos, max_workers=jobs or FLEET_DEFAULT_WORKERS)
+    journal.finish(clean=all(ok for _, ok, _ in outcomes))
+    return outcomes
+
+
 def cmd_setup_secrets(args: argparse.Namespace) -> CommandResult:
     """Set HUB_DISPATCH_TOKEN on hub and optionally all connected repos."""
     import getpass
@@ -249,11 +306,16 @@ def cmd_setup_secrets(args: argparse.Namespace) -> CommandResult:
     failures = 0
     if args.all:
         messages.append("Setting on connected repos...")
-        repos = get_connected_repos()
-        for repo in repos:
-            if repo == hub_repo:
-                continue
-            ok, error = _set_secret(gh_bin, repo, "HUB_DISPATCH_TOKEN", token)
+        repos = [repo for repo in get_connected_repos() if repo != hub_repo]
+        outcomes = _set_secret_on_repos(
+            gh_bin,
+            repos,
+            "HUB_DISPATCH_TOKEN",
+            token,
+            jobs=getattr(args, "jobs", None),
+            resume=not getattr(args, "no_resume", False),
+        )
+        for repo, ok, error in outcomes:
             if ok:
                 messages.append(f"[OK] {repo}")
                 repo_results.append({"repo": repo, "status": "updated"})
@@ -394,8 +456,15 @@ def cmd_setup_nvd(args: argparse.Namespace) -> CommandResult:
     success_count = 0
     repo_results: list[dict[str, str]] = []
 
-    for repo in java_repos:
-        ok, error = _set_secret(gh_bin, repo, "NVD_API_KEY", nvd_key)
+    outcomes = _set_secret_on_repos(
+        gh_bin,
+        java_repos,
+        "NVD_API_KEY",
+        nvd_key,
+        jobs=getattr(args, "jobs", None),
+        resume=not getattr(args, "no_resume", False),
+    )
+    for repo, ok, error in outcomes:
         if ok:
             messages.append(f"[OK] {repo}")
             success_count += 1
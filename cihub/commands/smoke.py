@@ -1,26 +1,48 @@
-"""Smoke test helper for the CLI."""
+"""Smoke test helper for the CLI.
+
+Fixture types are scaffolded once into pristine templates, cached in the
+FIXTURE_CACHE_SUBDIR directory of the private per-user cache (user_cache_dir)
+and keyed on a hash of their scaffold sources; each case
+gets its own copy of a template as its workspace. With more than one job,
+cases run concurrently, each in its own `cihub smoke <workspace>` process
+whose output is buffered and replayed in case order.
+"""
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
+import cihub
+from cihub import __version__
 from cihub.commands.ci import cmd_ci
 from cihub.commands.detect import cmd_detect
 from cihub.commands.init import cmd_init
-from cihub.commands.scaffold import SCAFFOLD_TYPES, scaffold_fixture
+from cihub.commands.scaffold import SCAFFOLD_TYPES, _template_root, scaffold_fixture
 from cihub.commands.validate import cmd_validate
 from cihub.config.io import load_yaml_file, save_yaml_file
 from cihub.exit_codes import EXIT_FAILURE, EXIT_SUCCESS, EXIT_USAGE
 from cihub.types import CommandResult
-from cihub.utils.paths import validate_repo_path
+from cihub.utils.exec_utils import TIMEOUT_EXTENDED, CommandNotFoundError, CommandTimeoutError, safe_run
+from cihub.utils.parallel import default_workers
+from cihub.utils.paths import user_cache_dir, validate_repo_path
 
 DEFAULT_TYPES = ["python-pyproject", "java-maven"]
 # Use keys from SCAFFOLD_TYPES to ensure consistency
 ALL_TYPES = list(SCAFFOLD_TYPES.keys())
+FIXTURE_CACHE_SUBDIR = "smoke-fixtures"
+# Scaffold template directories each fixture type is built from
+_FIXTURE_SOURCES = {"monorepo": ("java-maven", "python-pyproject")}
 
 
 @dataclass
@@ -292,6 +314,129 @@ def _run_case(
     return steps, language
 
 
+def _fixture_source_hash(fixture_type: str) -> str:
+    """Digest of everything a fixture is scaffolded from (template files and cihub version)."""
+    h = hashlib.sha256(f"{__version__}\0{fixture_type}".encode())
+    root = _template_root()
+    for source in _FIXTURE_SOURCES.get(fixture_type, (fixture_type,)):
+        source_dir = root / source
+        for path in sorted(source_dir.rglob("*")):
+            if path.is_file():
+                h.update(f"\0{source}/{path.relative_to(source_dir).as_posix()}\0".encode())
+                h.update(path.read_bytes())
+    return h.hexdigest()[:16]
+
+
+def _fixture_template(fixture_type: str, cache_dir: Path) -> Path:
+    """Pristine scaffold of a fixture type, generated once per scaffold source hash.
+
+    Templates are published with an atomic rename, so concurrent smoke runs
+    never see a half-written one. Templates of older sources are removed.
+    """
+    digest = _fixture_source_hash(fixture_type)
+    template = cache_dir / f"{fixture_type}-{digest}"
+    if template.is_dir():
+        return template
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{fixture_type}-", dir=cache_dir))
+    try:
+        scaffold_fixture(fixture_type, staging / "repo", force=True)
+        try:
+            (staging / "repo").rename(template)
+        except OSError:
+            if not template.is_dir():
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    stale = re.compile(rf"{re.escape(fixture_type)}-[0-9a-f]{{16}}")
+    for old in cache_dir.iterdir():
+        if old != template and stale.fullmatch(old.name):
+            shutil.rmtree(old, ignore_errors=True)
+    return template
+
+
+def _fixture_cache_dir() -> Path | None:
+    """The fixture template cache, or None when no private cache directory is available."""
+    try:
+        return user_cache_dir(FIXTURE_CACHE_SUBDIR)
+    except OSError:
+        return None
+
+
+def _prepare_workspace(fixture_type: str, dest: Path, cache_dir: Path | None) -> None:
+    """Give a case its own copy of the fixture template (scaffolding directly if the cache is unusable).
+
+    Workspaces are full copies rather than hardlink trees: init and the smoke
+    overrides rewrite files in place, which would corrupt a hardlinked template.
+    """
+    if cache_dir is not None:
+        try:
+            template = _fixture_template(fixture_type, cache_dir)
+            if dest.exists():
+                shutil.rmtree(dest)
+            shutil.copytree(template, dest, symlinks=True)
+            return
+        except OSError:
+            pass
+    scaffold_fixture(fixture_type, dest, force=True)
+
+
+def _smoke_case_command(case: SmokeCase, full: bool, install_deps: bool, relax: bool, force: bool) -> list[str]:
+    cmd = [sys.executable, "-m", "cihub", "smoke", str(case.repo_path), "--json"]
+    if case.subdir:
+        cmd += ["--subdir", case.subdir]
+    if full:
+        cmd.append("--full")
+    if install_deps:
+        cmd.append("--install-deps")
+    # Generated fixtures always run with relaxed overrides (see _run_case)
+    if relax or case.generated:
+        cmd.append("--relax")
+    if force:
+        cmd.append("--force")
+    return cmd
+
+
+def _run_case_isolated(
+    case: SmokeCase,
+    full: bool,
+    install_deps: bool,
+    relax: bool,
+    force: bool,
+) -> tuple[list[SmokeStep], str | None, str]:
+    """Run one case in its own cihub process (no shared cwd, env or stdio with other cases).
+
+    Returns:
+        The case's steps, its detected language and its buffered stderr output
+    """
+    cmd = _smoke_case_command(case, full, install_deps, relax, force)
+    env = os.environ.copy()
+    package_parent = str(Path(cihub.__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_parent, env.get("PYTHONPATH")]))
+    try:
+        proc = safe_run(cmd, env=env, timeout=TIMEOUT_EXTENDED)
+    except (CommandNotFoundError, CommandTimeoutError) as exc:
+        return [SmokeStep(name="run", exit_code=EXIT_FAILURE, summary=str(exc), problems=[])], None, ""
+    try:
+        payload = json.loads(proc.stdout)
+        case_data = payload["data"]["cases"][0]
+        steps = [
+            SmokeStep(
+                name=step["name"],
+                exit_code=step["exit_code"],
+                summary=step["summary"],
+                problems=step["problems"],
+            )
+            for step in case_data["steps"]
+        ]
+        return steps, case_data.get("language"), proc.stderr
+    except (ValueError, KeyError, IndexError, TypeError):
+        message = (proc.stderr or proc.stdout).strip().splitlines()[-1:] or ["no output"]
+        problems = [{"severity": "error", "message": message[0]}]
+        step = SmokeStep(name="run", exit_code=proc.returncode or EXIT_FAILURE, summary=message[0], problems=problems)
+        return [step], None, proc.stderr
+
+
 def _resolve_types(args: argparse.Namespace) -> list[str]:
     if args.all:
         return ALL_TYPES
@@ -307,6 +452,9 @@ def _resolve_types(args: argparse.Namespace) -> list[str]:
 def cmd_smoke(args: argparse.Namespace) -> CommandResult:
     """Run smoke tests on repositories.
 
+    With --jobs above 1 (default: one per CPU), cases run concurrently in
+    separate processes; results and output keep case order.
+
     Always returns CommandResult for consistent output handling.
     """
     if args.repo and (args.all or args.type):
@@ -354,12 +502,13 @@ def cmd_smoke(args: argparse.Namespace) -> CommandResult:
             # Keep reference to context manager for cleanup
             temp_dir_ctx = tempfile.TemporaryDirectory(prefix="cihub-smoke-")
             temp_dir = Path(temp_dir_ctx.name)
+        cache_dir = _fixture_cache_dir()
         for fixture_type in types:
             if fixture_type == "monorepo":
                 for subdir in ["java", "python"]:
                     name = f"monorepo-{subdir}"
                     repo_path = temp_dir / name
-                    scaffold_fixture("monorepo", repo_path, force=True)
+                    _prepare_workspace("monorepo", repo_path, cache_dir)
                     cases.append(
                         SmokeCase(
                             name=name,
@@ -370,7 +519,7 @@ def cmd_smoke(args: argparse.Namespace) -> CommandResult:
                     )
             else:
                 repo_path = temp_dir / fixture_type
-                scaffold_fixture(fixture_type, repo_path, force=True)
+                _prepare_workspace(fixture_type, repo_path, cache_dir)
                 cases.append(
                     SmokeCase(
                         name=fixture_type,
@@ -384,40 +533,51 @@ def cmd_smoke(args: argparse.Namespace) -> CommandResult:
     items: list[str] = []  # Human-readable output
     failures = 0
 
-    for case in cases:
-        steps, language = _run_case(
-            case,
-            full=bool(args.full),
-            install_deps=bool(args.install_deps),
-            relax=bool(args.relax),
-            force=bool(args.force),
-        )
-        success = all(step.exit_code == EXIT_SUCCESS for step in steps)
-        failures += 0 if success else 1
-        results.append(
-            {
-                "name": case.name,
-                "repo": str(case.repo_path),
-                "subdir": case.subdir,
-                "language": language,
-                "success": success,
-                "steps": [
-                    {
-                        "name": step.name,
-                        "exit_code": step.exit_code,
-                        "summary": step.summary,
-                        "problems": step.problems,
-                    }
-                    for step in steps
-                ],
-            }
-        )
-        # Collect human-readable output
-        status = "OK" if success else "FAIL"
-        items.append(f"[{status}] {case.name}")
-        for step in steps:
-            step_status = "OK" if step.exit_code == EXIT_SUCCESS else "FAIL"
-            items.append(f"  - {step_status} {step.name}: {step.summary}")
+    options = {
+        "full": bool(args.full),
+        "install_deps": bool(args.install_deps),
+        "relax": bool(args.relax),
+        "force": bool(args.force),
+    }
+    jobs = max(1, min(getattr(args, "jobs", None) or default_workers(), len(cases)))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        if jobs > 1:
+            outcomes: Iterable[tuple[list[SmokeStep], str | None, str]] = pool.map(
+                lambda case: _run_case_isolated(case, **options), cases
+            )
+        else:
+            outcomes = ((*_run_case(case, **options), "") for case in cases)
+
+        for case, (steps, language, output) in zip(cases, outcomes, strict=True):
+            if output:
+                sys.stderr.write(output)
+                sys.stderr.flush()
+            success = all(step.exit_code == EXIT_SUCCESS for step in steps)
+            failures += 0 if success else 1
+            results.append(
+                {
+                    "name": case.name,
+                    "repo": str(case.repo_path),
+                    "subdir": case.subdir,
+                    "language": language,
+                    "success": success,
+                    "steps": [
+                        {
+                            "name": step.name,
+                            "exit_code": step.exit_code,
+                            "summary": step.summary,
+                            "problems": step.problems,
+                        }
+                        for step in steps
+                    ],
+                }
+            )
+            # Collect human-readable output
+            status = "OK" if success else "FAIL"
+            items.append(f"[{status}] {case.name}")
+            for step in steps:
+                step_status = "OK" if step.exit_code == EXIT_SUCCESS else "FAIL"
+                items.append(f"  - {step_status} {step.name}: {step.summary}")
 
     if temp_dir and args.keep:
         items.append(f"Fixtures preserved at: {temp_dir}")
@@ -436,6 +596,7 @@ def cmd_smoke(args: argparse.Namespace) -> CommandResult:
             "cases": results,
             "fixtures_root": str(temp_dir) if temp_dir else None,
             "full": bool(args.full),
+            "jobs": jobs,
             "items": items,
         },
     )
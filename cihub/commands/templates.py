@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import os
 import subprocess
+from functools import partial
 from typing import Any
 
 from cihub.exit_codes import EXIT_FAILURE, EXIT_SUCCESS, EXIT_USAGE
@@ -20,8 +21,185 @@ from cihub.utils.exec_utils import (
     CommandTimeoutError,
     safe_run,
 )
+from cihub.utils.fleet import (
+    BATCH_MIN_REPOS,
+    FLEET_DEFAULT_WORKERS,
+    FLEET_JOURNAL_DIR,
+    FleetJournal,
+    RateBudget,
+    budgeted_call,
+    fetch_remote_blob_shas,
+    fleet_map,
+    git_blob_sha,
+    journal_key,
+)
 from cihub.utils.github_api import delete_remote_file, fetch_remote_file, update_remote_file
 
+# Per-language workflows replaced by the unified hub-ci.yml
+STALE_WORKFLOW_NAMES = ("hub-java-ci.yml", "hub-python-ci.yml")
+
+
+def _remote_paths(entry: dict[str, Any]) -> tuple[str, str, list[str]]:
+    """(repo, branch, paths) whose remote state a repo's sync depends on."""
+    dispatch_workflow = entry.get("dispatch_workflow", "hub-ci.yml")
+    branch = entry.get("default_branch", "main") or "main"
+    paths = [f".github/workflows/{dispatch_workflow}"]
+    if dispatch_workflow == "hub-ci.yml":
+        paths += [f".github/workflows/{name}" for name in STALE_WORKFLOW_NAMES]
+    return entry["full"], branch, paths
+
+
+def _remote_file(
+    repo: str,
+    path: str,
+    branch: str,
+    remote_shas: dict[tuple[str, str, str], str | None],
+    budget: RateBudget,
+) -> dict[str, str] | None:
+    """Remote file state from the batched lookup, else from a per-repo fetch."""
+    key = (repo, branch, path)
+    if key in remote_shas:
+        sha = remote_shas[key]
+        return {"sha": sha} if sha else None
+    return budgeted_call(budget, lambda: fetch_remote_file(repo, path, branch))
+
+
+def _is_up_to_date(remote: dict[str, str] | None, desired: str) -> bool:
+    if not remote:
+        return False
+    if "content" in remote:
+        return remote["content"] == desired
+    return remote.get("sha") == git_blob_sha(desired)
+
+
+def _sync_repo(
+    entry: dict[str, Any],
+    desired: str | ValueError,
+    args: argparse.Namespace,
+    remote_shas: dict[tuple[str, str, str], str | None],
+    budget: RateBudget,
+) -> dict[str, Any]:
+    """Sync one repo's dispatch workflow and remove stale ones.
+
+    Returns:
+        Dict with the repo result, its messages and problems, and its failure count
+    """
+    repo = entry["full"]
+    dispatch_workflow = entry.get("dispatch_workflow", "hub-ci.yml")
+    branch = entry.get("default_branch", "main") or "main"
+    path = f".github/workflows/{dispatch_workflow}"
+    messages: list[str] = []
+    problems: list[dict[str, Any]] = []
+    failures = 0
+    repo_result: dict[str, Any] = {
+        "repo": repo,
+        "path": path,
+        "status": "unknown",
+        "stale": [],
+    }
+    outcome = {"result": repo_result, "messages": messages, "problems": problems}
+
+    if isinstance(desired, ValueError):
+        messages.append(f"[ERROR] {repo} {path}: {desired}")
+        problems.append(
+            {
+                "severity": "error",
+                "message": f"{repo} {path}: {desired}",
+                "code": "CIHUB-TEMPLATES-RENDER-ERROR",
+            }
+        )
+        repo_result["status"] = "error"
+        repo_result["message"] = str(desired)
+        return {**outcome, "failures": 1}
+
+    remote = _remote_file(repo, path, branch, remote_shas, budget)
+    workflow_synced = False
+
+    if _is_up_to_date(remote, desired):
+        messages.append(f"[OK] {repo} {path} up to date")
+        workflow_synced = True
+        repo_result["status"] = "up_to_date"
+    elif args.check:
+        messages.append(f"[FAIL] {repo} {path} out of date")
+        failures += 1
+        repo_result["status"] = "out_of_date"
+    elif args.dry_run:
+        messages.append(f"# Would update {repo} {path}")
+        repo_result["status"] = "would_update"
+    else:
+        try:
+            budgeted_call(
+                budget,
+                lambda: update_remote_file(
+                    repo,
+                    path,
+                    branch,
+                    desired,
+                    args.commit_message,
+                    remote.get("sha") if remote else None,
+                ),
+            )
+            messages.append(f"[OK] {repo} {path} updated")
+            workflow_synced = True
+            repo_result["status"] = "updated"
+        except RuntimeError as exc:
+            messages.append(f"[FAIL] {repo} {path} update failed: {exc}")
+            problems.append(
+                {
+                    "severity": "error",
+                    "message": f"{repo} {path} update failed: {exc}",
+                    "code": "CIHUB-TEMPLATES-UPDATE-FAILED",
+                }
+            )
+            failures += 1
+            repo_result["status"] = "failed"
+            repo_result["message"] = str(exc)
+
+    if dispatch_workflow == "hub-ci.yml":
+        for stale_name in STALE_WORKFLOW_NAMES:
+            stale_path = f".github/workflows/{stale_name}"
+            stale_file = _remote_file(repo, stale_path, branch, remote_shas, budget)
+            if stale_file and stale_file.get("sha"):
+                if args.check:
+                    messages.append(f"[FAIL] {repo} {stale_path} stale (should be deleted)")
+                    failures += 1
+                    repo_result["stale"].append({"path": stale_path, "status": "stale"})
+                elif args.dry_run:
+                    messages.append(f"# Would delete {repo} {stale_path} (stale)")
+                    repo_result["stale"].append({"path": stale_path, "status": "would_delete"})
+                elif workflow_synced:
+                    try:
+                        budgeted_call(
+                            budget,
+                            partial(
+                                delete_remote_file,
+                                repo,
+                                stale_path,
+                                branch,
+                                stale_file["sha"],
+                                "Remove stale workflow (migrated to hub-ci.yml)",
+                            ),
+                        )
+                        messages.append(f"[OK] {repo} {stale_path} deleted (stale)")
+                        repo_result["stale"].append({"path": stale_path, "status": "deleted"})
+                    except RuntimeError as exc:
+                        messages.append(f"[WARN] {repo} {stale_path} delete failed: {exc}")
+                        problems.append(
+                            {
+                                "severity": "warning",
+                                "message": f"{repo} {stale_path} delete failed: {exc}",
+                                "code": "CIHUB-TEMPLATES-DELETE-FAILED",
+                            }
+                        )
+                        repo_result["stale"].append(
+                            {
+                                "path": stale_path,
+                                "status": "delete_failed",
+                                "message": str(exc),
+                            }
+                        )
+    return {**outcome, "failures": failures}
+
 
 def cmd_sync_templates(args: argparse.Namespace) -> CommandResult:
     """Sync caller workflow templates to target repos."""
@@ -111,118 +289,52 @@ def cmd_sync_templates(args: argparse.Namespace) -> CommandResult:
             data={"repos": [], "failures": 0},
         )
 
-    failures = 0
+    jobs = getattr(args, "jobs", None) or FLEET_DEFAULT_WORKERS
+    budget = RateBudget()
+    desired_by_repo: dict[str, str | ValueError] = {}
     for entry in entries:
-        repo = entry["full"]
-        language = entry.get("language", "")
-        dispatch_workflow = entry.get("dispatch_workflow", "hub-ci.yml")
-        branch = entry.get("default_branch", "main") or "main"
-        path = f".github/workflows/{dispatch_workflow}"
-        repo_result: dict[str, Any] = {
-            "repo": repo,
-            "path": path,
-            "status": "unknown",
-            "stale": [],
-        }
-
         try:
-            desired = render_dispatch_workflow(language, dispatch_workflow)
-        except ValueError as exc:
-            messages.append(f"[ERROR] {repo} {path}: {exc}")
-            problems.append(
-                {
-                    "severity": "error",
-                    "message": f"{repo} {path}: {exc}",
-                    "code": "CIHUB-TEMPLATES-RENDER-ERROR",
-                }
+            desired_by_repo[entry["full"]] = render_dispatch_workflow(
+                entry.get("language", ""), entry.get("dispatch_workflow", "hub-ci.yml")
             )
-            repo_result["status"] = "error"
-            repo_result["message"] = str(exc)
-            failures += 1
-            results.append(repo_result)
-            continue
+        except ValueError as exc:
+            desired_by_repo[entry["full"]] = exc
 
-        remote = fetch_remote_file(repo, path, branch)
-        workflow_synced = False
+    remote_shas: dict[tuple[str, str, str], str | None] = {}
+    if len(entries) >= BATCH_MIN_REPOS:
+        remote_shas = fetch_remote_blob_shas([_remote_paths(entry) for entry in entries], budget=budget)
 
-        if remote and remote.get("content") == desired:
-            messages.append(f"[OK] {repo} {path} up to date")
-            workflow_synced = True
-            repo_result["status"] = "up_to_date"
-        elif args.check:
-            messages.append(f"[FAIL] {repo} {path} out of date")
-            failures += 1
-            repo_result["status"] = "out_of_date"
-        elif args.dry_run:
-            messages.append(f"# Would update {repo} {path}")
-            repo_result["status"] = "would_update"
-        else:
-            try:
-                update_remote_file(
-                    repo,
-                    path,
-                    branch,
-                    desired,
-                    args.commit_message,
-                    remote.get("sha") if remote else None,
-                )
-                messages.append(f"[OK] {repo} {path} updated")
-                workflow_synced = True
-                repo_result["status"] = "updated"
-            except RuntimeError as exc:
-                messages.append(f"[FAIL] {repo} {path} update failed: {exc}")
-                problems.append(
-                    {
-                        "severity": "error",
-                        "message": f"{repo} {path} update failed: {exc}",
-                        "code": "CIHUB-TEMPLATES-UPDATE-FAILED",
-                    }
-                )
-                failures += 1
-                repo_result["status"] = "failed"
-                repo_result["message"] = str(exc)
-
-        if dispatch_workflow == "hub-ci.yml":
-            stale_workflow_names = ["hub-java-ci.yml", "hub-python-ci.yml"]
-            for stale_name in stale_workflow_names:
-                stale_path = f".github/workflows/{stale_name}"
-                stale_file = fetch_remote_file(repo, stale_path, branch)
-                if stale_file and stale_file.get("sha"):
-                    if args.check:
-                        messages.append(f"[FAIL] {repo} {stale_path} stale (should be deleted)")
-                        failures += 1
-                        repo_result["stale"].append({"path": stale_path, "status": "stale"})
-                    elif args.dry_run:
-                        messages.append(f"# Would delete {repo} {stale_path} (stale)")
-                        repo_result["stale"].append({"path": stale_path, "status": "would_delete"})
-                    elif workflow_synced:
-                        try:
-                            delete_remote_file(
-                                repo,
-                                stale_path,
-                                branch,
-                                stale_file["sha"],
-                                "Remove stale workflow (migrated to hub-ci.yml)",
-                            )
-                            messages.append(f"[OK] {repo} {stale_path} deleted (stale)")
-                            repo_result["stale"].append({"path": stale_path, "status": "deleted"})
-                        except RuntimeError as exc:
-                            messages.append(f"[WARN] {repo} {stale_path} delete failed: {exc}")
-                            problems.append(
-                                {
-                                    "severity": "warning",
-                                    "message": f"{repo} {stale_path} delete failed: {exc}",
-                                    "code": "CIHUB-TEMPLATES-DELETE-FAILED",
-                                }
-                            )
-                            repo_result["stale"].append(
-                                {
-                                    "path": stale_path,
-                                    "status": "delete_failed",
-                                    "message": str(exc),
-                                }
-                            )
-        results.append(repo_result)
+    writing = not args.check and not args.dry_run
+    journal = FleetJournal(None, "")
+    if writing and not getattr(args, "no_resume", False):
+        key = journal_key(
+            "sync-templates",
+            args.commit_message,
+            [[entry["full"], *_remote_paths(entry)[1:], str(desired_by_repo[entry["full"]])] for entry in entries],
+        )
+        journal = FleetJournal.load(FLEET_JOURNAL_DIR / "sync-templates.jsonl", key)
+
+    def sync_one(entry: dict[str, Any]) -> dict[str, Any]:
+        done = journal.completed(entry["full"])
+        if done is not None:
+            return {**done["outcome"], "resumed": True}
+        outcome = _sync_repo(entry, desired_by_repo[entry["full"]], args, remote_shas, budget)
+        if writing:
+            ok = not outcome["failures"] and not outcome["problems"]
+            journal.record(entry["full"], ok, {"outcome": outcome})
+        return outcome
+
+    failures = 0
+    resumed = 0
+    for outcome in fleet_map(sync_one, entries, max_workers=jobs):
+        results.append(outcome["result"])
+        messages.extend(outcome["messages"])
+        problems.extend(outcome["problems"])
+        failures += outcome["failures"]
+        resumed += bool(outcome.get("resumed"))
+    if resumed:
+        messages.append(f"Resumed interrupted sync: {resumed} repo(s) already synced were skipped")
+    journal.finish(clean=not failures)
 
     exit_code = EXIT_SUCCESS
     if args.check and failures:
@@ -306,7 +418,14 @@ def cmd_sync_templates(args: argparse.Namespace) -> CommandResult:
         tag_status = "would_update"
 
     summary = "Template sync complete" if exit_code == EXIT_SUCCESS else f"Template sync: {failures} failure(s)"
-    data: dict[str, object] = {"repos": results, "failures": failures, "items": messages}
+    data: dict[str, object] = {
+        "repos": results,
+        "failures": failures,
+        "items": messages,
+        "jobs": jobs,
+        "api_calls": budget.calls,
+        "resumed": resumed,
+    }
     if tag_status:
         data["tag"] = tag_status
 
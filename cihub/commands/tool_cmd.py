@@ -1294,14 +1294,14 @@ def _disable_in_profile(tool: str, profile_name: str) -> CommandResult:
     )
 
 
-def _enable_for_repo(tool: str, repo_name: str) -> CommandResult:
-    """Enable a tool for a specific repo."""
-    from cihub.services.registry_service import get_repo_config, load_registry, save_registry
+def _set_tool_for_repo(tool: str, repo_name: str, enabled: bool) -> CommandResult:
+    """Set a tool's enabled flag for a specific repo in the registry."""
+    from cihub.services.registry_service import RegistryIndex
 
-    registry = load_registry()
-    repo_config = get_repo_config(registry, repo_name)
+    index = RegistryIndex.load()
+    action = "enabled" if enabled else "disabled"
 
-    if repo_config is None:
+    if repo_name not in index:
         return CommandResult(
             exit_code=EXIT_FAILURE,
             summary=f"Repository '{repo_name}' not found",
@@ -1314,10 +1314,7 @@ def _enable_for_repo(tool: str, repo_name: str) -> CommandResult:
             ],
         )
 
-    # Get language
-    config = repo_config.get("config", {})
-    lang = repo_config.get("language") or config.get("language")
-
+    lang = index.language(repo_name)
     if not lang:
         return CommandResult(
             exit_code=EXIT_FAILURE,
@@ -1335,111 +1332,36 @@ def _enable_for_repo(tool: str, repo_name: str) -> CommandResult:
     if language_check:
         return language_check
 
-    # Update config in registry
-    if "config" not in registry["repos"][repo_name]:
-        registry["repos"][repo_name]["config"] = {}
-    if lang not in registry["repos"][repo_name]["config"]:
-        registry["repos"][repo_name]["config"][lang] = {}
-    if "tools" not in registry["repos"][repo_name]["config"][lang]:
-        registry["repos"][repo_name]["config"][lang]["tools"] = {}
-
-    tools = registry["repos"][repo_name]["config"][lang]["tools"]
-    tool_config = tools.get(tool, {})
-    if isinstance(tool_config, bool):
-        tools[tool] = {"enabled": True}
-    elif isinstance(tool_config, dict):
-        tool_config["enabled"] = True
-        tools[tool] = tool_config
-    else:
-        tools[tool] = {"enabled": True}
-
-    save_registry(registry)
-
-    from cihub.services.registry_service import _get_registry_path
+    index.set_tool_enabled(repo_name, tool, enabled, language=lang)
+    written = index.save()
 
     return CommandResult(
         exit_code=EXIT_SUCCESS,
-        summary=f"Enabled '{tool}' for repo '{repo_name}'",
-        data={"tool": tool, "repo": repo_name, "action": "enabled"},
-        files_modified=[str(_get_registry_path())],
+        summary=f"{action.capitalize()} '{tool}' for repo '{repo_name}'",
+        data={"tool": tool, "repo": repo_name, "action": action},
+        files_modified=[str(index.path)] if written else [],
     )
 
 
-def _disable_for_repo(tool: str, repo_name: str) -> CommandResult:
-    """Disable a tool for a specific repo."""
-    from cihub.services.registry_service import get_repo_config, load_registry, save_registry
-
-    registry = load_registry()
-    repo_config = get_repo_config(registry, repo_name)
-
-    if repo_config is None:
-        return CommandResult(
-            exit_code=EXIT_FAILURE,
-            summary=f"Repository '{repo_name}' not found",
-            problems=[
-                {
-                    "severity": "error",
-                    "message": f"Repository '{repo_name}' not in registry",
-                    "code": "CIHUB-TOOL-REPO-NOT-FOUND",
-                }
-            ],
-        )
-
-    config = repo_config.get("config", {})
-    lang = repo_config.get("language") or config.get("language")
-
-    if not lang:
-        return CommandResult(
-            exit_code=EXIT_FAILURE,
-            summary=f"Repository '{repo_name}' has no language set",
-            problems=[
-                {
-                    "severity": "error",
-                    "message": "Cannot determine language for repo",
-                    "code": "CIHUB-TOOL-NO-LANGUAGE",
-                }
-            ],
-        )
-
-    language_check = _validate_tool_language_for_repo(tool, lang, repo_name)
-    if language_check:
-        return language_check
-
-    if "config" not in registry["repos"][repo_name]:
-        registry["repos"][repo_name]["config"] = {}
-    if lang not in registry["repos"][repo_name]["config"]:
-        registry["repos"][repo_name]["config"][lang] = {}
-    if "tools" not in registry["repos"][repo_name]["config"][lang]:
-        registry["repos"][repo_name]["config"][lang]["tools"] = {}
-
-    tools = registry["repos"][repo_name]["config"][lang]["tools"]
-    tool_config = tools.get(tool, {})
-    if isinstance(tool_config, bool):
-        tools[tool] = {"enabled": False}
-    elif isinstance(tool_config, dict):
-        tool_config["enabled"] = False
-        tools[tool] = tool_config
-    else:
-        tools[tool] = {"enabled": False}
+def _enable_for_repo(tool: str, repo_name: str) -> CommandResult:
+    """Enable a tool for a specific repo."""
+    return _set_tool_for_repo(tool, repo_name, True)
 
-    save_registry(registry)
 
-    from cihub.services.registry_service import _get_registry_path
+def _disable_for_repo(tool: str, repo_name: str) -> CommandResult:
+    """Disable a tool for a specific repo."""
+    return _set_tool_for_repo(tool, repo_name, False)
 
-    return CommandResult(
-        exit_code=EXIT_SUCCESS,
-        summary=f"Disabled '{tool}' for repo '{repo_name}'",
-        data={"tool": tool, "repo": repo_name, "action": "disabled"},
-        files_modified=[str(_get_registry_path())],
-    )
 
+def _set_tool_for_all_repos(tool: str, enabled: bool) -> CommandResult:
+    """Set a tool's enabled flag for every repo whose language supports it.
 
-def _enable_for_all_repos(tool: str) -> CommandResult:
-    """Enable a tool for all repos."""
-    from cihub.services.registry_service import list_repos, load_registry, save_registry
+    Uses the registry index: only repo names and languages are needed, so no
+    effective thresholds are computed and only changed repos are journaled.
+    """
+    from cihub.services.registry_service import RegistryIndex
 
-    registry = load_registry()
-    repos = list_repos(registry)
+    index = RegistryIndex.load()
 
     info = _get_tool_info(tool)
     tool_lang = info.get("language")
@@ -1447,104 +1369,36 @@ def _enable_for_all_repos(tool: str) -> CommandResult:
     updated = []
     skipped = []
 
-    for repo in repos:
-        repo_name = repo["name"]
-        repo_lang = repo.get("language")
+    for repo_name in index.names():
+        repo_lang = index.language(repo_name)
 
         # Skip if language mismatch
-        if tool_lang not in ("both", repo_lang):
+        if tool_lang not in ("both", repo_lang) or not repo_lang:
             skipped.append(repo_name)
             continue
 
-        if not repo_lang:
-            skipped.append(repo_name)
-            continue
-
-        if "config" not in registry["repos"][repo_name]:
-            registry["repos"][repo_name]["config"] = {}
-        if repo_lang not in registry["repos"][repo_name]["config"]:
-            registry["repos"][repo_name]["config"][repo_lang] = {}
-        if "tools" not in registry["repos"][repo_name]["config"][repo_lang]:
-            registry["repos"][repo_name]["config"][repo_lang]["tools"] = {}
-
-        tools = registry["repos"][repo_name]["config"][repo_lang]["tools"]
-        tool_config = tools.get(tool, {})
-        if isinstance(tool_config, bool):
-            tools[tool] = {"enabled": True}
-        elif isinstance(tool_config, dict):
-            tool_config["enabled"] = True
-            tools[tool] = tool_config
-        else:
-            tools[tool] = {"enabled": True}
-
+        index.set_tool_enabled(repo_name, tool, enabled, language=repo_lang)
         updated.append(repo_name)
 
-    save_registry(registry)
-
-    from cihub.services.registry_service import _get_registry_path
+    written = index.save()
 
+    verb = "Enabled" if enabled else "Disabled"
     return CommandResult(
         exit_code=EXIT_SUCCESS,
-        summary=f"Enabled '{tool}' for {len(updated)} repo(s), skipped {len(skipped)}",
+        summary=f"{verb} '{tool}' for {len(updated)} repo(s), skipped {len(skipped)}",
         data={"tool": tool, "updated": updated, "skipped": skipped},
-        files_modified=[str(_get_registry_path())],
+        files_modified=[str(index.path)] if written else [],
     )
 
 
-def _disable_for_all_repos(tool: str) -> CommandResult:
-    """Disable a tool for all repos."""
-    from cihub.services.registry_service import list_repos, load_registry, save_registry
-
-    registry = load_registry()
-    repos = list_repos(registry)
-
-    info = _get_tool_info(tool)
-    tool_lang = info.get("language")
-
-    updated = []
-    skipped = []
-
-    for repo in repos:
-        repo_name = repo["name"]
-        repo_lang = repo.get("language")
-
-        if tool_lang not in ("both", repo_lang):
-            skipped.append(repo_name)
-            continue
-
-        if not repo_lang:
-            skipped.append(repo_name)
-            continue
-
-        if "config" not in registry["repos"][repo_name]:
-            registry["repos"][repo_name]["config"] = {}
-        if repo_lang not in registry["repos"][repo_name]["config"]:
-            registry["repos"][repo_name]["config"][repo_lang] = {}
-        if "tools" not in registry["repos"][repo_name]["config"][repo_lang]:
-            registry["repos"][repo_name]["config"][repo_lang]["tools"] = {}
-
-        tools = registry["repos"][repo_name]["config"][repo_lang]["tools"]
-        tool_config = tools.get(tool, {})
-        if isinstance(tool_config, bool):
-            tools[tool] = {"enabled": False}
-        elif isinstance(tool_config, dict):
-            tool_config["enabled"] = False
-            tools[tool] = tool_config
-        else:
-            tools[tool] = {"enabled": False}
-
-        updated.append(repo_name)
-
-    save_registry(registry)
+def _enable_for_all_repos(tool: str) -> CommandResult:
+    """Enable a tool for all repos."""
+    return _set_tool_for_all_repos(tool, True)
 
-    from cihub.services.registry_service import _get_registry_path
 
-    return CommandResult(
-        exit_code=EXIT_SUCCESS,
-        summary=f"Disabled '{tool}' for {len(updated)} repo(s), skipped {len(skipped)}",
-        data={"tool": tool, "updated": updated, "skipped": skipped},
-        files_modified=[str(_get_registry_path())],
-    )
+def _disable_for_all_repos(tool: str) -> CommandResult:
+    """Disable a tool for all repos."""
+    return _set_tool_for_all_repos(tool, False)
 
 
 def _configure_in_profile(tool: str, param: str, value: Any, profile_name: str) -> CommandResult:
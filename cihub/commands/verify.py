@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import argparse
+import shlex
 import shutil
+import subprocess
 import sys
 import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, cast
 
@@ -22,9 +27,16 @@ from cihub.utils.exec_utils import (
     CommandTimeoutError,
     safe_run,
 )
+from cihub.utils.parallel import default_workers
 from cihub.utils.paths import hub_root, project_root
 
 REQUIRED_TEMPLATE_INPUTS = {"hub_repo", "hub_ref"}
+# Bare mirrors reused across integration runs (relative to the working directory)
+MIRROR_CACHE_DIR = Path(".cihub") / "cache" / "mirrors"
+# Mirrors track branches (tags follow); pull request and other refs are never fetched.
+MIRROR_REFSPEC = "+refs/heads/*:refs/heads/*"
+# Clones are network-bound, so more of them run at once than CI runs
+CLONE_WORKERS = 8
 
 
 def _as_dict(value: Any) -> dict[str, Any]:
@@ -245,145 +257,271 @@ def _run_sync_check(
     return cmd_sync_templates(args)
 
 
-def _run_integration(
+def _git_auth_args(gh_bin: str) -> list[str]:
+    """git -c options that authenticate plain git fetches through gh (as `gh repo clone` does)."""
+    return ["-c", "credential.helper=", "-c", f"credential.helper=!{shlex.quote(gh_bin)} auth git-credential"]
+
+
+def _sync_mirror(gh_bin: str, git_bin: str, repo: str, mirror: Path) -> bool:
+    """Create or incrementally refresh a repo's branch mirror. Returns False when it is unusable.
+
+    The mirror is a bare clone refreshed with MIRROR_REFSPEC, not `git clone
+    --mirror`, which would also download every refs/pull/* head.
+
+    It deliberately keeps full history with every blob rather than being a
+    shallow or --filter=blob:none clone. Integration clones are made locally
+    from it (--shared/--reference) and check out without touching the
+    network. A partial mirror cannot serve those checkouts, because git's
+    upload-pack does not lazily fetch missing objects for a client, so every
+    run would download the blobs from GitHub again. The full download happens
+    once per host; later runs fetch only new branch commits.
+    """
+    try:
+        if (mirror / "HEAD").exists():
+            proc = safe_run(
+                [
+                    git_bin,
+                    *_git_auth_args(gh_bin),
+                    "-C",
+                    str(mirror),
+                    "fetch",
+                    "--prune",
+                    "--quiet",
+                    "origin",
+                    MIRROR_REFSPEC,
+                ],
+                timeout=TIMEOUT_NETWORK,
+            )
+            return proc.returncode == 0
+        mirror.parent.mkdir(parents=True, exist_ok=True)
+        staging = mirror.with_name(f"{mirror.name}.tmp-{uuid.uuid4().hex[:8]}")
+        proc = safe_run(
+            [gh_bin, "repo", "clone", repo, str(staging), "--", "--bare", "--quiet"], timeout=TIMEOUT_NETWORK
+        )
+        if proc.returncode != 0:
+            shutil.rmtree(staging, ignore_errors=True)
+            return False
+        try:
+            staging.rename(mirror)
+        except OSError:
+            # Another run published the mirror first
+            shutil.rmtree(staging, ignore_errors=True)
+        return (mirror / "HEAD").exists()
+    except (CommandNotFoundError, CommandTimeoutError, OSError):
+        return False
+
+
+def _clone_for_integration(
+    gh_bin: str,
+    git_bin: str,
+    repo: str,
+    repo_dir: Path,
+    mirror_dir: Path | None,
+    persist: bool,
+) -> tuple[subprocess.CompletedProcess[str], str]:
+    """Clone a repo for an integration run, from its local mirror when possible.
+
+    A mirror clone shares the mirror's objects (--shared), so it costs no
+    network and no object copies; clones that outlive the run are
+    dissociated so later mirror maintenance cannot break them. Without a
+    usable mirror the repo is shallow-cloned from GitHub.
+
+    Returns:
+        The clone process result and the clone source ("mirror" or "github")
+    """
+    if mirror_dir is not None:
+        mirror = mirror_dir / f"{repo.replace('/', '__')}.git"
+        if _sync_mirror(gh_bin, git_bin, repo, mirror):
+            cmd = [git_bin, "clone", "--quiet", "--no-tags"]
+            cmd += ["--reference", str(mirror), "--dissociate"] if persist else ["--shared"]
+            clone = safe_run([*cmd, str(mirror), str(repo_dir)], timeout=TIMEOUT_NETWORK)
+            if clone.returncode == 0:
+                # Point origin back at GitHub so the run sees the real remote, not the cache
+                safe_run(
+                    [git_bin, "-C", str(repo_dir), "remote", "set-url", "origin", f"https://github.com/{repo}.git"],
+                    timeout=TIMEOUT_QUICK,
+                )
+                return clone, "mirror"
+            shutil.rmtree(repo_dir, ignore_errors=True)
+    clone_cmd = [gh_bin, "repo", "clone", repo, str(repo_dir), "--", "--depth", "1"]
+    return safe_run(clone_cmd, timeout=TIMEOUT_NETWORK), "github"
+
+
+def _integration_repo(
+    entry: dict[str, str],
     *,
-    entries: list[dict[str, str]],
+    gh_bin: str,
+    git_bin: str,
     workdir: Path,
     install_deps: bool,
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    mirror_dir: Path | None,
+    persist: bool,
+    ci_slots: threading.Semaphore,
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Clone, check out and run `cihub ci` for one repo."""
     problems: list[dict[str, Any]] = []
-    results: list[dict[str, Any]] = []
+    repo = entry["full"]
+    repo_dir = workdir / repo.replace("/", "__")
+    result_entry: dict[str, Any] = {"repo": repo, "path": str(repo_dir), "status": "unknown"}
 
-    for entry in entries:
-        repo = entry["full"]
-        repo_dir = workdir / repo.replace("/", "__")
-        result_entry: dict[str, Any] = {"repo": repo, "path": str(repo_dir), "status": "unknown"}
+    try:
+        clone, source = _clone_for_integration(gh_bin, git_bin, repo, repo_dir, mirror_dir, persist)
+    except (CommandNotFoundError, CommandTimeoutError) as exc:
+        result_entry["status"] = "clone_failed"
+        result_entry["detail"] = str(exc)
+        problems.append(
+            {
+                "severity": "error",
+                "message": f"Clone failed for {repo}",
+                "detail": str(exc),
+            }
+        )
+        return result_entry, problems
+    if clone.returncode != 0:
+        detail = (clone.stderr or clone.stdout or "").strip()
+        result_entry["status"] = "clone_failed"
+        result_entry["detail"] = detail
+        problems.append(
+            {
+                "severity": "error",
+                "message": f"Clone failed for {repo}",
+                "detail": detail,
+            }
+        )
+        return result_entry, problems
+    result_entry["source"] = source
 
+    branch = entry.get("default_branch") or ""
+    if branch:
         try:
-            gh_bin = resolve_executable("gh")
-        except FileNotFoundError:
-            problems.append(
-                {
-                    "severity": "error",
-                    "message": "gh not found (required for integration)",
-                }
+            checkout = safe_run(
+                [git_bin, "-C", str(repo_dir), "checkout", branch],
+                timeout=TIMEOUT_QUICK,
             )
-            break
-
-        clone_cmd = [gh_bin, "repo", "clone", repo, str(repo_dir), "--", "--depth", "1"]
-        try:
-            clone = safe_run(clone_cmd, timeout=TIMEOUT_NETWORK)
         except (CommandNotFoundError, CommandTimeoutError) as exc:
-            result_entry["status"] = "clone_failed"
-            result_entry["detail"] = str(exc)
             problems.append(
                 {
                     "severity": "error",
-                    "message": f"Clone failed for {repo}",
+                    "message": f"Checkout failed for {repo} ({branch})",
                     "detail": str(exc),
                 }
             )
-            results.append(result_entry)
-            continue
-        if clone.returncode != 0:
-            detail = (clone.stderr or clone.stdout or "").strip()
-            result_entry["status"] = "clone_failed"
-            result_entry["detail"] = detail
+            result_entry["status"] = "checkout_failed"
+            result_entry["detail"] = str(exc)
+            return result_entry, problems
+        if checkout.returncode != 0:
+            detail = (checkout.stderr or checkout.stdout or "").strip()
             problems.append(
                 {
                     "severity": "error",
-                    "message": f"Clone failed for {repo}",
+                    "message": f"Checkout failed for {repo} ({branch})",
                     "detail": detail,
                 }
             )
-            results.append(result_entry)
-            continue
-
-        branch = entry.get("default_branch") or ""
-        if branch:
-            try:
-                git_bin = resolve_executable("git")
-            except FileNotFoundError:
-                problems.append(
-                    {
-                        "severity": "error",
-                        "message": "git not found (required for integration)",
-                    }
-                )
-                break
-            try:
-                checkout = safe_run(
-                    [git_bin, "-C", str(repo_dir), "checkout", branch],
-                    timeout=TIMEOUT_QUICK,
-                )
-            except (CommandNotFoundError, CommandTimeoutError) as exc:
-                problems.append(
-                    {
-                        "severity": "error",
-                        "message": f"Checkout failed for {repo} ({branch})",
-                        "detail": str(exc),
-                    }
-                )
-                result_entry["status"] = "checkout_failed"
-                result_entry["detail"] = str(exc)
-                results.append(result_entry)
-                continue
-            if checkout.returncode != 0:
-                detail = (checkout.stderr or checkout.stdout or "").strip()
-                problems.append(
-                    {
-                        "severity": "error",
-                        "message": f"Checkout failed for {repo} ({branch})",
-                        "detail": detail,
-                    }
-                )
-                result_entry["status"] = "checkout_failed"
-                result_entry["detail"] = detail
-                results.append(result_entry)
-                continue
+            result_entry["status"] = "checkout_failed"
+            result_entry["detail"] = detail
+            return result_entry, problems
 
-        cmd = [sys.executable, "-m", "cihub", "ci", "--repo", str(repo_dir)]
-        if install_deps:
-            cmd.append("--install-deps")
+    cmd = [sys.executable, "-m", "cihub", "ci", "--repo", str(repo_dir)]
+    if install_deps:
+        cmd.append("--install-deps")
 
-        try:
+    try:
+        with ci_slots:
             run = safe_run(cmd, timeout=TIMEOUT_BUILD)
-        except CommandTimeoutError:
-            result_entry["status"] = "failed"
-            result_entry["detail"] = "CI run timed out"
-            problems.append(
-                {
-                    "severity": "error",
-                    "message": f"Integration run timed out for {repo}",
-                }
-            )
-            results.append(result_entry)
-            continue
-        except CommandNotFoundError as exc:
-            result_entry["status"] = "failed"
-            result_entry["detail"] = str(exc)
-            problems.append(
-                {
-                    "severity": "error",
-                    "message": f"Integration run failed for {repo}",
-                    "detail": str(exc),
-                }
-            )
-            results.append(result_entry)
-            continue
-        detail = (run.stdout or "") + (run.stderr or "")
-        result_entry["status"] = "ok" if run.returncode == 0 else "failed"
-        result_entry["detail"] = detail.strip()
-        results.append(result_entry)
-        if run.returncode != 0:
-            problems.append(
-                {
-                    "severity": "error",
-                    "message": f"Integration run failed for {repo}",
-                    "detail": detail.strip(),
-                }
-            )
+    except CommandTimeoutError:
+        result_entry["status"] = "failed"
+        result_entry["detail"] = "CI run timed out"
+        problems.append(
+            {
+                "severity": "error",
+                "message": f"Integration run timed out for {repo}",
+            }
+        )
+        return result_entry, problems
+    except CommandNotFoundError as exc:
+        result_entry["status"] = "failed"
+        result_entry["detail"] = str(exc)
+        problems.append(
+            {
+                "severity": "error",
+                "message": f"Integration run failed for {repo}",
+                "detail": str(exc),
+            }
+        )
+        return result_entry, problems
+    detail = (run.stdout or "") + (run.stderr or "")
+    result_entry["status"] = "ok" if run.returncode == 0 else "failed"
+    result_entry["detail"] = detail.strip()
+    if run.returncode != 0:
+        problems.append(
+            {
+                "severity": "error",
+                "message": f"Integration run failed for {repo}",
+                "detail": detail.strip(),
+            }
+        )
+    return result_entry, problems
 
+
+def _run_integration(
+    *,
+    entries: list[dict[str, str]],
+    workdir: Path,
+    install_deps: bool,
+    jobs: int | None = None,
+    mirror_dir: Path | None = None,
+    persist: bool = False,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Clone each repo and run `cihub ci` in it.
+
+    Clones run up to CLONE_WORKERS at a time (network-bound); at most `jobs`
+    CI runs execute at once. Results and problems keep entry order.
+
+    Args:
+        entries: Repo entries to verify
+        workdir: Directory that receives one clone per repo
+        install_deps: Pass --install-deps to each CI run
+        jobs: Concurrent CI runs (default: one per CPU)
+        mirror_dir: Bare-mirror object cache reused between runs (None clones from GitHub)
+        persist: Clones outlive the run (dissociate them from the mirror)
+
+    Returns:
+        (problems, results)
+    """
+    if not entries:
+        return [], []
+    try:
+        gh_bin = resolve_executable("gh")
+    except FileNotFoundError:
+        return [{"severity": "error", "message": "gh not found (required for integration)"}], []
+    try:
+        git_bin = resolve_executable("git")
+    except FileNotFoundError:
+        if any(entry.get("default_branch") for entry in entries):
+            return [{"severity": "error", "message": "git not found (required for integration)"}], []
+        git_bin, mirror_dir = "git", None
+
+    ci_slots = threading.Semaphore(max(1, jobs or default_workers()))
+
+    def verify_one(entry: dict[str, str]) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        return _integration_repo(
+            entry,
+            gh_bin=gh_bin,
+            git_bin=git_bin,
+            workdir=workdir,
+            install_deps=install_deps,
+            mirror_dir=mirror_dir,
+            persist=persist,
+            ci_slots=ci_slots,
+        )
+
+    problems: list[dict[str, Any]] = []
+    results: list[dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=min(CLONE_WORKERS, len(entries))) as pool:
+        for result_entry, repo_problems in pool.map(verify_one, entries):
+            results.append(result_entry)
+            problems.extend(repo_problems)
     return problems, results
 
 
@@ -447,13 +585,21 @@ def cmd_verify(args: argparse.Namespace) -> CommandResult:
         else:
             workdir = Path(tempfile.mkdtemp(prefix="cihub-verify-"))
             delete_workdir = True
+        mirror_dir = None if getattr(args, "no_mirror_cache", False) else MIRROR_CACHE_DIR.resolve()
         integration_problems, integration_results = _run_integration(
             entries=entries,
             workdir=workdir,
             install_deps=install_deps,
+            jobs=getattr(args, "jobs", None),
+            mirror_dir=mirror_dir,
+            persist=keep or not delete_workdir,
         )
         problems.extend(integration_problems)
-        integration_data = {"workdir": str(workdir), "results": integration_results}
+        integration_data = {
+            "workdir": str(workdir),
+            "mirror_dir": str(mirror_dir) if mirror_dir else None,
+            "results": integration_results,
+        }
         if delete_workdir and not keep:
             shutil.rmtree(workdir, ignore_errors=True)
 
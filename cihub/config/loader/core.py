@@ -22,6 +22,7 @@ from cihub.config.io import load_yaml_file
 from cihub.config.merge import deep_merge
 from cihub.config.normalize import normalize_config
 from cihub.config.normalize import tool_enabled as _tool_enabled_canonical
+from cihub.utils.tracing import traced
 
 
 class ConfigValidationError(Exception):
@@ -40,6 +41,7 @@ def _load_yaml(path: Path, source: str) -> dict:
         raise ConfigValidationError(f"{source}: {exc}") from exc
 
 
+@traced("config.load")
 def load_config(
     repo_name: str,
     hub_root: Path,
@@ -58,28 +60,25 @@ def load_config(
     Returns:
         Merged configuration dictionary
     """
-    from jsonschema import Draft7Validator
+    from cihub.utils.json_schema import error_path, get_validator
 
-    # Load schema for validation
+    # Load schema for validation (compiled once per process)
     schema_path = hub_root / "schema" / "ci-hub-config.schema.json"
-    schema: dict[str, Any] = {}
+    validator = None
     if schema_path.exists():
-        with schema_path.open(encoding="utf-8") as f:
-            schema = json.load(f)
+        validator = get_validator(schema_path)
     else:
         print(f"Warning: schema not found at {schema_path}", file=sys.stderr)
 
     def validate_config(cfg: dict, source: str) -> None:
-        if not schema:
+        if validator is None or not validator.schema:
             return
-        validator = Draft7Validator(schema)
         errors = list(validator.iter_errors(cfg))
         if errors:
             print(f"Config validation failed for {source}:", file=sys.stderr)
             messages: list[str] = []
             for err in errors:
-                path = ".".join([str(p) for p in err.path]) or "<root>"
-                message = f"{path}: {err.message}"
+                message = f"{error_path(err)}: {err.message}"
                 messages.append(message)
                 print(f"  - {message}", file=sys.stderr)
             raise ConfigValidationError(f"Validation failed for {source}", errors=messages)
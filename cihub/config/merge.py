@@ -7,6 +7,7 @@ from typing import Any
 
 from cihub.config.normalize import normalize_config
 from cihub.config.paths import PathConfig
+from cihub.utils.tracing import traced
 
 
 def deep_merge(base: dict[str, Any], overlay: dict[str, Any]) -> dict[str, Any]:
@@ -42,6 +43,7 @@ def deep_merge(base: dict[str, Any], overlay: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
+@traced("config.merge")
 def build_effective_config(
     defaults: dict[str, Any],
     profile: dict[str, Any] | None = None,
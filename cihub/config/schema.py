@@ -6,9 +6,8 @@ import json
 from pathlib import Path
 from typing import Any
 
-from jsonschema import Draft7Validator
-
 from cihub.config.paths import PathConfig
+from cihub.utils.json_schema import get_validator, schema_errors
 
 
 def get_schema(paths: PathConfig) -> dict[str, Any]:
@@ -38,13 +37,8 @@ def validate_config(config: dict[str, Any], paths: PathConfig) -> list[str]:
     Returns:
         Sorted list of validation error strings.
     """
-    schema = get_schema(paths)
-    validator = Draft7Validator(schema)
-    errors: list[str] = []
-    for err in validator.iter_errors(config):
-        path = ".".join(str(p) for p in err.path) or "<root>"
-        errors.append(f"{path}: {err.message}")
-    return sorted(errors)
+    validator = get_validator(Path(paths.schema_dir) / "ci-hub-config.schema.json")
+    return sorted(schema_errors(validator, config))
 
 
 # Threshold sanity check limits - warn when exceeding these
@@ -16,6 +16,7 @@ from .status import (
     create_run_status,
     load_dispatch_metadata,
 )
+from .store import FleetMetricsStore, StoredRun, project_report
 
 __all__ = [
     "GitHubAPI",
@@ -35,4 +36,7 @@ __all__ = [
     "load_thresholds",
     "run_aggregation",
     "run_reports_aggregation",
+    "FleetMetricsStore",
+    "StoredRun",
+    "project_report",
 ]
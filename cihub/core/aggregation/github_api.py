@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Any
 from urllib import request
 
+from cihub.utils.tracing import span, traced
+
 
 def _safe_extractall(zip_path: Path, target_dir: Path) -> None:
     """Extract ZIP with path traversal protection.
@@ -45,7 +47,7 @@ class GitHubAPI:
                         "X-GitHub-Api-Version": "2022-11-28",
                     },
                 )
-                with request.urlopen(req, timeout=timeout) as resp:  # noqa: S310
+                with span("github.api", url=url), request.urlopen(req, timeout=timeout) as resp:  # noqa: S310
                     data = json.loads(resp.read().decode())
                     return data if isinstance(data, dict) else {}
             except Exception as exc:
@@ -56,6 +58,7 @@ class GitHubAPI:
                 print(f"Retry {attempt}/{retries} for {url}: {exc} (sleep {sleep_for}s)")
                 time.sleep(sleep_for)
 
+    @traced("github.download")
     def download_artifact(self, archive_url: str, target_dir: Path) -> Path | None:
         """Download an artifact from GitHub.
 
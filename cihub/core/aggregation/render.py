@@ -57,21 +57,29 @@ def aggregate_results(results: list[dict[str, Any]]) -> dict[str, Any]:
     return aggregated
 
 
+def render_report_details(report_data: dict[str, Any]) -> str:
+    """Render the per-repo details fragment for one report."""
+    try:
+        return render_summary(report_data, include_metrics=True)
+    except Exception as exc:
+        return f"*Error rendering summary: {exc}*"
+
+
 def generate_details_markdown(results: list[dict[str, Any]]) -> str:
     lines = ["# Per-Repo Details", ""]
     for entry in results:
         config = entry.get("config", "unknown")
+        # Pre-rendered fragment (reports-dir mode) or the full report to render now
+        details = entry.get("_details_md")
         report_data = entry.get("_report_data")
+        if details is None and report_data:
+            details = render_report_details(report_data)
         status = entry.get("status", "unknown")
         conclusion = entry.get("conclusion", "unknown")
         lines.append(f"<details><summary><strong>{config}</strong></summary>")
         lines.append("")
-        if report_data:
-            try:
-                detailed_summary = render_summary(report_data, include_metrics=True)
-                lines.append(detailed_summary)
-            except Exception as exc:
-                lines.append(f"*Error rendering summary: {exc}*")
+        if details is not None:
+            lines.append(details)
         else:
             lines.append(f"*No report.json available (status: {status}, conclusion: {conclusion}).*")
         lines.append("")
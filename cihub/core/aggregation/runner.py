@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -11,17 +10,24 @@ from typing import Any
 import yaml
 
 from cihub.core.correlation import find_run_by_correlation_id
+from cihub.utils.json_io import write_json
 
 from .artifacts import fetch_and_validate_artifact
 from .github_api import GitHubAPI
 from .metrics import extract_metrics_from_report
-from .render import aggregate_results, generate_details_markdown, generate_summary_markdown
+from .render import (
+    aggregate_results,
+    generate_details_markdown,
+    generate_summary_markdown,
+    render_report_details,
+)
 from .status import (
     _run_status_for_invalid_report,
     _run_status_from_report,
     create_run_status,
     load_dispatch_metadata,
 )
+from .store import FleetMetricsStore, StoredRun, load_report, map_report_files
 
 
 def poll_run_completion(
@@ -89,9 +95,26 @@ def load_thresholds(defaults_file: Path) -> tuple[int, int]:
 # -----------------------------------------------------------------------------
 
 
+# Per-run keys used only for details rendering; never written to JSON output
+_DETAIL_KEYS = ("_report_data", "_details_md")
+
+
 def _strip_report_data(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Strip _report_data from results for JSON output (too large to include)."""
-    return [{k: v for k, v in r.items() if k != "_report_data"} for r in results]
+    """Strip report payloads and detail fragments from results for JSON output (too large to include)."""
+    return [{k: v for k, v in r.items() if k not in _DETAIL_KEYS} for r in results]
+
+
+def _render_details_from_file(path: str) -> str | None:
+    """Load one report and render its details fragment; runs in worker processes.
+
+    Only the rendered markdown is returned, so the full report never leaves
+    the worker.
+    """
+    try:
+        report_data = load_report(Path(path))
+    except (OSError, ValueError):
+        return None
+    return render_report_details(report_data) if report_data else None
 
 
 def _build_aggregated_report(
@@ -136,7 +159,7 @@ def _write_output_files(
     missing_label: str = "Missing metadata",
 ) -> None:
     """Write output, summary, and details files."""
-    output_file.write_text(json.dumps(report, indent=2))
+    write_json(output_file, report)
     print(f"Report written to {output_file}")
 
     details_md = None
@@ -443,39 +466,57 @@ def run_reports_aggregation(
     strict: bool = False,
     details_file: Path | None = None,
     include_details: bool = False,
+    metrics_store: Path | None = None,
 ) -> int:
+    """Aggregate report.json files found under reports_dir.
+
+    Args:
+        metrics_store: Optional columnar store file. Reports whose mtime and
+            size are unchanged since the last run are not re-parsed.
+    """
     reports_dir = reports_dir.resolve()
-    report_paths = sorted(reports_dir.rglob("report.json"))
+    store = FleetMetricsStore.load(metrics_store) if metrics_store else FleetMetricsStore()
+    store.ingest(reports_dir)
+    runs = store.runs(reports_dir)
+    store.save()
+    want_details = include_details or details_file is not None
     results: list[dict[str, Any]] = []
     invalid_reports = 0
 
     if total_repos <= 0:
-        total_repos = len(report_paths)
+        total_repos = len(runs)
 
     print(f"\n{'=' * 60}")
     print(f"Starting aggregation from reports dir: {reports_dir}")
     print(f"   Hub Run ID: {hub_run_id}")
     print(f"   Total expected repos: {total_repos}")
+    if metrics_store:
+        print(f"   Metrics store: {store.reused} reused, {store.parsed} parsed")
     print(f"{'=' * 60}\n")
 
-    for report_path in report_paths:
-        try:
-            with report_path.open(encoding="utf-8") as f:
-                report_data = json.load(f)
-            if not isinstance(report_data, dict):
-                raise ValueError("report.json is not a JSON object")
-        except Exception as exc:
+    detail_runs: list[tuple[dict[str, Any], StoredRun]] = []
+    for run in runs:
+        if run.report is None:
             invalid_reports += 1
-            print(f"Warning: invalid report {report_path}: {exc}")
-            results.append(_run_status_for_invalid_report(report_path, reports_dir, "invalid_report"))
+            print(f"Warning: invalid report {run.path}: {run.error}")
+            results.append(_run_status_for_invalid_report(run.path, reports_dir, "invalid_report"))
             continue
 
-        run_status = _run_status_from_report(report_data, report_path, reports_dir)
-        extract_metrics_from_report(report_data, run_status)
-        # Store full report for detailed summary generation
-        run_status["_report_data"] = report_data
+        run_status = _run_status_from_report(run.report, run.path, reports_dir)
+        extract_metrics_from_report(run.report, run_status)
+        if want_details:
+            detail_runs.append((run_status, run))
         results.append(run_status)
 
+    if detail_runs:
+        # Details need the full report; render each fragment in a worker and keep only the markdown
+        fragments = map_report_files(_render_details_from_file, [str(run.path) for _, run in detail_runs])
+        for (run_status, run), fragment in zip(detail_runs, fragments, strict=True):
+            if fragment is None and run.report:
+                fragment = render_report_details(run.report)
+            if fragment is not None:
+                run_status["_details_md"] = fragment
+
     processed = len(results)
     missing = max(total_repos - processed, 0)
     missing_run_id = len([e for e in results if not e.get("run_id")])
@@ -0,0 +1,283 @@
+"""Columnar fleet metrics store for aggregation and dashboards.
+
+Hub runs download one report.json per repo. Aggregation, threshold checks and
+dashboards only read a few dozen fields from each report, so the store parses
+every report once, projects it down to those fields and keeps the projection
+in a compact columnar file (one list per field). Later runs only re-parse
+reports whose mtime or size changed; unchanged rows are reused and new
+reports are appended. Reports that need parsing are parsed in a process pool
+once there are enough of them, and only the projection crosses back.
+
+Usage:
+    store = FleetMetricsStore.load(Path(".cihub/fleet-metrics.json"))
+    store.ingest(reports_dir)
+    for run in store.runs(reports_dir):
+        ...
+    store.save()
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Any, TypeVar
+
+from cihub.utils.json_cache import load_json_cache, save_json_cache
+from cihub.utils.parallel import process_map
+
+# Covers PROJECTED_FIELDS and the columnar layout.
+METRICS_STORE_VERSION = 1
+REPORT_FILENAME = "report.json"
+# Below this many reports, process start-up costs more than parsing serially.
+PARALLEL_MIN_REPORTS = 16
+
+_T = TypeVar("_T")
+
+# Top-level report keys read by run status, metrics, threshold and dashboard code.
+# Presence matters (detect_language checks `"java_version" in report`), so a
+# key is only restored if the source report had it.
+PROJECTED_FIELDS: tuple[str, ...] = (
+    "schema_version",
+    "repository",
+    "branch",
+    "timestamp",
+    "run_id",
+    "hub_correlation_id",
+    "java_version",
+    "python_version",
+    "results",
+    "tool_metrics",
+    "thresholds",
+    "tools_configured",
+    "tools_ran",
+    "tools_success",
+    "tools_require_run",
+    "metadata",
+    "environment",
+)
+
+# Nested objects where only a few keys are read.
+NESTED_FIELDS: dict[str, tuple[str, ...]] = {
+    "metadata": ("workflow_ref",),
+    "environment": ("workdir",),
+}
+
+
+def project_report(report: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a full report to the fields aggregation and dashboards read."""
+    projected: dict[str, Any] = {}
+    for field in PROJECTED_FIELDS:
+        if field not in report:
+            continue
+        value = report[field]
+        keep = NESTED_FIELDS.get(field)
+        if keep is not None and isinstance(value, dict):
+            value = {key: value[key] for key in keep if key in value}
+        projected[field] = value
+    return projected
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    """Read and parse a report.json file.
+
+    Raises:
+        OSError, ValueError: If the file cannot be read, is not JSON, or is
+            not a JSON object (json.JSONDecodeError is a ValueError).
+    """
+    with path.open(encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("report.json is not a JSON object")
+    return data
+
+
+def _parse_report(path: str) -> tuple[str | None, dict[str, Any] | None]:
+    """Parse and project one report; runs in worker processes."""
+    try:
+        return None, project_report(load_report(Path(path)))
+    except Exception as exc:  # noqa: BLE001 - any unreadable report is recorded as invalid
+        return str(exc), None
+
+
+def map_report_files(
+    func: Callable[[str], _T],
+    paths: Sequence[str],
+    max_workers: int | None = None,
+) -> list[_T]:
+    """Apply func to each report path, in a process pool for large batches.
+
+    func must be a module-level function so it can be pickled. Results keep
+    the order of paths. Falls back to serial execution when worker processes
+    are unavailable.
+    """
+    return process_map(func, paths, max_workers=max_workers, min_items=PARALLEL_MIN_REPORTS)
+
+
+@dataclass
+class StoredRun:
+    """One report as seen through the store.
+
+    Attributes:
+        source: Report path relative to the reports dir (POSIX separators)
+        path: Absolute report path
+        report: Projected report fields (None if the report could not be loaded)
+        error: Load/parse error message (None on success)
+    """
+
+    source: str
+    path: Path
+    report: dict[str, Any] | None
+    error: str | None = None
+
+
+class FleetMetricsStore:
+    """Projected report rows keyed by source path, persisted as columns.
+
+    Args:
+        path: Store file. When None, the store lives in memory only.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self.reports_dir: str | None = None
+        self.parsed = 0
+        self.reused = 0
+        # source -> (mtime_ns, size, error, projected report)
+        self._rows: dict[str, tuple[int, int, str | None, dict[str, Any] | None]] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> FleetMetricsStore:
+        """Load a store file; rows that fail to decode leave the store empty."""
+        store = cls(path)
+        payload = load_json_cache(path, METRICS_STORE_VERSION)
+        if payload is None:
+            return store
+        try:
+            store.reports_dir = payload.get("reports_dir")
+            store._rows = _rows_from_columns(payload)
+        except (KeyError, TypeError, ValueError, IndexError):
+            store._rows = {}
+        return store
+
+    def ingest(self, reports_dir: Path, max_workers: int | None = None) -> None:
+        """Sync rows with the report.json files under reports_dir.
+
+        New and modified reports are parsed and projected (the full payload is
+        dropped immediately); unchanged reports reuse their stored row; rows
+        for reports that no longer exist are removed.
+
+        Args:
+            reports_dir: Directory searched recursively for report.json
+            max_workers: Parse worker processes (default: up to 8)
+        """
+        reports_dir = reports_dir.resolve()
+        if self.reports_dir != str(reports_dir):
+            self._rows = {}
+            self.reports_dir = str(reports_dir)
+
+        rows: dict[str, tuple[int, int, str | None, dict[str, Any] | None]] = {}
+        pending: list[tuple[str, Path, int, int]] = []
+        for report_path in sorted(reports_dir.rglob(REPORT_FILENAME)):
+            source = report_path.relative_to(reports_dir).as_posix()
+            try:
+                stat = report_path.stat()
+            except OSError as exc:
+                rows[source] = (0, 0, str(exc), None)
+                self.parsed += 1
+                continue
+            previous = self._rows.get(source)
+            if previous is not None and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size:
+                rows[source] = previous
+                self.reused += 1
+                continue
+            # Placeholder keeps rows in path order; filled in after parsing
+            rows[source] = (stat.st_mtime_ns, stat.st_size, None, None)
+            pending.append((source, report_path, stat.st_mtime_ns, stat.st_size))
+
+        parsed = map_report_files(_parse_report, [str(path) for _, path, _, _ in pending], max_workers)
+        for (source, _, mtime_ns, size), (error, projected) in zip(pending, parsed, strict=True):
+            rows[source] = (mtime_ns, size, error, projected)
+        self.parsed += len(pending)
+        self._rows = rows
+
+    def runs(self, reports_dir: Path) -> list[StoredRun]:
+        """Return stored rows in report path order."""
+        reports_dir = reports_dir.resolve()
+        return [
+            StoredRun(source=source, path=reports_dir / source, report=report, error=error)
+            for source, (_, _, error, report) in self._rows.items()
+        ]
+
+    def column(self, field: str) -> list[Any]:
+        """Return one projected field for every valid row (None where absent)."""
+        return [report.get(field) for _, _, _, report in self._rows.values() if report is not None]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def save(self) -> None:
+        """Persist the store as columns."""
+        if self.path is None:
+            return
+        payload = _rows_to_columns(self._rows)
+        payload["reports_dir"] = self.reports_dir
+        save_json_cache(self.path, METRICS_STORE_VERSION, payload)
+
+
+def _rows_to_columns(
+    rows: dict[str, tuple[int, int, str | None, dict[str, Any] | None]],
+) -> dict[str, Any]:
+    sources = list(rows)
+    columns: dict[str, list[Any]] = {field: [] for field in PROJECTED_FIELDS}
+    present: list[int] = []
+    for source in sources:
+        report = rows[source][3] or {}
+        mask = 0
+        for bit, field in enumerate(PROJECTED_FIELDS):
+            if field in report:
+                mask |= 1 << bit
+            columns[field].append(report.get(field))
+        present.append(mask)
+    return {
+        "fields": list(PROJECTED_FIELDS),
+        "sources": sources,
+        "mtime_ns": [rows[s][0] for s in sources],
+        "size": [rows[s][1] for s in sources],
+        "errors": [rows[s][2] for s in sources],
+        "present": present,
+        "columns": columns,
+    }
+
+
+def _rows_from_columns(
+    payload: dict[str, Any],
+) -> dict[str, tuple[int, int, str | None, dict[str, Any] | None]]:
+    if payload.get("fields") != list(PROJECTED_FIELDS):
+        return {}
+    columns = payload["columns"]
+    rows: dict[str, tuple[int, int, str | None, dict[str, Any] | None]] = {}
+    for i, source in enumerate(payload["sources"]):
+        if PurePosixPath(source).is_absolute() or ".." in PurePosixPath(source).parts:
+            continue
+        error = payload["errors"][i]
+        report: dict[str, Any] | None = None
+        if error is None:
+            mask = int(payload["present"][i])
+            report = {field: columns[field][i] for bit, field in enumerate(PROJECTED_FIELDS) if mask & (1 << bit)}
+        rows[str(source)] = (int(payload["mtime_ns"][i]), int(payload["size"][i]), error, report)
+    return rows
+
+
+__all__ = [
+    "METRICS_STORE_VERSION",
+    "NESTED_FIELDS",
+    "PROJECTED_FIELDS",
+    "PARALLEL_MIN_REPORTS",
+    "FleetMetricsStore",
+    "StoredRun",
+    "load_report",
+    "map_report_files",
+    "project_report",
+]
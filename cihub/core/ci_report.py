@@ -7,6 +7,10 @@ from datetime import datetime, timezone
 from typing import Any
 
 from cihub import __version__
+from cihub.core.ci_runner.security_cache import SECURITY_DB_KEY
+
+# Written next to report.json by `cihub ci` so `cihub report build` can report it too
+DEPENDENCY_CACHE_FILE = "dependency-cache.json"
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -24,6 +28,7 @@ class RunContext:
     project_type: str | None
     docker_compose_file: str | None
     docker_health_endpoint: str | None
+    dependency_cache: dict[str, Any] | None = None
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -214,12 +219,14 @@ def _derive_tool_evidence(tool_results: dict[str, dict[str, Any]]) -> dict[str,
     return evidence
 
 
-def _get_docker_metrics(tool_results: dict[str, dict[str, Any]]) -> dict[str, bool]:
+def _get_docker_metrics(tool_results: dict[str, dict[str, Any]]) -> dict[str, Any]:
     """Extract docker metrics shared by both languages."""
     docker_data = tool_results.get("docker", {}).get("metrics", {})
     return {
         "docker_missing_compose": bool(docker_data.get("docker_missing_compose", False)),
         "docker_health_ok": bool(docker_data.get("docker_health_ok", False)),
+        "docker_time_to_healthy_seconds": docker_data.get("docker_time_to_healthy_seconds"),
+        "docker_port_time_to_healthy": docker_data.get("docker_port_time_to_healthy"),
     }
 
 
@@ -460,6 +467,15 @@ def _build_report(
         "retention_days": context.retention_days,
         **metrics.environment_extras,
     }
+    if context.dependency_cache:
+        environment["dependency_cache"] = context.dependency_cache
+    security_db = {
+        tool: payload["metrics"][SECURITY_DB_KEY]
+        for tool, payload in sorted(tool_results.items())
+        if isinstance(payload.get("metrics"), dict) and isinstance(payload["metrics"].get(SECURITY_DB_KEY), dict)
+    }
+    if security_db:
+        environment["security_db"] = security_db
 
     report = {
         "schema_version": "2.0",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 import urllib.request
 from pathlib import Path
@@ -11,9 +12,12 @@ import yaml
 from . import shared
 from .base import ToolResult
 
-# Health check polling configuration
+# Health check polling configuration (per-port backoff from the initial delay up to the interval)
+HEALTH_CHECK_INITIAL_DELAY_SECONDS = 0.25
 HEALTH_CHECK_INTERVAL_SECONDS = 5
 HEALTH_CHECK_HTTP_TIMEOUT_SECONDS = 5
+# How long the other ports keep being probed once the first one is healthy
+HEALTH_CHECK_GRACE_SECONDS = 2
 
 
 def _resolve_docker_compose_command() -> list[str]:
@@ -63,21 +67,67 @@ def _parse_compose_ports(compose_path: Path) -> list[int]:
     return ports
 
 
-def _wait_for_health(ports: list[int], endpoint: str, timeout_seconds: int) -> bool:
-    if not ports:
+def _probe_health(url: str, timeout: float) -> bool:
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:  # noqa: S310
+            return bool(200 <= resp.status < 400)
+    except Exception:  # expected failures during health poll
         return False
-    deadline = time.monotonic() + max(timeout_seconds, 0)
-    while time.monotonic() < deadline:
-        for port in ports:
-            url = f"http://localhost:{port}{endpoint}"
-            try:
-                with urllib.request.urlopen(url, timeout=HEALTH_CHECK_HTTP_TIMEOUT_SECONDS) as resp:  # noqa: S310
-                    if 200 <= resp.status < 400:
-                        return True
-            except Exception:  # noqa: S112 - expected failures during health poll
-                continue
-        time.sleep(HEALTH_CHECK_INTERVAL_SECONDS)
-    return False
+
+
+def _wait_for_ports(ports: list[int], endpoint: str, timeout_seconds: float) -> dict[int, float | None]:
+    """Probe every port concurrently until one answers healthy or the timeout passes.
+
+    Each port is polled from its own thread with exponential backoff (from
+    HEALTH_CHECK_INITIAL_DELAY_SECONDS up to HEALTH_CHECK_INTERVAL_SECONDS),
+    so a port that hangs until HEALTH_CHECK_HTTP_TIMEOUT_SECONDS never delays
+    the others. Once the first port is healthy the rest get at most
+    HEALTH_CHECK_GRACE_SECONDS more to record their own time, so a published
+    port without the health endpoint (a database, say) does not cost the
+    whole budget.
+
+    Args:
+        ports: Published host ports to probe
+        endpoint: Health endpoint path (e.g. "/health")
+        timeout_seconds: Overall time budget
+
+    Returns:
+        Seconds from the start until each port first answered healthy
+        (None for ports that never did before polling stopped)
+    """
+    times: dict[int, float | None] = dict.fromkeys(ports)
+    if not times:
+        return times
+    start = time.monotonic()
+    deadline = start + max(timeout_seconds, 0)
+    lock = threading.Lock()
+
+    def poll(port: int) -> None:
+        nonlocal deadline
+        url = f"http://localhost:{port}{endpoint}"
+        delay = HEALTH_CHECK_INITIAL_DELAY_SECONDS
+        while (remaining := deadline - time.monotonic()) > 0:
+            if _probe_health(url, min(HEALTH_CHECK_HTTP_TIMEOUT_SECONDS, remaining)):
+                with lock:
+                    now = time.monotonic()
+                    times[port] = round(now - start, 3)
+                    deadline = min(deadline, now + HEALTH_CHECK_GRACE_SECONDS)
+                return
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 2, HEALTH_CHECK_INTERVAL_SECONDS)
+
+    # Daemon threads: a probe stuck in urlopen must not hold up compose down
+    threads = [threading.Thread(target=poll, args=(port,), name=f"cihub-health-{port}", daemon=True) for port in times]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(max(deadline - time.monotonic(), 0))
+    with lock:
+        return dict(times)
+
+
+def _wait_for_health(ports: list[int], endpoint: str, timeout_seconds: int) -> bool:
+    return any(seconds is not None for seconds in _wait_for_ports(ports, endpoint, timeout_seconds).values())
 
 
 def run_docker(
@@ -104,25 +154,32 @@ def run_docker(
     ran = True
     success = proc_up.returncode == 0
     health_ok = None
+    port_times: dict[int, float | None] = {}
 
     if success and health_endpoint:
         endpoint = health_endpoint.strip()
         if endpoint and not endpoint.startswith("/"):
             endpoint = f"/{endpoint}"
-        ports = _parse_compose_ports(compose_path)
-        health_ok = _wait_for_health(ports, endpoint, int(health_timeout))
+        port_times = _wait_for_ports(_parse_compose_ports(compose_path), endpoint, int(health_timeout))
+        health_ok = any(seconds is not None for seconds in port_times.values())
         success = success and health_ok
 
-    proc_logs = shared._run_tool_command("docker", [*compose_args, "logs", "--no-color"], workdir, output_dir)
-    log_contents = f"{proc_logs.stdout or ''}{proc_logs.stderr or ''}"
-    if log_contents:
-        log_path.write_text(log_contents, encoding="utf-8")
+    # Compose logs can be large: stream them to disk rather than into memory
+    logs_cmd = [*compose_args, "logs", "--no-color"]
+    shared._write_tool_logs("docker", output_dir, "", "", cmd=logs_cmd)
+    log_path.unlink(missing_ok=True)
+    shared._run_command_to_file(logs_cmd, workdir, log_path)
+    if log_path.exists() and log_path.stat().st_size == 0:
+        log_path.unlink()
 
     shared._run_tool_command("docker", [*compose_args, "down", "--remove-orphans"], workdir, output_dir)
 
     metrics: dict[str, object] = {"docker_missing_compose": False}
     if health_endpoint:
         metrics["docker_health_ok"] = bool(health_ok)
+        healthy = [seconds for seconds in port_times.values() if seconds is not None]
+        metrics["docker_time_to_healthy_seconds"] = min(healthy) if healthy else None
+        metrics["docker_port_time_to_healthy"] = {str(port): seconds for port, seconds in port_times.items()}
     return ToolResult(
         tool="docker",
         ran=ran,
@@ -0,0 +1,206 @@
+"""Filesystem index for report discovery.
+
+Tool runners look for their reports with rglob-style patterns
+(``target/pit-reports/**/mutations.xml``). Walking a multi-module build tree
+once per tool is slow, so each workdir gets one FileIndex: a single pruned
+walk records every directory's entries and mtime.
+
+Later lookups revalidate instead of re-walking: each indexed directory is
+stat'ed and only directories whose mtime changed (a tool wrote or removed
+entries in them) are listed again. Directories modified within
+RACY_WINDOW_NS of being listed are listed again on the next lookup, since
+their mtime may not yet reflect a concurrent write.
+"""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+# Never searched for reports: VCS metadata, dependency trees and tool caches.
+PRUNE_DIRS = frozenset(
+    {
+        ".git",
+        ".gradle",
+        ".hg",
+        ".idea",
+        ".mypy_cache",
+        ".nox",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".svn",
+        ".tox",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+        "venv",
+    }
+)
+RACY_WINDOW_NS = 2_000_000_000
+INDEX_CACHE_SIZE = 8
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+def _match_segments(parts: list[str], patterns: list[str]) -> bool:
+    if not patterns:
+        return not parts
+    head = patterns[0]
+    if head == "**":
+        return any(_match_segments(parts[i:], patterns[1:]) for i in range(len(parts) + 1))
+    return bool(parts) and fnmatch.fnmatchcase(parts[0], head) and _match_segments(parts[1:], patterns[1:])
+
+
+def matches(rel_path: str, pattern: str) -> bool:
+    """Whether a relative POSIX path matches an rglob pattern (which may start at any depth)."""
+    segments = [segment for segment in pattern.strip("/").split("/") if segment]
+    return _match_segments(rel_path.split("/"), ["**", *segments])
+
+
+class FileIndex:
+    """Entries under one root, refreshed incrementally from directory mtimes."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.scans = 0  # directory listings performed (for diagnostics and tests)
+        self._dirs: dict[str, tuple[int | None, list[str], list[str]]] = {}
+        self._paths: list[str] | None = None
+        self._by_name: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+        self._built = False
+
+    def _scan_dir(self, rel: str) -> list[str]:
+        """List one directory; returns its subdirectories to descend into."""
+        path = self.root / rel if rel else self.root
+        entries: list[str] = []
+        subdirs: list[str] = []
+        try:
+            mtime: int | None = path.stat().st_mtime_ns
+            with os.scandir(path) as listing:
+                for entry in listing:
+                    entries.append(entry.name)
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_dir = False
+                    if is_dir and entry.name not in PRUNE_DIRS:
+                        subdirs.append(entry.name)
+        except OSError:
+            self._dirs.pop(rel, None)
+            return []
+        self.scans += 1
+        if mtime is not None and time.time_ns() - mtime < RACY_WINDOW_NS:
+            mtime = None  # may still change within this timestamp tick
+        self._dirs[rel] = (mtime, entries, subdirs)
+        self._paths = None
+        return [f"{rel}/{name}" if rel else name for name in subdirs]
+
+    def _scan_tree(self, rel: str) -> None:
+        pending = [rel]
+        while pending:
+            pending.extend(self._scan_dir(pending.pop()))
+
+    def _drop_tree(self, rel: str) -> None:
+        prefix = f"{rel}/"
+        for key in [key for key in self._dirs if key == rel or key.startswith(prefix)]:
+            del self._dirs[key]
+        self._paths = None
+
+    def refresh(self) -> None:
+        """Re-list directories whose mtime changed since they were indexed."""
+        for rel in sorted(self._dirs):
+            if rel not in self._dirs:
+                continue  # dropped with a removed parent
+            mtime, _entries, old_subdirs = self._dirs[rel]
+            try:
+                current = (self.root / rel if rel else self.root).stat().st_mtime_ns
+            except OSError:
+                self._drop_tree(rel)
+                continue
+            if mtime is not None and current == mtime:
+                continue
+            new_subdirs = self._scan_dir(rel)
+            base = f"{rel}/" if rel else ""
+            kept = {f"{base}{name}" for name in old_subdirs}
+            for child in kept - set(new_subdirs):
+                self._drop_tree(child)
+            for child in new_subdirs:
+                if child not in self._dirs:
+                    self._scan_tree(child)
+
+    def _build_lookup(self) -> list[str]:
+        paths: list[str] = []
+        by_name: dict[str, list[str]] = {}
+        for rel, (_mtime, entries, _subdirs) in self._dirs.items():
+            base = f"{rel}/" if rel else ""
+            for name in entries:
+                paths.append(base + name)
+                by_name.setdefault(name, []).append(base + name)
+        paths.sort()
+        self._paths = paths
+        self._by_name = by_name
+        return paths
+
+    def _candidates(self, pattern: str, paths: list[str]) -> list[str]:
+        segments = [segment for segment in pattern.strip("/").split("/") if segment]
+        literal = next(
+            (i for i in range(len(segments) - 1, -1, -1) if not _GLOB_CHARS.search(segments[i])),
+            None,
+        )
+        if literal is None:
+            return paths
+        named = self._by_name.get(segments[literal], [])
+        if literal == len(segments) - 1:
+            return named
+        # Entries below each directory carrying the literal segment
+        candidates: list[str] = []
+        for anchor in named:
+            prefix = f"{anchor}/"
+            start = bisect.bisect_left(paths, prefix)
+            end = bisect.bisect_left(paths, prefix + "\U0010ffff")
+            candidates.extend(paths[start:end])
+        return candidates
+
+    def find(self, patterns: list[str]) -> list[Path]:
+        """Paths matching any rglob-style pattern, resolved, unique and sorted."""
+        with self._lock:
+            if self._built:
+                self.refresh()
+            else:
+                self._scan_tree("")
+                self._built = True
+            paths = self._paths if self._paths is not None else self._build_lookup()
+            matched: set[str] = set()
+            for pattern in patterns:
+                matched.update(rel for rel in self._candidates(pattern, paths) if matches(rel, pattern))
+        unique = {(self.root / rel).resolve() for rel in matched}
+        return sorted(unique, key=lambda path: str(path))
+
+
+_indexes: OrderedDict[Path, FileIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def file_index(root: Path) -> FileIndex:
+    """The shared index for a root directory (walked on first lookup, then refreshed per lookup)."""
+    key = root.resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+            return index
+    index = FileIndex(key)
+    with _indexes_lock:
+        _indexes[key] = index
+        while len(_indexes) > INDEX_CACHE_SIZE:
+            _indexes.popitem(last=False)
+    return index
+
+
+__all__ = ["INDEX_CACHE_SIZE", "PRUNE_DIRS", "RACY_WINDOW_NS", "FileIndex", "file_index", "matches"]
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import os
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 from . import shared
 from .base import ToolResult
@@ -16,6 +18,10 @@ from .parsers import (
     _parse_pmd_files,
     _parse_spotbugs_files,
 )
+from .security_cache import SECURITY_DB_KEY, SecurityDb, prepare_security_db, unavailable_result
+
+# H2 database dependency-check keeps in its data directory
+OWASP_DB_FILE = "odc.mv.db"
 
 
 def _maven_cmd(workdir: Path) -> list[str]:
@@ -265,6 +271,26 @@ def run_pmd(workdir: Path, output_dir: Path, build_tool: str) -> ToolResult:
     )
 
 
+def _populate_owasp_db(
+    workdir: Path,
+    output_dir: Path,
+    nvd_flags: list[str],
+    env: dict[str, str],
+    data_dir: Path,
+) -> bool:
+    cmd = _maven_cmd(workdir) + [
+        "-B",
+        "-ntp",
+        "org.owasp:dependency-check-maven:update-only",
+        f"-DdataDirectory={data_dir}",
+        "-DnvdApiDelay=2500",
+        "-DnvdMaxRetryCount=10",
+        *nvd_flags,
+    ]
+    proc = shared._run_tool_command("owasp", cmd, workdir, output_dir, env=env)
+    return proc.returncode == 0
+
+
 def run_owasp(
     workdir: Path,
     output_dir: Path,
@@ -283,6 +309,20 @@ def run_owasp(
     elif not use_nvd_api_key:
         nvd_flags.append("-DautoUpdate=false")
     format_flag = "-Dformat=JSON"
+    # Shared NVD data (Maven only: the Gradle plugin takes its data directory from the build script)
+    db = SecurityDb("owasp", None, "bypass")
+    if build_tool != "gradle":
+        db = prepare_security_db(
+            "owasp",
+            OWASP_DB_FILE,
+            partial(_populate_owasp_db, workdir, output_dir, nvd_flags, env),
+            can_populate=use_nvd_api_key,
+        )
+        if db.status == "unavailable":
+            return unavailable_result(db)
+        if db.usable and db.path is not None:
+            nvd_flags = [flag for flag in nvd_flags if flag != "-DautoUpdate=false"]
+            nvd_flags += [f"-DdataDirectory={db.path}", "-DautoUpdate=false"]
     if build_tool == "gradle":
         cmd = _gradle_cmd(workdir) + [
             "dependencyCheckAnalyze",
@@ -324,7 +364,7 @@ def run_owasp(
         placeholder.write_text('{"dependencies": []}', encoding="utf-8")
         report_paths = [placeholder]
         report_found = True
-    metrics = (
+    metrics: dict[str, Any] = (
         _parse_dependency_check(report_paths[0])
         if report_paths
         else {
@@ -337,6 +377,7 @@ def run_owasp(
     )
     metrics["report_found"] = report_found
     metrics["owasp_data_missing"] = nvd_access_failed
+    metrics[SECURITY_DB_KEY] = db.metrics()
     if report_paths and report_paths[0].name == "dependency-check-report.json" and output_dir in report_paths[0].parents:
         metrics["report_placeholder"] = True
     return ToolResult(
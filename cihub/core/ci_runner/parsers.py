@@ -1,14 +1,86 @@
-"""Parsing helpers for tool outputs."""
+"""Parsing helpers for tool outputs.
+
+XML reports (JUnit, Cobertura, JaCoCo, PITest, Checkstyle, SpotBugs, PMD) are
+streamed rather than loaded whole: multi-module PITest and coverage reports
+can run to hundreds of MB. When several report files add up to at least
+PARALLEL_MIN_XML_BYTES they are parsed in worker processes.
+"""
 
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator, TypeVar
 
 import defusedxml.ElementTree as ET
 
+from cihub.utils.parallel import process_map
+from cihub.utils.tracing import span
+
 from .shared import _parse_json
 
+_R = TypeVar("_R")
+
+# Below this combined size, worker process startup costs more than it saves.
+PARALLEL_MIN_XML_BYTES = 32 * 1024 * 1024
+
+
+def _iter_xml_starts(path: Path) -> Iterator[tuple[int, Any]]:
+    """Stream an XML file, yielding (depth, element) as each element opens.
+
+    Only the tag and attributes of a yielded element are populated. Elements
+    are cleared as they close, so memory stays bounded however large the file
+    is. Uses defusedxml's iterparse, so entity expansion stays forbidden.
+    Raises ET.ParseError if the document turns out to be malformed.
+    """
+    depth = 0
+    root = None
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            yield depth, elem
+            depth += 1
+            continue
+        depth -= 1
+        elem.clear()
+        if depth == 1 and root is not None:
+            root.clear()  # drop closed top-level children too
+
+
+def _parse_many(func: Callable[[Path], _R], paths: list[Path]) -> list[_R]:
+    """Apply a per-file parser to each path, in worker processes when the reports are large."""
+    total_bytes = 0
+    for path in paths:
+        try:
+            total_bytes += path.stat().st_size
+        except OSError:
+            pass
+    min_items = 2 if total_bytes >= PARALLEL_MIN_XML_BYTES else len(paths) + 1
+    with span("parse", files=len(paths), bytes=total_bytes):
+        return process_map(func, paths, min_items=min_items)
+
+
+def _junit_totals(path: Path) -> dict[str, Any] | None:
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0, "time": 0.0}
+    aggregate = False
+    try:
+        for depth, elem in _iter_xml_starts(path):
+            if depth == 0:
+                aggregate = elem.tag.endswith("testsuites")
+                if aggregate:
+                    continue
+            elif depth > 1 or not aggregate:
+                continue
+            totals["tests"] += int(elem.attrib.get("tests", 0))
+            totals["failures"] += int(elem.attrib.get("failures", 0))
+            totals["errors"] += int(elem.attrib.get("errors", 0))
+            totals["skipped"] += int(elem.attrib.get("skipped", 0))
+            totals["time"] += float(elem.attrib.get("time", 0.0))
+    except ET.ParseError:
+        return None
+    return totals
+
 
 def _parse_junit(path: Path) -> dict[str, Any]:
     default_result = {
@@ -19,26 +91,9 @@ def _parse_junit(path: Path) -> dict[str, Any]:
     }
     if not path.exists():
         return default_result
-    try:
-        root = ET.parse(path).getroot()
-    except ET.ParseError:
+    totals = _junit_totals(path)
+    if totals is None:
         return default_result
-    if root.tag.endswith("testsuites"):
-        totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0, "time": 0.0}
-        for suite in root:
-            totals["tests"] += int(suite.attrib.get("tests", 0))
-            totals["failures"] += int(suite.attrib.get("failures", 0))
-            totals["errors"] += int(suite.attrib.get("errors", 0))
-            totals["skipped"] += int(suite.attrib.get("skipped", 0))
-            totals["time"] += float(suite.attrib.get("time", 0.0))
-    else:
-        totals = {
-            "tests": int(root.attrib.get("tests", 0)),
-            "failures": int(root.attrib.get("failures", 0)),
-            "errors": int(root.attrib.get("errors", 0)),
-            "skipped": int(root.attrib.get("skipped", 0)),
-            "time": float(root.attrib.get("time", 0.0)),
-        }
     failed = totals["failures"] + totals["errors"]
     passed = max(totals["tests"] - failed - totals["skipped"], 0)
     return {
@@ -57,13 +112,16 @@ def _parse_coverage(path: Path) -> dict[str, Any]:
     }
     if not path.exists():
         return default_result
+    attrib: dict[str, str] = {}
     try:
-        root = ET.parse(path).getroot()
+        for depth, elem in _iter_xml_starts(path):
+            if depth == 0:
+                attrib = dict(elem.attrib)
     except ET.ParseError:
         return default_result
-    line_rate = float(root.attrib.get("line-rate", 0))
-    lines_covered = int(root.attrib.get("lines-covered", 0))
-    lines_total = int(root.attrib.get("lines-valid", root.attrib.get("lines-total", 0)))
+    line_rate = float(attrib.get("line-rate", 0))
+    lines_covered = int(attrib.get("lines-covered", 0))
+    lines_total = int(attrib.get("lines-valid", attrib.get("lines-total", 0)))
     coverage = int(round(line_rate * 100))
     return {
         "coverage": coverage,
@@ -79,8 +137,7 @@ def _parse_junit_files(paths: list[Path]) -> dict[str, Any]:
         "tests_skipped": 0,
         "tests_runtime_seconds": 0.0,
     }
-    for path in paths:
-        parsed = _parse_junit(path)
+    for parsed in _parse_many(_parse_junit, paths):
         totals["tests_passed"] += int(parsed.get("tests_passed", 0))
         totals["tests_failed"] += int(parsed.get("tests_failed", 0))
         totals["tests_skipped"] += int(parsed.get("tests_skipped", 0))
@@ -88,19 +145,27 @@ def _parse_junit_files(paths: list[Path]) -> dict[str, Any]:
     return totals
 
 
-def _parse_jacoco_files(paths: list[Path]) -> dict[str, Any]:
+def _jacoco_line_counts(path: Path) -> tuple[int, int] | None:
     covered = 0
     missed = 0
-    for path in paths:
-        try:
-            root = ET.parse(path).getroot()
-        except ET.ParseError:
-            continue
-        for counter in root.iter("counter"):
-            if counter.attrib.get("type") != "LINE":
+    try:
+        for _depth, elem in _iter_xml_starts(path):
+            if elem.tag != "counter" or elem.attrib.get("type") != "LINE":
                 continue
-            covered += int(counter.attrib.get("covered", 0))
-            missed += int(counter.attrib.get("missed", 0))
+            covered += int(elem.attrib.get("covered", 0))
+            missed += int(elem.attrib.get("missed", 0))
+    except ET.ParseError:
+        return None
+    return covered, missed
+
+
+def _parse_jacoco_files(paths: list[Path]) -> dict[str, Any]:
+    covered = 0
+    missed = 0
+    for counts in _parse_many(_jacoco_line_counts, paths):
+        if counts is not None:
+            covered += counts[0]
+            missed += counts[1]
     total = covered + missed
     coverage = int(round((covered / total) * 100)) if total else 0
     return {
@@ -110,23 +175,29 @@ def _parse_jacoco_files(paths: list[Path]) -> dict[str, Any]:
     }
 
 
+def _pitest_status_counts(path: Path) -> dict[str, int] | None:
+    counts = {"KILLED": 0, "SURVIVED": 0, "NO_COVERAGE": 0}
+    try:
+        for _depth, elem in _iter_xml_starts(path):
+            if elem.tag != "mutation":
+                continue
+            status = elem.attrib.get("status")
+            if status in counts:
+                counts[status] += 1
+    except ET.ParseError:
+        return None
+    return counts
+
+
 def _parse_pitest_files(paths: list[Path]) -> dict[str, Any]:
     killed = 0
     survived = 0
     no_coverage = 0
-    for path in paths:
-        try:
-            root = ET.parse(path).getroot()
-        except ET.ParseError:
-            continue
-        for mutation in root.iter("mutation"):
-            status = mutation.attrib.get("status")
-            if status == "KILLED":
-                killed += 1
-            elif status == "SURVIVED":
-                survived += 1
-            elif status == "NO_COVERAGE":
-                no_coverage += 1
+    for counts in _parse_many(_pitest_status_counts, paths):
+        if counts is not None:
+            killed += counts["KILLED"]
+            survived += counts["SURVIVED"]
+            no_coverage += counts["NO_COVERAGE"]
     total = killed + survived + no_coverage
     score = int(round((killed / total) * 100)) if total else 0
     return {
@@ -136,37 +207,27 @@ def _parse_pitest_files(paths: list[Path]) -> dict[str, Any]:
     }
 
 
+def _count_elements(tag: str, path: Path) -> int | None:
+    try:
+        return sum(1 for _depth, elem in _iter_xml_starts(path) if elem.tag == tag)
+    except ET.ParseError:
+        return None
+
+
+def _count_in_files(tag: str, paths: list[Path]) -> int:
+    return sum(count or 0 for count in _parse_many(partial(_count_elements, tag), paths))
+
+
 def _parse_checkstyle_files(paths: list[Path]) -> dict[str, Any]:
-    violations = 0
-    for path in paths:
-        try:
-            root = ET.parse(path).getroot()
-        except ET.ParseError:
-            continue
-        violations += len(list(root.iter("error")))
-    return {"checkstyle_issues": violations}
+    return {"checkstyle_issues": _count_in_files("error", paths)}
 
 
 def _parse_spotbugs_files(paths: list[Path]) -> dict[str, Any]:
-    issues = 0
-    for path in paths:
-        try:
-            root = ET.parse(path).getroot()
-        except ET.ParseError:
-            continue
-        issues += len(list(root.iter("BugInstance")))
-    return {"spotbugs_issues": issues}
+    return {"spotbugs_issues": _count_in_files("BugInstance", paths)}
 
 
 def _parse_pmd_files(paths: list[Path]) -> dict[str, Any]:
-    violations = 0
-    for path in paths:
-        try:
-            root = ET.parse(path).getroot()
-        except ET.ParseError:
-            continue
-        violations += len(list(root.iter("violation")))
-    return {"pmd_violations": violations}
+    return {"pmd_violations": _count_in_files("violation", paths)}
 
 
 def _parse_dependency_check(path: Path) -> dict[str, Any]:
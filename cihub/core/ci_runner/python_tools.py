@@ -11,6 +11,8 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from cihub.utils.tracing import span
+
 from . import shared
 from .base import ToolResult
 from .parsers import _parse_coverage, _parse_junit
@@ -126,8 +128,9 @@ def run_pytest(
         "junit_report_found": junit_found,
         "coverage_report_found": coverage_found,
     }
-    metrics.update(_parse_junit(junit_path))
-    metrics.update(_parse_coverage(coverage_path))
+    with span("parse", files=2):
+        metrics.update(_parse_junit(junit_path))
+        metrics.update(_parse_coverage(coverage_path))
     return ToolResult(
         tool="pytest",
         ran=True,
@@ -0,0 +1,268 @@
+"""Host-level cache for vulnerability databases.
+
+Trivy and OWASP dependency-check each download a database before they scan
+(the trivy DB, the NVD mirror). Left alone, every
+target of a multi-repo run downloads it again. This cache keeps one copy per
+host under CIHUB_SECURITY_CACHE_DIR (default: the private per-user cache,
+~/.cache/cihub/security; the cache is off if that directory is not safe to use):
+
+- A copy younger than CIHUB_SECURITY_DB_MAX_AGE_HOURS is a hit. The tool
+  scans against it with its own updates turned off, so targets only read it.
+- An older or missing copy is refreshed once, under a lock, by the first
+  target that needs it; concurrent targets wait and then reuse it. When the
+  refresh fails the previous copy is still used (reported as stale). The
+  lock holder records its PID and host and keeps a heartbeat, so a refresh
+  may take hours (a first NVD sync) while a lock left by a killed run is
+  broken.
+- With CIHUB_OFFLINE nothing is downloaded. A copy younger than
+  CIHUB_SECURITY_DB_OFFLINE_MAX_AGE_HOURS is used as-is; otherwise the tool
+  fails immediately instead of attempting a download.
+
+The outcome of each tool (status and DB age) is recorded in its metrics under
+SECURITY_DB_KEY and surfaced as environment.security_db in the report.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import shutil
+import socket
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cihub.utils.env import env_bool, env_int, env_str
+from cihub.utils.paths import user_cache_dir
+
+from .base import ToolResult
+
+SECURITY_DB_KEY = "security_db"
+STAMP_NAME = ".cihub-updated"
+DEFAULT_MAX_AGE_HOURS = 24
+DEFAULT_OFFLINE_MAX_AGE_HOURS = 168
+LOCK_POLL_SECONDS = 1.0
+LOCK_OWNER_FILE = "owner"
+LOCK_HEARTBEAT_SECONDS = 30.0
+# A lock whose heartbeat is this old is abandoned, even if its holder is on another host
+LOCK_STALE_SECONDS = 600
+
+# Statuses whose data directory the tool should scan against
+USABLE_STATUSES = frozenset({"hit", "miss", "stale"})
+
+
+@dataclass(frozen=True)
+class SecurityDbPolicy:
+    """Where the cache lives and how old its contents may get."""
+
+    root: Path
+    max_age_hours: int
+    offline: bool
+    offline_max_age_hours: int
+
+
+@dataclass(frozen=True)
+class SecurityDb:
+    """Cache outcome for one tool.
+
+    Status is one of:
+    - hit: fresh copy reused
+    - miss: copy refreshed by this run
+    - stale: refresh failed or offline; an older copy is used
+    - unavailable: offline and no usable copy (the tool must not run)
+    - bypass: no copy and it could not be populated; the tool runs uncached
+    - disabled: cache turned off
+    """
+
+    tool: str
+    path: Path | None
+    status: str
+    age_hours: float | None = None
+    offline: bool = False
+
+    @property
+    def usable(self) -> bool:
+        return self.path is not None and self.status in USABLE_STATUSES
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "age_hours": None if self.age_hours is None else round(self.age_hours, 2),
+        }
+
+
+def security_db_policy() -> SecurityDbPolicy | None:
+    """The cache policy from the environment.
+
+    None when CIHUB_SECURITY_CACHE turns the cache off, or when the default
+    root cannot be created or belongs to someone else.
+    """
+    if not env_bool("CIHUB_SECURITY_CACHE", default=True):
+        return None
+    override = env_str("CIHUB_SECURITY_CACHE_DIR")
+    if override:
+        root = Path(override).expanduser()
+    else:
+        try:
+            root = user_cache_dir("security")
+        except OSError:
+            return None
+    return SecurityDbPolicy(
+        root=root,
+        max_age_hours=env_int("CIHUB_SECURITY_DB_MAX_AGE_HOURS", DEFAULT_MAX_AGE_HOURS),
+        offline=env_bool("CIHUB_OFFLINE", default=False),
+        offline_max_age_hours=env_int("CIHUB_SECURITY_DB_OFFLINE_MAX_AGE_HOURS", DEFAULT_OFFLINE_MAX_AGE_HOURS),
+    )
+
+
+def _age_hours(path: Path, artifact: str) -> float | None:
+    """Hours since the copy was last refreshed, or None when there is no complete copy."""
+    if not (path / artifact).exists():
+        return None
+    try:
+        updated = (path / STAMP_NAME).stat().st_mtime
+    except OSError:
+        return None
+    return max(time.time() - updated, 0.0) / 3600
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        return True  # os.kill would terminate the process; rely on the heartbeat
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # exists, but owned by another user
+    return True
+
+
+def _lock_is_stale(lock: Path) -> bool:
+    """True when the lock's holder is gone: a dead PID on this host, or no recent heartbeat."""
+    owner = lock / LOCK_OWNER_FILE
+    try:
+        pid, _, host = owner.read_text(encoding="utf-8").partition(" ")
+        heartbeat = owner.stat().st_mtime
+    except (OSError, UnicodeDecodeError):
+        try:  # taken a moment ago, owner not written yet (or left by a run killed right then)
+            return time.time() - lock.stat().st_mtime > LOCK_STALE_SECONDS
+        except OSError:
+            return False
+    if host.strip() == socket.gethostname() and pid.isdigit() and not _pid_alive(int(pid)):
+        return True
+    return time.time() - heartbeat > LOCK_STALE_SECONDS
+
+
+def _heartbeat(owner: Path, stop: threading.Event) -> None:
+    while not stop.wait(LOCK_HEARTBEAT_SECONDS):
+        with contextlib.suppress(OSError):
+            os.utime(owner)
+
+
+@contextlib.contextmanager
+def _populate_lock(path: Path) -> Iterator[None]:
+    """Host-wide lock around refreshing one tool's copy (a lock directory next to it)."""
+    lock = path.with_name(f"{path.name}.lock")
+    lock.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        try:
+            lock.mkdir()
+            break
+        except FileExistsError:
+            if _lock_is_stale(lock):
+                # Rename first so only one waiter removes it
+                abandoned = lock.with_name(f"{lock.name}.stale-{uuid.uuid4().hex[:8]}")
+                with contextlib.suppress(OSError):
+                    lock.rename(abandoned)
+                    shutil.rmtree(abandoned, ignore_errors=True)
+                continue
+            time.sleep(LOCK_POLL_SECONDS)
+    owner = lock / LOCK_OWNER_FILE
+    stop = threading.Event()
+    beat = threading.Thread(target=_heartbeat, args=(owner, stop), name="cihub-lock-heartbeat", daemon=True)
+    try:
+        owner.write_text(f"{os.getpid()} {socket.gethostname()}", encoding="utf-8")
+        beat.start()
+        yield
+    finally:
+        stop.set()
+        if beat.is_alive():
+            beat.join()
+        with contextlib.suppress(OSError):
+            owner.unlink(missing_ok=True)
+            lock.rmdir()
+
+
+def prepare_security_db(
+    tool: str,
+    artifact: str,
+    populate: Callable[[Path], bool],
+    *,
+    can_populate: bool = True,
+) -> SecurityDb:
+    """Make sure a tool's cached data is fresh enough to scan against.
+
+    Args:
+        tool: Tool name; its data lives in <cache root>/<tool>
+        artifact: Path (relative to the tool's directory) that exists once the copy is complete
+        populate: Downloads the data into the given directory; returns True on success
+        can_populate: False when the data cannot be downloaded (e.g. missing credentials)
+
+    Returns:
+        The cache outcome; scan against SecurityDb.path only when SecurityDb.usable
+    """
+    policy = security_db_policy()
+    if policy is None:
+        return SecurityDb(tool, None, "disabled")
+    path = policy.root / tool
+    age = _age_hours(path, artifact)
+    if age is not None and age <= policy.max_age_hours:
+        return SecurityDb(tool, path, "hit", age, policy.offline)
+    if policy.offline:
+        if age is not None and age <= policy.offline_max_age_hours:
+            return SecurityDb(tool, path, "stale", age, offline=True)
+        return SecurityDb(tool, path, "unavailable", age, offline=True)
+    if not can_populate:
+        return SecurityDb(tool, path, "stale", age) if age is not None else SecurityDb(tool, None, "bypass")
+
+    with _populate_lock(path):
+        age = _age_hours(path, artifact)
+        if age is not None and age <= policy.max_age_hours:
+            return SecurityDb(tool, path, "hit", age)  # refreshed by a concurrent target
+        path.mkdir(parents=True, exist_ok=True)
+        if populate(path) and (path / artifact).exists():
+            (path / STAMP_NAME).write_text(time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), encoding="utf-8")
+            return SecurityDb(tool, path, "miss", 0.0)
+    if age is not None:
+        return SecurityDb(tool, path, "stale", age)
+    return SecurityDb(tool, None, "bypass")
+
+
+def unavailable_result(db: SecurityDb) -> ToolResult:
+    """Failed, not-run result for a tool whose data is unavailable offline."""
+    age = "no cached copy" if db.age_hours is None else f"the cached copy is {db.age_hours:.0f}h old"
+    return ToolResult(
+        tool=db.tool,
+        ran=False,
+        success=False,
+        metrics={SECURITY_DB_KEY: db.metrics()},
+        stderr=(
+            f"{db.tool}: offline mode and {age} in {db.path} "
+            "(refresh it online, or raise CIHUB_SECURITY_DB_OFFLINE_MAX_AGE_HOURS)"
+        ),
+    )
+
+
+__all__ = [
+    "SECURITY_DB_KEY",
+    "SecurityDb",
+    "SecurityDbPolicy",
+    "prepare_security_db",
+    "security_db_policy",
+    "unavailable_result",
+]
@@ -2,10 +2,25 @@
 
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
 
 from . import shared
 from .base import ToolResult
+from .security_cache import SECURITY_DB_KEY, prepare_security_db, unavailable_result
+
+TRIVY_DB_FILE = "db/trivy.db"
+TRIVY_JAVA_DB_FILE = "java-db/trivy-java.db"
+
+
+def _populate_trivy_db(workdir: Path, output_dir: Path, cache_dir: Path) -> bool:
+    base = ["trivy", "image", "--cache-dir", str(cache_dir)]
+    proc = shared._run_tool_command("trivy", [*base, "--download-db-only"], workdir, output_dir)
+    if proc.returncode != 0:
+        return False
+    # The Java DB is only needed for JAR scanning; a failed download leaves it to trivy
+    shared._run_tool_command("trivy", [*base, "--download-java-db-only"], workdir, output_dir)
+    return True
 
 
 def run_semgrep(workdir: Path, output_dir: Path) -> ToolResult:
@@ -30,7 +45,18 @@ def run_semgrep(workdir: Path, output_dir: Path) -> ToolResult:
 
 def run_trivy(workdir: Path, output_dir: Path) -> ToolResult:
     report_path = output_dir / "trivy-report.json"
-    cmd = ["trivy", "fs", "--format", "json", "--output", str(report_path), "."]
+    db = prepare_security_db("trivy", TRIVY_DB_FILE, partial(_populate_trivy_db, workdir, output_dir))
+    if db.status == "unavailable":
+        return unavailable_result(db)
+    cache_flags: list[str] = []
+    if db.usable and db.path is not None:
+        # The scan cache (fanal) stays in memory: concurrent targets only read the shared DBs
+        cache_flags = ["--cache-dir", str(db.path), "--cache-backend", "memory", "--skip-db-update"]
+        if (db.path / TRIVY_JAVA_DB_FILE).exists():
+            cache_flags.append("--skip-java-db-update")
+        if db.offline:
+            cache_flags.append("--offline-scan")
+    cmd = ["trivy", "fs", *cache_flags, "--format", "json", "--output", str(report_path), "."]
     proc = shared._run_tool_command("trivy", cmd, workdir, output_dir)
     data = shared._parse_json(report_path)
     parse_ok = data is not None
@@ -74,6 +100,7 @@ def run_trivy(workdir: Path, output_dir: Path) -> ToolResult:
             "trivy_low": low,
             "trivy_max_cvss": max_cvss,
             "parse_error": not parse_ok,
+            SECURITY_DB_KEY: db.metrics(),
         },
         artifacts={"report": str(report_path)},
         stdout=proc.stdout,
@@ -18,6 +18,9 @@ from cihub.utils.exec_utils import (
     resolve_executable,
     safe_run,
 )
+from cihub.utils.tracing import span
+
+from .file_index import file_index
 
 
 def _run_command(
@@ -116,6 +119,41 @@ def _run_command(
     )
 
 
+def _run_command_to_file(
+    cmd: list[str],
+    workdir: Path,
+    log_path: Path,
+    timeout: int | None = None,
+) -> int:
+    """Run a command with stdout and stderr streamed into log_path.
+
+    For commands whose output can be large (e.g. `docker compose logs`): the
+    output goes straight to disk instead of being held in memory.
+
+    Returns:
+        The exit code (127 when the command is missing, 124 on timeout)
+    """
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("ab") as handle:
+        try:
+            proc = subprocess.Popen(  # noqa: S603
+                [resolve_executable(cmd[0]), *cmd[1:]],
+                cwd=workdir,
+                env=os.environ.copy(),
+                stdout=handle,
+                stderr=subprocess.STDOUT,
+            )
+        except OSError as exc:
+            handle.write(f"{exc}\n".encode())
+            return 127
+        try:
+            return proc.wait(timeout=timeout or TIMEOUT_BUILD)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            return 124
+
+
 def _append_text(path: Path, content: str) -> None:
     if not content:
         return
@@ -143,7 +181,8 @@ def _run_tool_command(
     env: dict[str, str] | None = None,
 ) -> subprocess.CompletedProcess[str]:
     verbose = env_bool("CIHUB_VERBOSE", default=False)
-    proc = _run_command(cmd, workdir, timeout=timeout, env=env, stream_output=verbose)
+    with span("exec", tool=tool):
+        proc = _run_command(cmd, workdir, timeout=timeout, env=env, stream_output=verbose)
     _write_tool_logs(tool, output_dir, proc.stdout, proc.stderr, cmd=cmd)
     return proc
 
@@ -152,7 +191,7 @@ def _parse_json(path: Path) -> dict[str, Any] | list[Any] | None:
     if not path.exists():
         return None
     try:
-        with path.open(encoding="utf-8") as f:
+        with span("parse", file=path.name), path.open(encoding="utf-8") as f:
             data = json.load(f)
     except json.JSONDecodeError:
         return None
@@ -162,8 +201,7 @@ def _parse_json(path: Path) -> dict[str, Any] | list[Any] | None:
 
 
 def _find_files(workdir: Path, patterns: list[str]) -> list[Path]:
-    files: list[Path] = []
-    for pattern in patterns:
-        files.extend(workdir.rglob(pattern))
-    unique = {path.resolve() for path in files}
-    return sorted(unique, key=lambda path: str(path))
+    """Resolved paths under workdir matching any rglob pattern, from the shared file index."""
+    if not workdir.is_dir():
+        return []
+    return file_index(workdir).find(patterns)
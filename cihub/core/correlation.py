@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Any, Callable
 from urllib import request
 
+from cihub.utils.tracing import span, traced
+
 
 def _safe_extractall(zip_path: Path, target_dir: Path) -> None:
     """Extract ZIP with path traversal protection.
@@ -30,6 +32,7 @@ def _safe_extractall(zip_path: Path, target_dir: Path) -> None:
         zf.extractall(target_dir)
 
 
+@traced("github.download")
 def download_artifact(archive_url: str, target_dir: Path, token: str) -> Path | None:
     """Download and extract a GitHub artifact ZIP."""
     req = request.Request(  # noqa: S310
@@ -96,7 +99,7 @@ def find_run_by_correlation_id(
                     "X-GitHub-Api-Version": "2022-11-28",
                 },
             )
-            with request.urlopen(req) as resp:  # noqa: S310
+            with span("github.api", url=url), request.urlopen(req) as resp:  # noqa: S310
                 data = json.loads(resp.read().decode())
                 return data if isinstance(data, dict) else {}
 
@@ -91,6 +91,8 @@ class LanguageStrategy(ABC):
         workdir: str,
         output_dir: Path,
         problems: list[dict[str, Any]],
+        *,
+        dependency_cache: dict[str, Any] | None = None,
     ) -> tuple[dict[str, dict[str, Any]], dict[str, bool], dict[str, bool]]:
         """Execute all enabled tools, return results.
 
@@ -100,6 +102,7 @@ class LanguageStrategy(ABC):
             workdir: Working directory relative to repo_path
             output_dir: Directory for tool output artifacts
             problems: List to append warnings/errors to
+            dependency_cache: Filled with the dependency install cache outcome, if any
 
         Returns:
             Tuple of (tool_outputs, tools_ran, tools_success) dictionaries.
@@ -76,6 +76,7 @@ class JavaStrategy(LanguageStrategy):
         problems: list[dict[str, Any]],
         *,
         build_tool: str | None = None,
+        dependency_cache: dict[str, Any] | None = None,
     ) -> tuple[dict[str, dict[str, Any]], dict[str, bool], dict[str, bool]]:
         """Execute Java tools by delegating to existing implementation.
 
@@ -86,6 +87,7 @@ class JavaStrategy(LanguageStrategy):
             output_dir: Directory for tool output artifacts
             problems: List to append warnings/errors to
             build_tool: Build tool to use (maven/gradle), auto-detected if None
+            dependency_cache: Filled with the dependency install cache outcome, if any
         """
         # Import here to avoid circular dependencies
         from cihub.services.ci_engine.java_tools import _run_java_tools
@@ -109,7 +111,9 @@ class JavaStrategy(LanguageStrategy):
         self._auto_fix_build_files(workdir_path, config, build_tool, problems)
 
         runners = self.get_runners()
-        return _run_java_tools(config, repo_path, workdir, output_dir, build_tool, problems, runners)
+        return _run_java_tools(
+            config, repo_path, workdir, output_dir, build_tool, problems, runners, dependency_cache=dependency_cache
+        )
 
     def _auto_fix_build_files(
         self,
@@ -76,6 +76,7 @@ class PythonStrategy(LanguageStrategy):
         problems: list[dict[str, Any]],
         *,
         install_deps: bool = False,
+        dependency_cache: dict[str, Any] | None = None,
     ) -> tuple[dict[str, dict[str, Any]], dict[str, bool], dict[str, bool]]:
         """Execute Python tools by delegating to existing implementation.
 
@@ -86,6 +87,7 @@ class PythonStrategy(LanguageStrategy):
             output_dir: Directory for tool output artifacts
             problems: List to append warnings/errors to
             install_deps: If True, install dependencies before running tools
+            dependency_cache: Filled with the dependency install cache outcome, if any
         """
         # Import here to avoid circular dependencies
         from cihub.services.ci_engine.python_tools import (
@@ -96,11 +98,16 @@ class PythonStrategy(LanguageStrategy):
         # Install dependencies only if requested
         if install_deps:
             workdir_path = repo_path / workdir
-            _install_python_dependencies(config, workdir_path, problems)
+            outcome = _install_python_dependencies(config, workdir_path, problems)
+            if outcome and dependency_cache is not None:
+                dependency_cache.update(outcome)
 
         # Run tools
         runners = self.get_runners()
-        return _run_python_tools(config, repo_path, workdir, output_dir, problems, runners)
+        tool_outputs, tools_ran, tools_success = _run_python_tools(
+            config, repo_path, workdir, output_dir, problems, runners
+        )
+        return tool_outputs, tools_ran, tools_success
 
     def evaluate_gates(
         self,
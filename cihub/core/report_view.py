@@ -0,0 +1,463 @@
+"""Structured view of a single report: tool rows, threshold rows, gate results.
+
+The Markdown summary renderer (cihub.core.reporting) builds its tables from
+these rows instead of formatting report fields inline. Self-validation does
+not use the view: it parses the summary that was actually rendered, so drift
+between report.json and the written summary.md is still caught.
+
+Usage:
+    view = build_report_view(report)
+    gate_statuses = {row.check: row.status for row in view.gates}
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from cihub.core.gate_specs import threshold_rows, tool_rows
+
+
+@dataclass(frozen=True)
+class ToolRow:
+    """One row of the Tools Enabled table.
+
+    Attributes:
+        category: Tool category label (e.g., "Testing")
+        label: Display label (the build tool name for the build row)
+        key: Report key in tools_configured/tools_ran/tools_success
+        configured: Whether the tool was configured
+        ran: Whether the tool ran
+        success: Whether the tool succeeded
+    """
+
+    category: str
+    label: str
+    key: str
+    configured: bool
+    ran: bool
+    success: bool
+
+
+@dataclass(frozen=True)
+class ThresholdRow:
+    """One effective threshold setting ("%" suffix renders as a percentage)."""
+
+    label: str
+    key: str
+    suffix: str
+    value: Any
+
+
+@dataclass(frozen=True)
+class GateRow:
+    """One quality gate check and its status (e.g., "PASSED", "SKIP", "NOT RUN")."""
+
+    check: str
+    status: str
+
+
+@dataclass(frozen=True)
+class ReportView:
+    """Rows behind the Markdown summary tables."""
+
+    language: str
+    tools: tuple[ToolRow, ...]
+    thresholds: tuple[ThresholdRow, ...]
+    gates: tuple[GateRow, ...]
+
+
+def detect_language(report: dict[str, Any]) -> str:
+    if "java_version" in report:
+        return "java"
+    if "python_version" in report:
+        return "python"
+    return "unknown"
+
+
+def format_number(value: Any) -> int:
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return 0
+
+
+def tool_table_rows(report: dict[str, Any], language: str) -> list[ToolRow]:
+    """Tools Enabled rows for a report, in display order."""
+    tools_configured = report.get("tools_configured", {}) or {}
+    tools_ran = report.get("tools_ran", {}) or {}
+    tools_success = report.get("tools_success", {}) or {}
+    results = report.get("results", {}) or {}
+    env = report.get("environment", {}) or {}
+
+    rows: list[ToolRow] = []
+    for category, label, key in tool_rows(language):
+        if key == "__build__":
+            # Build tool uses "build" as the report key, not "__build__"
+            build_tool = env.get("build_tool") or report.get("build_tool") or "build"
+            build_status = results.get("build")
+            # Check actual build status from report - build is configured if it ran
+            build_ran = bool(tools_ran.get("build", False)) or build_status is not None
+            # Build is implicitly configured if it ran
+            rows.append(ToolRow(category, str(build_tool), "build", build_ran, build_ran, build_status == "success"))
+            continue
+        rows.append(
+            ToolRow(
+                category,
+                label,
+                key,
+                bool(tools_configured.get(key, False)),
+                bool(tools_ran.get(key, False)),
+                bool(tools_success.get(key, False)),
+            )
+        )
+    return rows
+
+
+def threshold_table_rows(report: dict[str, Any], language: str) -> list[ThresholdRow]:
+    """Effective threshold rows for a report, in display order."""
+    thresholds = report.get("thresholds", {}) or {}
+    return [ThresholdRow(label, key, suffix, thresholds.get(key)) for label, key, suffix in threshold_rows(language)]
+
+
+def quality_gate_rows(report: dict[str, Any], language: str) -> list[GateRow]:
+    """Quality gate checks and their statuses, in display order."""
+    results = report.get("results", {}) or {}
+    tool_metrics = report.get("tool_metrics", {}) or {}
+    thresholds = report.get("thresholds", {}) or {}
+    tools_configured = report.get("tools_configured", {}) or {}
+    tools_ran = report.get("tools_ran", {}) or {}
+    tools_success = report.get("tools_success", {}) or {}
+    tools_require_run = report.get("tools_require_run", {}) or {}
+    tool_evidence = report.get("tool_evidence", {}) or {}
+
+    def gate_status(condition: bool, fail_label: str) -> str:
+        """Return gate status indicator."""
+        if condition:
+            return "PASSED"
+        return fail_label.upper()
+
+    def ran(tool: str) -> bool:
+        return bool(tools_ran.get(tool, False))
+
+    def has_evidence(tool: str) -> bool:
+        return bool(tool_evidence.get(tool, True))
+
+    def not_run_status(tool: str) -> str:
+        """Return NOT RUN status with annotation for hard-fail vs soft-skip."""
+        if tools_require_run.get(tool, False):
+            return "NOT RUN (required)"  # Hard-fail: will cause CI to fail
+        return "NOT RUN"  # Soft-skip: warning only
+
+    def no_report_status(tool: str) -> str:
+        if tools_require_run.get(tool, False):
+            return "NO REPORT (required)"
+        return "NO REPORT"
+
+    def skip_status() -> str:
+        """Return SKIP status."""
+        return "SKIP"
+
+    rows: list[GateRow] = []
+
+    tests_failed = format_number(results.get("tests_failed"))
+    tests_passed = format_number(results.get("tests_passed"))
+    tests_skipped = format_number(results.get("tests_skipped"))
+    tests_total = tests_failed + tests_passed + tests_skipped
+    if tests_total == 0:
+        if language == "python" and ran("pytest") and not has_evidence("pytest"):
+            rows.append(GateRow("Unit Tests", "NO REPORT"))
+        else:
+            rows.append(GateRow("Unit Tests", "NOT RUN"))
+    else:
+        rows.append(GateRow("Unit Tests", f"{gate_status(tests_failed == 0, 'Failed')}"))
+
+    if language == "java":
+        if tools_configured.get("jacoco", False):
+            if not ran("jacoco"):
+                rows.append(GateRow("JaCoCo Coverage", f"{not_run_status('jacoco')}"))
+            elif not has_evidence("jacoco"):
+                rows.append(GateRow("JaCoCo Coverage", f"{no_report_status('jacoco')}"))
+            else:
+                cov = format_number(results.get("coverage"))
+                min_cov = format_number(thresholds.get("coverage_min"))
+                cov_status = gate_status(cov >= min_cov, "Failed")
+                rows.append(GateRow("JaCoCo Coverage", f"{cov_status}"))
+        else:
+            rows.append(GateRow("JaCoCo Coverage", "SKIP"))
+
+        if tools_configured.get("pitest", False):
+            if not ran("pitest"):
+                rows.append(GateRow("PITest Mutation", f"{not_run_status('pitest')}"))
+            elif not has_evidence("pitest"):
+                rows.append(GateRow("PITest Mutation", f"{no_report_status('pitest')}"))
+            else:
+                mut = format_number(results.get("mutation_score"))
+                min_mut = format_number(thresholds.get("mutation_score_min"))
+                mut_status = gate_status(mut >= min_mut, "Failed")
+                rows.append(GateRow("PITest Mutation", f"{mut_status}"))
+        else:
+            rows.append(GateRow("PITest Mutation", "SKIP"))
+
+        if tools_configured.get("checkstyle", False):
+            if not ran("checkstyle"):
+                rows.append(GateRow("Checkstyle", f"{not_run_status('checkstyle')}"))
+            elif not has_evidence("checkstyle"):
+                rows.append(GateRow("Checkstyle", f"{no_report_status('checkstyle')}"))
+            else:
+                issues = format_number(tool_metrics.get("checkstyle_issues"))
+                max_issues = format_number(thresholds.get("max_checkstyle_errors"))
+                rows.append(GateRow("Checkstyle", f"{gate_status(issues <= max_issues, 'Violations')}"))
+        else:
+            rows.append(GateRow("Checkstyle", "SKIP"))
+
+        if tools_configured.get("spotbugs", False):
+            if not ran("spotbugs"):
+                rows.append(GateRow("SpotBugs", f"{not_run_status('spotbugs')}"))
+            elif not has_evidence("spotbugs"):
+                rows.append(GateRow("SpotBugs", f"{no_report_status('spotbugs')}"))
+            else:
+                issues = format_number(tool_metrics.get("spotbugs_issues"))
+                max_issues = format_number(thresholds.get("max_spotbugs_bugs"))
+                rows.append(GateRow("SpotBugs", f"{gate_status(issues <= max_issues, 'Bugs found')}"))
+        else:
+            rows.append(GateRow("SpotBugs", "SKIP"))
+
+        if tools_configured.get("pmd", False):
+            if not ran("pmd"):
+                rows.append(GateRow("PMD", f"{not_run_status('pmd')}"))
+            elif not has_evidence("pmd"):
+                rows.append(GateRow("PMD", f"{no_report_status('pmd')}"))
+            else:
+                issues = format_number(tool_metrics.get("pmd_violations"))
+                max_issues = format_number(thresholds.get("max_pmd_violations"))
+                rows.append(GateRow("PMD", f"{gate_status(issues <= max_issues, 'Violations')}"))
+        else:
+            rows.append(GateRow("PMD", "SKIP"))
+
+        if tools_configured.get("owasp", False):
+            if not ran("owasp"):
+                rows.append(GateRow("OWASP Check", f"{not_run_status('owasp')}"))
+            elif not has_evidence("owasp"):
+                rows.append(GateRow("OWASP Check", f"{no_report_status('owasp')}"))
+            else:
+                crit = format_number(tool_metrics.get("owasp_critical"))
+                high = format_number(tool_metrics.get("owasp_high"))
+                max_crit = format_number(thresholds.get("max_critical_vulns"))
+                max_high = format_number(thresholds.get("max_high_vulns"))
+                ok = crit <= max_crit and high <= max_high
+                rows.append(GateRow("OWASP Check", f"{gate_status(ok, 'Vulnerabilities')}"))
+        else:
+            rows.append(GateRow("OWASP Check", "SKIP"))
+
+        if tools_configured.get("semgrep", False):
+            if not ran("semgrep"):
+                rows.append(GateRow("Semgrep", f"{not_run_status('semgrep')}"))
+            else:
+                findings = format_number(tool_metrics.get("semgrep_findings"))
+                max_findings = format_number(thresholds.get("max_semgrep_findings"))
+                rows.append(GateRow("Semgrep", f"{gate_status(findings <= max_findings, 'Findings')}"))
+        else:
+            rows.append(GateRow("Semgrep", "SKIP"))
+
+        if tools_configured.get("trivy", False):
+            if not ran("trivy"):
+                rows.append(GateRow("Trivy", f"{not_run_status('trivy')}"))
+            else:
+                crit = format_number(tool_metrics.get("trivy_critical"))
+                high = format_number(tool_metrics.get("trivy_high"))
+                max_crit = format_number(thresholds.get("max_critical_vulns"))
+                max_high = format_number(thresholds.get("max_high_vulns"))
+                ok = crit <= max_crit and high <= max_high
+                rows.append(GateRow("Trivy", f"{gate_status(ok, 'Findings')}"))
+        else:
+            rows.append(GateRow("Trivy", "SKIP"))
+
+        if tools_configured.get("codeql", False):
+            if not ran("codeql"):
+                rows.append(GateRow("CodeQL", f"{not_run_status('codeql')}"))
+            else:
+                rows.append(GateRow("CodeQL", f"{gate_status(bool(tools_success.get('codeql', False)), 'Failed')}"))
+        else:
+            rows.append(GateRow("CodeQL", "SKIP"))
+
+        if tools_configured.get("docker", False):
+            docker_missing = bool(tool_metrics.get("docker_missing_compose", False))
+            if docker_missing:
+                rows.append(GateRow("Docker", "Missing compose"))
+            elif not ran("docker"):
+                rows.append(GateRow("Docker", f"{not_run_status('docker')}"))
+            else:
+                rows.append(GateRow("Docker", f"{gate_status(bool(tools_success.get('docker', False)), 'Failed')}"))
+        else:
+            rows.append(GateRow("Docker", "SKIP"))
+
+        if tools_configured.get("sbom", False):
+            if not ran("sbom"):
+                rows.append(GateRow("SBOM", f"{not_run_status('sbom')}"))
+            else:
+                rows.append(GateRow("SBOM", f"{gate_status(bool(tools_success.get('sbom', False)), 'Failed')}"))
+        else:
+            rows.append(GateRow("SBOM", "SKIP"))
+
+    else:
+        if tools_configured.get("pytest", False):
+            if not ran("pytest"):
+                rows.append(GateRow("pytest", f"{not_run_status('pytest')}"))
+            elif not has_evidence("pytest"):
+                rows.append(GateRow("pytest", f"{no_report_status('pytest')}"))
+            elif tests_total == 0:
+                rows.append(GateRow("pytest", f"{not_run_status('pytest')}"))
+            else:
+                rows.append(GateRow("pytest", f"{gate_status(tests_failed == 0, 'Failed')}"))
+        else:
+            rows.append(GateRow("pytest", "SKIP"))
+
+        if tools_configured.get("mutmut", False):
+            if not ran("mutmut"):
+                rows.append(GateRow("mutmut", f"{not_run_status('mutmut')}"))
+            else:
+                mut = format_number(results.get("mutation_score"))
+                min_mut = format_number(thresholds.get("mutation_score_min"))
+                rows.append(GateRow("mutmut", f"{gate_status(mut >= min_mut, 'Failed')}"))
+        else:
+            rows.append(GateRow("mutmut", "SKIP"))
+
+        if tools_configured.get("ruff", False):
+            if not ran("ruff"):
+                rows.append(GateRow("Ruff", f"{not_run_status('ruff')}"))
+            else:
+                issues = format_number(tool_metrics.get("ruff_errors"))
+                max_issues = format_number(thresholds.get("max_ruff_errors"))
+                rows.append(GateRow("Ruff", f"{gate_status(issues <= max_issues, 'Issues')}"))
+        else:
+            rows.append(GateRow("Ruff", "SKIP"))
+
+        if tools_configured.get("black", False):
+            if not ran("black"):
+                rows.append(GateRow("Black", f"{not_run_status('black')}"))
+            else:
+                issues = format_number(tool_metrics.get("black_issues"))
+                max_issues = format_number(thresholds.get("max_black_issues"))
+                rows.append(GateRow("Black", f"{gate_status(issues <= max_issues, 'Issues')}"))
+        else:
+            rows.append(GateRow("Black", "SKIP"))
+
+        if tools_configured.get("isort", False):
+            if not ran("isort"):
+                rows.append(GateRow("isort", f"{not_run_status('isort')}"))
+            else:
+                issues = format_number(tool_metrics.get("isort_issues"))
+                max_issues = format_number(thresholds.get("max_isort_issues"))
+                rows.append(GateRow("isort", f"{gate_status(issues <= max_issues, 'Issues')}"))
+        else:
+            rows.append(GateRow("isort", "SKIP"))
+
+        if tools_configured.get("mypy", False):
+            if not ran("mypy"):
+                rows.append(GateRow("mypy", f"{not_run_status('mypy')}"))
+            else:
+                issues = format_number(tool_metrics.get("mypy_errors"))
+                rows.append(GateRow("mypy", f"{gate_status(issues == 0, 'Errors')}"))
+        else:
+            rows.append(GateRow("mypy", "SKIP"))
+
+        if tools_configured.get("bandit", False):
+            if not ran("bandit"):
+                rows.append(GateRow("Bandit", f"{not_run_status('bandit')}"))
+            else:
+                high = format_number(tool_metrics.get("bandit_high"))
+                max_high = format_number(thresholds.get("max_high_vulns"))
+                rows.append(GateRow("Bandit", f"{gate_status(high <= max_high, 'Findings')}"))
+        else:
+            rows.append(GateRow("Bandit", "SKIP"))
+
+        if tools_configured.get("pip_audit", False):
+            if not ran("pip_audit"):
+                rows.append(GateRow("pip-audit", f"{not_run_status('pip_audit')}"))
+            else:
+                vulns = format_number(tool_metrics.get("pip_audit_vulns"))
+                max_high = format_number(thresholds.get("max_high_vulns"))
+                raw_pip = thresholds.get("max_pip_audit_vulns")
+                limit = format_number(raw_pip) if raw_pip is not None else max_high
+                rows.append(GateRow("pip-audit", f"{gate_status(vulns <= limit, 'Findings')}"))
+        else:
+            rows.append(GateRow("pip-audit", "SKIP"))
+
+        if tools_configured.get("semgrep", False):
+            if not ran("semgrep"):
+                rows.append(GateRow("Semgrep", f"{not_run_status('semgrep')}"))
+            else:
+                findings = format_number(tool_metrics.get("semgrep_findings"))
+                max_findings = format_number(thresholds.get("max_semgrep_findings"))
+                rows.append(GateRow("Semgrep", f"{gate_status(findings <= max_findings, 'Findings')}"))
+        else:
+            rows.append(GateRow("Semgrep", "SKIP"))
+
+        if tools_configured.get("trivy", False):
+            if not ran("trivy"):
+                rows.append(GateRow("Trivy", f"{not_run_status('trivy')}"))
+            else:
+                crit = format_number(tool_metrics.get("trivy_critical"))
+                high = format_number(tool_metrics.get("trivy_high"))
+                max_crit = format_number(thresholds.get("max_critical_vulns"))
+                max_high = format_number(thresholds.get("max_high_vulns"))
+                ok = crit <= max_crit and high <= max_high
+                rows.append(GateRow("Trivy", f"{gate_status(ok, 'Findings')}"))
+        else:
+            rows.append(GateRow("Trivy", "SKIP"))
+
+        if tools_configured.get("codeql", False):
+            if not ran("codeql"):
+                rows.append(GateRow("CodeQL", f"{not_run_status('codeql')}"))
+            else:
+                rows.append(GateRow("CodeQL", f"{gate_status(bool(tools_success.get('codeql', False)), 'Failed')}"))
+        else:
+            rows.append(GateRow("CodeQL", "SKIP"))
+
+        if tools_configured.get("docker", False):
+            docker_missing = bool(tool_metrics.get("docker_missing_compose", False))
+            if docker_missing:
+                rows.append(GateRow("Docker", "Missing compose"))
+            elif not ran("docker"):
+                rows.append(GateRow("Docker", f"{not_run_status('docker')}"))
+            else:
+                rows.append(GateRow("Docker", f"{gate_status(bool(tools_success.get('docker', False)), 'Failed')}"))
+        else:
+            rows.append(GateRow("Docker", "SKIP"))
+
+        if tools_configured.get("sbom", False):
+            if not ran("sbom"):
+                rows.append(GateRow("SBOM", f"{not_run_status('sbom')}"))
+            else:
+                rows.append(GateRow("SBOM", f"{gate_status(bool(tools_success.get('sbom', False)), 'Failed')}"))
+        else:
+            rows.append(GateRow("SBOM", "SKIP"))
+
+    return rows
+
+
+def build_report_view(report: dict[str, Any]) -> ReportView:
+    """Build the view for a single (non multi-target) report."""
+    language = detect_language(report)
+    return ReportView(
+        language=language,
+        tools=tuple(tool_table_rows(report, language)),
+        thresholds=tuple(threshold_table_rows(report, language)),
+        gates=tuple(quality_gate_rows(report, language)),
+    )
+
+
+__all__ = [
+    "GateRow",
+    "ReportView",
+    "ThresholdRow",
+    "ToolRow",
+    "build_report_view",
+    "detect_language",
+    "format_number",
+    "quality_gate_rows",
+    "threshold_table_rows",
+    "tool_table_rows",
+]
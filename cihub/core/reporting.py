@@ -6,7 +6,17 @@ import json
 from pathlib import Path
 from typing import Any, Iterable
 
-from cihub.core.gate_specs import threshold_rows, tool_rows
+from cihub.core.report_view import (
+    GateRow,
+    ThresholdRow,
+    ToolRow,
+    build_report_view,
+    detect_language,
+    format_number,
+    quality_gate_rows,
+    threshold_table_rows,
+    tool_table_rows,
+)
 
 BAR_WIDTH = 20
 BAR_FULL = chr(0x2588)
@@ -35,14 +45,6 @@ def load_report(path: Path) -> dict[str, Any]:
     return data
 
 
-def detect_language(report: dict[str, Any]) -> str:
-    if "java_version" in report:
-        return "java"
-    if "python_version" in report:
-        return "python"
-    return "unknown"
-
-
 def fmt_bool(value: Any) -> str:
     return "true" if bool(value) else "false"
 
@@ -73,14 +75,6 @@ def fmt_workdir(value: Any) -> str:
     return f"`{value}`"
 
 
-def format_number(value: Any) -> int:
-    if isinstance(value, (int, float)):
-        return int(value)
-    if isinstance(value, str) and value.strip().isdigit():
-        return int(value.strip())
-    return 0
-
-
 def render_bar(percent: int | None) -> str:
     if percent is None:
         return "-"
@@ -90,62 +84,51 @@ def render_bar(percent: int | None) -> str:
     return f"{value}% {bar}"
 
 
-def build_tools_table(report: dict[str, Any], language: str) -> Iterable[str]:
-    tools_configured = report.get("tools_configured", {}) or {}
-    tools_ran = report.get("tools_ran", {}) or {}
-    tools_success = report.get("tools_success", {}) or {}
-    results = report.get("results", {}) or {}
-    env = report.get("environment", {}) or {}
-
-    rows = tool_rows(language)
+def _render_tools_table(rows: Iterable[ToolRow]) -> list[str]:
     lines = [
         "## Tools Enabled",
         "| Category | Tool | Configured | Ran | Success |",
         "|----------|------|------------|-----|---------|",
     ]
-
-    for category, label, key in rows:
-        if key == "__build__":
-            # Build tool uses "build" as the report key, not "__build__"
-            build_tool = env.get("build_tool") or report.get("build_tool") or "build"
-            build_status = results.get("build")
-            # Check actual build status from report - build is configured if it ran
-            build_ran = bool(tools_ran.get("build", False)) or build_status is not None
-            build_configured = build_ran  # Build is implicitly configured if it ran
-            build_success = fmt_bool(build_status == "success")
-            lines.append(
-                f"| {category} | {build_tool} | {fmt_bool(build_configured)} "
-                f"| {fmt_bool(build_ran)} | {build_success} |"
-            )
-            continue
-        configured = fmt_bool(tools_configured.get(key, False))
-        ran = fmt_bool(tools_ran.get(key, False))
-        success = fmt_bool(tools_success.get(key, False))
-        lines.append(f"| {category} | {label} | {configured} | {ran} | {success} |")
-
+    for row in rows:
+        configured, ran, success = fmt_bool(row.configured), fmt_bool(row.ran), fmt_bool(row.success)
+        lines.append(f"| {row.category} | {row.label} | {configured} | {ran} | {success} |")
     lines.append("")
     return lines
 
 
-def build_thresholds_table(report: dict[str, Any], language: str) -> Iterable[str]:
-    thresholds = report.get("thresholds", {}) or {}
-    rows = threshold_rows(language)
+def _render_thresholds_table(rows: Iterable[ThresholdRow]) -> list[str]:
     lines = [
         "## Thresholds (effective)",
         "| Setting | Value |",
         "|---------|-------|",
     ]
-    for label, key, suffix in rows:
-        value = thresholds.get(key)
-        if suffix == "%":
-            display = fmt_percent(value)
-        else:
-            display = fmt_value(value)
-        lines.append(f"| {label} | {display} |")
+    for row in rows:
+        display = fmt_percent(row.value) if row.suffix == "%" else fmt_value(row.value)
+        lines.append(f"| {row.label} | {display} |")
     lines.append("")
     return lines
 
 
+def _render_quality_gates(rows: Iterable[GateRow]) -> list[str]:
+    lines = [
+        "## Quality Gates",
+        "| Check | Status |",
+        "|-------|--------|",
+    ]
+    lines.extend(f"| {row.check} | {row.status} |" for row in rows)
+    lines.append("")
+    return lines
+
+
+def build_tools_table(report: dict[str, Any], language: str) -> Iterable[str]:
+    return _render_tools_table(tool_table_rows(report, language))
+
+
+def build_thresholds_table(report: dict[str, Any], language: str) -> Iterable[str]:
+    return _render_thresholds_table(threshold_table_rows(report, language))
+
+
 def build_environment_table(report: dict[str, Any]) -> Iterable[str]:
     env = report.get("environment", {}) or {}
     merged = {
@@ -247,9 +230,13 @@ def build_java_metrics(report: dict[str, Any]) -> Iterable[str]:
         if owasp_ran and owasp_evidence
         else ("No report" if owasp_ran else "-")
     )
-    spotbugs_detail = "Static analysis" if spotbugs_ran and spotbugs_evidence else ("No report" if spotbugs_ran else "-")
+    spotbugs_detail = (
+        "Static analysis" if spotbugs_ran and spotbugs_evidence else ("No report" if spotbugs_ran else "-")
+    )
     pmd_detail = "Code analysis" if pmd_ran and pmd_evidence else ("No report" if pmd_ran else "-")
-    checkstyle_detail = "Code style" if checkstyle_ran and checkstyle_evidence else ("No report" if checkstyle_ran else "-")
+    checkstyle_detail = (
+        "Code style" if checkstyle_ran and checkstyle_evidence else ("No report" if checkstyle_ran else "-")
+    )
     semgrep_detail = "SAST analysis" if semgrep_ran else "-"
     trivy_detail = "Container scan" if trivy_ran else "-"
 
@@ -381,331 +368,15 @@ def build_dependency_severity(report: dict[str, Any]) -> Iterable[str]:
 
 
 def build_quality_gates(report: dict[str, Any], language: str) -> Iterable[str]:
-    results = report.get("results", {}) or {}
-    tool_metrics = report.get("tool_metrics", {}) or {}
-    thresholds = report.get("thresholds", {}) or {}
-    tools_configured = report.get("tools_configured", {}) or {}
-    tools_ran = report.get("tools_ran", {}) or {}
-    tools_success = report.get("tools_success", {}) or {}
-    tools_require_run = report.get("tools_require_run", {}) or {}
-    tool_evidence = report.get("tool_evidence", {}) or {}
-
-    def gate_status(condition: bool, fail_label: str) -> str:
-        """Return gate status indicator."""
-        if condition:
-            return "PASSED"
-        return fail_label.upper()
-
-    def ran(tool: str) -> bool:
-        return bool(tools_ran.get(tool, False))
-
-    def has_evidence(tool: str) -> bool:
-        return bool(tool_evidence.get(tool, True))
-
-    def not_run_status(tool: str) -> str:
-        """Return NOT RUN status with annotation for hard-fail vs soft-skip."""
-        if tools_require_run.get(tool, False):
-            return "NOT RUN (required)"  # Hard-fail: will cause CI to fail
-        return "NOT RUN"  # Soft-skip: warning only
-
-    def no_report_status(tool: str) -> str:
-        if tools_require_run.get(tool, False):
-            return "NO REPORT (required)"
-        return "NO REPORT"
-
-    def skip_status() -> str:
-        """Return SKIP status."""
-        return "SKIP"
-
-    lines = [
-        "## Quality Gates",
-        "| Check | Status |",
-        "|-------|--------|",
-    ]
-
-    tests_failed = format_number(results.get("tests_failed"))
-    tests_passed = format_number(results.get("tests_passed"))
-    tests_skipped = format_number(results.get("tests_skipped"))
-    tests_total = tests_failed + tests_passed + tests_skipped
-    if tests_total == 0:
-        if language == "python" and ran("pytest") and not has_evidence("pytest"):
-            lines.append("| Unit Tests | NO REPORT |")
-        else:
-            lines.append("| Unit Tests | NOT RUN |")
-    else:
-        lines.append(f"| Unit Tests | {gate_status(tests_failed == 0, 'Failed')} |")
-
-    if language == "java":
-        if tools_configured.get("jacoco", False):
-            if not ran("jacoco"):
-                lines.append(f"| JaCoCo Coverage | {not_run_status('jacoco')} |")
-            elif not has_evidence("jacoco"):
-                lines.append(f"| JaCoCo Coverage | {no_report_status('jacoco')} |")
-            else:
-                cov = format_number(results.get("coverage"))
-                min_cov = format_number(thresholds.get("coverage_min"))
-                cov_status = gate_status(cov >= min_cov, "Failed")
-                lines.append(f"| JaCoCo Coverage | {cov_status} |")
-        else:
-            lines.append("| JaCoCo Coverage | SKIP |")
-
-        if tools_configured.get("pitest", False):
-            if not ran("pitest"):
-                lines.append(f"| PITest Mutation | {not_run_status('pitest')} |")
-            elif not has_evidence("pitest"):
-                lines.append(f"| PITest Mutation | {no_report_status('pitest')} |")
-            else:
-                mut = format_number(results.get("mutation_score"))
-                min_mut = format_number(thresholds.get("mutation_score_min"))
-                mut_status = gate_status(mut >= min_mut, "Failed")
-                lines.append(f"| PITest Mutation | {mut_status} |")
-        else:
-            lines.append("| PITest Mutation | SKIP |")
-
-        if tools_configured.get("checkstyle", False):
-            if not ran("checkstyle"):
-                lines.append(f"| Checkstyle | {not_run_status('checkstyle')} |")
-            elif not has_evidence("checkstyle"):
-                lines.append(f"| Checkstyle | {no_report_status('checkstyle')} |")
-            else:
-                issues = format_number(tool_metrics.get("checkstyle_issues"))
-                max_issues = format_number(thresholds.get("max_checkstyle_errors"))
-                lines.append(f"| Checkstyle | {gate_status(issues <= max_issues, 'Violations')} |")
-        else:
-            lines.append("| Checkstyle | SKIP |")
-
-        if tools_configured.get("spotbugs", False):
-            if not ran("spotbugs"):
-                lines.append(f"| SpotBugs | {not_run_status('spotbugs')} |")
-            elif not has_evidence("spotbugs"):
-                lines.append(f"| SpotBugs | {no_report_status('spotbugs')} |")
-            else:
-                issues = format_number(tool_metrics.get("spotbugs_issues"))
-                max_issues = format_number(thresholds.get("max_spotbugs_bugs"))
-                lines.append(f"| SpotBugs | {gate_status(issues <= max_issues, 'Bugs found')} |")
-        else:
-            lines.append("| SpotBugs | SKIP |")
-
-        if tools_configured.get("pmd", False):
-            if not ran("pmd"):
-                lines.append(f"| PMD | {not_run_status('pmd')} |")
-            elif not has_evidence("pmd"):
-                lines.append(f"| PMD | {no_report_status('pmd')} |")
-            else:
-                issues = format_number(tool_metrics.get("pmd_violations"))
-                max_issues = format_number(thresholds.get("max_pmd_violations"))
-                lines.append(f"| PMD | {gate_status(issues <= max_issues, 'Violations')} |")
-        else:
-            lines.append("| PMD | SKIP |")
-
-        if tools_configured.get("owasp", False):
-            if not ran("owasp"):
-                lines.append(f"| OWASP Check | {not_run_status('owasp')} |")
-            elif not has_evidence("owasp"):
-                lines.append(f"| OWASP Check | {no_report_status('owasp')} |")
-            else:
-                crit = format_number(tool_metrics.get("owasp_critical"))
-                high = format_number(tool_metrics.get("owasp_high"))
-                max_crit = format_number(thresholds.get("max_critical_vulns"))
-                max_high = format_number(thresholds.get("max_high_vulns"))
-                ok = crit <= max_crit and high <= max_high
-                lines.append(f"| OWASP Check | {gate_status(ok, 'Vulnerabilities')} |")
-        else:
-            lines.append("| OWASP Check | SKIP |")
-
-        if tools_configured.get("semgrep", False):
-            if not ran("semgrep"):
-                lines.append(f"| Semgrep | {not_run_status('semgrep')} |")
-            else:
-                findings = format_number(tool_metrics.get("semgrep_findings"))
-                max_findings = format_number(thresholds.get("max_semgrep_findings"))
-                lines.append(f"| Semgrep | {gate_status(findings <= max_findings, 'Findings')} |")
-        else:
-            lines.append("| Semgrep | SKIP |")
-
-        if tools_configured.get("trivy", False):
-            if not ran("trivy"):
-                lines.append(f"| Trivy | {not_run_status('trivy')} |")
-            else:
-                crit = format_number(tool_metrics.get("trivy_critical"))
-                high = format_number(tool_metrics.get("trivy_high"))
-                max_crit = format_number(thresholds.get("max_critical_vulns"))
-                max_high = format_number(thresholds.get("max_high_vulns"))
-                ok = crit <= max_crit and high <= max_high
-                lines.append(f"| Trivy | {gate_status(ok, 'Findings')} |")
-        else:
-            lines.append("| Trivy | SKIP |")
-
-        if tools_configured.get("codeql", False):
-            if not ran("codeql"):
-                lines.append(f"| CodeQL | {not_run_status('codeql')} |")
-            else:
-                lines.append(f"| CodeQL | {gate_status(bool(tools_success.get('codeql', False)), 'Failed')} |")
-        else:
-            lines.append("| CodeQL | SKIP |")
-
-        if tools_configured.get("docker", False):
-            docker_missing = bool(tool_metrics.get("docker_missing_compose", False))
-            if docker_missing:
-                lines.append("| Docker | Missing compose |")
-            elif not ran("docker"):
-                lines.append(f"| Docker | {not_run_status('docker')} |")
-            else:
-                lines.append(f"| Docker | {gate_status(bool(tools_success.get('docker', False)), 'Failed')} |")
-        else:
-            lines.append("| Docker | SKIP |")
-
-        if tools_configured.get("sbom", False):
-            if not ran("sbom"):
-                lines.append(f"| SBOM | {not_run_status('sbom')} |")
-            else:
-                lines.append(f"| SBOM | {gate_status(bool(tools_success.get('sbom', False)), 'Failed')} |")
-        else:
-            lines.append("| SBOM | SKIP |")
-
-    else:
-        if tools_configured.get("pytest", False):
-            if not ran("pytest"):
-                lines.append(f"| pytest | {not_run_status('pytest')} |")
-            elif not has_evidence("pytest"):
-                lines.append(f"| pytest | {no_report_status('pytest')} |")
-            elif tests_total == 0:
-                lines.append(f"| pytest | {not_run_status('pytest')} |")
-            else:
-                lines.append(f"| pytest | {gate_status(tests_failed == 0, 'Failed')} |")
-        else:
-            lines.append("| pytest | SKIP |")
-
-        if tools_configured.get("mutmut", False):
-            if not ran("mutmut"):
-                lines.append(f"| mutmut | {not_run_status('mutmut')} |")
-            else:
-                mut = format_number(results.get("mutation_score"))
-                min_mut = format_number(thresholds.get("mutation_score_min"))
-                lines.append(f"| mutmut | {gate_status(mut >= min_mut, 'Failed')} |")
-        else:
-            lines.append("| mutmut | SKIP |")
-
-        if tools_configured.get("ruff", False):
-            if not ran("ruff"):
-                lines.append(f"| Ruff | {not_run_status('ruff')} |")
-            else:
-                issues = format_number(tool_metrics.get("ruff_errors"))
-                max_issues = format_number(thresholds.get("max_ruff_errors"))
-                lines.append(f"| Ruff | {gate_status(issues <= max_issues, 'Issues')} |")
-        else:
-            lines.append("| Ruff | SKIP |")
-
-        if tools_configured.get("black", False):
-            if not ran("black"):
-                lines.append(f"| Black | {not_run_status('black')} |")
-            else:
-                issues = format_number(tool_metrics.get("black_issues"))
-                max_issues = format_number(thresholds.get("max_black_issues"))
-                lines.append(f"| Black | {gate_status(issues <= max_issues, 'Issues')} |")
-        else:
-            lines.append("| Black | SKIP |")
-
-        if tools_configured.get("isort", False):
-            if not ran("isort"):
-                lines.append(f"| isort | {not_run_status('isort')} |")
-            else:
-                issues = format_number(tool_metrics.get("isort_issues"))
-                max_issues = format_number(thresholds.get("max_isort_issues"))
-                lines.append(f"| isort | {gate_status(issues <= max_issues, 'Issues')} |")
-        else:
-            lines.append("| isort | SKIP |")
-
-        if tools_configured.get("mypy", False):
-            if not ran("mypy"):
-                lines.append(f"| mypy | {not_run_status('mypy')} |")
-            else:
-                issues = format_number(tool_metrics.get("mypy_errors"))
-                lines.append(f"| mypy | {gate_status(issues == 0, 'Errors')} |")
-        else:
-            lines.append("| mypy | SKIP |")
-
-        if tools_configured.get("bandit", False):
-            if not ran("bandit"):
-                lines.append(f"| Bandit | {not_run_status('bandit')} |")
-            else:
-                high = format_number(tool_metrics.get("bandit_high"))
-                max_high = format_number(thresholds.get("max_high_vulns"))
-                lines.append(f"| Bandit | {gate_status(high <= max_high, 'Findings')} |")
-        else:
-            lines.append("| Bandit | SKIP |")
-
-        if tools_configured.get("pip_audit", False):
-            if not ran("pip_audit"):
-                lines.append(f"| pip-audit | {not_run_status('pip_audit')} |")
-            else:
-                vulns = format_number(tool_metrics.get("pip_audit_vulns"))
-                max_high = format_number(thresholds.get("max_high_vulns"))
-                raw_pip = thresholds.get("max_pip_audit_vulns")
-                limit = format_number(raw_pip) if raw_pip is not None else max_high
-                lines.append(f"| pip-audit | {gate_status(vulns <= limit, 'Findings')} |")
-        else:
-            lines.append("| pip-audit | SKIP |")
-
-        if tools_configured.get("semgrep", False):
-            if not ran("semgrep"):
-                lines.append(f"| Semgrep | {not_run_status('semgrep')} |")
-            else:
-                findings = format_number(tool_metrics.get("semgrep_findings"))
-                max_findings = format_number(thresholds.get("max_semgrep_findings"))
-                lines.append(f"| Semgrep | {gate_status(findings <= max_findings, 'Findings')} |")
-        else:
-            lines.append("| Semgrep | SKIP |")
-
-        if tools_configured.get("trivy", False):
-            if not ran("trivy"):
-                lines.append(f"| Trivy | {not_run_status('trivy')} |")
-            else:
-                crit = format_number(tool_metrics.get("trivy_critical"))
-                high = format_number(tool_metrics.get("trivy_high"))
-                max_crit = format_number(thresholds.get("max_critical_vulns"))
-                max_high = format_number(thresholds.get("max_high_vulns"))
-                ok = crit <= max_crit and high <= max_high
-                lines.append(f"| Trivy | {gate_status(ok, 'Findings')} |")
-        else:
-            lines.append("| Trivy | SKIP |")
-
-        if tools_configured.get("codeql", False):
-            if not ran("codeql"):
-                lines.append(f"| CodeQL | {not_run_status('codeql')} |")
-            else:
-                lines.append(f"| CodeQL | {gate_status(bool(tools_success.get('codeql', False)), 'Failed')} |")
-        else:
-            lines.append("| CodeQL | SKIP |")
-
-        if tools_configured.get("docker", False):
-            docker_missing = bool(tool_metrics.get("docker_missing_compose", False))
-            if docker_missing:
-                lines.append("| Docker | Missing compose |")
-            elif not ran("docker"):
-                lines.append(f"| Docker | {not_run_status('docker')} |")
-            else:
-                lines.append(f"| Docker | {gate_status(bool(tools_success.get('docker', False)), 'Failed')} |")
-        else:
-            lines.append("| Docker | SKIP |")
-
-        if tools_configured.get("sbom", False):
-            if not ran("sbom"):
-                lines.append(f"| SBOM | {not_run_status('sbom')} |")
-            else:
-                lines.append(f"| SBOM | {gate_status(bool(tools_success.get('sbom', False)), 'Failed')} |")
-        else:
-            lines.append("| SBOM | SKIP |")
-
-    lines.append("")
-    return lines
+    return _render_quality_gates(quality_gate_rows(report, language))
 
 
 def _build_summary_sections(report: dict[str, Any], include_metrics: bool) -> list[str]:
-    language = detect_language(report)
+    view = build_report_view(report)
+    language = view.language
     sections: list[str] = []
-    sections.extend(build_tools_table(report, language))
-    sections.extend(build_thresholds_table(report, language))
+    sections.extend(_render_tools_table(view.tools))
+    sections.extend(_render_thresholds_table(view.thresholds))
     sections.extend(build_environment_table(report))
     if include_metrics:
         if language == "java":
@@ -713,7 +384,7 @@ def _build_summary_sections(report: dict[str, Any], include_metrics: bool) -> li
         elif language == "python":
             sections.extend(build_python_metrics(report))
     sections.extend(build_dependency_severity(report))
-    sections.extend(build_quality_gates(report, language))
+    sections.extend(_render_quality_gates(view.gates))
     return sections
 
 
@@ -37,6 +37,7 @@ build_dependency_severity = _core.build_dependency_severity
 build_quality_gates = _core.build_quality_gates
 render_summary = _core.render_summary
 render_summary_from_path = _core.render_summary_from_path
+build_report_view = _core.build_report_view
 
 __all__ = [
     "JAVA_TOOL_ROWS",
@@ -65,4 +66,5 @@ __all__ = [
     "build_quality_gates",
     "render_summary",
     "render_summary_from_path",
+    "build_report_view",
 ]
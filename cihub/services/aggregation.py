@@ -100,6 +100,7 @@ def aggregate_from_reports_dir(
     strict: bool = False,
     details_file: Path | None = None,
     include_details: bool = False,
+    metrics_store: Path | None = None,
 ) -> AggregationResult:
     """Aggregate reports from a local directory of report.json files.
 
@@ -116,6 +117,7 @@ def aggregate_from_reports_dir(
         details_file: Optional path for per-repo detail markdown.
         include_details: Include per-repo details in the summary output.
         strict: Fail on any failed runs or threshold violations.
+        metrics_store: Optional columnar metrics store reused across runs.
 
     Returns:
         AggregationResult with success status and report data.
@@ -131,6 +133,7 @@ def aggregate_from_reports_dir(
         strict=strict,
         details_file=details_file,
         include_details=include_details,
+        metrics_store=metrics_store,
     )
 
     return _build_result(
@@ -6,16 +6,19 @@ maintaining backward compatibility by re-exporting all public symbols.
 
 from __future__ import annotations
 
+import copy
 import json
 import os
 import shutil
-import copy
+import threading
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Any, Mapping
 
 from cihub.ci_config import load_ci_config, load_hub_config
 from cihub.ci_runner import run_java_build  # Keep for backward compat re-export
+from cihub.core.ci_report import DEPENDENCY_CACHE_FILE
 from cihub.core.languages import get_strategy
 from cihub.exit_codes import EXIT_FAILURE, EXIT_INTERNAL_ERROR, EXIT_SUCCESS
 from cihub.reporting import render_summary
@@ -37,6 +40,7 @@ from cihub.utils import (
     resolve_executable,
     validate_subdir,
 )
+from cihub.utils.tracing import span
 
 # Backward compatibility aliases (deprecated, use non-underscore versions)
 _detect_java_project_type = detect_java_project_type
@@ -72,6 +76,15 @@ from .python_tools import (
     _run_dep_command,
     _run_python_tools,
 )
+from .side_effects import (
+    CODECOV_TIMEOUT_SECONDS,
+    MIRROR_TIMEOUT_SECONDS,
+    NOTIFY_TIMEOUT_SECONDS,
+    SideEffect,
+    collect_side_effects,
+    run_side_effects,
+    start_side_effects,
+)
 from .validation import _self_validate_report
 
 
@@ -152,10 +165,26 @@ def _resolve_targets(config: dict[str, Any], override_workdir: str | None) -> li
     return targets
 
 
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hardlink a mirrored file, copying when linking is not possible (other filesystem, no permission)."""
+    try:
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+class _MirrorCancelled(Exception):
+    """Raised from inside copytree to stop a mirror that ran out of time."""
+
+
 def _mirror_output_dir_to_workspace(
     output_dir: Path,
     env_map: Mapping[str, str],
     problems: list[dict[str, Any]],
+    cancel: threading.Event | None = None,
 ) -> Path | None:
     workspace = env_map.get("GITHUB_WORKSPACE")
     if not workspace:
@@ -170,9 +199,21 @@ def _mirror_output_dir_to_workspace(
     target_dir = workspace_path / output_dir_resolved.name
     if not output_dir_resolved.exists():
         return None
+    existed = target_dir.exists()
+
+    def copy_file(src: str, dst: str) -> str:
+        # Not an OSError, so copytree stops at once instead of collecting it
+        if cancel is not None and cancel.is_set():
+            raise _MirrorCancelled
+        return _link_or_copy(src, dst)
+
     try:
-        shutil.copytree(output_dir_resolved, target_dir, dirs_exist_ok=True)
+        shutil.copytree(output_dir_resolved, target_dir, dirs_exist_ok=True, copy_function=copy_file)
         return target_dir
+    except _MirrorCancelled:
+        if not existed:
+            shutil.rmtree(target_dir, ignore_errors=True)
+        return None
     except Exception as exc:
         problems.append(
             {
@@ -243,18 +284,21 @@ def _run_ci_with_config(
     tool_outputs: dict[str, dict[str, Any]] = {}
     tools_ran: dict[str, bool] = {}
     tools_success: dict[str, bool] = {}
+    dependency_cache: dict[str, Any] = {}
     gate_failures: list[str] = []
 
     try:
-        run_kwargs = strategy.get_run_kwargs(config, install_deps=install_deps)
-        tool_outputs, tools_ran, tools_success = strategy.run_tools(
-            config,
-            repo_path,
-            run_workdir,
-            output_dir,
-            problems,
-            **run_kwargs,
-        )
+        with span("tools.run", language=language):
+            run_kwargs = strategy.get_run_kwargs(config, install_deps=install_deps)
+            tool_outputs, tools_ran, tools_success = strategy.run_tools(
+                config,
+                repo_path,
+                run_workdir,
+                output_dir,
+                problems,
+                dependency_cache=dependency_cache,
+                **run_kwargs,
+            )
     except Exception as exc:
         message = f"Tool execution failed: {exc}"
         problems.append(
@@ -291,32 +335,42 @@ def _run_ci_with_config(
     context_kwargs: dict[str, Any] = {
         "docker_compose_file": docker_compose,
         "docker_health_endpoint": docker_health,
+        "dependency_cache": dependency_cache or None,
     }
     context_extras = strategy.get_context_extras(config, repo_path / run_workdir)
     context_kwargs.update(context_extras)
 
     context = _build_context(repo_path, config, run_workdir, correlation_id, **context_kwargs)
 
-    report = strategy.build_report(
-        config,
-        tool_outputs,
-        tools_configured,
-        tools_ran,
-        tools_success,
-        thresholds,
-        context,
-        tools_require_run=tools_require_run,
-    )
-    gate_failures = strategy.evaluate_gates(report, thresholds, tools_configured, config)
+    with span("report.build"):
+        report = strategy.build_report(
+            config,
+            tool_outputs,
+            tools_configured,
+            tools_ran,
+            tools_success,
+            thresholds,
+            context,
+            tools_require_run=tools_require_run,
+        )
+    with span("gates.evaluate"):
+        gate_failures = strategy.evaluate_gates(report, thresholds, tools_configured, config)
 
     resolved_report_path = report_path or output_dir / "report.json"
     if not resolved_report_path.is_absolute():
         resolved_report_path = repo_path / resolved_report_path
-    resolved_report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    with span("report.write"):
+        resolved_report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        dependency_cache_path = output_dir / DEPENDENCY_CACHE_FILE
+        if dependency_cache:
+            dependency_cache_path.write_text(json.dumps(dependency_cache, indent=2), encoding="utf-8")
+        else:
+            dependency_cache_path.unlink(missing_ok=True)
 
     github_summary_cfg = config.get("reports", {}).get("github_summary", {}) or {}
     include_metrics = bool(github_summary_cfg.get("include_metrics", True))
-    summary_text = render_summary(report, include_metrics=include_metrics)
+    with span("summary.render"):
+        summary_text = render_summary(report, include_metrics=include_metrics)
     if write_github_summary is None:
         write_summary = bool(github_summary_cfg.get("enabled", True))
     else:
@@ -335,16 +389,45 @@ def _run_ci_with_config(
 
     _self_validate_report(report, summary_text, output_dir, problems, env_map)
 
-    codecov_cfg = config.get("reports", {}).get("codecov", {}) or {}
-    if codecov_cfg.get("enabled", True):
-        files = _collect_codecov_files(language, output_dir, tool_outputs)
-        _run_codecov_upload(
-            files,
-            bool(codecov_cfg.get("fail_ci_on_error", False)),
-            problems,
+    if gate_failures:
+        problems.extend(
+            [
+                {
+                    "severity": "error",
+                    "message": failure,
+                    "code": "CIHUB-CI-GATE",
+                }
+                for failure in gate_failures
+            ]
         )
 
-    mirror_dir = _mirror_output_dir_to_workspace(output_dir, env_map, problems)
+    # The report is final: mirror it in the background while uploading to codecov,
+    # then notify once the upload can no longer change the outcome
+    with span("side_effects"):
+        cancel_mirror = threading.Event()
+        mirror = SideEffect(
+            "mirror",
+            partial(_mirror_output_dir_to_workspace, output_dir, env_map, cancel=cancel_mirror),
+            MIRROR_TIMEOUT_SECONDS,
+            cancel=cancel_mirror,
+        )
+        mirroring = start_side_effects([mirror])
+        side_effect_outcomes: dict[str, dict[str, Any]] = {}
+        codecov_cfg = config.get("reports", {}).get("codecov", {}) or {}
+        if codecov_cfg.get("enabled", True):
+            files = _collect_codecov_files(language, output_dir, tool_outputs)
+            upload = partial(_run_codecov_upload, files, bool(codecov_cfg.get("fail_ci_on_error", False)))
+            codecov = start_side_effects([SideEffect("codecov", upload, CODECOV_TIMEOUT_SECONDS)])
+            side_effect_outcomes.update(collect_side_effects(codecov, problems))
+        # A failed codecov upload with fail_ci_on_error still fails the run
+        has_errors = any(p.get("severity") == "error" for p in problems)
+        if notify:
+            send = partial(_notify, not has_errors, config, report, env=env_map)
+            notifying = start_side_effects([SideEffect("notify", send, NOTIFY_TIMEOUT_SECONDS)])
+            side_effect_outcomes.update(collect_side_effects(notifying, problems))
+        side_effect_outcomes.update(collect_side_effects(mirroring, problems))
+
+    mirror_dir = mirror.result if side_effect_outcomes["mirror"]["status"] != "timeout" else None
     if mirror_dir:
         try:
             resolved_report_path = mirror_dir / resolved_report_path.relative_to(output_dir)
@@ -357,26 +440,11 @@ def _run_ci_with_config(
                 pass
         output_dir = mirror_dir
 
-    if gate_failures:
-        problems.extend(
-            [
-                {
-                    "severity": "error",
-                    "message": failure,
-                    "code": "CIHUB-CI-GATE",
-                }
-                for failure in gate_failures
-            ]
-        )
-
-    has_errors = any(p.get("severity") == "error" for p in problems)
-    if notify:
-        _notify(not has_errors, config, report, problems, env_map)
     exit_code = EXIT_FAILURE if has_errors else EXIT_SUCCESS
     errors, warnings = _split_problems(problems)
 
     artifacts: dict[str, str] = {"report": str(resolved_report_path)}
-    data: dict[str, str] = {"report_path": str(resolved_report_path)}
+    data: dict[str, Any] = {"report_path": str(resolved_report_path), "side_effects": side_effect_outcomes}
     if resolved_summary_path:
         artifacts["summary"] = str(resolved_summary_path)
         data["summary_path"] = str(resolved_summary_path)
@@ -428,20 +496,21 @@ def _run_ci_multi(
         target_output_dir = targets_dir / target.slug
         target_output_dir.mkdir(parents=True, exist_ok=True)
 
-        target_result = _run_ci_with_config(
-            repo_path,
-            target_config,
-            output_dir=target_output_dir,
-            report_path=target_output_dir / "report.json",
-            summary_path=target_output_dir / "summary.md",
-            workdir=target.subdir,
-            install_deps=install_deps,
-            correlation_id=correlation_id,
-            no_summary=no_summary,
-            write_github_summary=False,
-            env_map=env_map,
-            notify=False,
-        )
+        with span("target", slug=target.slug):
+            target_result = _run_ci_with_config(
+                repo_path,
+                target_config,
+                output_dir=target_output_dir,
+                report_path=target_output_dir / "report.json",
+                summary_path=target_output_dir / "summary.md",
+                workdir=target.subdir,
+                install_deps=install_deps,
+                correlation_id=correlation_id,
+                no_summary=no_summary,
+                write_github_summary=False,
+                env_map=env_map,
+                notify=False,
+            )
 
         if base_report is None:
             base_report = target_result.report
@@ -489,7 +558,8 @@ def _run_ci_multi(
 
     github_summary_cfg = config.get("reports", {}).get("github_summary", {}) or {}
     include_metrics = bool(github_summary_cfg.get("include_metrics", True))
-    summary_text = render_summary(aggregate_report, include_metrics=include_metrics)
+    with span("summary.render"):
+        summary_text = render_summary(aggregate_report, include_metrics=include_metrics)
     if write_github_summary is None:
         write_summary = bool(github_summary_cfg.get("enabled", True))
     else:
@@ -498,7 +568,8 @@ def _run_ci_multi(
     resolved_report_path = report_path or output_dir / "report.json"
     if not resolved_report_path.is_absolute():
         resolved_report_path = repo_path / resolved_report_path
-    resolved_report_path.write_text(json.dumps(aggregate_report, indent=2), encoding="utf-8")
+    with span("report.write"):
+        resolved_report_path.write_text(json.dumps(aggregate_report, indent=2), encoding="utf-8")
 
     resolved_summary_path: Path | None = None
     if not no_summary:
@@ -514,11 +585,12 @@ def _run_ci_multi(
     _self_validate_report(aggregate_report, summary_text, output_dir, problems, env_map)
 
     has_errors = any(p.get("severity") == "error" for p in problems)
-    _notify(not has_errors, config, aggregate_report, problems, env_map)
+    send = partial(_notify, not has_errors, config, aggregate_report, env=env_map)
+    side_effect_outcomes = run_side_effects([SideEffect("notify", send, NOTIFY_TIMEOUT_SECONDS)], problems)
 
     errors, warnings = _split_problems(problems)
     artifacts: dict[str, str] = {"report": str(resolved_report_path)}
-    data: dict[str, str] = {"report_path": str(resolved_report_path)}
+    data: dict[str, Any] = {"report_path": str(resolved_report_path), "side_effects": side_effect_outcomes}
     if resolved_summary_path:
         artifacts["summary"] = str(resolved_summary_path)
         data["summary_path"] = str(resolved_summary_path)
@@ -0,0 +1,208 @@
+"""Install snapshot cache for dependency installs in `cihub ci`.
+
+An install is skipped when its inputs are unchanged since the last successful
+install and what that install produced is still in place.
+
+Python: the key covers the dependency manifests and lockfiles in the workdir,
+the pip commands and the interpreter (version and prefix). After an install
+the cache keeps a digest of the interpreter's installed distributions; a hit
+also requires that digest to match, so a recreated or modified environment is
+installed again.
+
+Maven multi-module projects: the key covers every pom.xml, the main sources
+and the wrapper/JDK identity; a hit also requires the project's artifacts to
+still exist in the local Maven repository.
+
+Stamps live in .cihub/cache/deps.json under the workdir. Each records how long
+its install took, which is reported as the time saved on a hit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Iterable
+
+from cihub.utils.java_pom import elem_text, get_xml_namespace, ns_tag, parse_xml_file
+from cihub.utils.json_cache import load_json_cache, save_json_cache
+
+# Raise when python_dependency_key or maven_install_key hash different inputs.
+DEPS_CACHE_VERSION = 1
+DEPS_CACHE_PATH = Path(".cihub") / "cache" / "deps.json"
+
+PYTHON_DEPENDENCY_FILES = (
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "poetry.lock",
+    "uv.lock",
+    "pdm.lock",
+    "Pipfile.lock",
+)
+_PRUNE_DIRS = frozenset({".git", ".cihub", "target", "build", "node_modules", ".gradle", ".idea"})
+
+
+def _hash_files(root: Path, rel_paths: Iterable[str], h: Any) -> None:
+    for rel_path in sorted(rel_paths):
+        try:
+            digest = hashlib.sha256((root / rel_path).read_bytes()).hexdigest()
+        except OSError:
+            digest = "<unreadable>"
+        h.update(f"\0{rel_path}\0{digest}".encode())
+
+
+def _executable_identity(name: str) -> str:
+    path = shutil.which(name)
+    if path is None:
+        return f"{name}:missing"
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return f"{name}:{path}"
+    return f"{name}:{os.path.realpath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def python_dependency_key(workdir: Path, python_bin: str, commands: list[list[str]]) -> str | None:
+    """Key of a Python install, or None when the workdir declares no dependencies.
+
+    Args:
+        workdir: Project directory the install runs in
+        python_bin: Interpreter pip installs into
+        commands: The install commands that would run
+
+    Returns:
+        Hex digest of the manifests, lockfiles, commands and interpreter
+    """
+    files = [name for name in PYTHON_DEPENDENCY_FILES if (workdir / name).is_file()]
+    files += [path.name for path in workdir.glob("requirements*.txt") if path.is_file()]
+    if not files:
+        return None
+    h = hashlib.sha256()
+    h.update(json.dumps(["python", python_bin, sys.version, sys.prefix, commands]).encode("utf-8"))
+    _hash_files(workdir, files, h)
+    return h.hexdigest()
+
+
+def python_environment_digest() -> str:
+    """Digest of the distributions installed in the running interpreter."""
+    installed = sorted(f"{dist.metadata['Name'] or ''}=={dist.version}".lower() for dist in metadata.distributions())
+    return hashlib.sha256("\n".join(installed).encode("utf-8")).hexdigest()
+
+
+def maven_install_key(workdir: Path) -> str:
+    """Key of a multi-module `mvn install`: build files, main sources and toolchain identity."""
+    files: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(workdir):
+        dirnames[:] = [d for d in dirnames if d not in _PRUNE_DIRS]
+        rel_dir = Path(dirpath).relative_to(workdir).as_posix()
+        prefix = "" if rel_dir == "." else f"{rel_dir}/"
+        in_main = "/src/main/" in f"/{prefix}" or prefix.startswith(".mvn/")
+        for name in filenames:
+            if in_main or name in ("pom.xml", "mvnw"):
+                files.append(f"{prefix}{name}")
+    h = hashlib.sha256()
+    identity = [os.environ.get("JAVA_HOME", ""), _executable_identity("java"), _executable_identity("mvn")]
+    h.update(json.dumps(["maven-install", identity]).encode("utf-8"))
+    _hash_files(workdir, files, h)
+    return h.hexdigest()
+
+
+def _maven_local_repository() -> Path:
+    match = re.search(r"-Dmaven\.repo\.local=(\S+)", os.environ.get("MAVEN_OPTS", ""))
+    if match:
+        return Path(match.group(1)).expanduser()
+    return Path.home() / ".m2" / "repository"
+
+
+def maven_artifacts_installed(workdir: Path) -> bool:
+    """True when the root project's artifacts are present in the local Maven repository."""
+    try:
+        root = parse_xml_file(workdir / "pom.xml")
+    except (OSError, ValueError, SyntaxError):  # SyntaxError covers ParseError
+        return False
+    namespace = get_xml_namespace(root)
+    parent = root.find(ns_tag(namespace, "parent"))
+    group_id = elem_text(root.find(ns_tag(namespace, "groupId")))
+    version = elem_text(root.find(ns_tag(namespace, "version")))
+    if parent is not None:
+        group_id = group_id or elem_text(parent.find(ns_tag(namespace, "groupId")))
+        version = version or elem_text(parent.find(ns_tag(namespace, "version")))
+    artifact_id = elem_text(root.find(ns_tag(namespace, "artifactId")))
+    if not group_id or not artifact_id:
+        return False
+    location = _maven_local_repository().joinpath(*group_id.split("."), artifact_id)
+    if version and "${" not in version:
+        location = location / version
+    return location.is_dir()
+
+
+class DependencyCache:
+    """Install stamps for one workdir, keyed by install name ("python", "maven-install")."""
+
+    def __init__(self, path: Path | None, entries: dict[str, Any] | None = None) -> None:
+        self.path = path
+        self.entries: dict[str, Any] = entries or {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, workdir: Path) -> DependencyCache:
+        """Load the install stamps recorded for a workdir."""
+        path = workdir / DEPS_CACHE_PATH
+        payload = load_json_cache(path, DEPS_CACHE_VERSION) or {}
+        entries = payload.get("entries")
+        return cls(path, entries if isinstance(entries, dict) else None)
+
+    def lookup(self, name: str, key: str, state: str | None = None) -> float | None:
+        """Recorded install seconds when the stamp matches key (and state), else None."""
+        entry = self.entries.get(name)
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        if state is not None and entry.get("state") != state:
+            return None
+        seconds = entry.get("seconds")
+        return float(seconds) if isinstance(seconds, (int, float)) else 0.0
+
+    def store(self, name: str, key: str, seconds: float, state: str | None = None) -> None:
+        self.entries[name] = {"key": key, "state": state, "seconds": round(seconds, 2)}
+        self._dirty = True
+
+    def forget(self, name: str) -> None:
+        if self.entries.pop(name, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the stamps if any changed."""
+        if self.path is None or not self._dirty:
+            return
+        save_json_cache(self.path, DEPS_CACHE_VERSION, {"entries": self.entries})
+
+
+def cache_enabled(config: dict[str, Any], language: str) -> bool:
+    """Whether install stamps are used (`<language>.dependencies.cache: false` turns them off)."""
+    lang_cfg = config.get(language, {}) if isinstance(config.get(language), dict) else {}
+    deps_cfg = lang_cfg.get("dependencies")
+    return not (isinstance(deps_cfg, dict) and deps_cfg.get("cache") is False)
+
+
+def outcome(status: str, seconds: float, seconds_saved: float = 0.0) -> dict[str, Any]:
+    """Report entry for environment.dependency_cache."""
+    return {"status": status, "seconds": round(seconds, 2), "seconds_saved": round(seconds_saved, 2)}
+
+
+__all__ = [
+    "DEPS_CACHE_PATH",
+    "DEPS_CACHE_VERSION",
+    "DependencyCache",
+    "cache_enabled",
+    "maven_artifacts_installed",
+    "maven_install_key",
+    "outcome",
+    "python_dependency_key",
+    "python_environment_digest",
+]
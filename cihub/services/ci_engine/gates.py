@@ -109,6 +109,7 @@ def _build_context(
     project_type: str | None = None,
     docker_compose_file: str | None = None,
     docker_health_endpoint: str | None = None,
+    dependency_cache: dict[str, Any] | None = None,
 ) -> RunContext:
     repo_info = config.get("repo", {}) if isinstance(config.get("repo"), dict) else {}
     ctx = GitHubContext.from_env()
@@ -128,6 +129,7 @@ def _build_context(
         project_type=project_type,
         docker_compose_file=docker_compose_file,
         docker_health_endpoint=docker_health_endpoint,
+        dependency_cache=dependency_cache,
     )
 
 
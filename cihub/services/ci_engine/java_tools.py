@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import shlex
+import time
 from pathlib import Path
 from typing import Any
 
@@ -21,7 +22,10 @@ from cihub.utils.exec_utils import (
 )
 from cihub.utils.paths import hub_root
 from cihub.utils.project import detect_java_project_type
+from cihub.utils.tracing import span, traced
 
+from .dependency_cache import DependencyCache, cache_enabled, maven_artifacts_installed, maven_install_key
+from .dependency_cache import outcome as cache_outcome
 from .helpers import _parse_env_bool, _tool_enabled
 
 
@@ -86,6 +90,51 @@ def _ensure_checkstyle_config(
     )
 
 
+@traced("deps.install")
+def _maven_install_cached(
+    config: dict[str, Any],
+    workdir_path: Path,
+    output_dir: Path,
+    tool_output_dir: Path,
+    problems: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Run `mvn install` for a multi-module project unless its install stamp is current.
+
+    Returns:
+        The dependency cache outcome for the report
+    """
+    cache = DependencyCache.load(workdir_path) if cache_enabled(config, "java") else None
+    started = time.monotonic()
+    key = maven_install_key(workdir_path) if cache is not None else ""
+    if cache is not None:
+        saved = cache.lookup("maven-install", key)
+        if saved is not None and maven_artifacts_installed(workdir_path):
+            ToolResult(tool="maven-install", ran=False, success=True, metrics={"cached": True}).write_json(
+                tool_output_dir / "maven-install.json"
+            )
+            return cache_outcome("hit", time.monotonic() - started, saved)
+
+    install_result = run_maven_install(workdir_path, output_dir)
+    install_result.write_json(tool_output_dir / "maven-install.json")
+    elapsed = time.monotonic() - started
+    if not install_result.success:
+        problems.append(
+            {
+                "severity": "error",
+                "message": "Maven install failed for multi-module project; tool runs may be incomplete",
+                "code": "CIHUB-CI-MAVEN-INSTALL",
+            }
+        )
+    if cache is None:
+        return cache_outcome("disabled", elapsed)
+    if install_result.success:
+        cache.store("maven-install", key, elapsed)
+    else:
+        cache.forget("maven-install")
+    cache.save()
+    return cache_outcome("miss", elapsed)
+
+
 def _run_java_tools(
     config: dict[str, Any],
     repo_path: Path,
@@ -94,6 +143,7 @@ def _run_java_tools(
     build_tool: str,
     problems: list[dict[str, Any]],
     runners: dict[str, Any],
+    dependency_cache: dict[str, Any] | None = None,
 ) -> tuple[dict[str, dict[str, Any]], dict[str, bool], dict[str, bool]]:
     workdir_path = repo_path / workdir
     if not workdir_path.exists():
@@ -113,7 +163,8 @@ def _run_java_tools(
         _ensure_checkstyle_config(config, repo_path, workdir_path, problems)
 
     jacoco_enabled = _tool_enabled(config, "jacoco", "java")
-    build_result = run_java_build(workdir_path, output_dir, build_tool, jacoco_enabled)
+    with span("tool.build", build_tool=build_tool):
+        build_result = run_java_build(workdir_path, output_dir, build_tool, jacoco_enabled)
     tool_outputs["build"] = build_result.to_payload()
     build_result.write_json(tool_output_dir / "build.json")
 
@@ -122,16 +173,9 @@ def _run_java_tools(
         if project_type.startswith("Multi-module"):
             install_tools = {"checkstyle", "spotbugs", "pmd", "pitest", "owasp"}
             if any(_tool_enabled(config, tool, "java") for tool in install_tools):
-                install_result = run_maven_install(workdir_path, output_dir)
-                install_result.write_json(tool_output_dir / "maven-install.json")
-                if not install_result.success:
-                    problems.append(
-                        {
-                            "severity": "error",
-                            "message": "Maven install failed for multi-module project; tool runs may be incomplete",
-                            "code": "CIHUB-CI-MAVEN-INSTALL",
-                        }
-                    )
+                outcome = _maven_install_cached(config, workdir_path, output_dir, tool_output_dir, problems)
+                if dependency_cache is not None:
+                    dependency_cache.update(outcome)
 
     for tool in JAVA_TOOLS:
         if tool == "jqwik":
@@ -170,37 +214,38 @@ def _run_java_tools(
             )
             ToolResult(tool=tool, ran=False, success=False).write_json(tool_output_dir / f"{tool}.json")
             continue
-        try:
-            # Get tool-specific config from centralized registry (Part 5.3)
-            tool_args = get_tool_runner_args(config, tool, "java")
+        with span(f"tool.{tool}"):
+            try:
+                # Get tool-specific config from centralized registry (Part 5.3)
+                tool_args = get_tool_runner_args(config, tool, "java")
 
-            if tool_args.get("needs_build_tool"):
-                # Tools that need build_tool parameter: pitest, checkstyle, spotbugs, pmd
-                if tool == "owasp":
-                    result = runner(workdir_path, output_dir, build_tool, tool_args.get("use_nvd_api_key", True))
+                if tool_args.get("needs_build_tool"):
+                    # Tools that need build_tool parameter: pitest, checkstyle, spotbugs, pmd
+                    if tool == "owasp":
+                        result = runner(workdir_path, output_dir, build_tool, tool_args.get("use_nvd_api_key", True))
+                    else:
+                        result = runner(workdir_path, output_dir, build_tool)
+                elif tool == "sbom":
+                    result = runner(workdir_path, output_dir, tool_args.get("sbom_format", "cyclonedx"))
+                elif tool == "docker":
+                    result = runner(
+                        workdir_path,
+                        output_dir,
+                        tool_args.get("compose_file", "docker-compose.yml"),
+                        tool_args.get("health_endpoint"),
+                        tool_args.get("health_timeout", 300),
+                    )
                 else:
-                    result = runner(workdir_path, output_dir, build_tool)
-            elif tool == "sbom":
-                result = runner(workdir_path, output_dir, tool_args.get("sbom_format", "cyclonedx"))
-            elif tool == "docker":
-                result = runner(
-                    workdir_path,
-                    output_dir,
-                    tool_args.get("compose_file", "docker-compose.yml"),
-                    tool_args.get("health_endpoint"),
-                    tool_args.get("health_timeout", 300),
+                    result = runner(workdir_path, output_dir)
+            except FileNotFoundError as exc:
+                problems.append(
+                    {
+                        "severity": "error",
+                        "message": f"Tool '{tool}' not found: {exc}",
+                        "code": "CIHUB-CI-MISSING-TOOL",
+                    }
                 )
-            else:
-                result = runner(workdir_path, output_dir)
-        except FileNotFoundError as exc:
-            problems.append(
-                {
-                    "severity": "error",
-                    "message": f"Tool '{tool}' not found: {exc}",
-                    "code": "CIHUB-CI-MISSING-TOOL",
-                }
-            )
-            result = ToolResult(tool=tool, ran=False, success=False)
+                result = ToolResult(tool=tool, ran=False, success=False)
 
         tool_outputs[tool] = result.to_payload()
         tools_ran[tool] = result.ran
@@ -260,7 +305,8 @@ def _run_java_tools(
                 cmd_parts = shlex.split(command)
             else:
                 cmd_parts = [str(p) for p in command]
-            proc = safe_run(cmd_parts, cwd=workdir_path, timeout=TIMEOUT_BUILD)
+            with span(f"tool.{tool_name}"):
+                proc = safe_run(cmd_parts, cwd=workdir_path, timeout=TIMEOUT_BUILD)
             ran = True
             success = proc.returncode == 0
             result = ToolResult(
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import json
 import smtplib
+import threading
 import urllib.request
+from collections.abc import Callable
 from email.message import EmailMessage
+from functools import partial
 from typing import Any, Mapping
 
 from .helpers import _get_env_name, _get_env_value, _parse_env_bool
@@ -134,6 +137,7 @@ def _notify(
     repo = report.get("repository", "") or report.get("repo", "") or "unknown"
     branch = report.get("branch", "") or "unknown"
     status = "SUCCESS" if success else "FAILURE"
+    sends: list[Callable[[list[dict[str, Any]]], None]] = []
 
     if slack_cfg.get("enabled", False):
         on_success = bool(slack_cfg.get("on_success", False))
@@ -150,13 +154,27 @@ def _notify(
                     }
                 )
             else:
-                _send_slack(webhook, f"CIHUB {status}: {repo} ({branch})", problems)
+                sends.append(partial(_send_slack, webhook, f"CIHUB {status}: {repo} ({branch})"))
 
     if email_cfg.get("enabled", False):
-        _send_email(
-            f"CIHUB {status}: {repo}",
-            f"Repository: {repo}\nBranch: {branch}\nStatus: {status}\n",
-            problems,
-            email_cfg,
-            env,
+        sends.append(
+            partial(
+                _send_email,
+                f"CIHUB {status}: {repo}",
+                f"Repository: {repo}\nBranch: {branch}\nStatus: {status}\n",
+                email_cfg=email_cfg,
+                env=env,
+            )
         )
+
+    # Slack and email go out concurrently; each applies its own network timeout
+    results: list[list[dict[str, Any]]] = [[] for _ in sends]
+    threads = [
+        threading.Thread(target=send, args=(found,), daemon=True) for send, found in zip(sends, results, strict=True)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for found in results:
+        problems.extend(found)
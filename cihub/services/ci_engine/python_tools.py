@@ -6,6 +6,7 @@ import os
 import shlex
 import shutil
 import sys
+import time
 from pathlib import Path
 from typing import Any
 
@@ -22,7 +23,15 @@ from cihub.utils.exec_utils import (
     CommandTimeoutError,
     safe_run,
 )
+from cihub.utils.tracing import span, traced
 
+from .dependency_cache import (
+    DependencyCache,
+    cache_enabled,
+    python_dependency_key,
+    python_environment_digest,
+)
+from .dependency_cache import outcome as cache_outcome
 from .helpers import _parse_env_bool, _tool_enabled
 
 
@@ -140,15 +149,26 @@ def _install_qt_system_deps(workdir: Path, problems: list[dict[str, Any]]) -> No
     )
 
 
+@traced("deps.install")
 def _install_python_dependencies(
     config: dict[str, Any],
     workdir: Path,
     problems: list[dict[str, Any]],
-) -> None:
+) -> dict[str, Any] | None:
+    """Install the project's Python dependencies into the running interpreter.
+
+    The default pip installs are skipped when the dependency files and the
+    environment match the last successful install (see dependency_cache).
+
+    Returns:
+        The dependency cache outcome for the report, or None when nothing was
+        installed through the cache (install disabled, custom commands or no
+        dependency files)
+    """
     deps_cfg = config.get("python", {}).get("dependencies", {}) or {}
     if isinstance(deps_cfg, dict):
         if deps_cfg.get("install") is False:
-            return
+            return None
         commands = deps_cfg.get("commands")
     else:
         commands = None
@@ -170,36 +190,45 @@ def _install_python_dependencies(
             if not parts:
                 continue
             _run_dep_command(parts, workdir, " ".join(parts), problems)
-        return
+        return None
 
-    if (workdir / "requirements.txt").exists():
-        _run_dep_command(
-            [python_bin, "-m", "pip", "install", "-r", "requirements.txt"],
-            workdir,
-            "requirements.txt",
-            problems,
-        )
-    if (workdir / "requirements-dev.txt").exists():
-        _run_dep_command(
-            [python_bin, "-m", "pip", "install", "-r", "requirements-dev.txt"],
-            workdir,
-            "requirements-dev.txt",
-            problems,
-        )
+    pip = [python_bin, "-m", "pip", "install"]
+    steps: list[tuple[list[str], str]] = []
+    for requirements in ("requirements.txt", "requirements-dev.txt"):
+        if (workdir / requirements).exists():
+            steps.append((pip + ["-r", requirements], requirements))
     if (workdir / "pyproject.toml").exists():
-        ok = _run_dep_command(
-            [python_bin, "-m", "pip", "install", "-e", ".[dev]"],
-            workdir,
-            "pyproject.toml [dev]",
-            problems,
-        )
-        if not ok:
-            _run_dep_command(
-                [python_bin, "-m", "pip", "install", "-e", "."],
-                workdir,
-                "pyproject.toml",
-                problems,
-            )
+        steps.append((pip + ["-e", ".[dev]"], "pyproject.toml [dev]"))
+
+    if not steps:
+        return None
+    key = python_dependency_key(workdir, python_bin, [cmd for cmd, _label in steps])
+    if key is None:
+        return None
+    cache = DependencyCache.load(workdir) if cache_enabled(config, "python") else None
+    started = time.monotonic()
+    if cache is not None:
+        saved = cache.lookup("python", key, python_environment_digest())
+        if saved is not None:
+            return cache_outcome("hit", time.monotonic() - started, saved)
+
+    ok = True
+    for cmd, label in steps:
+        if _run_dep_command(cmd, workdir, label, problems):
+            continue
+        if label == "pyproject.toml [dev]":
+            ok = _run_dep_command(pip + ["-e", "."], workdir, "pyproject.toml", problems) and ok
+        else:
+            ok = False
+    elapsed = time.monotonic() - started
+
+    if cache is not None:
+        if ok:
+            cache.store("python", key, elapsed, python_environment_digest())
+        else:
+            cache.forget("python")
+        cache.save()
+    return cache_outcome("miss" if cache is not None else "disabled", elapsed)
 
 
 def _run_python_tools(
@@ -275,56 +304,57 @@ def _run_python_tools(
             )
             ToolResult(tool=tool, ran=False, success=False).write_json(tool_output_dir / f"{tool}.json")
             continue
-        try:
-            # Get tool-specific config from centralized registry (Part 5.3)
-            tool_args = get_tool_runner_args(config, tool, "python")
-            if tool == "bandit":
-                bandit_gate = {
-                    "fail_on_high": bool(tool_args.get("fail_on_high", True)),
-                    "fail_on_medium": bool(tool_args.get("fail_on_medium", False)),
-                    "fail_on_low": bool(tool_args.get("fail_on_low", False)),
-                }
+        with span(f"tool.{tool}"):
+            try:
+                # Get tool-specific config from centralized registry (Part 5.3)
+                tool_args = get_tool_runner_args(config, tool, "python")
+                if tool == "bandit":
+                    bandit_gate = {
+                        "fail_on_high": bool(tool_args.get("fail_on_high", True)),
+                        "fail_on_medium": bool(tool_args.get("fail_on_medium", False)),
+                        "fail_on_low": bool(tool_args.get("fail_on_low", False)),
+                    }
 
-            if tool == "pytest":
-                pytest_args = tool_args.get("args") or []
-                pytest_env = tool_args.get("env")
-                if not isinstance(pytest_args, list):
-                    pytest_args = []
-                if not isinstance(pytest_env, dict):
-                    pytest_env = None
-                result = runner(
-                    workdir_path,
-                    output_dir,
-                    tool_args.get("fail_fast", False),
-                    pytest_args,
-                    pytest_env,
-                )
-            elif tool == "isort":
-                use_black_profile = _tool_enabled(config, "black", "python")
-                result = runner(workdir_path, output_dir, use_black_profile)
-            elif tool == "mutmut":
-                result = runner(workdir_path, output_dir, tool_args.get("timeout_seconds", 900))
-            elif tool == "sbom":
-                result = runner(workdir_path, output_dir, tool_args.get("sbom_format", "cyclonedx"))
-            elif tool == "docker":
-                result = runner(
-                    workdir_path,
-                    output_dir,
-                    tool_args.get("compose_file", "docker-compose.yml"),
-                    tool_args.get("health_endpoint"),
-                    tool_args.get("health_timeout", 300),
+                if tool == "pytest":
+                    pytest_args = tool_args.get("args") or []
+                    pytest_env = tool_args.get("env")
+                    if not isinstance(pytest_args, list):
+                        pytest_args = []
+                    if not isinstance(pytest_env, dict):
+                        pytest_env = None
+                    result = runner(
+                        workdir_path,
+                        output_dir,
+                        tool_args.get("fail_fast", False),
+                        pytest_args,
+                        pytest_env,
+                    )
+                elif tool == "isort":
+                    use_black_profile = _tool_enabled(config, "black", "python")
+                    result = runner(workdir_path, output_dir, use_black_profile)
+                elif tool == "mutmut":
+                    result = runner(workdir_path, output_dir, tool_args.get("timeout_seconds", 900))
+                elif tool == "sbom":
+                    result = runner(workdir_path, output_dir, tool_args.get("sbom_format", "cyclonedx"))
+                elif tool == "docker":
+                    result = runner(
+                        workdir_path,
+                        output_dir,
+                        tool_args.get("compose_file", "docker-compose.yml"),
+                        tool_args.get("health_endpoint"),
+                        tool_args.get("health_timeout", 300),
+                    )
+                else:
+                    result = runner(workdir_path, output_dir)
+            except FileNotFoundError as exc:
+                problems.append(
+                    {
+                        "severity": "error",
+                        "message": f"Tool '{tool}' not found: {exc}",
+                        "code": "CIHUB-CI-MISSING-TOOL",
+                    }
                 )
-            else:
-                result = runner(workdir_path, output_dir)
-        except FileNotFoundError as exc:
-            problems.append(
-                {
-                    "severity": "error",
-                    "message": f"Tool '{tool}' not found: {exc}",
-                    "code": "CIHUB-CI-MISSING-TOOL",
-                }
-            )
-            result = ToolResult(tool=tool, ran=False, success=False)
+                result = ToolResult(tool=tool, ran=False, success=False)
         tool_outputs[tool] = result.to_payload()
         tools_ran[tool] = result.ran
         if tool == "bandit" and bandit_gate is not None:
@@ -395,7 +425,8 @@ def _run_python_tools(
                 cmd_parts = shlex.split(command)
             else:
                 cmd_parts = [str(p) for p in command]
-            proc = safe_run(cmd_parts, cwd=workdir_path, timeout=TIMEOUT_BUILD)
+            with span(f"tool.{tool_name}"):
+                proc = safe_run(cmd_parts, cwd=workdir_path, timeout=TIMEOUT_BUILD)
             ran = True
             success = proc.returncode == 0
             result = ToolResult(
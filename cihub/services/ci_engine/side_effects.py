@@ -0,0 +1,130 @@
+"""Post-run side effects for `cihub ci`.
+
+Once the report is final, the workspace mirror runs in the background while
+the codecov upload and then the notifications run. Notifications wait for
+the upload because a codecov error can still fail the run, and they must
+report the final outcome. Each side effect gets its own daemon thread and
+time budget: a hung webhook is abandoned after its budget (and reported)
+rather than holding up the run, and it cannot keep the process alive at
+exit. A side effect with a cancel event is told to stop when it overruns,
+and is given CANCEL_GRACE_SECONDS to do so.
+
+Each side effect appends problems to a private list; they are merged into the
+run's problems in queue order once it finishes, so output stays deterministic.
+Durations and outcomes are returned for CiRunResult.data["side_effects"].
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from cihub.utils.exec_utils import TIMEOUT_NETWORK
+from cihub.utils.tracing import span, traced
+
+# Budgets sit above the timeouts the side effects apply themselves
+CODECOV_TIMEOUT_SECONDS = TIMEOUT_NETWORK + 15
+MIRROR_TIMEOUT_SECONDS = 300
+NOTIFY_TIMEOUT_SECONDS = 30
+CANCEL_GRACE_SECONDS = 5.0
+
+Started = list[tuple["SideEffect", threading.Thread, float]]
+
+
+@dataclass
+class SideEffect:
+    """One queued side effect; func receives the problems list to append to.
+
+    When cancel is given, func must watch it and return early once it is set.
+    """
+
+    name: str
+    func: Callable[[list[dict[str, Any]]], Any]
+    timeout: float
+    cancel: threading.Event | None = None
+    result: Any = None
+    status: str = "pending"
+    seconds: float = 0.0
+    problems: list[dict[str, Any]] = field(default_factory=list)
+
+    def _run(self) -> None:
+        start = time.monotonic()
+        try:
+            with span(f"side_effect.{self.name}"):
+                self.result = self.func(self.problems)
+        except Exception as exc:
+            self.problems.append(
+                {
+                    "severity": "warning",
+                    "message": f"Post-run step '{self.name}' failed: {exc}",
+                    "code": "CIHUB-CI-SIDE-EFFECT-FAILED",
+                }
+            )
+            self.status = "failed"
+        else:
+            severities = {problem.get("severity") for problem in self.problems}
+            self.status = "error" if "error" in severities else "warning" if "warning" in severities else "ok"
+        self.seconds = round(time.monotonic() - start, 3)
+
+
+def start_side_effects(effects: list[SideEffect]) -> Started:
+    """Start side effects in the background; pass the result to collect_side_effects."""
+    started: Started = []
+    for effect in effects:
+        thread = threading.Thread(target=effect._run, name=f"cihub-{effect.name}", daemon=True)
+        thread.start()
+        started.append((effect, thread, time.monotonic() + effect.timeout))
+    return started
+
+
+def collect_side_effects(started: Started, problems: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Wait for started side effects, each until its own deadline.
+
+    Args:
+        started: Result of start_side_effects
+        problems: Run problems; each finished side effect's problems are appended in queue order
+
+    Returns:
+        Per side effect: status (ok, warning, error, failed or timeout) and seconds
+    """
+    outcomes: dict[str, dict[str, Any]] = {}
+    for effect, thread, deadline in started:
+        thread.join(max(deadline - time.monotonic(), 0))
+        if thread.is_alive() and effect.cancel is not None:
+            effect.cancel.set()
+            thread.join(CANCEL_GRACE_SECONDS)
+        if thread.is_alive() or effect.cancel is not None and effect.cancel.is_set():
+            # Whatever it reports from here on is dropped
+            problems.append(
+                {
+                    "severity": "warning",
+                    "message": f"Post-run step '{effect.name}' did not finish within {effect.timeout:g}s",
+                    "code": "CIHUB-CI-SIDE-EFFECT-TIMEOUT",
+                }
+            )
+            outcomes[effect.name] = {"status": "timeout", "seconds": float(effect.timeout)}
+            continue
+        problems.extend(effect.problems)
+        outcomes[effect.name] = {"status": effect.status, "seconds": effect.seconds}
+    return outcomes
+
+
+@traced("side_effects")
+def run_side_effects(effects: list[SideEffect], problems: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Run side effects concurrently and wait for them (see collect_side_effects)."""
+    return collect_side_effects(start_side_effects(effects), problems)
+
+
+__all__ = [
+    "CANCEL_GRACE_SECONDS",
+    "CODECOV_TIMEOUT_SECONDS",
+    "MIRROR_TIMEOUT_SECONDS",
+    "NOTIFY_TIMEOUT_SECONDS",
+    "SideEffect",
+    "collect_side_effects",
+    "run_side_effects",
+    "start_side_effects",
+]
@@ -9,7 +9,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Mapping
 
+from cihub.utils.tracing import traced
 
+
+@traced("report.validate")
 def _self_validate_report(
     report: dict[str, Any],
     summary_text: str,
@@ -28,6 +28,9 @@ from cihub.services.registry.diff import (
     compute_diff,
 )
 
+# Indexed access for bulk commands
+from cihub.services.registry.index import RegistryIndex, RegistryMutation
+
 # I/O operations
 from cihub.services.registry.io import (
     _get_registry_path,
@@ -35,6 +38,9 @@ from cihub.services.registry.io import (
     save_registry,
 )
 
+# Merkle digests and the persisted diff cache
+from cihub.services.registry.merkle import DIFF_CACHE_PATH, DiffCache, TreeDigests
+
 # Normalization functions
 from cihub.services.registry.normalize import (
     _normalize_registry_inplace,
@@ -98,11 +104,16 @@ __all__ = [
     "_compute_repo_metadata_drift",
     "_compute_repo_local_config_overrides",
     "compute_diff",
+    "DIFF_CACHE_PATH",
+    "DiffCache",
+    "TreeDigests",
     # Sync
     "sync_to_configs",
     "bootstrap_from_configs",
     # Query
     "list_repos",
+    "RegistryIndex",
+    "RegistryMutation",
     "get_repo_config",
     "set_repo_tier",
     "set_repo_override",
@@ -5,15 +5,31 @@ Handles computing differences between registry settings and actual config files.
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
 from pathlib import Path
 from typing import Any
 
 from cihub.services.registry import _paths as _registry_paths
+from cihub.services.registry.merkle import DiffCache, TreeDigests
 from cihub.services.registry.thresholds import (
     _DEFAULT_THRESHOLDS,
     _normalize_threshold_dict_inplace,
 )
+from cihub.utils.parallel import process_map
+
+# Normalized fragments keyed by content hash. Tier, profile and repo fragments
+# repeat across hundreds of repos in sync/diff, and normalize_config() deep-copies
+# and rewrites each one; identical content always normalizes identically.
+_FRAGMENT_CACHE: dict[str, dict[str, Any]] = {}
+_FRAGMENT_CACHE_MAX = 4096
+
+
+def _fragment_key(fragment: dict[str, Any]) -> str:
+    # repr() keeps key order and value types (1 vs "1" vs True), both of which
+    # survive normalization and end up in written YAML.
+    return hashlib.sha256(repr(fragment).encode("utf-8")).hexdigest()
 
 
 def _normalize_config_fragment(fragment: Any) -> dict[str, Any]:
@@ -21,11 +37,26 @@ def _normalize_config_fragment(fragment: Any) -> dict[str, Any]:
 
     NOTE: This is used for registry-managed *fragments* (sparse storage). We avoid
     writing derived/defaulted keys into fragments when possible.
-    """
-    from cihub.config.normalize import normalize_config
 
+    Results are cached by fragment content; callers get their own copy.
+    """
     if not isinstance(fragment, dict):
         return {}
+    if not fragment:
+        return _normalize_config_fragment_uncached(fragment)
+
+    key = _fragment_key(fragment)
+    cached = _FRAGMENT_CACHE.get(key)
+    if cached is None:
+        cached = _normalize_config_fragment_uncached(fragment)
+        if len(_FRAGMENT_CACHE) >= _FRAGMENT_CACHE_MAX:
+            _FRAGMENT_CACHE.clear()
+        _FRAGMENT_CACHE[key] = cached
+    return copy.deepcopy(cached)
+
+
+def _normalize_config_fragment_uncached(fragment: dict[str, Any]) -> dict[str, Any]:
+    from cihub.config.normalize import normalize_config
 
     original_thresholds = fragment.get("thresholds")
     original_has_trivy_cvss = isinstance(original_thresholds, dict) and "trivy_cvss_fail" in original_thresholds
@@ -93,12 +124,23 @@ def _collect_sparse_config_diffs(
     return diffs
 
 
-def _diff_objects(before: Any, after: Any, prefix: str = "") -> list[tuple[str, Any, Any]]:
+def _diff_objects(
+    before: Any,
+    after: Any,
+    prefix: str = "",
+    *,
+    digests: TreeDigests | None = None,
+) -> list[tuple[str, Any, Any]]:
     """Compute a deterministic deep diff of JSON-ish objects.
 
+    With digests, subtrees whose Merkle digests match are skipped without
+    being walked; the result is the same as without them.
+
     Returns a list of (field_path, old, new) tuples.
     """
     changes: list[tuple[str, Any, Any]] = []
+    if digests is not None and digests.same(before, after):
+        return changes
 
     if isinstance(before, dict) and isinstance(after, dict):
         keys = sorted(set(before.keys()) | set(after.keys()))
@@ -113,7 +155,7 @@ def _diff_objects(before: Any, after: Any, prefix: str = "") -> list[tuple[str,
             b = before.get(key)
             a = after.get(key)
             if isinstance(b, dict) and isinstance(a, dict):
-                changes.extend(_diff_objects(b, a, prefix=f"{path}."))
+                changes.extend(_diff_objects(b, a, prefix=f"{path}.", digests=digests))
                 continue
             if isinstance(b, list) and isinstance(a, list):
                 if not _values_equal(b, a):
@@ -337,21 +379,66 @@ def _compute_repo_local_config_overrides(
     return diffs
 
 
+def _tier_layers(tier_cfg: Any, paths: Any, load_profile: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return a tier's (profile fragment, tier fragment) expected-config layers."""
+    if not isinstance(tier_cfg, dict):
+        tier_cfg = {}
+
+    # Load tier profile
+    profile_cfg: dict[str, Any] = {}
+    profile_name = tier_cfg.get("profile")
+    if isinstance(profile_name, str) and profile_name:
+        profile_cfg = _normalize_config_fragment(load_profile(paths, profile_name))
+
+    # Build tier fragment with tier-level threshold keys merged in
+    tier_fragment = _normalize_config_fragment(tier_cfg.get("config"))
+    # Extract tier-level threshold keys (direct on tier, not in tier.config)
+    # These are part of the tier layer, not overrides applied at the end
+    tier_thresholds = tier_fragment.setdefault("thresholds", {})
+    for key in _DEFAULT_THRESHOLDS:
+        if key in tier_cfg and key not in tier_thresholds:
+            # Only add if not already in tier.config.thresholds (config takes precedence)
+            tier_thresholds[key] = tier_cfg[key]
+    return profile_cfg, tier_fragment
+
+
+def _load_config_file(config_path: Path) -> tuple[dict[str, Any] | None, str | None]:
+    """Parse one config/repos YAML file in a worker: (config, None) or (None, error)."""
+    from cihub.config.io import load_yaml_file  # Avoid circular import
+
+    try:
+        return load_yaml_file(config_path), None
+    except Exception as exc:  # noqa: BLE001
+        return None, str(exc)
+
+
 def compute_diff(
     registry: dict[str, Any],
     configs_dir: Path,
     *,
     hub_root_path: Path | None = None,
     repo_paths: dict[str, Path] | None = None,
+    max_workers: int | None = None,
+    cache_path: Path | None = None,
 ) -> list[dict[str, Any]]:
     """Compare registry against actual repo configs.
 
+    Config files are parsed once, in a process pool for large fleets, and the
+    parsed configs are shared with the dry-run sync. Entries keep a
+    deterministic order (sorted config paths, then registry repo order).
+
+    With cache_path, per-file results are persisted keyed by file content
+    (see merkle.DiffCache): files unchanged since a run that found them in
+    sync with the same registry inputs are not parsed or diffed again.
+
     Args:
         registry: Registry dict
         configs_dir: Path to config/repos/ directory
         hub_root_path: Optional path to hub root (for loading profiles/schemas)
         repo_paths: Optional mapping of repo_name -> path to cloned repo dir.
                     When provided, reads each repo's .ci-hub.yml and reports overrides.
+        max_workers: Worker processes for per-repo work (1 runs serially)
+        cache_path: Optional persisted diff cache file. When None, nothing is persisted.
 
     Returns:
         List of diff entries with:
@@ -390,7 +477,19 @@ def compute_diff(
         )
     registry_repo_names = set(repos.keys())
     failed_load: set[str] = set()
-    for config_path in sorted(configs_dir.rglob("*.yaml")):
+    loaded_configs: dict[str, dict[str, Any]] = {}
+    diff_cache = DiffCache.load(cache_path) if cache_path is not None else None
+    config_paths = sorted(configs_dir.rglob("*.yaml"))
+    # Files whose top-level keys are cached by content need no parsing for the orphan scan
+    cached_keys: dict[Path, list[str]] = {}
+    if diff_cache is not None:
+        for config_path in config_paths:
+            keys = diff_cache.top_level_keys(diff_cache.content_hash(config_path))
+            if keys is not None:
+                cached_keys[config_path] = keys
+    to_parse = [config_path for config_path in config_paths if config_path not in cached_keys]
+    parsed = dict(zip(to_parse, process_map(_load_config_file, to_parse, max_workers=max_workers), strict=True))
+    for config_path in config_paths:
         try:
             rel = config_path.relative_to(configs_dir)
             repo_name = rel.with_suffix("").as_posix()
@@ -406,23 +505,28 @@ def compute_diff(
                     "severity": "warning",
                 }
             )
-        try:
-            actual = load_yaml_file(config_path)
-        except Exception as exc:  # noqa: BLE001
+        top_level_keys = cached_keys.get(config_path)
+        actual, load_error = parsed.get(config_path, (None, None))
+        if load_error is not None:
             diffs.append(
                 {
                     "repo": repo_name,
                     "field": "config_file",
                     "registry_value": "valid",
-                    "actual_value": f"error: {exc}",
+                    "actual_value": f"error: {load_error}",
                     "severity": "error",
                 }
             )
             failed_load.add(repo_name)
             continue
-        if not isinstance(actual, dict):
-            continue
-        for key in sorted(actual.keys()):
+        if top_level_keys is None:
+            if not isinstance(actual, dict):
+                continue
+            loaded_configs[repo_name] = actual
+            top_level_keys = sorted(actual.keys())
+            if diff_cache is not None:
+                diff_cache.remember_keys(diff_cache.content_hash(config_path), top_level_keys)
+        for key in top_level_keys:
             if key not in config_schema_top_level_keys and not schema_error:
                 diffs.append(
                     {
@@ -446,7 +550,15 @@ def compute_diff(
 
     # Phase 2.4: non-threshold managedConfig drift. Reuse the sync engine in dry-run mode
     # to compute the intended on-disk state across allowlisted keys.
-    for change in sync_to_configs(registry, configs_dir, dry_run=True, hub_root_path=hub_root_path):
+    for change in sync_to_configs(
+        registry,
+        configs_dir,
+        dry_run=True,
+        hub_root_path=hub_root_path,
+        max_workers=max_workers,
+        loaded_configs=loaded_configs,
+        diff_cache=diff_cache,
+    ):
         if change.get("action") == "skip":
             reason = change.get("reason", "skipped")
             repo_name = change.get("repo", "<unknown>")
@@ -490,6 +602,9 @@ def compute_diff(
                 }
             )
 
+    if diff_cache is not None:
+        diff_cache.save()
+
     # Phase 2.4: Detect .ci-hub.yml overrides when repo_paths are provided
     if repo_paths:
         from cihub.config.io import load_defaults, load_profile
@@ -505,6 +620,8 @@ def compute_diff(
 
         # Load defaults once (base layer for expected config)
         defaults_cfg = _normalize_config_fragment(load_defaults(paths))
+        # Profile and tier layers are built once per tier and shared by its repos
+        tier_layers: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
 
         for repo_name, repo_path in repo_paths.items():
             ci_hub_yml_path = repo_path / ".ci-hub.yml"
@@ -536,15 +653,9 @@ def compute_diff(
             if not isinstance(repo_cfg, dict):
                 repo_cfg = {}
             tier_name = repo_cfg.get("tier", "standard")
-            tier_cfg = tiers.get(tier_name, {})
-            if not isinstance(tier_cfg, dict):
-                tier_cfg = {}
-
-            # Load tier profile
-            profile_cfg: dict[str, Any] = {}
-            profile_name = tier_cfg.get("profile")
-            if isinstance(profile_name, str) and profile_name:
-                profile_cfg = _normalize_config_fragment(load_profile(paths, profile_name))
+            if tier_name not in tier_layers:
+                tier_layers[tier_name] = _tier_layers(tiers.get(tier_name, {}), paths, load_profile)
+            profile_cfg, tier_fragment = tier_layers[tier_name]
 
             # Extract repo-level explicit overrides (repos.<name>.overrides) and normalize
             repo_overrides = repo_cfg.get("overrides", {})
@@ -553,16 +664,6 @@ def compute_diff(
             # Normalize legacy keys in repo overrides (coverage->coverage_min, etc.)
             _normalize_threshold_dict_inplace(repo_overrides)
 
-            # Build tier fragment with tier-level threshold keys merged in
-            tier_fragment = _normalize_config_fragment(tier_cfg.get("config"))
-            # Extract tier-level threshold keys (direct on tier, not in tier.config)
-            # These are part of the tier layer, not overrides applied at the end
-            tier_thresholds = tier_fragment.setdefault("thresholds", {})
-            for key in _DEFAULT_THRESHOLDS:
-                if key in tier_cfg and key not in tier_thresholds:
-                    # Only add if not already in tier.config.thresholds (config takes precedence)
-                    tier_thresholds[key] = tier_cfg[key]
-
             # Merge fragments: defaults -> profile -> tier (with tier thresholds) -> repo
             repo_fragment = _normalize_config_fragment(repo_cfg.get("config"))
             expected_config = _merge_config_layers(
@@ -0,0 +1,243 @@
+"""Indexed access to the registry for bulk commands.
+
+RegistryIndex wraps a loaded registry dict and answers the questions bulk
+commands ask (which repos are in a tier, use a language, enable a tool) from
+indexes built once, in a single pass over the raw repo entries. Per-repo
+views with effective thresholds are materialized lazily, only for the repos a
+command actually looks at.
+
+Mutations go through the index so they are journaled; save() normalizes only
+the repos the journal touched and writes registry.json with an atomic replace.
+It skips the write entirely when nothing changed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cihub.services.registry.io import _get_registry_path, load_registry
+from cihub.services.registry.normalize import _normalize_repo_metadata_inplace, _resolve_repo_language
+from cihub.services.registry.query import _hub_paths, _repo_list_entry, _tier_threshold_defaults
+from cihub.services.registry.thresholds import _normalize_threshold_dict_inplace
+from cihub.utils.json_io import write_json
+
+
+@dataclass(frozen=True)
+class RegistryMutation:
+    """One journaled registry change."""
+
+    repo: str
+    path: tuple[str, ...]
+    old: Any
+    new: Any
+
+
+def _tool_enabled(tool_cfg: Any) -> bool | None:
+    """Return the enabled flag of a registry tool entry (None when unset)."""
+    if isinstance(tool_cfg, bool):
+        return tool_cfg
+    if isinstance(tool_cfg, dict) and isinstance(tool_cfg.get("enabled"), bool):
+        return bool(tool_cfg["enabled"])
+    return None
+
+
+class RegistryIndex:
+    """Lazily indexed view over a registry dict."""
+
+    def __init__(
+        self,
+        registry: dict[str, Any],
+        *,
+        registry_path: Path | None = None,
+        hub_root_path: Path | None = None,
+    ) -> None:
+        self.registry = registry
+        self.registry_path = registry_path
+        self.hub_root_path = hub_root_path
+        self.journal: list[RegistryMutation] = []
+        self._languages: dict[str, str | None] | None = None
+        self._by_tier: dict[str, list[str]] | None = None
+        self._by_language: dict[str, list[str]] | None = None
+        self._tool_state: dict[str, dict[str, bool | None]] = {}
+        self._tier_defaults: dict[str, dict[str, Any]] = {}
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._paths: Any = None
+
+    @classmethod
+    def load(cls, registry_path: Path | None = None, *, hub_root_path: Path | None = None) -> RegistryIndex:
+        """Load registry.json and wrap it in an index."""
+        return cls(load_registry(registry_path), registry_path=registry_path, hub_root_path=hub_root_path)
+
+    @property
+    def repos(self) -> dict[str, Any]:
+        repos = self.registry.get("repos")
+        return repos if isinstance(repos, dict) else {}
+
+    def names(self) -> list[str]:
+        """All repo names, sorted (same order as list_repos())."""
+        return sorted(self.repos)
+
+    def __contains__(self, repo_name: object) -> bool:
+        return repo_name in self.repos
+
+    def __len__(self) -> int:
+        return len(self.repos)
+
+    def _build(self) -> None:
+        languages: dict[str, str | None] = {}
+        by_tier: dict[str, list[str]] = {}
+        by_language: dict[str, list[str]] = {}
+        for name in self.names():
+            config = self.repos[name]
+            if not isinstance(config, dict):
+                continue
+            language = _resolve_repo_language(config)
+            languages[name] = language
+            by_tier.setdefault(config.get("tier", "standard"), []).append(name)
+            if language:
+                by_language.setdefault(language, []).append(name)
+        self._languages = languages
+        self._by_tier = by_tier
+        self._by_language = by_language
+
+    def _invalidate(self, repo_name: str, *, indexes: bool = True) -> None:
+        if indexes:
+            self._languages = None
+            self._by_tier = None
+            self._by_language = None
+        self._entries.pop(repo_name, None)
+        self._tool_state.pop(repo_name, None)
+
+    def language(self, repo_name: str) -> str | None:
+        """Resolved language of a repo (canonical config.repo.language first)."""
+        if self._languages is None:
+            self._build()
+        assert self._languages is not None  # noqa: S101 - populated by _build
+        return self._languages.get(repo_name)
+
+    def by_tier(self, tier: str) -> list[str]:
+        """Repo names assigned to tier, sorted."""
+        if self._by_tier is None:
+            self._build()
+        assert self._by_tier is not None  # noqa: S101 - populated by _build
+        return list(self._by_tier.get(tier, []))
+
+    def by_language(self, language: str) -> list[str]:
+        """Repo names whose resolved language is language, sorted."""
+        if self._by_language is None:
+            self._build()
+        assert self._by_language is not None  # noqa: S101 - populated by _build
+        return list(self._by_language.get(language, []))
+
+    def tool_enabled(self, repo_name: str, tool: str) -> bool | None:
+        """Registry-level enabled flag for a tool in a repo (None when the registry leaves it unset)."""
+        states = self._tool_state.setdefault(repo_name, {})
+        if tool not in states:
+            language = self.language(repo_name)
+            config = self.repos.get(repo_name)
+            state = None
+            if language and isinstance(config, dict):
+                lang_cfg = (config.get("config") or {}).get(language)
+                tools = lang_cfg.get("tools") if isinstance(lang_cfg, dict) else None
+                if isinstance(tools, dict):
+                    state = _tool_enabled(tools.get(tool))
+            states[tool] = state
+        return states[tool]
+
+    def with_tool(self, tool: str, *, enabled: bool = True) -> list[str]:
+        """Repo names whose registry entry explicitly sets tool to enabled."""
+        return [name for name in self.names() if self.tool_enabled(name, tool) is enabled]
+
+    def _tier_baseline(self, tier_name: str) -> dict[str, Any]:
+        if tier_name not in self._tier_defaults:
+            tiers = self.registry.get("tiers", {})
+            tier_cfg = tiers.get(tier_name) if isinstance(tiers, dict) else None
+            if isinstance(tier_cfg, dict):
+                if self._paths is None:
+                    self._paths = _hub_paths(self.hub_root_path)
+                self._tier_defaults[tier_name] = _tier_threshold_defaults(tier_cfg, self._paths)
+            else:
+                self._tier_defaults[tier_name] = {}
+        return self._tier_defaults[tier_name]
+
+    def entry(self, repo_name: str) -> dict[str, Any] | None:
+        """list_repos()-style entry for one repo, with effective thresholds."""
+        if repo_name not in self._entries:
+            config = self.repos.get(repo_name)
+            if not isinstance(config, dict):
+                return None
+            tier_defaults = self._tier_baseline(config.get("tier", "standard"))
+            self._entries[repo_name] = _repo_list_entry(repo_name, config, tier_defaults)
+        return self._entries[repo_name]
+
+    def set_tool_enabled(self, repo_name: str, tool: str, enabled: bool, *, language: str | None = None) -> bool:
+        """Set config.<language>.tools.<tool>.enabled for a repo.
+
+        Args:
+            repo_name: Repo to update (must exist)
+            tool: Tool name
+            enabled: New enabled flag
+            language: Language block to write (defaults to the repo's resolved language)
+
+        Returns:
+            True when the registry changed
+        """
+        language = language or self.language(repo_name)
+        if not language:
+            raise ValueError(f"Repository '{repo_name}' has no language set")
+
+        repo_cfg = self.repos[repo_name]
+        config = repo_cfg.setdefault("config", {})
+        tools = config.setdefault(language, {}).setdefault("tools", {})
+        tool_config = tools.get(tool, {})
+        old = tool_config if isinstance(tool_config, (bool, dict)) else None
+        if isinstance(tool_config, dict):
+            if tool_config.get("enabled") is enabled:
+                return False
+            old = dict(tool_config)
+            tool_config["enabled"] = enabled
+            tools[tool] = tool_config
+        else:
+            tools[tool] = {"enabled": enabled}
+
+        self.journal.append(RegistryMutation(repo_name, ("config", language, "tools", tool, "enabled"), old, enabled))
+        # Tool blocks don't feed the tier/language indexes
+        self._invalidate(repo_name, indexes=False)
+        return True
+
+    def record(self, repo_name: str, path: tuple[str, ...], old: Any, new: Any) -> None:
+        """Journal a change made directly to the registry dict."""
+        self.journal.append(RegistryMutation(repo_name, path, old, new))
+        self._invalidate(repo_name)
+
+    @property
+    def path(self) -> Path:
+        return self.registry_path or _get_registry_path()
+
+    def save(self) -> bool:
+        """Write journaled changes to registry.json.
+
+        Only repos touched by the journal are re-normalized; the file is
+        replaced atomically.
+
+        Returns:
+            True when the file was written (False when the journal is empty)
+        """
+        if not self.journal:
+            return False
+        for name in {mutation.repo for mutation in self.journal}:
+            repo_cfg = self.repos.get(name)
+            if not isinstance(repo_cfg, dict):
+                continue
+            overrides = repo_cfg.get("overrides")
+            if isinstance(overrides, dict):
+                _normalize_threshold_dict_inplace(overrides)
+            _normalize_repo_metadata_inplace(repo_cfg)
+        write_json(self.path, self.registry, trailing_newline=True, atomic=True)
+        self.journal.clear()
+        return True
+
+
+__all__ = ["RegistryIndex", "RegistryMutation"]
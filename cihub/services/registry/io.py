@@ -5,12 +5,12 @@ Handles loading and saving the registry from/to disk.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
 from cihub.services.registry import _paths as _registry_paths
 from cihub.services.registry.normalize import _normalize_registry_inplace
+from cihub.utils.json_io import read_json, write_json
 
 
 def _get_registry_path() -> Path:
@@ -31,14 +31,13 @@ def load_registry(registry_path: Path | None = None) -> dict[str, Any]:
     if not path.exists():
         return {"schema_version": "cihub-registry-v1", "tiers": {}, "repos": {}}
 
-    with path.open(encoding="utf-8") as f:
-        data: dict[str, Any] = json.load(f)
-        _normalize_registry_inplace(data)
-        return data
+    data: dict[str, Any] = read_json(path)
+    _normalize_registry_inplace(data)
+    return data
 
 
 def save_registry(registry: dict[str, Any], registry_path: Path | None = None) -> None:
-    """Save the registry to disk.
+    """Save the registry to disk (atomic replace).
 
     Args:
         registry: Registry dict to save
@@ -46,6 +45,4 @@ def save_registry(registry: dict[str, Any], registry_path: Path | None = None) -
     """
     path = registry_path or _get_registry_path()
     _normalize_registry_inplace(registry)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(registry, f, indent=2)
-        f.write("\n")
+    write_json(path, registry, trailing_newline=True, atomic=True)
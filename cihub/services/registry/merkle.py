@@ -0,0 +1,169 @@
+"""Merkle-style subtree digests for registry/config trees.
+
+A subtree digest covers a value's type and content: dict digests are built
+from their children's digests (key order does not matter), list digests keep
+element order. Two subtrees with equal digests are strictly equal, so diffing
+can skip them without walking them. Unequal digests only mean "compare": the
+caller falls back to its normal comparison, which keeps diff output identical.
+
+DiffCache persists per-file results across `cihub registry diff` runs, keyed
+by file content: the top-level keys of each parsed config and the digest of
+the registry inputs the file was last found in sync with. When neither the
+file nor its registry inputs changed, the repo costs one content hash and one
+digest comparison; its YAML is not parsed at all.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import hashlib
+import math
+from pathlib import Path
+from typing import Any
+
+from cihub import __version__
+from cihub.utils.json_cache import load_json_cache, save_json_cache
+
+# Bump when the cached fields or the digest encoding change.
+DIFF_CACHE_VERSION = 1
+DIFF_CACHE_PATH = Path(".cihub") / "cache" / "registry-diff.json"
+
+_DIGEST_SIZE = 16
+# Leaf types whose repr() is deterministic and equal reprs imply ==.
+_LEAF_TYPES = (str, int, float, bool, type(None), bytes, _dt.date, _dt.datetime)
+
+
+def _leaf_digest(value: Any) -> bytes | None:
+    if type(value) not in _LEAF_TYPES:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None  # nan != nan, so it never proves equality
+    return hashlib.blake2b(f"{type(value).__name__}:{value!r}".encode(), digest_size=_DIGEST_SIZE).digest()
+
+
+class TreeDigests:
+    """Memoized subtree digests for JSON-ish trees.
+
+    Containers are memoized by identity, so hashing a root fills in every
+    subtree's digest and later lookups are O(1). Trees must not be mutated
+    after they are hashed.
+    """
+
+    def __init__(self) -> None:
+        # id -> (object, digest); holding the object keeps its id from being reused
+        self._memo: dict[int, tuple[Any, bytes | None]] = {}
+
+    def digest(self, value: Any) -> bytes | None:
+        """Digest of value, or None when it contains something that cannot be hashed reliably."""
+        if not isinstance(value, (dict, list, tuple)):
+            return _leaf_digest(value)
+        cached = self._memo.get(id(value))
+        if cached is not None:
+            return cached[1]
+
+        result: bytes | None = None
+        h = hashlib.blake2b(type(value).__name__.encode(), digest_size=_DIGEST_SIZE)
+        if isinstance(value, dict):
+            pairs: list[bytes] = []
+            for key, child in value.items():
+                key_digest = _leaf_digest(key)
+                child_digest = self.digest(child)
+                if key_digest is None or child_digest is None:
+                    break
+                pairs.append(key_digest + child_digest)
+            else:
+                for pair in sorted(pairs):
+                    h.update(pair)
+                result = h.digest()
+        else:
+            for child in value:
+                child_digest = self.digest(child)
+                if child_digest is None:
+                    break
+                h.update(child_digest)
+            else:
+                result = h.digest()
+        self._memo[id(value)] = (value, result)
+        return result
+
+    def hexdigest(self, value: Any) -> str | None:
+        digest = self.digest(value)
+        return digest.hex() if digest is not None else None
+
+    def same(self, a: Any, b: Any) -> bool:
+        """True when a and b are provably identical subtrees (equal digests)."""
+        digest_a = self.digest(a)
+        return digest_a is not None and digest_a == self.digest(b)
+
+
+class DiffCache:
+    """Content-keyed per-file results persisted between registry diff runs."""
+
+    def __init__(self, path: Path | None = None, files: dict[str, dict[str, Any]] | None = None) -> None:
+        self.path = path
+        self.files: dict[str, dict[str, Any]] = files or {}
+        self.hits = 0
+        self.misses = 0
+        self._hashes: dict[str, str | None] = {}
+        self._seen: set[str] = set()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path | None) -> DiffCache:
+        """Load the cache file; entries written by another cihub version are dropped."""
+        payload = load_json_cache(path, DIFF_CACHE_VERSION, cihub_version=__version__) or {}
+        files = payload.get("files")
+        return cls(path, files if isinstance(files, dict) else {})
+
+    def content_hash(self, config_path: Path) -> str | None:
+        """sha256 of a config file's bytes (memoized per path; None when unreadable)."""
+        key = str(config_path)
+        if key not in self._hashes:
+            try:
+                digest: str | None = hashlib.sha256(config_path.read_bytes()).hexdigest()
+            except OSError:
+                digest = None
+            self._hashes[key] = digest
+            if digest is not None:
+                self._seen.add(digest)
+        return self._hashes[key]
+
+    def top_level_keys(self, content_hash: str | None) -> list[str] | None:
+        """Cached top-level keys of a parsed config file (None when not cached)."""
+        entry = self.files.get(content_hash) if content_hash else None
+        keys = entry.get("keys") if isinstance(entry, dict) else None
+        return keys if isinstance(keys, list) else None
+
+    def remember_keys(self, content_hash: str | None, keys: list[str]) -> None:
+        if content_hash and self.top_level_keys(content_hash) != keys:
+            self.files.setdefault(content_hash, {})["keys"] = keys
+            self._dirty = True
+
+    def in_sync(self, content_hash: str | None, inputs_digest: str | None) -> bool:
+        """True when this file content was already found in sync with these registry inputs."""
+        entry = self.files.get(content_hash) if content_hash else None
+        hit = inputs_digest is not None and isinstance(entry, dict) and entry.get("in_sync") == inputs_digest
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return hit
+
+    def mark_in_sync(self, content_hash: str | None, inputs_digest: str | None) -> None:
+        if content_hash and inputs_digest:
+            entry = self.files.setdefault(content_hash, {})
+            if entry.get("in_sync") != inputs_digest:
+                entry["in_sync"] = inputs_digest
+                self._dirty = True
+
+    def save(self) -> None:
+        """Persist entries for files seen this run, dropping the rest."""
+        if self.path is None:
+            return
+        files = {key: entry for key, entry in self.files.items() if key in self._seen}
+        if not self._dirty and len(files) == len(self.files):
+            return
+        save_json_cache(self.path, DIFF_CACHE_VERSION, {"files": files}, cihub_version=__version__)
+
+
+__all__ = ["DIFF_CACHE_PATH", "DIFF_CACHE_VERSION", "DiffCache", "TreeDigests"]
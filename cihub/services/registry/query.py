@@ -18,9 +18,86 @@ from cihub.services.registry.thresholds import (
 )
 
 
+def _tier_threshold_defaults(tier_cfg: dict[str, Any], paths: Any) -> dict[str, Any]:
+    """Build a tier's threshold baseline.
+
+    Layers, later wins: optional profile, tier config fragment, legacy
+    top-level tier threshold keys.
+    """
+    profile_cfg: dict[str, Any] = {}
+    profile_name = tier_cfg.get("profile")
+    if isinstance(profile_name, str) and profile_name:
+        from cihub.config.io import load_profile
+
+        profile_cfg = _normalize_config_fragment(load_profile(paths, profile_name))
+
+    tier_fragment = _normalize_config_fragment(tier_cfg.get("config"))
+
+    defaults_for_tier: dict[str, Any] = {}
+    if isinstance(profile_cfg.get("thresholds"), dict):
+        defaults_for_tier.update(profile_cfg["thresholds"])
+    if isinstance(tier_fragment.get("thresholds"), dict):
+        defaults_for_tier.update(tier_fragment["thresholds"])
+
+    # Legacy tier threshold keys (top-level) override profile/tier fragment thresholds.
+    for key in _DEFAULT_THRESHOLDS:
+        if key in tier_cfg:
+            defaults_for_tier[key] = tier_cfg.get(key)
+    return defaults_for_tier
+
+
+def _hub_paths(hub_root_path: Path | None) -> Any:
+    from cihub.config.paths import PathConfig
+
+    return PathConfig(str(hub_root_path or _registry_paths.get_hub_root()))
+
+
+def _repo_threshold_overrides(config: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any], bool]:
+    """Return (explicit overrides, combined overrides, has config-fragment thresholds) for a repo."""
+    overrides = config.get("overrides", {})
+    if not isinstance(overrides, dict):
+        overrides = {}
+
+    # Include repo config fragment thresholds as a baseline, overridden by explicit overrides.
+    repo_fragment = _normalize_config_fragment(config.get("config"))
+    combined_overrides: dict[str, Any] = {}
+    repo_fragment_thresholds = repo_fragment.get("thresholds")
+    has_config_thresholds = isinstance(repo_fragment_thresholds, dict) and bool(repo_fragment_thresholds)
+    if has_config_thresholds and repo_fragment_thresholds is not None:
+        combined_overrides.update(repo_fragment_thresholds)
+    combined_overrides.update(overrides)
+    return overrides, combined_overrides, has_config_thresholds
+
+
+def _repo_list_entry(name: str, config: dict[str, Any], tier_defaults: dict[str, Any]) -> dict[str, Any]:
+    """Build one list_repos() entry, including effective thresholds."""
+    tier_name = config.get("tier", "standard")
+    overrides, combined_overrides, has_config_thresholds = _repo_threshold_overrides(config)
+
+    # Compute effective settings for ALL threshold fields (profile/tier/repo baselines + overrides)
+    effective = _compute_all_effective_thresholds(combined_overrides, tier_defaults)
+
+    return {
+        "name": name,
+        "tier": tier_name,
+        "description": config.get("description", ""),
+        "language": _resolve_repo_language(config),
+        "config": config.get("config", {}),
+        "effective": effective,
+        # Back-compat: explicit overrides only.
+        "has_overrides": bool(overrides),
+        # New: any per-repo threshold config (explicit overrides OR managedConfig.thresholds).
+        "has_threshold_overrides": bool(overrides) or has_config_thresholds,
+        "has_config_thresholds": has_config_thresholds,
+    }
+
+
 def list_repos(registry: dict[str, Any], *, hub_root_path: Path | None = None) -> list[dict[str, Any]]:
     """List all repos with their tiers and effective settings.
 
+    Commands that only touch some repos should use RegistryIndex instead, which
+    computes effective thresholds per repo on demand.
+
     Returns:
         List of repo info dicts with:
         - name: repo name
@@ -29,77 +106,19 @@ def list_repos(registry: dict[str, Any], *, hub_root_path: Path | None = None) -
     """
     tiers = registry.get("tiers", {})
     repos = registry.get("repos", {})
-    result = []
 
     # Precompute tier threshold baselines (defaults + optional profile + tier config fragment + legacy tier keys)
     tier_threshold_defaults: dict[str, dict[str, Any]] = {}
     if isinstance(tiers, dict):
-        from cihub.config.io import load_profile
-        from cihub.config.paths import PathConfig
-
-        paths = PathConfig(str(hub_root_path or _registry_paths.get_hub_root()))
+        paths = _hub_paths(hub_root_path)
         for tier_name, tier_cfg in tiers.items():
-            if not isinstance(tier_cfg, dict):
-                continue
-
-            profile_cfg: dict[str, Any] = {}
-            profile_name = tier_cfg.get("profile")
-            if isinstance(profile_name, str) and profile_name:
-                profile_cfg = _normalize_config_fragment(load_profile(paths, profile_name))
-
-            tier_fragment = _normalize_config_fragment(tier_cfg.get("config"))
-
-            defaults_for_tier: dict[str, Any] = {}
-            if isinstance(profile_cfg.get("thresholds"), dict):
-                defaults_for_tier.update(profile_cfg["thresholds"])
-            if isinstance(tier_fragment.get("thresholds"), dict):
-                defaults_for_tier.update(tier_fragment["thresholds"])
-
-            # Legacy tier threshold keys (top-level) override profile/tier fragment thresholds.
-            for key in _DEFAULT_THRESHOLDS:
-                if key in tier_cfg:
-                    defaults_for_tier[key] = tier_cfg.get(key)
-
-            tier_threshold_defaults[tier_name] = defaults_for_tier
-
-    for name, config in repos.items():
-        tier_name = config.get("tier", "standard")
-        overrides = config.get("overrides", {})
-        if not isinstance(overrides, dict):
-            overrides = {}
-
-        # Include repo config fragment thresholds as a baseline, overridden by explicit overrides.
-        repo_fragment = _normalize_config_fragment(config.get("config") if isinstance(config, dict) else None)
-        combined_overrides: dict[str, Any] = {}
-        repo_fragment_thresholds = repo_fragment.get("thresholds")
-        has_config_thresholds = isinstance(repo_fragment_thresholds, dict) and bool(repo_fragment_thresholds)
-        if has_config_thresholds and repo_fragment_thresholds is not None:
-            combined_overrides.update(repo_fragment_thresholds)
-        combined_overrides.update(overrides)
-
-        tier_defaults = tier_threshold_defaults.get(tier_name, {})
-
-        # Compute effective settings for ALL threshold fields (profile/tier/repo baselines + overrides)
-        effective = _compute_all_effective_thresholds(combined_overrides, tier_defaults)
-
-        repo_language = _resolve_repo_language(config) if isinstance(config, dict) else None
-
-        result.append(
-            {
-                "name": name,
-                "tier": tier_name,
-                "description": config.get("description", ""),
-                "language": repo_language,
-                "config": config.get("config", {}),
-                "effective": effective,
-                # Back-compat: explicit overrides only.
-                "has_overrides": bool(overrides),
-                # New: any per-repo threshold config (explicit overrides OR managedConfig.thresholds).
-                "has_threshold_overrides": bool(overrides) or has_config_thresholds,
-                "has_config_thresholds": has_config_thresholds,
-            }
-        )
+            if isinstance(tier_cfg, dict):
+                tier_threshold_defaults[tier_name] = _tier_threshold_defaults(tier_cfg, paths)
 
+    result = [
+        _repo_list_entry(name, config, tier_threshold_defaults.get(config.get("tier", "standard"), {}))
+        for name, config in repos.items()
+    ]
     return sorted(result, key=lambda x: x["name"])
 
 
@@ -125,34 +144,8 @@ def get_repo_config(
     if not isinstance(tier_cfg, dict):
         tier_cfg = {}
 
-    profile_cfg: dict[str, Any] = {}
-    profile_name = tier_cfg.get("profile")
-    if isinstance(profile_name, str) and profile_name:
-        from cihub.config.io import load_profile
-        from cihub.config.paths import PathConfig
-
-        paths = PathConfig(str(hub_root_path or _registry_paths.get_hub_root()))
-        profile_cfg = _normalize_config_fragment(load_profile(paths, profile_name))
-
-    tier_fragment = _normalize_config_fragment(tier_cfg.get("config"))
-    tier_defaults: dict[str, Any] = {}
-    if isinstance(profile_cfg.get("thresholds"), dict):
-        tier_defaults.update(profile_cfg["thresholds"])
-    if isinstance(tier_fragment.get("thresholds"), dict):
-        tier_defaults.update(tier_fragment["thresholds"])
-    for key in _DEFAULT_THRESHOLDS:
-        if key in tier_cfg:
-            tier_defaults[key] = tier_cfg.get(key)
-
-    overrides = config.get("overrides", {})
-    if not isinstance(overrides, dict):
-        overrides = {}
-
-    repo_fragment = _normalize_config_fragment(config.get("config") if isinstance(config, dict) else None)
-    combined_overrides: dict[str, Any] = {}
-    if isinstance(repo_fragment.get("thresholds"), dict):
-        combined_overrides.update(repo_fragment["thresholds"])
-    combined_overrides.update(overrides)
+    tier_defaults = _tier_threshold_defaults(tier_cfg, _hub_paths(hub_root_path))
+    overrides, combined_overrides, _ = _repo_threshold_overrides(config)
 
     # Compute effective settings for ALL threshold fields
     effective = _compute_all_effective_thresholds(combined_overrides, tier_defaults)
@@ -5,6 +5,8 @@ Handles syncing registry settings to repo config files and bootstrapping from ex
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -16,11 +18,150 @@ from cihub.services.registry.diff import (
     _normalize_config_fragment,
 )
 from cihub.services.registry.io import load_registry, save_registry
+from cihub.services.registry.merkle import DiffCache, TreeDigests
 from cihub.services.registry.query import list_repos
 from cihub.services.registry.thresholds import (
     _DEFAULT_THRESHOLDS,
     _normalize_threshold_dict_inplace,
 )
+from cihub.utils.parallel import process_map
+
+
+@dataclass(frozen=True)
+class _RepoSyncTask:
+    """Inputs for syncing one repo config file (picklable for worker processes)."""
+
+    repo_name: str
+    config_path: Path
+    is_new_file: bool
+    merged_fragment: dict[str, Any]
+    effective: dict[str, Any]
+    registry_lang: str | None
+    dry_run: bool
+    preloaded: dict[str, Any] | None = None
+
+
+def _sync_repo(task: _RepoSyncTask) -> dict[str, Any]:
+    """Apply registry settings to one repo config and report the change."""
+    import copy
+
+    import yaml  # Only needed for write
+
+    from cihub.config.io import load_yaml_file
+
+    repo_name = task.repo_name
+    if task.is_new_file:
+        # Start with an empty config that will be populated from registry
+        config: dict[str, Any] = {}
+        before_config: dict[str, Any] = {}
+    else:
+        if task.preloaded is not None:
+            config = copy.deepcopy(task.preloaded)
+        else:
+            try:
+                config = load_yaml_file(task.config_path)
+            except Exception as exc:  # noqa: BLE001
+                return {
+                    "repo": repo_name,
+                    "action": "skip",
+                    "reason": f"failed to load: {exc}",
+                }
+        before_config = copy.deepcopy(config)
+
+    # Apply tier/repo config fragments (sparse managedConfig).
+    if task.merged_fragment:
+        # IMPORTANT: Do NOT normalize the entire config file here.
+        # Registry sync must be allowlist-driven; normalizing the full config can
+        # rewrite unrelated/unmanaged keys (e.g., tool booleans -> objects).
+        from cihub.config.merge import deep_merge
+
+        config = deep_merge(config, task.merged_fragment)
+
+    # Update thresholds - sync ALL threshold fields from effective config
+    thresholds = config.setdefault("thresholds", {})
+    if not isinstance(thresholds, dict):
+        thresholds = {}
+        config["thresholds"] = thresholds
+
+    # Clean up legacy (schema-incompatible) keys if they exist.
+    # Note: Both "mutation" and "mutation_score" are legacy aliases for "mutation_score_min"
+    for legacy_key in ("coverage", "mutation", "mutation_score", "vulns_max"):
+        if legacy_key in thresholds:
+            thresholds.pop(legacy_key, None)
+
+    # Sync all threshold fields from registry-computed effective values
+    for key, default_val in _DEFAULT_THRESHOLDS.items():
+        if thresholds.get(key, default_val) != task.effective[key]:
+            thresholds[key] = task.effective[key]
+
+    # Ensure language is set consistently (both top-level and repo.language)
+    # For new files, language may come from registry top-level or config.repo.language
+    repo_block = config.get("repo")
+    if not isinstance(repo_block, dict):
+        repo_block = {}
+        config["repo"] = repo_block
+
+    # Get language from repo.language or registry top-level
+    repo_lang = repo_block.get("language")
+    effective_lang = repo_lang or task.registry_lang
+
+    if effective_lang:
+        # Set both top-level and repo.language for consistency
+        config["language"] = effective_lang
+        if not repo_lang:
+            repo_block["language"] = effective_lang
+
+    # Hash both trees once; identical subtrees are then skipped in O(1)
+    repo_changes = _diff_objects(before_config, config, prefix="", digests=TreeDigests())
+
+    if not repo_changes and not task.is_new_file:
+        return {
+            "repo": repo_name,
+            "action": "unchanged",
+            "reason": "already in sync",
+        }
+
+    if not task.dry_run:
+        # Ensure parent directory exists for new files
+        if task.is_new_file:
+            task.config_path.parent.mkdir(parents=True, exist_ok=True)
+        with task.config_path.open("w", encoding="utf-8") as f:
+            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+
+    # Distinguish "created" from "updated"
+    if task.is_new_file:
+        action = "created" if not task.dry_run else "would_create"
+    else:
+        action = "updated" if not task.dry_run else "would_update"
+
+    return {
+        "repo": repo_name,
+        "action": action,
+        "fields": repo_changes,
+    }
+
+
+def _missing_required_fields(repo_cfg: Any) -> list[str]:
+    """Fields a registry entry lacks to produce a schema-valid new config file."""
+    # Note: language can be at top-level OR in config.repo.language (canonical after normalization)
+    if not isinstance(repo_cfg, dict):
+        repo_cfg = {}
+    # Defensive: config may be null in malformed entries
+    config_block = repo_cfg.get("config")
+    if not isinstance(config_block, dict):
+        config_block = {}
+    repo_block = config_block.get("repo")
+    if not isinstance(repo_block, dict):
+        repo_block = {}
+    missing = []
+    if not repo_block.get("owner"):
+        missing.append("repo.owner")
+    if not repo_block.get("name"):
+        missing.append("repo.name")
+    # Check both top-level language and config.repo.language (canonical location)
+    if not (repo_cfg.get("language") or repo_block.get("language")):
+        missing.append("language")
+    return missing
 
 
 def sync_to_configs(
@@ -29,24 +170,30 @@ def sync_to_configs(
     *,
     dry_run: bool = True,
     hub_root_path: Path | None = None,
+    max_workers: int | None = None,
+    loaded_configs: Mapping[str, dict[str, Any]] | None = None,
+    diff_cache: DiffCache | None = None,
 ) -> list[dict[str, Any]]:
     """Sync registry settings to repo config files.
 
+    Tier/profile fragments are merged once per tier; per-repo work (load,
+    merge, diff, write) runs in a process pool for large registries. Changes
+    are returned in repo-name order regardless of worker scheduling.
+
     Args:
         registry: Registry dict
         configs_dir: Path to config/repos/ directory
         dry_run: If True, report what would change without modifying files
+        hub_root_path: Optional hub root path for loading profiles
+        max_workers: Worker processes for per-repo work (1 runs serially)
+        loaded_configs: Already-parsed config files keyed by repo name (skips re-reading them)
+        diff_cache: Content-keyed cache of files known to be in sync; a repo whose
+            file and registry inputs both match a cached entry is reported
+            unchanged without loading the file
 
     Returns:
         List of changes (applied or would-be-applied)
     """
-    import copy
-
-    import yaml  # Only needed for write
-
-    from cihub.config.io import load_yaml_file
-
-    changes = []
     repos_info = list_repos(registry, hub_root_path=hub_root_path)
     tiers = registry.get("tiers", {})
     repos = registry.get("repos", {})
@@ -69,10 +216,16 @@ def sync_to_configs(
             tier_cfg_fragment = _normalize_config_fragment(tier_cfg.get("config"))
             tier_fragments[tier_name] = _merge_config_layers([profile_cfg, tier_cfg_fragment])
 
+    # Slots keep output in repo order: guard skips are filled now, sync tasks after the pool.
+    changes: list[dict[str, Any] | None] = []
+    tasks: list[_RepoSyncTask] = []
+    task_slots: list[int] = []
+    # (content hash, registry inputs digest) per task, recorded in diff_cache when in sync
+    cache_keys: list[tuple[str | None, str | None]] = []
+    input_digests = TreeDigests()
     for repo_info in repos_info:
         repo_name = repo_info["name"]
-        effective = repo_info["effective"]
-        tier_name = repo_info["tier"]
+        repo_cfg = repos.get(repo_name)
 
         config_path = configs_dir / f"{repo_name}.yaml"
         is_new_file = not config_path.exists()
@@ -80,32 +233,8 @@ def sync_to_configs(
         if is_new_file:
             # Guard: Only create new configs if registry has essential fields
             # (repo.owner, repo.name, language) to produce a schema-valid config
-            # Note: language can be at top-level OR in config.repo.language (canonical after normalization)
-            repo_cfg = repos.get(repo_name, {})
-            if not isinstance(repo_cfg, dict):
-                repo_cfg = {}
-            # Defensive: config may be null in malformed entries
-            config_block = repo_cfg.get("config")
-            if not isinstance(config_block, dict):
-                config_block = {}
-            repo_block = config_block.get("repo")
-            if not isinstance(repo_block, dict):
-                repo_block = {}
-            has_owner = bool(repo_block.get("owner"))
-            has_name = bool(repo_block.get("name"))
-            # Check both top-level language and config.repo.language (canonical location)
-            top_level_lang = repo_cfg.get("language")
-            repo_lang = repo_block.get("language")
-            has_language = bool(top_level_lang or repo_lang)
-
-            if not (has_owner and has_name and has_language):
-                missing = []
-                if not has_owner:
-                    missing.append("repo.owner")
-                if not has_name:
-                    missing.append("repo.name")
-                if not has_language:
-                    missing.append("language")
+            missing = _missing_required_fields(repo_cfg)
+            if missing:
                 changes.append(
                     {
                         "repo": repo_name,
@@ -115,108 +244,44 @@ def sync_to_configs(
                 )
                 continue
 
-            # Start with an empty config that will be populated from registry
-            config = {}
-            before_config = {}
-        else:
-            try:
-                config = load_yaml_file(config_path)
-            except Exception as exc:  # noqa: BLE001
-                changes.append(
-                    {
-                        "repo": repo_name,
-                        "action": "skip",
-                        "reason": f"failed to load: {exc}",
-                    }
-                )
-                continue
-            before_config = copy.deepcopy(config)
-
-        # Apply tier/repo config fragments (sparse managedConfig).
-        repo_cfg = repos.get(repo_name)
         repo_fragment: dict[str, Any] = {}
         if isinstance(repo_cfg, dict):
             repo_fragment = _normalize_config_fragment(repo_cfg.get("config"))
-        tier_fragment = tier_fragments.get(tier_name, {})
+        tier_fragment = tier_fragments.get(repo_info["tier"], {})
         merged_fragment = _merge_config_layers([tier_fragment, repo_fragment])
-        if merged_fragment:
-            # IMPORTANT: Do NOT normalize the entire config file here.
-            # Registry sync must be allowlist-driven; normalizing the full config can
-            # rewrite unrelated/unmanaged keys (e.g., tool booleans -> objects).
-            from cihub.config.merge import deep_merge
-
-            config = deep_merge(config, merged_fragment)
-
-        # Update thresholds - sync ALL threshold fields from effective config
-        thresholds = config.setdefault("thresholds", {})
-        if not isinstance(thresholds, dict):
-            thresholds = {}
-            config["thresholds"] = thresholds
-
-        # Clean up legacy (schema-incompatible) keys if they exist.
-        # Note: Both "mutation" and "mutation_score" are legacy aliases for "mutation_score_min"
-        for legacy_key in ("coverage", "mutation", "mutation_score", "vulns_max"):
-            if legacy_key in thresholds:
-                thresholds.pop(legacy_key, None)
-
-        # Sync all threshold fields from registry-computed effective values
-        for key, default_val in _DEFAULT_THRESHOLDS.items():
-            if thresholds.get(key, default_val) != effective[key]:
-                thresholds[key] = effective[key]
-
-        # Ensure language is set consistently (both top-level and repo.language)
-        # For new files, language may come from registry top-level or config.repo.language
-        repo_block = config.get("repo")
-        if not isinstance(repo_block, dict):
-            repo_block = {}
-            config["repo"] = repo_block
-
-        # Get language from repo.language or registry top-level
-        repo_cfg = repos.get(repo_name)
         registry_lang = repo_cfg.get("language") if isinstance(repo_cfg, dict) else None
-        repo_lang = repo_block.get("language")
-        effective_lang = repo_lang or registry_lang
-
-        if effective_lang:
-            # Set both top-level and repo.language for consistency
-            config["language"] = effective_lang
-            if not repo_lang:
-                repo_block["language"] = effective_lang
-
-        repo_changes = _diff_objects(before_config, config, prefix="")
-
-        if not repo_changes and not is_new_file:
-            changes.append(
-                {
-                    "repo": repo_name,
-                    "action": "unchanged",
-                    "reason": "already in sync",
-                }
-            )
-            continue
-
-        if not dry_run:
-            # Ensure parent directory exists for new files
-            if is_new_file:
-                config_path.parent.mkdir(parents=True, exist_ok=True)
-            with config_path.open("w", encoding="utf-8") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
 
-        # Distinguish "created" from "updated"
-        if is_new_file:
-            action = "created" if not dry_run else "would_create"
+        if diff_cache is not None and not is_new_file:
+            content_hash = diff_cache.content_hash(config_path)
+            inputs_digest = input_digests.hexdigest((merged_fragment, repo_info["effective"], registry_lang))
+            if diff_cache.in_sync(content_hash, inputs_digest):
+                changes.append({"repo": repo_name, "action": "unchanged", "reason": "already in sync"})
+                continue
+            cache_keys.append((content_hash, inputs_digest))
         else:
-            action = "updated" if not dry_run else "would_update"
-
-        changes.append(
-            {
-                "repo": repo_name,
-                "action": action,
-                "fields": repo_changes,
-            }
+            cache_keys.append((None, None))
+
+        task_slots.append(len(changes))
+        changes.append(None)
+        tasks.append(
+            _RepoSyncTask(
+                repo_name=repo_name,
+                config_path=config_path,
+                is_new_file=is_new_file,
+                merged_fragment=merged_fragment,
+                effective=repo_info["effective"],
+                registry_lang=registry_lang,
+                dry_run=dry_run,
+                preloaded=(loaded_configs or {}).get(repo_name),
+            )
         )
 
-    return changes
+    results = process_map(_sync_repo, tasks, max_workers=max_workers)
+    for slot, (content_hash, inputs_digest), change in zip(task_slots, cache_keys, results, strict=True):
+        changes[slot] = change
+        if diff_cache is not None and change.get("action") == "unchanged":
+            diff_cache.mark_in_sync(content_hash, inputs_digest)
+    return [change for change in changes if change is not None]
 
 
 def bootstrap_from_configs(
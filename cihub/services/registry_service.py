@@ -13,6 +13,10 @@ from __future__ import annotations
 from cihub.services.registry import (
     _DEFAULT_THRESHOLDS,
     _FLOAT_THRESHOLD_KEYS,
+    DIFF_CACHE_PATH,
+    DiffCache,
+    RegistryIndex,
+    RegistryMutation,
     _as_int,
     _as_number,
     _collect_sparse_config_diffs,
@@ -75,11 +79,15 @@ __all__ = [
     "_compute_repo_metadata_drift",
     "_compute_repo_local_config_overrides",
     "compute_diff",
+    "DIFF_CACHE_PATH",
+    "DiffCache",
     # Sync
     "sync_to_configs",
     "bootstrap_from_configs",
     # Query
     "list_repos",
+    "RegistryIndex",
+    "RegistryMutation",
     "get_repo_config",
     "set_repo_tier",
     "set_repo_override",
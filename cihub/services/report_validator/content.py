@@ -63,7 +63,11 @@ def _parse_summary_tools(
     Returns:
         Tuple of (configured, ran, success) dicts mapping tool names to booleans.
     """
-    lines = summary_text.splitlines()
+    # Only the Tools Enabled section matters; skip splitting everything before it
+    start = summary_text.find("## Tools Enabled")
+    if start < 0:
+        return {}, {}, {}
+    lines = summary_text[start:].splitlines()
     in_tools = False
     configured: dict[str, bool] = {}
     ran: dict[str, bool] = {}
@@ -47,6 +47,7 @@ from cihub.services.triage.types import (
     ToolStatus,
     TriageBundle,
 )
+from cihub.utils.json_io import write_json
 
 # Explicit re-exports for backward compatibility
 __all__ = [
@@ -604,10 +605,11 @@ def write_triage_bundle(bundle: TriageBundle, output_dir: Path) -> dict[str, Pat
     md_path = output_dir / "triage.md"
     history_path = output_dir / "history.jsonl"
 
-    triage_path.write_text(json.dumps(bundle.triage, indent=2), encoding="utf-8")
-    priority_path.write_text(json.dumps(bundle.priority, indent=2), encoding="utf-8")
+    write_json(triage_path, bundle.triage)
+    write_json(priority_path, bundle.priority)
     md_path.write_text(bundle.markdown, encoding="utf-8")
     with history_path.open("a", encoding="utf-8") as handle:
+        # history.jsonl keeps the stdlib's ", "/": " separators that existing readers and diffs expect
         handle.write(json.dumps(bundle.history_entry) + "\n")
 
     return {
@@ -5,11 +5,12 @@ This module contains types that are used across multiple modules.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from cihub.utils.json_io import write_json
+
 
 @dataclass
 class CommandResult:
@@ -127,6 +128,5 @@ class ToolResult:
         )
 
     def write_json(self, path: Path) -> None:
-        """Write to JSON file (preserves ci_runner/base.py behavior)."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(self.to_payload(), indent=2), encoding="utf-8")
+        """Write to JSON file (compact: tool outputs are machine-read only)."""
+        write_json(path, self.to_payload(), pretty=False)
@@ -0,0 +1,351 @@
+"""Shared Markdown corpus index for docs commands.
+
+`cihub docs audit`, `cihub docs links`, `cihub docs stale` and `cihub adr check`
+all scan the same Markdown tree. The corpus walks the docs directory once,
+reads each file at most once, and parses it once into the structures those
+passes need (headings, links, reference definitions, fenced blocks, checklist
+items, backtick references). Parsed entries are persisted in a small JSON cache
+keyed by file mtime and size, so unchanged docs are never re-parsed. Entries
+from different docs directories share the cache file without evicting each
+other.
+
+Usage:
+    corpus = load_docs_corpus(repo_root)
+    for doc in corpus.iter_docs("docs/guides"):
+        for text, target in doc.links:
+            ...
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from cihub.utils.json_cache import load_json_cache, save_json_cache
+
+# Shape of DocFile.to_cache().
+CORPUS_CACHE_VERSION = 2
+CORPUS_CACHE_PATH = Path(".cihub") / "cache" / "docs-corpus.json"
+
+MARKDOWN_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
+FENCED_BLOCK_RE = re.compile(r"```.*?```|~~~.*?~~~", re.DOTALL)
+REFERENCE_DEF_RE = re.compile(r"^\s*\[([^\]]+)\]:\s*(\S+)", re.MULTILINE)
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*$")
+CHECKLIST_RE = re.compile(r"^[-*]\s*\[([ xX])\]\s*(.+)$")
+BACKTICK_RE = re.compile(r"`([^`]+)`")
+HTML_ANCHOR_RE = re.compile(r"""<a\s[^>]*?\b(?:name|id)\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+_SLUG_STRIP_RE = re.compile(r"[^\w\- ]")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def strip_fenced_blocks(content: str) -> str:
+    """Remove fenced code blocks so example links are not treated as real links."""
+    return FENCED_BLOCK_RE.sub("", content)
+
+
+def extract_markdown_links(content: str) -> list[tuple[str, str]]:
+    """Return (text, target) pairs for inline links outside fenced blocks."""
+    return [(m.group(1), m.group(2)) for m in MARKDOWN_LINK_RE.finditer(strip_fenced_blocks(content))]
+
+
+def extract_reference_defs(content: str) -> list[tuple[str, str]]:
+    """Return (ref_id, target) pairs for reference-style link definitions."""
+    return [(m.group(1), m.group(2)) for m in REFERENCE_DEF_RE.finditer(strip_fenced_blocks(content))]
+
+
+def heading_slug(text: str) -> str:
+    """Return the GitHub-style anchor slug for a heading's text.
+
+    Inline code, link and HTML markup are reduced to their text, then the
+    result is lowercased, punctuation is dropped and spaces become hyphens.
+    """
+    text = BACKTICK_RE.sub(r"\1", text)
+    text = MARKDOWN_LINK_RE.sub(r"\1", text)
+    text = _HTML_TAG_RE.sub("", text)
+    return _SLUG_STRIP_RE.sub("", text.strip().lower()).replace(" ", "-")
+
+
+def parse_fenced_blocks(lines: list[str]) -> list[tuple[str, int, int]]:
+    """Return (language, start_line, end_line) for each fenced block (1-based lines)."""
+    blocks: list[tuple[str, int, int]] = []
+    in_block = False
+    block_lang = ""
+    block_start = 0
+
+    for i, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if not in_block and (stripped.startswith("```") or stripped.startswith("~~~")):
+            in_block = True
+            block_lang = stripped[3:].strip().split()[0] if len(stripped) > 3 else ""
+            block_start = i
+        elif in_block and (stripped == "```" or stripped == "~~~"):
+            blocks.append((block_lang.lower(), block_start, i))
+            in_block = False
+            block_lang = ""
+
+    return blocks
+
+
+@dataclass
+class DocFile:
+    """A single Markdown file in the corpus.
+
+    Parsed fields are computed once (or restored from the persisted cache);
+    the raw content is only read when a pass actually needs line-level access.
+    """
+
+    path: Path
+    rel_path: str
+    mtime_ns: int
+    size: int
+    line_count: int = 0
+    headings: list[tuple[int, str, int]] = field(default_factory=list)
+    links: list[tuple[str, str]] = field(default_factory=list)
+    reference_defs: list[tuple[str, str]] = field(default_factory=list)
+    fenced_blocks: list[tuple[str, int, int]] = field(default_factory=list)
+    checklist_items: list[tuple[int, bool, str]] = field(default_factory=list)
+    backtick_refs: list[tuple[int, str]] = field(default_factory=list)
+    html_anchors: list[str] = field(default_factory=list)
+    readable: bool = True
+    _content: str | None = field(default=None, repr=False, compare=False)
+    _anchors: frozenset[str] | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def content(self) -> str:
+        """File content (read lazily, empty string if unreadable)."""
+        if self._content is None:
+            try:
+                self._content = self.path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                self._content = ""
+                self.readable = False
+        return self._content
+
+    @property
+    def lines(self) -> list[str]:
+        return self.content.splitlines()
+
+    @property
+    def anchors(self) -> frozenset[str]:
+        """Link fragments this doc defines (heading slugs plus explicit HTML anchors)."""
+        if self._anchors is None:
+            anchors: set[str] = {anchor.lower() for anchor in self.html_anchors}
+            seen: dict[str, int] = {}
+            for _, text, _ in self.headings:
+                slug = heading_slug(text)
+                count = seen.get(slug, 0)
+                seen[slug] = count + 1
+                # Repeated headings get -1, -2, ... suffixes like GitHub renders them
+                anchors.add(slug if count == 0 else f"{slug}-{count}")
+            self._anchors = frozenset(anchors)
+        return self._anchors
+
+    def parse(self) -> None:
+        """Populate parsed fields from the file content."""
+        content = self.content
+        lines = content.splitlines()
+        self.line_count = len(lines)
+        self.fenced_blocks = parse_fenced_blocks(lines)
+        self.links = extract_markdown_links(content)
+        self.reference_defs = extract_reference_defs(content)
+        self.html_anchors = HTML_ANCHOR_RE.findall(content)
+        self._anchors = None
+
+        fenced_lines: set[int] = set()
+        for _, start, end in self.fenced_blocks:
+            fenced_lines.update(range(start, end + 1))
+
+        self.headings = []
+        self.checklist_items = []
+        self.backtick_refs = []
+        for line_num, line in enumerate(lines, 1):
+            if line_num not in fenced_lines:
+                heading = HEADING_RE.match(line)
+                if heading:
+                    self.headings.append((len(heading.group(1)), heading.group(2), line_num))
+            checklist = CHECKLIST_RE.match(line.strip())
+            if checklist:
+                status, text = checklist.groups()
+                self.checklist_items.append((line_num, status.lower() == "x", text.strip()))
+            for match in BACKTICK_RE.finditer(line):
+                self.backtick_refs.append((line_num, match.group(1)))
+
+    def to_cache(self) -> dict[str, Any]:
+        return {
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "readable": self.readable,
+            "line_count": self.line_count,
+            "headings": self.headings,
+            "links": self.links,
+            "reference_defs": self.reference_defs,
+            "fenced_blocks": self.fenced_blocks,
+            "checklist_items": self.checklist_items,
+            "backtick_refs": self.backtick_refs,
+            "html_anchors": self.html_anchors,
+        }
+
+    @classmethod
+    def from_cache(cls, path: Path, rel_path: str, entry: dict[str, Any]) -> DocFile:
+        return cls(
+            path=path,
+            rel_path=rel_path,
+            mtime_ns=int(entry["mtime_ns"]),
+            size=int(entry["size"]),
+            readable=bool(entry.get("readable", True)),
+            line_count=int(entry.get("line_count", 0)),
+            headings=[(int(a), str(b), int(c)) for a, b, c in entry.get("headings", [])],
+            links=[(str(a), str(b)) for a, b in entry.get("links", [])],
+            reference_defs=[(str(a), str(b)) for a, b in entry.get("reference_defs", [])],
+            fenced_blocks=[(str(a), int(b), int(c)) for a, b, c in entry.get("fenced_blocks", [])],
+            checklist_items=[(int(a), bool(b), str(c)) for a, b, c in entry.get("checklist_items", [])],
+            backtick_refs=[(int(a), str(b)) for a, b in entry.get("backtick_refs", [])],
+            html_anchors=[str(a) for a in entry.get("html_anchors", [])],
+        )
+
+
+def _walk_markdown(root: Path) -> Iterator[Path]:
+    """Yield Markdown files under root in a stable (sorted) order."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.endswith(".md"):
+                yield Path(dirpath) / name
+
+
+def _load_cache(cache_path: Path | None) -> dict[str, Any]:
+    payload = load_json_cache(cache_path, CORPUS_CACHE_VERSION) or {}
+    files = payload.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+@dataclass
+class DocsCorpus:
+    """Index of Markdown files under a docs directory (plus the root README)."""
+
+    repo_root: Path
+    docs_dir: Path
+    files: dict[str, DocFile] = field(default_factory=dict)
+    parsed: int = 0
+    cached: int = 0
+    # Cache entries outside this corpus (other docs_dir roots), kept on save
+    other_entries: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def load(
+        cls,
+        repo_root: Path,
+        docs_dir: Path | None = None,
+        *,
+        cache_path: Path | None = None,
+    ) -> DocsCorpus:
+        """Walk docs_dir once and parse each Markdown file (or restore it from cache).
+
+        Args:
+            repo_root: Repository root; rel_path keys are relative to it.
+            docs_dir: Directory to index (default: repo_root/docs).
+            cache_path: Optional persisted cache file. When None, nothing is persisted.
+        """
+        docs_dir = docs_dir if docs_dir is not None else repo_root / "docs"
+        corpus = cls(repo_root=repo_root, docs_dir=docs_dir)
+        cache_entries = _load_cache(cache_path)
+
+        candidates: list[Path] = list(_walk_markdown(docs_dir)) if docs_dir.is_dir() else []
+        root_readme = repo_root / "README.md"
+        if root_readme.is_file() and root_readme.parent != docs_dir:
+            candidates.append(root_readme)
+
+        # Entries this walk could have produced; anything else belongs to another docs_dir
+        prefix = corpus._relative(docs_dir).rstrip("/") + "/"
+        readme_rel = corpus._relative(root_readme)
+        in_scope = 0
+        for rel_path, entry in cache_entries.items():
+            if rel_path.startswith(prefix) or rel_path == readme_rel:
+                in_scope += 1
+            else:
+                corpus.other_entries[rel_path] = entry
+
+        for md_file in candidates:
+            try:
+                stat = md_file.stat()
+            except OSError:
+                continue
+            rel_path = corpus._relative(md_file)
+            entry = cache_entries.get(rel_path)
+            if (
+                isinstance(entry, dict)
+                and entry.get("mtime_ns") == stat.st_mtime_ns
+                and entry.get("size") == stat.st_size
+            ):
+                try:
+                    corpus.files[rel_path] = DocFile.from_cache(md_file, rel_path, entry)
+                    corpus.cached += 1
+                    continue
+                except (KeyError, TypeError, ValueError):
+                    pass
+            doc = DocFile(path=md_file, rel_path=rel_path, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            doc.parse()
+            corpus.files[rel_path] = doc
+            corpus.parsed += 1
+
+        if cache_path is not None and (corpus.parsed or in_scope != len(corpus.files)):
+            corpus.save(cache_path)
+        return corpus
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.repo_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def save(self, cache_path: Path) -> None:
+        """Write every indexed file's parsed entry to cache_path, keeping other roots' entries."""
+        entries = dict(self.other_entries)
+        entries.update((rel, doc.to_cache()) for rel, doc in self.files.items())
+        save_json_cache(cache_path, CORPUS_CACHE_VERSION, {"files": entries})
+
+    def get(self, path: Path | str) -> DocFile | None:
+        """Look up a doc by repo-relative path or absolute Path."""
+        key = self._relative(path) if isinstance(path, Path) else path
+        return self.files.get(key)
+
+    def iter_docs(self, under: Path | str | None = None, *, recursive: bool = True) -> Iterator[DocFile]:
+        """Iterate docs in the corpus, optionally restricted to a directory.
+
+        Args:
+            under: Directory (repo-relative string or Path) to restrict to.
+                Defaults to the indexed docs directory (the root README is excluded).
+            recursive: When False, only direct children of `under` are returned.
+        """
+        base = under if under is not None else self.docs_dir
+        prefix = self._relative(base) if isinstance(base, Path) else base
+        prefix = "" if prefix in ("", ".") else prefix.rstrip("/") + "/"
+        for rel_path, doc in self.files.items():
+            if not rel_path.startswith(prefix):
+                continue
+            if not recursive and "/" in rel_path[len(prefix) :]:
+                continue
+            yield doc
+
+
+def load_docs_corpus(repo_root: Path, docs_dir: Path | None = None) -> DocsCorpus:
+    """Load the docs corpus for a repo using the persisted cache under .cihub/."""
+    return DocsCorpus.load(repo_root, docs_dir, cache_path=repo_root / CORPUS_CACHE_PATH)
+
+
+__all__ = [
+    "CORPUS_CACHE_PATH",
+    "CORPUS_CACHE_VERSION",
+    "DocFile",
+    "DocsCorpus",
+    "extract_markdown_links",
+    "extract_reference_defs",
+    "heading_slug",
+    "load_docs_corpus",
+    "parse_fenced_blocks",
+    "strip_fenced_blocks",
+]
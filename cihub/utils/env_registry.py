@@ -63,6 +63,20 @@ _ENV_VARS: list[EnvVarDef] = [
         category="Debug",
         description="Emit decision/context debug blocks to stderr.",
     ),
+    EnvVarDef(
+        name="CIHUB_TRACE",
+        var_type="bool",
+        default="false",
+        category="Debug",
+        description="Record phase timings as a Chrome trace under .cihub/ and summarize them in command output.",
+    ),
+    EnvVarDef(
+        name="CIHUB_TRACE_FILE",
+        var_type="string",
+        default="",
+        category="Debug",
+        description="Trace file for CIHUB_TRACE; {pid} is the process id (default: .cihub/trace-COMMAND-PID.json).",
+    ),
     EnvVarDef(
         name="CIHUB_EMIT_TRIAGE",
         var_type="bool",
@@ -236,6 +250,48 @@ _ENV_VARS: list[EnvVarDef] = [
             "(e.g., CIHUB_RUN_PYTEST, CIHUB_RUN_RUFF, CIHUB_RUN_BANDIT)."
         ),
     ),
+    EnvVarDef(
+        name="CIHUB_CHECK_JOBS",
+        var_type="int",
+        default="",
+        category="Tools",
+        description="Job limit for concurrent `cihub check` steps (default: one per CPU; --jobs wins).",
+    ),
+    EnvVarDef(
+        name="CIHUB_SECURITY_CACHE",
+        var_type="bool",
+        default="true",
+        category="Tools",
+        description="Share trivy/OWASP vulnerability data across runs on this host.",
+    ),
+    EnvVarDef(
+        name="CIHUB_SECURITY_CACHE_DIR",
+        var_type="string",
+        default="~/.cache/cihub/security",
+        category="Tools",
+        description="Directory of the shared vulnerability data cache.",
+    ),
+    EnvVarDef(
+        name="CIHUB_SECURITY_DB_MAX_AGE_HOURS",
+        var_type="int",
+        default="24",
+        category="Tools",
+        description="Age after which cached vulnerability data is refreshed before scanning.",
+    ),
+    EnvVarDef(
+        name="CIHUB_OFFLINE",
+        var_type="bool",
+        default="false",
+        category="Tools",
+        description="Never download vulnerability data; scanners fail fast without a usable cached copy.",
+    ),
+    EnvVarDef(
+        name="CIHUB_SECURITY_DB_OFFLINE_MAX_AGE_HOURS",
+        var_type="int",
+        default="168",
+        category="Tools",
+        description="Oldest cached vulnerability data accepted in offline mode.",
+    ),
 ]
 
 # Build lookup dict for fast access
@@ -0,0 +1,339 @@
+"""Fleet-write helpers: bounded fan-out, a shared API budget and a resume journal.
+
+Fleet commands (sync-templates, setup-secrets) touch hundreds of repos through
+the GitHub API. The work is network-bound, so repos are processed by a small
+thread pool; every API call first takes a slot from a shared RateBudget, which
+keeps the whole fleet under GitHub's content-creation rate limit no matter how
+many workers run.
+
+Remote file state is looked up in batches: one GraphQL query returns the blob
+SHA of every requested file across up to GRAPHQL_BATCH_SIZE repos. A blob SHA
+equal to the local git_blob_sha() of the desired content means the file is up
+to date, so only changed files cost per-repo calls.
+
+FleetJournal appends one line per finished repo (under .cihub/journal/ in the
+working directory). An interrupted run started again with the same inputs
+skips the repos that already succeeded. Secret inputs enter the journal key
+only through secret_digest(), an HMAC under a per-user key kept outside the
+working directory, so a journal never holds a guessable hash of a secret.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Sequence, TypeVar
+
+from cihub.utils.exec_utils import (
+    TIMEOUT_NETWORK,
+    CommandNotFoundError,
+    CommandTimeoutError,
+    resolve_executable,
+    safe_run,
+)
+from cihub.utils.paths import user_cache_dir
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+FLEET_DEFAULT_WORKERS = 4
+# GitHub allows 80 content-generating requests per minute; stay below it.
+FLEET_CALLS_PER_MINUTE = 60
+FLEET_JOURNAL_VERSION = 1
+FLEET_JOURNAL_DIR = Path(".cihub") / "journal"
+# Random HMAC key for secret_digest(), stored in the per-user cache directory.
+JOURNAL_KEY_FILE = "journal.key"
+GRAPHQL_BATCH_SIZE = 50
+# Below this many repos a batched lookup saves nothing over per-repo calls.
+BATCH_MIN_REPOS = 8
+
+RemoteKey = tuple[str, str, str]
+
+
+class RateBudget:
+    """Thread-safe token bucket for API calls, shared by all fleet workers.
+
+    Up to calls_per_minute calls may start at once; after that calls are paced
+    at calls_per_minute / 60 per second.
+    """
+
+    def __init__(self, calls_per_minute: int = FLEET_CALLS_PER_MINUTE) -> None:
+        self.capacity = float(max(calls_per_minute, 1))
+        self.rate = self.capacity / 60.0
+        self.calls = 0
+        self.waited = 0.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call slot is available, then take it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            self.calls += 1
+            # A negative balance is the queue of callers ahead of this one
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited += delay
+        if delay > 0:
+            time.sleep(delay)
+
+    def back_off(self, seconds: float) -> None:
+        """Drain the bucket so no worker starts a call for `seconds` (after a rate-limit response)."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._tokens + (now - self._updated) * self.rate, -seconds * self.rate)
+            self._updated = now
+
+
+def is_rate_limited(message: str) -> bool:
+    lowered = message.lower()
+    return "rate limit" in lowered or "abuse detection" in lowered
+
+
+def budgeted_call(budget: RateBudget | None, func: Callable[[], _R], *, retries: int = 2) -> _R:
+    """Run one API call inside the budget, backing off and retrying on rate limits.
+
+    Args:
+        budget: Shared budget (None calls func directly)
+        func: The API call; failures are raised as RuntimeError
+        retries: Extra attempts after a rate-limit failure
+
+    Returns:
+        func()'s result
+    """
+    if budget is None:
+        return func()
+    for attempt in range(retries + 1):
+        budget.acquire()
+        try:
+            return func()
+        except RuntimeError as exc:
+            if attempt == retries or not is_rate_limited(str(exc)):
+                raise
+            budget.back_off(60.0 * (attempt + 1))
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def fleet_map(func: Callable[[_T], _R], items: Sequence[_T], *, max_workers: int | None = None) -> list[_R]:
+    """Apply func to each item on a bounded thread pool, keeping input order.
+
+    Args:
+        func: Per-item work (usually one repo); should not raise
+        items: Work items
+        max_workers: Worker threads (defaults to FLEET_DEFAULT_WORKERS; 1 runs inline)
+
+    Returns:
+        func(item) for each item, in input order
+    """
+    workers = max_workers if max_workers is not None else FLEET_DEFAULT_WORKERS
+    if workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        return list(pool.map(func, items))
+
+
+def git_blob_sha(content: str) -> str:
+    """Git blob SHA of text content (what the contents and GraphQL APIs report)."""
+    data = content.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data, usedforsecurity=False).hexdigest()
+
+
+def _graphql_batch(batch: Sequence[tuple[str, str, Sequence[str]]]) -> dict[RemoteKey, str | None]:
+    fields = []
+    for i, (repo, branch, paths) in enumerate(batch):
+        owner, _, name = repo.partition("/")
+        objects = " ".join(
+            f"f{j}: object(expression: {json.dumps(f'{branch}:{path}')}) {{ ... on Blob {{ oid }} }}"
+            for j, path in enumerate(paths)
+        )
+        fields.append(f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ {objects} }}")
+    query = "query { " + " ".join(fields) + " }"
+
+    gh_bin = resolve_executable("gh")
+    try:
+        proc = safe_run(
+            [gh_bin, "api", "graphql", "--input", "-"], input=json.dumps({"query": query}), timeout=TIMEOUT_NETWORK
+        )
+    except (CommandNotFoundError, CommandTimeoutError) as exc:
+        raise RuntimeError(str(exc)) from exc
+    # Partial results (e.g. one renamed repo) still come back on stdout with a non-zero exit.
+    try:
+        payload = json.loads(proc.stdout) if proc.stdout.strip() else {}
+    except json.JSONDecodeError as exc:
+        raise RuntimeError(proc.stderr.strip() or "gh api graphql returned invalid JSON") from exc
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if not isinstance(data, dict):
+        message = proc.stderr.strip() or proc.stdout.strip()
+        raise RuntimeError(message or "gh api graphql failed")
+
+    found: dict[RemoteKey, str | None] = {}
+    for i, (repo, branch, paths) in enumerate(batch):
+        repository = data.get(f"r{i}")
+        if not isinstance(repository, dict):
+            continue  # unknown repo or no access: leave it to per-repo calls
+        for j, path in enumerate(paths):
+            blob = repository.get(f"f{j}")
+            found[(repo, branch, path)] = blob.get("oid") if isinstance(blob, dict) else None
+    return found
+
+
+def fetch_remote_blob_shas(
+    targets: Sequence[tuple[str, str, Sequence[str]]],
+    *,
+    budget: RateBudget | None = None,
+    batch_size: int = GRAPHQL_BATCH_SIZE,
+) -> dict[RemoteKey, str | None]:
+    """Look up remote blob SHAs for many repos with batched GraphQL queries.
+
+    Args:
+        targets: (repo, branch, paths) per repo
+        budget: Shared API budget (one call per batch)
+        batch_size: Repos per query
+
+    Returns:
+        Mapping of (repo, branch, path) to the blob SHA, or None when the file
+        does not exist. Keys are missing for repos the lookup could not answer;
+        callers fall back to per-repo calls for those.
+    """
+    found: dict[RemoteKey, str | None] = {}
+    for start in range(0, len(targets), batch_size):
+        batch = targets[start : start + batch_size]
+        try:
+            found.update(budgeted_call(budget, partial(_graphql_batch, batch)))
+        except RuntimeError:
+            continue
+    return found
+
+
+def journal_key(*parts: Any) -> str:
+    """Stable digest of a fleet operation's inputs (pass secrets through secret_digest first)."""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _journal_secret_key() -> bytes:
+    path = user_cache_dir() / JOURNAL_KEY_FILE
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return path.read_bytes()
+    key = secrets.token_bytes(32)
+    with os.fdopen(fd, "wb") as handle:
+        handle.write(key)
+    return key
+
+
+def secret_digest(value: str) -> str | None:
+    """HMAC-SHA256 of a secret under this user's journal key.
+
+    The digest is stable across runs of the same user, so it can key a resume
+    journal, but cannot be checked against guesses without the key file.
+
+    Returns:
+        Hex digest, or None when the key cannot be read or created (callers
+        then run without a journal)
+    """
+    try:
+        key = _journal_secret_key()
+    except OSError:
+        return None
+    if not key:
+        return None
+    return hmac.new(key, value.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+class FleetJournal:
+    """Append-only progress record of a fleet operation, for resuming after interruption.
+
+    The first line holds the operation key; each later line records one repo's
+    outcome. A journal whose key does not match the current inputs is discarded.
+    """
+
+    def __init__(self, path: Path | None, key: str, entries: dict[str, dict[str, Any]] | None = None) -> None:
+        self.path = path
+        self.key = key
+        self.entries: dict[str, dict[str, Any]] = entries or {}
+        self._lock = threading.Lock()
+        self._started = bool(entries)
+
+    @classmethod
+    def load(cls, path: Path | None, key: str) -> FleetJournal:
+        """Load the journal for this operation (a missing or mismatched journal yields an empty one)."""
+        if path is None:
+            return cls(None, key)
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            return cls(path, key)
+        entries: dict[str, dict[str, Any]] = {}
+        for index, line in enumerate(lines):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a line cut short by the interruption
+            if not isinstance(record, dict):
+                continue
+            if index == 0:
+                if record.get("version") != FLEET_JOURNAL_VERSION or record.get("key") != key:
+                    return cls(path, key)
+            elif isinstance(record.get("repo"), str):
+                entries[record["repo"]] = record
+        return cls(path, key, entries)
+
+    def completed(self, repo: str) -> dict[str, Any] | None:
+        """The recorded outcome of a repo that already succeeded, else None."""
+        entry = self.entries.get(repo)
+        return entry if entry is not None and entry.get("ok") else None
+
+    def record(self, repo: str, ok: bool, outcome: dict[str, Any]) -> None:
+        """Append a repo's outcome (best-effort; write failures are ignored)."""
+        entry = {"repo": repo, "ok": ok, **outcome}
+        with self._lock:
+            self.entries[repo] = entry
+            if self.path is None:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                mode = "a" if self._started else "w"
+                with self.path.open(mode, encoding="utf-8") as handle:
+                    if not self._started:
+                        handle.write(json.dumps({"version": FLEET_JOURNAL_VERSION, "key": self.key}) + "\n")
+                        self._started = True
+                    handle.write(json.dumps(entry) + "\n")
+            except OSError:
+                pass
+
+    def finish(self, clean: bool) -> None:
+        """Remove the journal after a run with no failures; keep it for resuming otherwise."""
+        if clean and self.path is not None:
+            try:
+                self.path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+__all__ = [
+    "BATCH_MIN_REPOS",
+    "FLEET_CALLS_PER_MINUTE",
+    "FLEET_DEFAULT_WORKERS",
+    "FLEET_JOURNAL_DIR",
+    "FleetJournal",
+    "RateBudget",
+    "budgeted_call",
+    "fetch_remote_blob_shas",
+    "fleet_map",
+    "git_blob_sha",
+    "is_rate_limited",
+    "journal_key",
+    "secret_digest",
+]
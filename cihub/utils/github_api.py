@@ -7,6 +7,7 @@ import json
 from typing import Any
 
 from cihub.utils.exec_utils import TIMEOUT_NETWORK, resolve_executable, safe_run
+from cihub.utils.tracing import span
 
 
 def gh_api_json(path: str, method: str = "GET", payload: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -32,7 +33,8 @@ def gh_api_json(path: str, method: str = "GET", payload: dict[str, Any] | None =
     if payload is not None:
         cmd += ["--input", "-"]
         input_data = json.dumps(payload)
-    result = safe_run(cmd, input=input_data, timeout=TIMEOUT_NETWORK)
+    with span("github.api", method=method, path=path):
+        result = safe_run(cmd, input=input_data, timeout=TIMEOUT_NETWORK)
     if result.returncode != 0:
         msg = result.stderr.strip() or result.stdout.strip()
         raise RuntimeError(msg or "gh api failed")
@@ -0,0 +1,58 @@
+"""Versioned JSON cache files.
+
+Each persistent cache under .cihub/cache is one JSON object carrying a format
+version, optional extra tags (such as the cihub or Python version) and the
+cache's own keys. A file whose version or tags differ from the running code is
+treated as missing, so bumping a cache's version constant discards old entries.
+
+Caches only save work, so both directions are best-effort: an unreadable file
+loads as None and a failed write is reported but never raised.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from cihub.utils.json_io import read_json, write_json
+
+
+def load_json_cache(path: Path | None, version: int, **tags: Any) -> dict[str, Any] | None:
+    """Read a cache file written by save_json_cache.
+
+    Args:
+        path: Cache file (None means no cache)
+        version: Expected format version
+        **tags: Further fields that must match exactly
+
+    Returns:
+        The stored object, or None when the file is missing, unreadable,
+        corrupt, or written for another version or tag value
+    """
+    if path is None:
+        return None
+    try:
+        payload = read_json(path)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != version:
+        return None
+    if any(payload.get(key) != value for key, value in tags.items()):
+        return None
+    return payload
+
+
+def save_json_cache(path: Path, version: int, payload: dict[str, Any], **tags: Any) -> bool:
+    """Atomically write payload, tagged with version and tags, as compact JSON.
+
+    Returns:
+        True when the file was written, False when the write failed
+    """
+    try:
+        write_json(path, {"version": version, **tags, **payload}, pretty=False, atomic=True)
+    except OSError:
+        return False
+    return True
+
+
+__all__ = ["load_json_cache", "save_json_cache"]
@@ -0,0 +1,184 @@
+"""JSON serialization layer for cihub artifacts.
+
+Reports, triage bundles, tool outputs and the registry are all written through
+this module. When the optional ``orjson`` package is installed it is used as
+the encoder; otherwise (or whenever its output could differ) the stdlib
+``json`` module is used. Both paths produce byte-identical text:
+
+- ``pretty=True`` matches ``json.dumps(obj, indent=2)`` (human-facing files)
+- ``pretty=False`` matches ``json.dumps(obj, separators=(",", ":"))``
+  (machine-only artifacts such as tool outputs and JSONL history)
+
+orjson differs from the stdlib in a few places (non-ASCII strings, floats in
+exponent range, non-string keys, integers beyond 64 bits, and types such as
+enums and UUIDs that orjson encodes but the stdlib rejects). Those cases are
+detected and re-encoded with the stdlib. The one documented exception is
+NaN/Infinity, which are not valid JSON: orjson writes ``null`` where the stdlib
+writes ``NaN``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any
+
+try:  # Optional fast backend
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None  # type: ignore[assignment]
+
+BACKEND_ENV = "CIHUB_JSON_BACKEND"
+COMPACT_SEPARATORS = (",", ":")
+
+# orjson prints floats outside [1e-4, 1e16) differently from repr(): either in
+# exponent form without the "+"/zero padding ("1e16", "1e-7") or fixed-point
+# ("0.00001"). Any output containing these shapes is re-encoded with stdlib.
+# The lookbehind form lets the regex engine skip ahead on the literal "e".
+_EXPONENT_RE = re.compile(rb"e(?<=[0-9]e)")
+_SMALL_FIXED_FLOAT = b"0.0000"
+
+# Only payloads made of exactly these types take the fast path. Anything else
+# (enums, UUIDs, dataclasses, datetimes, subclasses) goes to the stdlib, which
+# encodes it as before or raises the same TypeError.
+_NATIVE_TYPES = frozenset({str, int, float, bool, type(None), dict, list, tuple})
+# orjson's own nesting limit; deeper (or circular) payloads go to the stdlib
+_MAX_DEPTH = 254
+
+
+def _use_fast_backend() -> bool:
+    return _orjson is not None and os.environ.get(BACKEND_ENV, "").lower() != "stdlib"
+
+
+def backend_name() -> str:
+    """Return the name of the encoder used for new output ("orjson" or "json")."""
+    return "orjson" if _use_fast_backend() else "json"
+
+
+def _stdlib_dumps(obj: Any, pretty: bool) -> str:
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=COMPACT_SEPARATORS)
+
+
+def _is_native(obj: Any, depth: int = 0) -> bool:
+    """True when obj holds only JSON-native values (dict keys are checked by orjson itself)."""
+    kind = type(obj)
+    if kind not in _NATIVE_TYPES:
+        return False
+    if kind is dict:
+        return depth < _MAX_DEPTH and all(_is_native(value, depth + 1) for value in obj.values())
+    if kind is list or kind is tuple:
+        return depth < _MAX_DEPTH and all(_is_native(value, depth + 1) for value in obj)
+    return True
+
+
+def _fast_dumps(obj: Any, pretty: bool) -> str | None:
+    """Encode with orjson, or return None when stdlib output would differ."""
+    assert _orjson is not None  # noqa: S101 - guarded by _use_fast_backend
+    if not _is_native(obj):
+        return None
+    try:
+        data = _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if pretty else 0)
+    except (TypeError, OverflowError):
+        return None
+    if not data.isascii() or _SMALL_FIXED_FLOAT in data or _EXPONENT_RE.search(data):
+        return None
+    return data.decode("ascii")
+
+
+def dumps(obj: Any, *, pretty: bool = True) -> str:
+    """Serialize obj to JSON text.
+
+    Args:
+        obj: JSON-compatible value
+        pretty: Indent with 2 spaces (human-facing) instead of compact output
+
+    Returns:
+        JSON text identical to the stdlib encoder's output for the same mode
+    """
+    if _use_fast_backend():
+        text = _fast_dumps(obj, pretty)
+        if text is not None:
+            return text
+    return _stdlib_dumps(obj, pretty)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text, using the fast backend when available."""
+    if _use_fast_backend():
+        assert _orjson is not None  # noqa: S101 - guarded by _use_fast_backend
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass  # Re-parse with stdlib for its error message / NaN support
+    return json.loads(data)
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    return loads(path.read_bytes())
+
+
+def write_json(
+    path: Path,
+    obj: Any,
+    *,
+    pretty: bool = True,
+    trailing_newline: bool = False,
+    atomic: bool = False,
+) -> None:
+    """Write obj to path as JSON (UTF-8), creating parent directories.
+
+    Args:
+        path: Destination file
+        obj: JSON-compatible value
+        pretty: Indent with 2 spaces (human-facing) instead of compact output
+        trailing_newline: Append a final newline
+        atomic: Write a uniquely named temp file next to path and rename it
+            over path, so readers never observe a partially written file and
+            concurrent writers never share a temp file
+    """
+    text = dumps(obj, pretty=pretty)
+    if trailing_newline:
+        text += "\n"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not atomic:
+        path.write_text(text, encoding="utf-8")
+        return
+    mode = _file_mode(path)
+    handle = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    tmp_path = Path(handle.name)
+    try:
+        with handle:
+            handle.write(text)
+        os.chmod(tmp_path, mode)
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _file_mode(path: Path) -> int:
+    """Permissions for a replacement file: the existing file's, else 0o666 minus the umask."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+__all__ = [
+    "BACKEND_ENV",
+    "backend_name",
+    "dumps",
+    "loads",
+    "read_json",
+    "write_json",
+]
@@ -0,0 +1,96 @@
+"""Compiled JSON Schema validators shared across the process.
+
+Building a `Draft7Validator` and re-reading the schema file for every config
+or report dominates bulk validation. `get_validator` compiles each schema
+file once per process and reuses it until the file's mtime or size changes.
+
+Error messages are the stock jsonschema messages; `schema_errors` only
+formats errors that are actually produced, so a valid instance costs one
+validation pass and nothing else.
+
+Usage:
+    validator = get_validator(hub_root() / "schema" / "ci-hub-config.schema.json")
+    errors = schema_errors(validator, config)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, cast
+
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import ValidationError
+
+# (resolved path, mtime_ns, size) -> compiled validator
+_VALIDATORS: dict[tuple[str, int, int], Draft7Validator] = {}
+# Validators are requested from worker threads (parallel check steps)
+_VALIDATORS_LOCK = threading.Lock()
+
+
+def get_validator(schema_path: Path) -> Draft7Validator:
+    """Return the compiled validator for a schema file.
+
+    Raises:
+        FileNotFoundError: If the schema file doesn't exist.
+        json.JSONDecodeError: If the schema file contains invalid JSON.
+        ValueError: If the schema is not a JSON object.
+    """
+    path = schema_path.resolve()
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    validator = _VALIDATORS.get(key)
+    if validator is not None:
+        return validator
+    with _VALIDATORS_LOCK:
+        validator = _VALIDATORS.get(key)
+        if validator is None:
+            with path.open(encoding="utf-8") as f:
+                schema = json.load(f)
+            if not isinstance(schema, dict):
+                raise ValueError(f"Schema at {schema_path} is not a JSON object")
+            validator = Draft7Validator(schema)
+            for stale in [k for k in _VALIDATORS if k[0] == key[0]]:
+                del _VALIDATORS[stale]
+            _VALIDATORS[key] = validator
+    return validator
+
+
+def load_schema(schema_path: Path) -> dict[str, Any]:
+    """Return the parsed schema behind the cached validator (do not mutate)."""
+    return cast(dict[str, Any], get_validator(schema_path).schema)
+
+
+def error_path(error: ValidationError, *, absolute: bool = False, root: str = "<root>") -> str:
+    """Dotted path of a validation error, or `root` for top-level errors."""
+    parts = error.absolute_path if absolute else error.path
+    return ".".join(str(p) for p in parts) or root
+
+
+def schema_errors(
+    validator: Draft7Validator,
+    instance: Any,
+    *,
+    absolute: bool = False,
+    root: str = "<root>",
+) -> list[str]:
+    """Validate instance and return "path: message" strings (empty if valid)."""
+    return [
+        f"{error_path(err, absolute=absolute, root=root)}: {err.message}" for err in validator.iter_errors(instance)
+    ]
+
+
+def clear_validator_cache() -> None:
+    """Drop all compiled validators (tests and long-lived processes)."""
+    with _VALIDATORS_LOCK:
+        _VALIDATORS.clear()
+
+
+__all__ = [
+    "clear_validator_cache",
+    "error_path",
+    "get_validator",
+    "load_schema",
+    "schema_errors",
+]
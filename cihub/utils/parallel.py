@@ -0,0 +1,61 @@
+"""Process-pool helpers for fleet-sized batches.
+
+Per-item work over hundreds of repos or reports (YAML/JSON parsing, config
+merging, rendering) is CPU-bound Python, so it is spread over worker
+processes. Small batches run inline: pool startup would cost more than it
+saves.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Sequence, TypeVar
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+PARALLEL_MIN_ITEMS = 16
+MAX_DEFAULT_WORKERS = 8
+
+
+def default_workers() -> int:
+    """Default worker count: one per CPU, capped at MAX_DEFAULT_WORKERS."""
+    return min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS)
+
+
+def process_map(
+    func: Callable[[_T], _R],
+    items: Sequence[_T],
+    *,
+    max_workers: int | None = None,
+    min_items: int = PARALLEL_MIN_ITEMS,
+) -> list[_R]:
+    """Apply func to each item, in a process pool for large batches.
+
+    func must be a module-level function and items must be picklable. Results
+    keep the order of items, so output stays deterministic. Falls back to
+    serial execution when worker processes are unavailable.
+
+    Args:
+        func: Module-level function applied to each item
+        items: Work items
+        max_workers: Worker processes (defaults to default_workers(); 1 runs inline)
+        min_items: Smallest batch worth starting a pool for
+
+    Returns:
+        func(item) for each item, in input order
+    """
+    workers = max_workers if max_workers is not None else default_workers()
+    if workers > 1 and len(items) >= min_items:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(items) // (workers * 4))
+                return list(pool.map(func, items, chunksize=chunksize))
+        except (OSError, BrokenProcessPool):
+            pass
+    return [func(item) for item in items]
+
+
+__all__ = ["MAX_DEFAULT_WORKERS", "PARALLEL_MIN_ITEMS", "default_workers", "process_map"]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import stat
 from pathlib import Path
 
 
@@ -24,6 +26,32 @@ def project_root() -> Path:
     return Path(__file__).resolve().parent.parent.parent
 
 
+def user_cache_dir(*parts: str) -> Path:
+    """Return a private per-user cache directory, creating it if needed.
+
+    The base is $XDG_CACHE_HOME/cihub (default ~/.cache/cihub); parts name a
+    subdirectory below it. cihub/ and every level below it are created with
+    mode 0700.
+
+    Raises:
+        PermissionError: If one of those directories belongs to another user
+            or is writable by group or others (its contents cannot be trusted).
+        OSError: If a directory cannot be created.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    path = Path(base)
+    path.mkdir(parents=True, exist_ok=True)
+    for part in ("cihub", *parts):
+        path = path / part
+        path.mkdir(mode=0o700, exist_ok=True)
+        info = path.stat()
+        if hasattr(os, "getuid") and info.st_uid != os.getuid():
+            raise PermissionError(f"Cache directory is owned by another user: {path}")
+        if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise PermissionError(f"Cache directory is writable by other users: {path}")
+    return path
+
+
 def validate_repo_path(repo_path: Path) -> Path:
     """Validate and canonicalize a repository path.
 
@@ -0,0 +1,123 @@
+"""Near-duplicate string detection without all-pairs comparison.
+
+`difflib.SequenceMatcher.ratio()` is expensive, and comparing every string
+with every other string is O(n²) ratio calls. `SimilarityIndex` generates
+candidate pairs from a prefix-filtered inverted index over character tokens
+and only returns strings that can still reach the threshold; callers confirm
+candidates with the exact ratio.
+
+The filter is exact, not probabilistic: ratio() is bounded above by
+quick_ratio() (the character-multiset overlap), so every pair with
+ratio >= threshold is guaranteed to be returned as a candidate. Callers get
+the same results as a full scan, just without scoring hopeless pairs.
+
+Usage:
+    index = SimilarityIndex(texts, threshold=0.8)
+    for j in index.candidates(query):
+        if similarity_ratio(query, texts[j]) >= 0.8:
+            ...
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Sequence
+from difflib import SequenceMatcher
+
+# Guards threshold arithmetic against float rounding in ratio() = 2*M/T.
+_EPSILON = 1e-9
+
+Token = tuple[str, int]
+
+
+def similarity_ratio(s1: str, s2: str) -> float:
+    """Return the SequenceMatcher similarity ratio between two strings."""
+    return SequenceMatcher(None, s1, s2).ratio()
+
+
+def _tokens(text: str) -> list[Token]:
+    """Character tokens with occurrence numbers, so multiset overlap is set overlap."""
+    seen: Counter[str] = Counter()
+    tokens: list[Token] = []
+    for ch in text:
+        tokens.append((ch, seen[ch]))
+        seen[ch] += 1
+    return tokens
+
+
+def _min_overlap(length: int, threshold: float) -> int:
+    """Smallest token overlap any string could share with one of `length` chars.
+
+    ratio >= t needs M >= t * (la + lb) / 2 matched chars, and lb can be no
+    shorter than t * la / (2 - t); the bound is smallest at that partner length.
+    """
+    min_partner = max(1, math.ceil(threshold * length / (2 - threshold) - _EPSILON))
+    return max(1, math.ceil(threshold * (length + min_partner) / 2 - _EPSILON))
+
+
+class SimilarityIndex:
+    """Inverted index that yields candidate matches above a similarity threshold.
+
+    Args:
+        strings: Strings to index; candidates are reported as indices into it.
+        threshold: Minimum SequenceMatcher ratio the caller is looking for.
+    """
+
+    def __init__(self, strings: Sequence[str], threshold: float) -> None:
+        self.strings = list(strings)
+        self.threshold = threshold
+        self._counts = [Counter(s) for s in self.strings]
+        self._empty = [i for i, s in enumerate(self.strings) if not s]
+
+        token_lists = [_tokens(s) for s in self.strings]
+        frequency: Counter[Token] = Counter()
+        for tokens in token_lists:
+            frequency.update(tokens)
+        self._frequency = frequency
+
+        self._postings: dict[Token, list[int]] = {}
+        for i, tokens in enumerate(token_lists):
+            for token in self._prefix(tokens):
+                self._postings.setdefault(token, []).append(i)
+
+    def _prefix(self, tokens: list[Token]) -> list[Token]:
+        """Rarest tokens of a string; any qualifying partner shares at least one."""
+        if not tokens:
+            return []
+        ordered = sorted(tokens, key=lambda token: (self._frequency.get(token, 0), token))
+        return ordered[: len(tokens) - _min_overlap(len(tokens), self.threshold) + 1]
+
+    def candidates(self, query: str) -> list[int]:
+        """Return indices (ascending) of strings that may reach the threshold.
+
+        Every indexed string whose ratio with `query` is >= threshold is
+        included; the query itself is included if it was indexed.
+        """
+        if self.threshold <= 0:
+            return list(range(len(self.strings)))
+        if not query:
+            # ratio("", "") is 1.0, ratio("", "x") is 0.0.
+            return list(self._empty)
+
+        query_len = len(query)
+        min_len = self.threshold * query_len / (2 - self.threshold) - _EPSILON
+        max_len = query_len * (2 - self.threshold) / self.threshold + _EPSILON
+
+        seen: set[int] = set()
+        for token in self._prefix(_tokens(query)):
+            for idx in self._postings.get(token, ()):
+                if idx not in seen and min_len <= len(self.strings[idx]) <= max_len:
+                    seen.add(idx)
+
+        query_counts = Counter(query)
+        result: list[int] = []
+        for idx in sorted(seen):
+            overlap = sum((query_counts & self._counts[idx]).values())
+            total = query_len + len(self.strings[idx])
+            if 2.0 * overlap / total >= self.threshold - _EPSILON:
+                result.append(idx)
+        return result
+
+
+__all__ = ["SimilarityIndex", "similarity_ratio"]
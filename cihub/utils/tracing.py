@@ -0,0 +1,216 @@
+"""Span-based execution tracing.
+
+With CIHUB_TRACE set, the CLI records nested spans around each command's
+phases (config loading and merging, tool runs and their subprocesses, report
+parsing and building, gates, validation, post-run side effects, GitHub
+calls). When the command finishes they are written as a Chrome trace
+(chrome://tracing or https://ui.perfetto.dev) to .cihub/trace-<command>-<pid>.json,
+or to CIHUB_TRACE_FILE, and a per-phase timing summary is added to the command
+result under data["trace"]. The process id keeps nested cihub processes, which
+inherit CIHUB_TRACE, from overwriting each other's trace; CIHUB_TRACE_FILE may
+use a {pid} placeholder for the same reason.
+
+Instrument code with span() or @traced(). While tracing is off (the default)
+both cost one global lookup: span() hands back a shared no-op context manager
+and records nothing.
+
+Span names are dotted; the part before the first dot is the trace category
+(e.g. "tool.pytest" is in category "tool").
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any, TypeVar
+
+from cihub.utils.env import env_bool, env_str
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+TRACE_DIR = ".cihub"
+
+_NOOP = contextlib.nullcontext()
+_tracer: Tracer | None = None
+
+
+class Tracer:
+    """Collects finished spans from every thread of the process."""
+
+    def __init__(self) -> None:
+        self.origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._spans: list[tuple[str, int, int, int, dict[str, Any]]] = []
+        self._threads: dict[int, str] = {}
+
+    def record(self, name: str, start_ns: int, end_ns: int, args: dict[str, Any]) -> None:
+        thread = threading.current_thread()
+        with self._lock:
+            self._spans.append((name, start_ns, end_ns, thread.ident or 0, args))
+            self._threads.setdefault(thread.ident or 0, thread.name)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """The recorded spans in Chrome trace event format (complete "X" events, microseconds)."""
+        pid = os.getpid()
+        with self._lock:
+            spans = sorted(self._spans, key=lambda span: span[1])
+            threads = dict(self._threads)
+        events: list[dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        for name, start_ns, end_ns, tid, args in spans:
+            event: dict[str, Any] = {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (start_ns - self.origin_ns) / 1000,
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def phases(self) -> dict[str, dict[str, Any]]:
+        """Calls and total milliseconds per span name, in order of first occurrence."""
+        with self._lock:
+            spans = sorted(self._spans, key=lambda span: span[1])
+        phases: dict[str, dict[str, Any]] = {}
+        for name, start_ns, end_ns, _tid, _args in spans:
+            phase = phases.setdefault(name, {"calls": 0, "total_ms": 0.0})
+            phase["calls"] += 1
+            phase["total_ms"] += (end_ns - start_ns) / 1e6
+        for phase in phases.values():
+            phase["total_ms"] = round(phase["total_ms"], 3)
+        return phases
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_args", "_start_ns")
+
+    def __init__(self, tracer: Tracer, name: str, args: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._args = args
+        self._start_ns = 0
+
+    def __enter__(self) -> _Span:
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer.record(self._name, self._start_ns, end_ns, self._args)
+
+
+def span(name: str, **args: Any) -> contextlib.AbstractContextManager[Any]:
+    """Time the enclosed block as a span; a no-op unless tracing is active.
+
+    Args:
+        name: Dotted span name (category first, e.g. "tool.pytest")
+        **args: JSON-serializable details shown with the span in the trace viewer
+
+    Returns:
+        A context manager
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP
+    return _Span(tracer, name, args)
+
+
+def traced(name: str) -> Callable[[_F], _F]:
+    """Decorator form of span() for timing a whole function."""
+
+    def decorate(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with _Span(tracer, name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def tracing_enabled(env: Mapping[str, str] | None = None) -> bool:
+    """Return True if CIHUB_TRACE is enabled."""
+    return env_bool("CIHUB_TRACE", default=False, env=env)
+
+
+def trace_path(command: str, env: Mapping[str, str] | None = None) -> Path:
+    """Where the trace for a command is written: CIHUB_TRACE_FILE or .cihub/trace-<command>-<pid>.json."""
+    pid = str(os.getpid())
+    override = env_str("CIHUB_TRACE_FILE", env=env)
+    if override:
+        return Path(override.replace("{pid}", pid)).expanduser()
+    slug = "-".join(command.split()) or "command"
+    return Path(TRACE_DIR) / f"trace-{slug}-{pid}.json"
+
+
+def start_tracing() -> Tracer:
+    """Start recording spans process-wide, replacing any active tracer."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Tracer | None:
+    """Stop recording spans and return the tracer that was active, if any."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def finish_tracing(path: Path) -> dict[str, Any] | None:
+    """Stop tracing, write the Chrome trace and summarize it.
+
+    Args:
+        path: Trace file to write (parent directories are created)
+
+    Returns:
+        None if tracing was not active. Otherwise "file" (None if the trace
+        could not be written), "total_ms" and the per-span-name "phases"
+    """
+    tracer = stop_tracing()
+    if tracer is None:
+        return None
+    written: str | None = str(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Span args come from callers; anything not JSON-native is written as its str()
+        path.write_text(json.dumps(tracer.chrome_trace(), default=str), encoding="utf-8")
+    except (OSError, TypeError, ValueError):
+        written = None
+    return {
+        "file": written,
+        "total_ms": round((time.perf_counter_ns() - tracer.origin_ns) / 1e6, 3),
+        "phases": tracer.phases(),
+    }
+
+
+__all__ = [
+    "TRACE_DIR",
+    "Tracer",
+    "finish_tracing",
+    "span",
+    "start_tracing",
+    "stop_tracing",
+    "trace_path",
+    "traced",
+    "tracing_enabled",
+]
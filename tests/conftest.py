@@ -104,6 +104,26 @@ def _strip_mutmut_env_from_subprocess(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(subprocess, "run", _run)
 
 
+@pytest.fixture(autouse=True)
+def _isolate_persistent_caches(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point cihub's persistent caches at a fresh directory per test.
+
+    Cache locations are relative to the repo being inspected; an absolute
+    path replaces them, so commands run against this checkout never write
+    into (or replay from) its .cihub/cache. The directory sits outside
+    tmp_path so cache files never count as inputs of a project built there.
+    """
+    cache_dir = tmp_path_factory.mktemp("cihub-cache")
+    monkeypatch.setattr("cihub.utils.docs_corpus.CORPUS_CACHE_PATH", cache_dir / "docs-corpus.json")
+    monkeypatch.setattr("cihub.commands.check_cache.CHECK_CACHE_PATH", cache_dir / "check-steps.json")
+    monkeypatch.setattr("cihub.commands.verify.MIRROR_CACHE_DIR", cache_dir / "mirrors")
+    monkeypatch.setattr("cihub.services.ci_engine.dependency_cache.DEPS_CACHE_PATH", cache_dir / "deps.json")
+    for module in ("cihub.commands.secrets", "cihub.commands.templates"):
+        monkeypatch.setattr(f"{module}.FLEET_JOURNAL_DIR", cache_dir / "journal")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir / "user"))
+    return cache_dir
+
+
 @pytest.fixture
 def tmp_repo(tmp_path: Path) -> Path:
     """Create a minimal temporary repository structure.
@@ -247,6 +247,78 @@ class TestReportBuildPerformance:
         assert result == 0
 
 
+def _aggregated_report(repos: int = 2000) -> dict:
+    """Build a hub-report.json sized like a large fleet aggregation."""
+    runs = []
+    for i in range(repos):
+        runs.append(
+            {
+                "config": f"repo-{i}",
+                "repo": f"acme/repo-{i}",
+                "subdir": "",
+                "language": "java" if i % 2 else "python",
+                "branch": "main",
+                "run_id": str(9_000_000 + i),
+                "correlation_id": f"hub-1-{i}",
+                "status": "completed",
+                "conclusion": "success" if i % 7 else "failure",
+                "coverage": 50 + i % 50,
+                "mutation_score": 40 + i % 60,
+                "tests_passed": 100 + i,
+                "tests_failed": i % 3,
+                "tests_skipped": 0,
+                "tests_runtime_seconds": 12.5 + i / 100,
+                "tool_metrics": {f"tool_{t}_issues": t * i % 17 for t in range(20)},
+                "tools_ran": {f"tool_{t}": bool((i + t) % 4) for t in range(20)},
+                "tools_success": {f"tool_{t}": bool((i + t) % 5) for t in range(20)},
+            }
+        )
+    return {
+        "hub_run_id": "1",
+        "timestamp": "2026-01-01T00:00:00Z",
+        "triggered_by": "schedule",
+        "total_repos": repos,
+        "dispatched_repos": repos,
+        "missing_dispatch_metadata": 0,
+        "runs": runs,
+    }
+
+
+class TestJsonSerializationPerformance:
+    """Benchmark the JSON layer on the largest aggregated report.
+
+    Set CIHUB_BENCH_AGGREGATED_REPORT to a real hub-report.json to benchmark it
+    instead of the synthetic fleet report.
+    """
+
+    @pytest.fixture(scope="class")
+    def aggregated_report(self) -> dict:
+        import os
+
+        from cihub.utils.json_io import read_json
+
+        path = os.environ.get("CIHUB_BENCH_AGGREGATED_REPORT")
+        return read_json(Path(path)) if path else _aggregated_report()
+
+    @pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+    @pytest.mark.parametrize("pretty", [True, False], ids=["pretty", "compact"])
+    def test_dumps_speed(self, benchmark, monkeypatch, aggregated_report: dict, backend: str, pretty: bool) -> None:
+        """Fast backend output must match stdlib byte for byte."""
+        import json
+
+        from cihub.utils import json_io
+
+        if backend == "orjson":
+            pytest.importorskip("orjson")
+        monkeypatch.setenv(json_io.BACKEND_ENV, backend)
+
+        text = benchmark(json_io.dumps, aggregated_report, pretty=pretty)
+        expected = (
+            json.dumps(aggregated_report, indent=2) if pretty else json.dumps(aggregated_report, separators=(",", ":"))
+        )
+        assert text == expected
+
+
 # Performance thresholds (optional - uncomment to enforce)
 # @pytest.mark.benchmark(min_time=0.1, max_time=0.5, min_rounds=5)
 # def test_detect_under_threshold(benchmark, python_repo: Path) -> None:
@@ -0,0 +1,144 @@
+"""Tests for the `cihub check` step result cache.
+
+Tests cover:
+- Fingerprints change with matching file content and tool versions only
+- Fingerprints of steps that run pytest cover every installed distribution
+- Passing steps with unchanged inputs are reported as cached on the next run
+- Editing an input file reruns only the steps that declare it
+- Failing steps and --no-cache runs are never served from the cache
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from cihub.commands import check as check_module
+from cihub.commands import check_cache
+from cihub.commands.check_cache import CheckStepCache
+from cihub.types import CommandResult
+
+REAL_LOAD = CheckStepCache.load
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "config.yaml").write_text("a: 1\n", encoding="utf-8")
+    (tmp_path / "README.md").write_text("# demo\n", encoding="utf-8")
+    return tmp_path
+
+
+class TestFingerprint:
+    def test_changes_with_matching_content_only(self, project: Path) -> None:
+        def fingerprint() -> str:
+            cache = CheckStepCache(project)
+            return cache.fingerprint("ruff-lint", ("*.py",), (), ("ruff", "check"))
+
+        before = fingerprint()
+        (project / "README.md").write_text("# changed\n", encoding="utf-8")
+        assert fingerprint() == before
+
+        (project / "pkg" / "mod.py").write_text("x = 2\n", encoding="utf-8")
+        assert fingerprint() != before
+
+    def test_changes_with_tool_version(self, project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        before = CheckStepCache(project).fingerprint("black", ("*.py",), ("black",), ())
+        monkeypatch.setattr(check_cache, "tool_version", lambda tool: f"{tool}==99.0")
+        assert CheckStepCache(project).fingerprint("black", ("*.py",), ("black",), ()) != before
+
+    @pytest.mark.parametrize("step", ["test", "validate-templates", "mutmut"])
+    def test_environment_covers_installed_distributions(
+        self, project: Path, monkeypatch: pytest.MonkeyPatch, step: str
+    ) -> None:
+        spec = check_module.STEP_CACHE_SPECS[step]
+        monkeypatch.setattr(check_cache, "python_environment_digest", lambda: "env-1")
+        before = CheckStepCache(project).fingerprint(step, *spec, ())
+        monkeypatch.setattr(check_cache, "python_environment_digest", lambda: "env-2")
+        assert CheckStepCache(project).fingerprint(step, *spec, ()) != before
+
+    def test_cache_round_trip(self, project: Path) -> None:
+        cache = CheckStepCache.load(project)
+        fingerprint = cache.fingerprint("isort", ("*.py",), (), ())
+        cache.record("isort", fingerprint)
+        cache.save()
+
+        reloaded = CheckStepCache.load(project)
+        assert reloaded.is_fresh("isort", reloaded.fingerprint("isort", ("*.py",), (), ()))
+
+
+def _run(monkeypatch: pytest.MonkeyPatch, project: Path, calls: list[str], **flags: Any) -> CommandResult:
+    def run_process(name: str, cmd: list[str], cwd: Path, **_kwargs: Any) -> CommandResult:
+        calls.append(name)
+        if name == "typecheck" and flags.get("fail_typecheck"):
+            return CommandResult(exit_code=1, summary="failed")
+        return CommandResult(exit_code=0, summary="ok")
+
+    def run_optional(name: str, *_args: Any, **_kwargs: Any) -> CommandResult:
+        calls.append(name)
+        return CommandResult(exit_code=0, summary="ok")
+
+    def stub(*_args: Any, **_kwargs: Any) -> CommandResult:
+        return CommandResult(exit_code=0, summary="ok")
+
+    for attr in ("cmd_preflight", "cmd_docs", "cmd_smoke"):
+        monkeypatch.setattr(check_module, attr, stub)
+    monkeypatch.setattr(check_module, "_run_process", run_process)
+    monkeypatch.setattr(check_module, "_run_optional", run_optional)
+    # The real project root is replaced by the temp project (cache under its .cihub/)
+    monkeypatch.setattr(check_module.CheckStepCache, "load", classmethod(lambda _cls, _root: REAL_LOAD(project)))
+    args = SimpleNamespace(
+        json=True,
+        audit=False,
+        security=False,
+        full=False,
+        mutation=False,
+        all=False,
+        jobs=1,
+        no_cache=flags.get("no_cache", False),
+    )
+    return check_module.cmd_check(args)
+
+
+class TestCheckStepCaching:
+    def test_unchanged_passing_steps_are_cached(self, monkeypatch: pytest.MonkeyPatch, project: Path) -> None:
+        first_calls: list[str] = []
+        _run(monkeypatch, project, first_calls)
+
+        calls: list[str] = []
+        result = _run(monkeypatch, project, calls)
+
+        steps = {step["name"]: step for step in result.data["steps"]}
+        assert result.exit_code == 0
+        assert calls == []
+        assert {name for name, step in steps.items() if step["cached"]} == set(first_calls) | {"docs-check"}
+        assert steps["ruff-lint"]["summary"] == "cached"
+        # Environment-dependent steps always run
+        assert not steps["preflight"]["cached"] and not steps["smoke"]["cached"]
+
+    def test_edit_reruns_only_affected_steps(self, monkeypatch: pytest.MonkeyPatch, project: Path) -> None:
+        _run(monkeypatch, project, [])
+        (project / "pkg" / "mod.py").write_text("x = 3\n", encoding="utf-8")
+
+        calls: list[str] = []
+        _run(monkeypatch, project, calls)
+
+        assert "yamllint" not in calls
+        assert {"ruff-lint", "typecheck", "test"} <= set(calls)
+
+    def test_failures_and_no_cache_always_run(self, monkeypatch: pytest.MonkeyPatch, project: Path) -> None:
+        _run(monkeypatch, project, [], fail_typecheck=True)
+
+        calls: list[str] = []
+        _run(monkeypatch, project, calls)
+        assert calls == ["typecheck"]
+
+        calls = []
+        _run(monkeypatch, project, calls, no_cache=True)
+        assert "ruff-lint" in calls and "typecheck" in calls
@@ -1,5 +1,7 @@
 """Unit tests for the check command."""
 
+import threading
+import time
 from types import SimpleNamespace
 
 from cihub.commands import check as check_module
@@ -66,6 +68,7 @@ def _run_check(monkeypatch, **flags) -> CommandResult:
         full=False,
         mutation=False,
         all=False,
+        no_cache=True,
     )
     for key, value in flags.items():
         setattr(args, key, value)
@@ -259,3 +262,82 @@ def test_check_streaming_emits_lines(monkeypatch) -> None:
     line_events = [payload for event, payload in events if event == "line"]
     assert line_events, "Expected streaming line events when sink is set"
     assert any("preflight" in str(payload.get("text", "")) for payload in line_events)
+
+
+def _run_check_with_process(monkeypatch, run_process, **flags) -> CommandResult:
+    """Run cmd_check with in-process commands stubbed and _run_process replaced."""
+    monkeypatch.setattr(check_module, "cmd_preflight", _stub_success)
+    monkeypatch.setattr(check_module, "cmd_docs", _stub_success)
+    monkeypatch.setattr(check_module, "cmd_smoke", _stub_success)
+    monkeypatch.setattr(check_module, "_run_optional", _stub_success)
+    monkeypatch.setattr(check_module, "_run_process", run_process)
+    args = SimpleNamespace(
+        json=False,
+        smoke_repo=None,
+        smoke_subdir=None,
+        install_deps=False,
+        relax=False,
+        keep=False,
+        audit=False,
+        security=False,
+        full=False,
+        mutation=False,
+        all=False,
+        no_cache=True,
+    )
+    for key, value in flags.items():
+        setattr(args, key, value)
+    return check_module.cmd_check(args)
+
+
+def test_check_parallel_output_matches_serial(monkeypatch) -> None:
+    """Steps finishing out of order still report in plan order."""
+
+    def slow_first(name: str, cmd: list[str], cwd, **_kwargs) -> CommandResult:
+        # Earlier steps sleep longer, so a pool completes them last
+        time.sleep({"ruff-lint": 0.05, "ruff-format": 0.03, "black": 0.01}.get(name, 0))
+        if name == "black":
+            return CommandResult(exit_code=1, summary="failed", problems=[{"message": "black failed"}])
+        return CommandResult(exit_code=0, summary="ok")
+
+    serial = _run_check_with_process(monkeypatch, slow_first, jobs=1)
+    parallel = _run_check_with_process(monkeypatch, slow_first, jobs=4)
+
+    assert parallel.data["steps"] == serial.data["steps"]
+    assert parallel.data["raw_output"] == serial.data["raw_output"]
+    assert parallel.problems == serial.problems
+    assert [step["name"] for step in parallel.data["steps"]] == FAST_STEPS
+    assert (serial.data["jobs"], parallel.data["jobs"]) == (1, 4)
+
+
+def test_check_runs_steps_concurrently_within_job_limit(monkeypatch) -> None:
+    lock = threading.Lock()
+    running: list[str] = []
+    peak: list[int] = [0]
+    overlapped_mutmut: list[list[str]] = []
+
+    def tracking(name: str, cmd: list[str], cwd, **_kwargs) -> CommandResult:
+        with lock:
+            if name == "mutmut" and running:
+                overlapped_mutmut.append(list(running))
+            running.append(name)
+            peak[0] = max(peak[0], len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(name)
+        return CommandResult(exit_code=0, summary="ok")
+
+    result = _run_check_with_process(monkeypatch, tracking, jobs=3, mutation=True)
+
+    assert result.exit_code == 0
+    assert 1 < peak[0] <= 3
+    assert overlapped_mutmut == []
+    assert [step["name"] for step in result.data["steps"]] == FAST_STEPS + MUTATION_STEPS
+
+
+def test_check_jobs_from_env(monkeypatch) -> None:
+    monkeypatch.setenv("CIHUB_CHECK_JOBS", "2")
+
+    result = _run_check(monkeypatch)
+
+    assert result.data["jobs"] == 2
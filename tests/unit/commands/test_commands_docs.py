@@ -90,7 +90,7 @@ def test_internal_links_broken(tmp_path: Path) -> None:
 def test_internal_links_skips_external(tmp_path: Path) -> None:
     """Test that external links are skipped."""
     (tmp_path / "README.md").write_text(
-        "See [GitHub](https://github.com) and [anchor](#section).",
+        "See [GitHub](https://github.com) and [anchor](#section).\n\n## Section\n",
         encoding="utf-8",
     )
 
@@ -133,6 +133,35 @@ def test_internal_links_reference_definitions_broken(tmp_path: Path) -> None:
     assert "missing.md" in problems[0]["target"]
 
 
+def test_internal_links_anchors_match_heading_slugs(tmp_path: Path) -> None:
+    """Fragments must match a heading slug (GitHub style) or an explicit HTML anchor."""
+    (tmp_path / "README.md").write_text(
+        "[ok](guide.md#setup--install) [dup](guide.md#usage-1) [html](guide.md#custom) [self](#top)\n\n# Top\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "guide.md").write_text(
+        '# Setup & Install\n\n## Usage\n\n## Usage\n\n<a name="custom"></a>\n',
+        encoding="utf-8",
+    )
+
+    assert _check_internal_links(tmp_path) == []
+
+
+def test_internal_links_broken_anchor(tmp_path: Path) -> None:
+    """Fragments that match no heading in the target doc are reported."""
+    (tmp_path / "README.md").write_text(
+        "[a](guide.md#missing) [b](#nowhere) [c](../outside.txt#line-1)\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "guide.md").write_text("# Guide\n\n```md\n# Missing\n```\n", encoding="utf-8")
+    (tmp_path.parent / "outside.txt").write_text("x", encoding="utf-8")
+
+    problems = _check_internal_links(tmp_path)
+
+    assert [p["target"] for p in problems] == ["guide.md#missing", "#nowhere"]
+    assert all(p["code"] == "CIHUB-DOCS-BROKEN-ANCHOR" for p in problems)
+
+
 def test_internal_links_skip_development_archive(tmp_path: Path) -> None:
     """Archived docs are excluded from link checking to avoid churn."""
     archive_dir = tmp_path / "development" / "archive"
@@ -5,6 +5,9 @@
 import argparse
 from pathlib import Path
 
+import pytest
+
+from cihub.commands import smoke as smoke_module
 from cihub.commands.scaffold import scaffold_fixture
 from cihub.commands.smoke import (
     ALL_TYPES,
@@ -242,3 +245,98 @@ class TestCmdSmoke:
         result = cmd_smoke(args)
         assert isinstance(result, CommandResult)
         # Should fail for invalid type
+
+
+def _smoke_args(**overrides: object) -> argparse.Namespace:
+    args = argparse.Namespace(
+        repo=None,
+        subdir=None,
+        full=False,
+        install_deps=False,
+        relax=False,
+        force=False,
+        keep=False,
+        type=None,
+        all=False,
+        json=True,
+        jobs=1,
+    )
+    for key, value in overrides.items():
+        setattr(args, key, value)
+    return args
+
+
+class TestFixtureTemplates:
+    """Tests for cached pristine fixture templates and per-case workspaces."""
+
+    def test_template_scaffolded_once_per_source_hash(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[str] = []
+        original = smoke_module.scaffold_fixture
+
+        def counting(fixture_type: str, dest: Path, force: bool = False) -> list[str]:
+            calls.append(fixture_type)
+            return original(fixture_type, dest, force=force)
+
+        monkeypatch.setattr(smoke_module, "scaffold_fixture", counting)
+        cache_dir = tmp_path / "cache"
+        for name in ("java", "python"):
+            smoke_module._prepare_workspace("monorepo", tmp_path / name, cache_dir)
+        assert calls == ["monorepo"]
+
+        # A workspace is a private copy: edits never reach the template
+        (tmp_path / "java" / "README.md").write_text("edited\n", encoding="utf-8")
+        template = smoke_module._fixture_template("monorepo", cache_dir)
+        assert (template / "README.md").read_text(encoding="utf-8") != "edited\n"
+
+        # New scaffold sources produce a new template and drop the old one
+        monkeypatch.setattr(smoke_module, "_fixture_source_hash", lambda _type: "0" * 16)
+        smoke_module._prepare_workspace("monorepo", tmp_path / "again", cache_dir)
+        assert calls == ["monorepo", "monorepo"]
+        assert [path.name for path in cache_dir.iterdir()] == ["monorepo-" + "0" * 16]
+
+    def test_unusable_cache_falls_back_to_scaffolding(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("", encoding="utf-8")
+        smoke_module._prepare_workspace("python-pyproject", tmp_path / "case", blocker / "cache")
+        assert (tmp_path / "case" / "pyproject.toml").exists()
+
+    def test_cache_dir_is_private_per_user(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        cache_dir = smoke_module._fixture_cache_dir()
+        assert cache_dir == tmp_path / "cihub" / smoke_module.FIXTURE_CACHE_SUBDIR
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+        # A directory others can write to may hold planted templates: scaffold afresh instead
+        cache_dir.chmod(0o777)
+        assert smoke_module._fixture_cache_dir() is None
+
+
+class TestParallelCases:
+    """Tests for running smoke cases concurrently in separate processes."""
+
+    def test_case_command_carries_options(self, tmp_path: Path) -> None:
+        case = SmokeCase(name="monorepo-java", repo_path=tmp_path, subdir="java", generated=True)
+        cmd = smoke_module._smoke_case_command(case, full=True, install_deps=False, relax=False, force=True)
+        assert cmd[-8:] == ["smoke", str(tmp_path), "--json", "--subdir", "java", "--full", "--relax", "--force"]
+
+    def test_parallel_matches_serial(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        types = ["python-pyproject", "monorepo"]
+
+        def outcome(result: CommandResult) -> list[object]:
+            return [
+                (case["name"], case["language"], case["success"], [(s["name"], s["exit_code"]) for s in case["steps"]])
+                for case in result.data["cases"]
+            ]
+
+        serial = cmd_smoke(_smoke_args(type=types, jobs=1))
+        parallel = cmd_smoke(_smoke_args(type=types, jobs=3))
+
+        assert parallel.data["jobs"] == 3
+        assert parallel.exit_code == serial.exit_code == 0
+        assert outcome(parallel) == outcome(serial)
+        assert [case["name"] for case in parallel.data["cases"]] == [
+            "python-pyproject",
+            "monorepo-java",
+            "monorepo-python",
+        ]
@@ -25,6 +25,7 @@ if str(ROOT) not in sys.path:
 from cihub.exit_codes import EXIT_FAILURE, EXIT_SUCCESS, EXIT_USAGE  # noqa: E402
 from cihub.types import CommandResult  # noqa: E402
 from cihub.commands.templates import cmd_sync_templates  # noqa: E402
+from cihub.commands import templates as templates_module  # noqa: E402
 
 # =============================================================================
 # Helper Fixtures
@@ -684,3 +685,82 @@ class TestSyncTemplatesIncludeDisabled:
 
             cmd_sync_templates(base_args)
             mock_get_entries.assert_called_once_with(only_dispatch_enabled=True)
+
+
+# =============================================================================
+# Fleet Tests (batched lookup, concurrency, resume)
+# =============================================================================
+
+
+class TestSyncTemplatesFleet:
+    """Tests for batched remote lookups and the resumable journal."""
+
+    DESIRED = "name: CI v2\n"
+
+    def _entries(self, count: int) -> list[dict[str, str]]:
+        return [make_repo_entry(full=f"owner/repo-{i:02d}") for i in range(count)]
+
+    def test_batched_lookup_skips_per_repo_fetches(self, base_args: argparse.Namespace) -> None:
+        """Up-to-date repos found by the batched query cost no per-repo calls."""
+        from cihub.utils.fleet import git_blob_sha
+
+        entries = self._entries(10)
+        shas = {("owner/repo-00", "main", ".github/workflows/hub-ci.yml"): "old"}
+        for entry in entries[1:]:
+            shas[(entry["full"], "main", ".github/workflows/hub-ci.yml")] = git_blob_sha(self.DESIRED)
+        for entry in entries:
+            for name in ("hub-java-ci.yml", "hub-python-ci.yml"):
+                shas[(entry["full"], "main", f".github/workflows/{name}")] = None
+        base_args.jobs = 4
+
+        with (
+            mock.patch("cihub.commands.templates.get_repo_entries", return_value=entries),
+            mock.patch("cihub.commands.templates.render_dispatch_workflow", return_value=self.DESIRED),
+            mock.patch("cihub.commands.templates.fetch_remote_blob_shas", return_value=shas),
+            mock.patch("cihub.commands.templates.fetch_remote_file") as mock_fetch,
+            mock.patch("cihub.commands.templates.update_remote_file") as mock_update,
+        ):
+            result = cmd_sync_templates(base_args)
+
+        assert result.exit_code == EXIT_SUCCESS
+        mock_fetch.assert_not_called()
+        mock_update.assert_called_once()
+        assert mock_update.call_args.args[0] == "owner/repo-00"
+        assert mock_update.call_args.args[5] == "old"
+        statuses = [repo["status"] for repo in result.data["repos"]]
+        assert statuses == ["updated"] + ["up_to_date"] * 9
+        assert [repo["repo"] for repo in result.data["repos"]] == [entry["full"] for entry in entries]
+
+    def test_interrupted_sync_resumes(self, base_args: argparse.Namespace, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A rerun after a failure only revisits repos that did not succeed."""
+        entries = self._entries(3)
+        attempts: list[str] = []
+        failing = {"owner/repo-01"}
+
+        def update(repo: str, *_args: object) -> None:
+            attempts.append(repo)
+            if repo in failing:
+                raise RuntimeError("connection reset")
+
+        monkeypatch.setenv("GH_TOKEN", "ghp_test")
+        base_args.jobs = 1
+        with (
+            mock.patch("cihub.commands.templates.get_repo_entries", return_value=entries),
+            mock.patch("cihub.commands.templates.render_dispatch_workflow", return_value=self.DESIRED),
+            mock.patch("cihub.commands.templates.fetch_remote_file", return_value=None),
+            mock.patch("cihub.commands.templates.update_remote_file", side_effect=update),
+        ):
+            first = cmd_sync_templates(base_args)
+            journal = templates_module.FLEET_JOURNAL_DIR / "sync-templates.jsonl"
+            assert first.exit_code == EXIT_FAILURE
+            assert journal.exists()
+
+            attempts.clear()
+            failing.clear()
+            second = cmd_sync_templates(base_args)
+
+        assert attempts == ["owner/repo-01"]
+        assert second.exit_code == EXIT_SUCCESS
+        assert second.data["resumed"] == 2
+        assert [repo["status"] for repo in second.data["repos"]] == ["updated"] * 3
+        assert not journal.exists()
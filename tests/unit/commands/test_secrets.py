@@ -638,3 +638,35 @@ class TestSecretsJsonMode:
         assert isinstance(result, CommandResult)
         assert result.exit_code == EXIT_FAILURE
         assert "whitespace" in result.summary
+
+
+class TestSecretJournal:
+    """Resume journal for setting a secret on many repos."""
+
+    def test_journal_resumes_without_storing_secret_hash(self) -> None:
+        from cihub.commands import secrets as secrets_module
+        from cihub.utils.fleet import journal_key
+
+        attempts: list[str] = []
+        failing = {"owner/b"}
+
+        def set_secret(_gh: str, repo: str, _name: str, _value: str) -> tuple[bool, str]:
+            attempts.append(repo)
+            return (repo not in failing, "boom" if repo in failing else "")
+
+        repos = ["owner/a", "owner/b"]
+        with mock.patch.object(secrets_module, "_set_secret", side_effect=set_secret):
+            secrets_module._set_secret_on_repos("gh", repos, "HUB_DISPATCH_TOKEN", "ghp_secret", jobs=1)
+            journal = secrets_module.FLEET_JOURNAL_DIR / "secret-hub_dispatch_token.jsonl"
+            text = journal.read_text(encoding="utf-8")
+            assert "ghp_secret" not in text
+            # An unkeyed hash of the inputs would let anyone confirm a guessed secret
+            assert journal_key("setup-secrets", "HUB_DISPATCH_TOKEN", "ghp_secret", repos) not in text
+
+            attempts.clear()
+            failing.clear()
+            outcomes = secrets_module._set_secret_on_repos("gh", repos, "HUB_DISPATCH_TOKEN", "ghp_secret", jobs=1)
+
+        assert attempts == ["owner/b"]
+        assert [ok for _, ok, _ in outcomes] == [True, True]
+        assert not journal.exists()
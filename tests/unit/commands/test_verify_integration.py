@@ -0,0 +1,179 @@
+"""Tests for `cihub verify --integration` cloning and scheduling.
+
+Tests cover:
+- First run creates a bare mirror; later runs refresh it incrementally
+- Mirrors fetch branches only, never pull request refs
+- Clones from the mirror carry new upstream commits and point origin at GitHub
+- Kept clones are dissociated from the mirror; temporary ones share its objects
+- Without a mirror cache, repos are shallow-cloned from GitHub
+- CI runs are capped at the job limit and results keep entry order
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import shutil
+import stat
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from cihub.commands import verify as verify_module
+from cihub.utils.exec_utils import safe_run
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(*args: str, cwd: Path | None = None) -> str:
+    proc = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)  # noqa: S603, S607
+    return proc.stdout.strip()
+
+
+@pytest.fixture()
+def upstream(tmp_path: Path) -> Path:
+    """A local repo standing in for github.com/acme/app."""
+    repo = tmp_path / "upstream"
+    repo.mkdir()
+    _git("init", "-q", "-b", "main", cwd=repo)
+    _git("config", "user.email", "t@example.com", cwd=repo)
+    _git("config", "user.name", "t", cwd=repo)
+    (repo / "README.md").write_text("v1\n", encoding="utf-8")
+    _git("add", ".", cwd=repo)
+    _git("commit", "-q", "-m", "v1", cwd=repo)
+    return repo
+
+
+@pytest.fixture()
+def fake_gh(tmp_path: Path, upstream: Path) -> Callable[[], list[list[str]]]:
+    """A `gh` that clones from the local upstream and logs its arguments."""
+    log = tmp_path / "gh.log"
+    script = tmp_path / "gh"
+    script.write_text(
+        f"""#!{sys.executable}
+import subprocess, sys
+with open({str(log)!r}, "a") as handle:
+    handle.write("\\t".join(sys.argv[1:]) + "\\n")
+args = sys.argv[1:]
+assert args[:2] == ["repo", "clone"]
+extra = args[args.index("--") + 1:] if "--" in args else []
+sys.exit(subprocess.call(["git", "clone", "-q", *extra, {("file://" + str(upstream))!r}, args[3]]))
+""",
+        encoding="utf-8",
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+
+    def calls() -> list[list[str]]:
+        return [line.split("\t") for line in log.read_text().splitlines()] if log.exists() else []
+
+    return calls
+
+
+def _run(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    workdir: Path,
+    *,
+    mirror: bool = True,
+    persist: bool = False,
+    entries: list[dict[str, str]] | None = None,
+    jobs: int | None = None,
+    ci_delay: float = 0.0,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], int]:
+    """Run _run_integration with a stubbed `cihub ci`; also returns the peak number of concurrent CI runs."""
+    lock = threading.Lock()
+    active = peak = 0
+
+    def fake_safe_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        nonlocal active, peak
+        if cmd[1:4] != ["-m", "cihub", "ci"]:
+            return safe_run(cmd, **kwargs)
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(ci_delay)
+        with lock:
+            active -= 1
+        return subprocess.CompletedProcess(cmd, 0, stdout="ok", stderr="")
+
+    gh_path = str(tmp_path / "gh")
+    monkeypatch.setattr(verify_module, "resolve_executable", lambda name: gh_path if name == "gh" else name)
+    monkeypatch.setattr(verify_module, "safe_run", fake_safe_run)
+    problems, results = verify_module._run_integration(
+        entries=entries or [{"full": "acme/app", "default_branch": "main"}],
+        workdir=workdir,
+        install_deps=False,
+        jobs=jobs,
+        mirror_dir=tmp_path / "mirrors" if mirror else None,
+        persist=persist,
+    )
+    return problems, results, peak
+
+
+class TestMirrorCache:
+    def test_mirror_created_then_refreshed(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, upstream: Path, fake_gh: Callable[[], list[list[str]]]
+    ) -> None:
+        problems, results, _ = _run(monkeypatch, tmp_path, tmp_path / "run1")
+        assert problems == []
+        assert results[0]["status"] == "ok" and results[0]["source"] == "mirror"
+        assert (tmp_path / "mirrors" / "acme__app.git" / "HEAD").exists()
+        assert [call[-2:] for call in fake_gh()] == [["--bare", "--quiet"]]
+
+        (upstream / "README.md").write_text("v2\n", encoding="utf-8")
+        _git("commit", "-q", "-am", "v2", cwd=upstream)
+        problems, results, _ = _run(monkeypatch, tmp_path, tmp_path / "run2")
+
+        clone = tmp_path / "run2" / "acme__app"
+        assert problems == []
+        assert len(fake_gh()) == 1  # refreshed by fetch, not re-cloned
+        assert (clone / "README.md").read_text(encoding="utf-8") == "v2\n"
+        assert _git("remote", "get-url", "origin", cwd=clone) == "https://github.com/acme/app.git"
+        assert (clone / ".git" / "objects" / "info" / "alternates").exists()
+
+    def test_mirror_skips_pull_request_refs(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, upstream: Path, fake_gh: Callable[[], list[list[str]]]
+    ) -> None:
+        _git("update-ref", "refs/pull/1/head", "HEAD", cwd=upstream)
+        _run(monkeypatch, tmp_path, tmp_path / "run1")
+        _git("branch", "feature", cwd=upstream)
+        _git("update-ref", "refs/pull/2/head", "HEAD", cwd=upstream)
+        _run(monkeypatch, tmp_path, tmp_path / "run2")
+
+        refs = _git("for-each-ref", "--format=%(refname)", cwd=tmp_path / "mirrors" / "acme__app.git").split()
+        assert refs == ["refs/heads/feature", "refs/heads/main"]
+
+    def test_kept_clones_are_dissociated(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, fake_gh: Callable[[], list[list[str]]]
+    ) -> None:
+        problems, _, _ = _run(monkeypatch, tmp_path, tmp_path / "kept", persist=True)
+        assert problems == []
+        assert not (tmp_path / "kept" / "acme__app" / ".git" / "objects" / "info" / "alternates").exists()
+
+    def test_without_mirror_shallow_clones(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, fake_gh: Callable[[], list[list[str]]]
+    ) -> None:
+        problems, results, _ = _run(monkeypatch, tmp_path, tmp_path / "run", mirror=False)
+        assert problems == []
+        assert results[0]["source"] == "github"
+        assert fake_gh()[0][-2:] == ["--depth", "1"]
+        assert not (tmp_path / "mirrors").exists()
+
+
+class TestScheduling:
+    def test_ci_runs_capped_and_ordered(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, fake_gh: Callable[[], list[list[str]]]
+    ) -> None:
+        entries = [{"full": f"acme/app{i}", "default_branch": ""} for i in range(5)]
+        problems, results, peak = _run(
+            monkeypatch, tmp_path, tmp_path / "run", entries=entries, jobs=2, ci_delay=0.05, mirror=False
+        )
+
+        assert problems == []
+        assert [result["repo"] for result in results] == [entry["full"] for entry in entries]
+        assert peak == 2
@@ -1,14 +1,16 @@
 """Tests for docs_stale symbol and reference extraction.
 
 Split from test_docs_stale.py for better organization.
-Tests: extract_python_symbols, extract_doc_references
+Tests: extract_python_symbols, SymbolCache, extract_doc_references
 """
 
 # TEST-METRICS:
 
 from __future__ import annotations
 
+import json
 import textwrap
+from pathlib import Path
 
 from cihub.commands.docs_stale import (
     KIND_CLI_COMMAND,
@@ -16,9 +18,11 @@ from cihub.commands.docs_stale import (
     KIND_CONFIG_KEY,
     KIND_ENV_VAR,
     KIND_FILE_PATH,
+    SymbolCache,
     extract_doc_references,
     extract_python_symbols,
 )
+from cihub.commands.docs_stale.extraction import git_blob_sha
 
 
 class TestExtractPythonSymbols:
@@ -91,6 +95,43 @@ class TestExtractPythonSymbols:
         assert symbols[0].line == 4
 
 
+class TestSymbolCache:
+    """Tests for the blob-SHA keyed symbol cache."""
+
+    def test_git_blob_sha_matches_git(self) -> None:
+        # `printf 'hello\n' | git hash-object --stdin`
+        assert git_blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+    def test_parallel_matches_serial(self) -> None:
+        sources = {f"sha{i}": f"def func_{i}(): pass\nCONST_{i} = {i}\n" for i in range(12)}
+        serial = SymbolCache()
+        serial.extract_many(sources, max_workers=1)
+        parallel = SymbolCache()
+        parallel.extract_many(sources, max_workers=2)
+
+        assert parallel.entries == serial.entries
+        assert serial.names("sha3") == {"func_3", "CONST_3"}
+
+    def test_cached_blobs_are_not_reparsed(self) -> None:
+        cache = SymbolCache()
+        cache.extract_many({"a": "def one(): pass"})
+        cache.extract_many({"a": "def one(): pass", "b": "def two(): pass"})
+        assert cache.misses == 2
+        assert cache.hits == 1
+
+    def test_roundtrip_and_version_mismatch(self, tmp_path: Path) -> None:
+        path = tmp_path / "symbols.json"
+        cache = SymbolCache(path)
+        cache.extract_many({"a": "class Widget: pass"})
+        cache.save()
+        assert SymbolCache.load(path).names("a") == {"Widget"}
+
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload["python"] = "2.7"
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        assert SymbolCache.load(path).entries == {}
+
+
 class TestExtractDocReferences:
     """Tests for markdown reference extraction."""
 
@@ -0,0 +1,138 @@
+"""Tests for docs_stale git access (single diff call + batched object reads).
+
+Tests: get_diff_entries parsing, GitBatchReader (including the read timeout
+fallback), blob-SHA symbol cache and its size cap, compare_symbols against a
+real temporary repository.
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cihub.commands.docs_stale import (
+    GitBatchReader,
+    SymbolCache,
+    compare_symbols,
+    get_diff_entries,
+    get_file_status,
+    get_renamed_files,
+)
+from cihub.commands.docs_stale import extraction as stale_extraction
+from cihub.commands.docs_stale import git as stale_git
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "kept.py").write_text("def old_helper():\n    pass\n\nclass Widget:\n    pass\n", encoding="utf-8")
+    (tmp_path / "gone.py").write_text("def obsolete_entrypoint():\n    pass\n", encoding="utf-8")
+    (tmp_path / "moved.py").write_text("MOVED_CONSTANT = 1\n\n\ndef moved_func():\n    return 1\n", encoding="utf-8")
+    (tmp_path / "README.md").write_text("# Repo\n", encoding="utf-8")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+
+    (tmp_path / "kept.py").write_text("def new_helper():\n    pass\n\nclass Widget:\n    pass\n", encoding="utf-8")
+    (tmp_path / "gone.py").unlink()
+    _git(tmp_path, "mv", "moved.py", "relocated.py")
+    return tmp_path
+
+
+class TestDiffEntries:
+    def test_single_diff_call_feeds_all_views(self, repo: Path) -> None:
+        with patch.object(stale_git, "_run_git", wraps=stale_git._run_git) as run_git:
+            entries = get_diff_entries("HEAD", repo)
+            status = get_file_status("HEAD", repo, entries)
+            renames = get_renamed_files("HEAD", repo, entries)
+        assert run_git.call_count == 1
+
+        assert status == {"gone.py": "D", "kept.py": "M", "moved.py": "R", "relocated.py": "A"}
+        assert renames == [("moved.py", "relocated.py")]
+        kept = next(e for e in entries if e.path == "kept.py")
+        assert kept.old_blob == _git(repo, "rev-parse", "HEAD:kept.py").strip()
+
+    def test_invalid_ref_returns_empty(self, repo: Path) -> None:
+        assert get_diff_entries("no-such-ref", repo) == []
+
+
+class TestGitBatchReader:
+    def test_reads_blobs_and_ref_paths(self, repo: Path) -> None:
+        with GitBatchReader(repo) as reader:
+            assert reader.read("HEAD:gone.py") == "def obsolete_entrypoint():\n    pass\n"
+            assert reader.read("HEAD:README.md") == "# Repo\n"
+            assert reader.read("HEAD:missing.py") is None
+            # Trees are not blobs
+            assert reader.read("HEAD") is None
+            assert reader.read("HEAD:kept.py") is not None
+
+    def test_falls_back_when_batch_process_unavailable(self, repo: Path) -> None:
+        with patch.object(GitBatchReader, "_process", return_value=None):
+            with GitBatchReader(repo) as reader:
+                assert reader.read("HEAD:README.md") == "# Repo\n"
+
+    def test_falls_back_when_batch_process_hangs(self, repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        stuck = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(60)"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        monkeypatch.setattr(stale_git, "BATCH_READ_TIMEOUT_SECONDS", 0.2)
+        try:
+            with patch.object(GitBatchReader, "_process", return_value=stuck):
+                with GitBatchReader(repo) as reader:
+                    started = time.monotonic()
+                    assert reader.read("HEAD:README.md") == "# Repo\n"
+                    assert time.monotonic() - started < 10
+            assert stuck.wait(timeout=10) is not None
+        finally:
+            stuck.kill()
+            stuck.wait()
+
+
+class TestCompareSymbols:
+    def test_detects_removed_added_and_renamed(self, repo: Path) -> None:
+        removed, added, renamed = compare_symbols("HEAD", repo, repo)
+
+        assert removed == {"obsolete_entrypoint"}
+        assert ("old_helper", "new_helper") in renamed
+        assert {"MOVED_CONSTANT", "moved_func"} <= added
+
+    def test_blob_symbols_parsed_once(self, repo: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        cache_path = tmp_path_factory.mktemp("cache") / "symbols.json"
+        cache = SymbolCache.load(cache_path)
+        first = compare_symbols("HEAD", repo, repo, cache=cache)
+        # Base kept.py and gone.py, head kept.py and relocated.py
+        assert cache.misses == 4
+        cache.save()
+
+        reloaded = SymbolCache.load(cache_path)
+        second = compare_symbols("HEAD", repo, repo, cache=reloaded)
+        assert reloaded.misses == 0
+        assert reloaded.hits == 4
+        assert second == first
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(stale_extraction, "SYMBOL_CACHE_MAX_ENTRIES", 2)
+        cache = SymbolCache()
+        cache.extract_many({"a": "A = 1\n", "b": "B = 1\n"})
+        cache.get("a")
+        cache.extract_many({"c": "C = 1\n"})
+        assert list(cache.entries) == ["a", "c"]
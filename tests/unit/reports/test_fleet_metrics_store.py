@@ -0,0 +1,218 @@
+"""Tests for the columnar fleet metrics store (cihub/core/aggregation/store.py).
+
+Tests cover:
+- Projection keeps only aggregation/dashboard fields and key presence
+- Incremental ingest (reuse unchanged, re-parse modified, drop removed)
+- Process-pool parsing and details rendering match serial results
+- Aggregation and dashboard parity with and without a persisted store
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from cihub.aggregation import run_reports_aggregation
+from cihub.commands.report.dashboard import _generate_dashboard_summary, _load_dashboard_reports
+from cihub.core.aggregation import runner as aggregation_runner
+from cihub.core.aggregation.store import (
+    METRICS_STORE_VERSION,
+    PARALLEL_MIN_REPORTS,
+    FleetMetricsStore,
+    project_report,
+)
+
+
+def _report(repo: str, coverage: int) -> dict:
+    return {
+        "schema_version": "2.0",
+        "repository": f"org/{repo}",
+        "branch": "main",
+        "run_id": "1",
+        "hub_correlation_id": "hub-1",
+        "python_version": "3.12",
+        "results": {"test": "success", "coverage": coverage, "tests_passed": 3, "tests_failed": 0},
+        "tool_metrics": {"ruff_errors": 0},
+        "tools_configured": {"pytest": True},
+        "tools_ran": {"pytest": True},
+        "tools_success": {"pytest": True},
+        "environment": {"workdir": ".", "runner_os": "Linux"},
+        "metadata": {"workflow_ref": "org/hub/.github/workflows/python-ci.yml@main", "extra": "x" * 100},
+        "logs": ["line"] * 50,
+    }
+
+
+def _write(reports_dir: Path, name: str, data: object) -> Path:
+    path = reports_dir / f"{name}-ci-report" / "report.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def _touch(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestProjection:
+    def test_drops_unread_fields_and_keeps_presence(self) -> None:
+        projected = project_report(_report("a", 80))
+
+        assert "logs" not in projected
+        assert projected["metadata"] == {"workflow_ref": "org/hub/.github/workflows/python-ci.yml@main"}
+        assert projected["environment"] == {"workdir": "."}
+        assert "python_version" in projected
+        assert "java_version" not in projected
+
+
+class TestIngest:
+    def test_unchanged_reports_are_reused(self, tmp_path: Path) -> None:
+        reports_dir = tmp_path / "reports"
+        _write(reports_dir, "a", _report("a", 80))
+        b_path = _write(reports_dir, "b", _report("b", 60))
+        store_path = tmp_path / "store.json"
+
+        store = FleetMetricsStore.load(store_path)
+        store.ingest(reports_dir)
+        store.save()
+        assert store.parsed == 2
+        assert json.loads(store_path.read_text(encoding="utf-8"))["version"] == METRICS_STORE_VERSION
+
+        b_path.write_text(json.dumps(_report("b", 65)), encoding="utf-8")
+        _touch(b_path)
+        _write(reports_dir, "c", _report("c", 90))
+
+        reloaded = FleetMetricsStore.load(store_path)
+        reloaded.ingest(reports_dir)
+        assert reloaded.reused == 1
+        assert reloaded.parsed == 2
+        assert [run.source for run in reloaded.runs(reports_dir)] == [
+            "a-ci-report/report.json",
+            "b-ci-report/report.json",
+            "c-ci-report/report.json",
+        ]
+        assert [results["coverage"] for results in reloaded.column("results")] == [80, 65, 90]
+
+    def test_removed_and_invalid_reports(self, tmp_path: Path) -> None:
+        reports_dir = tmp_path / "reports"
+        a_path = _write(reports_dir, "a", _report("a", 80))
+        _write(reports_dir, "bad", [1, 2])
+        store_path = tmp_path / "store.json"
+        store = FleetMetricsStore.load(store_path)
+        store.ingest(reports_dir)
+        store.save()
+
+        a_path.unlink()
+        reloaded = FleetMetricsStore.load(store_path)
+        reloaded.ingest(reports_dir)
+        runs = reloaded.runs(reports_dir)
+        assert len(runs) == 1
+        assert runs[0].report is None
+        assert runs[0].error == "report.json is not a JSON object"
+
+    def test_corrupt_store_is_ignored(self, tmp_path: Path) -> None:
+        reports_dir = tmp_path / "reports"
+        _write(reports_dir, "a", _report("a", 80))
+        store_path = tmp_path / "store.json"
+        store_path.write_text("{not json", encoding="utf-8")
+
+        store = FleetMetricsStore.load(store_path)
+        store.ingest(reports_dir)
+        assert store.parsed == 1
+
+
+class TestParallelIngest:
+    def test_pool_parse_matches_serial(self, tmp_path: Path) -> None:
+        reports_dir = tmp_path / "reports"
+        for i in range(PARALLEL_MIN_REPORTS + 2):
+            _write(reports_dir, f"repo{i:02d}", _report(f"repo{i:02d}", i))
+        _write(reports_dir, "broken", "not an object")
+
+        serial = FleetMetricsStore()
+        serial.ingest(reports_dir, max_workers=1)
+        pooled = FleetMetricsStore()
+        pooled.ingest(reports_dir, max_workers=2)
+
+        assert pooled.runs(reports_dir) == serial.runs(reports_dir)
+        assert pooled.parsed == PARALLEL_MIN_REPORTS + 3
+
+    def test_details_fragments_replace_full_reports(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        reports_dir = tmp_path / "reports"
+        _write(reports_dir, "a", _report("a", 80))
+        _write(reports_dir, "b", {})
+        defaults_file = tmp_path / "defaults.yaml"
+        defaults_file.write_text("thresholds: {}\n", encoding="utf-8")
+        captured: list[list[dict]] = []
+        original = aggregation_runner.generate_details_markdown
+
+        def _capture(results: list[dict]) -> str:
+            captured.append(results)
+            return original(results)
+
+        monkeypatch.setattr(aggregation_runner, "generate_details_markdown", _capture)
+        run_reports_aggregation(
+            reports_dir=reports_dir,
+            output_file=tmp_path / "hub-report.json",
+            summary_file=None,
+            defaults_file=defaults_file,
+            hub_run_id="hub-1",
+            hub_event="workflow_dispatch",
+            total_repos=0,
+            details_file=tmp_path / "details.md",
+        )
+
+        results = captured[0]
+        assert all("_report_data" not in entry for entry in results)
+        assert "_details_md" in results[0]
+        assert "_details_md" not in results[1]
+        details = (tmp_path / "details.md").read_text(encoding="utf-8")
+        assert "*No report.json available" in details
+
+
+class TestParity:
+    def test_aggregation_output_matches_without_store(self, tmp_path: Path) -> None:
+        reports_dir = tmp_path / "reports"
+        _write(reports_dir, "a", _report("a", 80))
+        _write(reports_dir, "b", _report("b", 40))
+        defaults_file = tmp_path / "defaults.yaml"
+        defaults_file.write_text("thresholds:\n  max_critical_vulns: 0\n  max_high_vulns: 0\n", encoding="utf-8")
+
+        outputs = []
+        for store in (None, tmp_path / "store.json", tmp_path / "store.json"):
+            output_file = tmp_path / "hub-report.json"
+            details_file = tmp_path / "details.md"
+            run_reports_aggregation(
+                reports_dir=reports_dir,
+                output_file=output_file,
+                summary_file=None,
+                defaults_file=defaults_file,
+                hub_run_id="hub-1",
+                hub_event="workflow_dispatch",
+                total_repos=0,
+                details_file=details_file,
+                metrics_store=store,
+            )
+            report = json.loads(output_file.read_text(encoding="utf-8"))
+            report.pop("timestamp")
+            outputs.append((report, details_file.read_text(encoding="utf-8")))
+
+        assert outputs[0] == outputs[1] == outputs[2]
+
+    def test_dashboard_summary_from_store(self, tmp_path: Path) -> None:
+        reports_dir = tmp_path / "reports"
+        _write(reports_dir, "a", _report("a", 80))
+        store = FleetMetricsStore(tmp_path / "store.json")
+
+        reports, skipped, warnings = _load_dashboard_reports(reports_dir, "warn", store)
+
+        assert skipped == 0
+        assert warnings == []
+        assert "logs" not in reports[0]
+        summary = _generate_dashboard_summary(reports)
+        assert summary["repos"][0]["coverage"] == 80
+        assert summary["repos"][0]["language"] == "python"
@@ -0,0 +1,66 @@
+"""Tests for the shared report view (cihub/core/report_view.py).
+
+Tests cover:
+- Tool rows from the view match the Tools Enabled table parsed from the rendered summary
+- Gate rows carry each check's status
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+from typing import Any
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from cihub.core.report_view import GateRow, build_report_view
+from cihub.reporting import render_summary
+from cihub.services.report_validator.content import _parse_summary_tools
+
+_TOOLS = ["pytest", "ruff", "black", "isort", "mypy", "bandit", "pip_audit", "jacoco", "checkstyle", "owasp", "build"]
+
+
+@st.composite
+def _reports(draw: st.DrawFn) -> dict[str, Any]:
+    report: dict[str, Any] = {"schema_version": "2.0"}
+    language = draw(st.sampled_from(["java_version", "python_version"]))
+    report[language] = "x"
+    flags = st.dictionaries(st.sampled_from(_TOOLS), st.booleans())
+    report["tools_configured"] = draw(flags)
+    report["tools_ran"] = draw(flags)
+    report["tools_success"] = draw(flags)
+    report["results"] = {
+        "build": draw(st.sampled_from([None, "success", "failure"])),
+        "tests_passed": draw(st.integers(0, 5)),
+        "tests_failed": draw(st.integers(0, 2)),
+        "coverage": draw(st.sampled_from([None, 50, 90])),
+    }
+    report["environment"] = {"build_tool": draw(st.sampled_from([None, "maven", "gradle"]))}
+    report["thresholds"] = {"coverage_min": draw(st.sampled_from([None, 70]))}
+    return report
+
+
+class TestReportView:
+    @given(_reports())
+    @settings(max_examples=60, deadline=None)
+    def test_tool_rows_match_parsed_summary(self, report: dict[str, Any]) -> None:
+        tools = build_report_view(report).tools
+
+        configured, ran, success = _parse_summary_tools(render_summary(report))
+
+        assert configured == {row.label: row.configured for row in tools}
+        assert ran == {row.label: row.ran for row in tools}
+        assert success == {row.label: row.success for row in tools}
+
+    def test_gate_rows(self) -> None:
+        report = {
+            "python_version": "3.12",
+            "results": {"tests_passed": 3, "tests_failed": 1},
+            "tools_configured": {"ruff": True},
+            "tools_ran": {},
+        }
+        gates = build_report_view(report).gates
+
+        assert gates[0] == GateRow("Unit Tests", "FAILED")
+        assert GateRow("Ruff", "NOT RUN") in gates
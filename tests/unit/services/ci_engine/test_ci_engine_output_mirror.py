@@ -43,3 +43,27 @@ def test_mirror_output_dir_to_workspace_noop_when_inside(tmp_path: Path) -> None
 
     assert mirror is None
     assert problems == []
+
+
+def test_mirror_output_dir_to_workspace_links_and_refreshes(tmp_path: Path) -> None:
+    output_dir = tmp_path / "repo" / ".cihub"
+    (output_dir / "tool-outputs").mkdir(parents=True)
+    report = output_dir / "report.json"
+    report.write_text("{}", encoding="utf-8")
+    (output_dir / "tool-outputs" / "ruff.json").write_text("[]", encoding="utf-8")
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    env = {"GITHUB_WORKSPACE": str(workspace)}
+    problems: list[dict[str, str]] = []
+
+    mirror = _mirror_output_dir_to_workspace(output_dir, env, problems)
+    assert mirror is not None
+    assert (mirror / "report.json").stat().st_ino == report.stat().st_ino
+    assert (mirror / "tool-outputs" / "ruff.json").read_text(encoding="utf-8") == "[]"
+
+    # A later run replaces the report file; mirroring again picks up the new one
+    report.unlink()
+    report.write_text('{"run": 2}', encoding="utf-8")
+    _mirror_output_dir_to_workspace(output_dir, env, problems)
+    assert (mirror / "report.json").read_text(encoding="utf-8") == '{"run": 2}'
+    assert problems == []
@@ -0,0 +1,166 @@
+"""Tests for post-run side effects (cihub/services/ci_engine/side_effects.py).
+
+Tests cover:
+- Side effects run concurrently; their problems are merged in queue order
+- Outcomes (ok, warning, error, failed, timeout) and durations are recorded
+- A side effect that overruns its budget is abandoned with a warning, or cancelled if it can be
+- run_ci notifies only after the codecov upload, so a codecov error is reported as a failure
+- A cancelled workspace mirror leaves no partial copy behind
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from cihub.exit_codes import EXIT_FAILURE
+from cihub.services.ci_engine import _mirror_output_dir_to_workspace, run_ci
+from cihub.services.ci_engine.side_effects import SideEffect, run_side_effects
+
+
+def _sleeper(seconds: float, severity: str | None = None, message: str = "") -> Any:
+    def run(problems: list[dict[str, Any]]) -> str:
+        time.sleep(seconds)
+        if severity:
+            problems.append({"severity": severity, "message": message, "code": "TEST"})
+        return message
+
+    return run
+
+
+class TestRunSideEffects:
+    def test_concurrent_with_ordered_problems(self) -> None:
+        effects = [
+            SideEffect("codecov", _sleeper(0.3, "error", "upload failed"), timeout=5),
+            SideEffect("mirror", _sleeper(0.1), timeout=5),
+            SideEffect("notify", _sleeper(0.2, "warning", "slack down"), timeout=5),
+        ]
+        problems: list[dict[str, Any]] = []
+
+        start = time.monotonic()
+        outcomes = run_side_effects(effects, problems)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.55  # serial would take 0.6s
+        assert [problem["message"] for problem in problems] == ["upload failed", "slack down"]
+        assert {name: outcome["status"] for name, outcome in outcomes.items()} == {
+            "codecov": "error",
+            "mirror": "ok",
+            "notify": "warning",
+        }
+        assert outcomes["codecov"]["seconds"] >= 0.3
+        assert effects[2].result == "slack down"
+
+    def test_exception_and_timeout(self) -> None:
+        def boom(problems: list[dict[str, Any]]) -> None:
+            raise RuntimeError("webhook exploded")
+
+        effects = [
+            SideEffect("notify", boom, timeout=5),
+            SideEffect("codecov", _sleeper(5, "error", "late"), timeout=0.2),
+        ]
+        problems: list[dict[str, Any]] = []
+
+        start = time.monotonic()
+        outcomes = run_side_effects(effects, problems)
+
+        assert time.monotonic() - start < 1
+        assert outcomes["notify"]["status"] == "failed"
+        assert outcomes["codecov"] == {"status": "timeout", "seconds": 0.2}
+        assert [problem["code"] for problem in problems] == [
+            "CIHUB-CI-SIDE-EFFECT-FAILED",
+            "CIHUB-CI-SIDE-EFFECT-TIMEOUT",
+        ]
+        assert all(problem["severity"] == "warning" for problem in problems)
+
+    def test_overrun_is_cancelled(self) -> None:
+        cancel = threading.Event()
+        stopped = threading.Event()
+
+        def copy(problems: list[dict[str, Any]]) -> None:
+            cancel.wait(5)
+            stopped.set()
+
+        problems: list[dict[str, Any]] = []
+        outcomes = run_side_effects([SideEffect("mirror", copy, timeout=0.1, cancel=cancel)], problems)
+
+        assert stopped.is_set()
+        assert outcomes["mirror"] == {"status": "timeout", "seconds": 0.1}
+        assert [problem["code"] for problem in problems] == ["CIHUB-CI-SIDE-EFFECT-TIMEOUT"]
+
+
+def test_cancelled_mirror_leaves_no_partial_copy(tmp_path: Path) -> None:
+    output_dir = tmp_path / "out" / ".cihub"
+    output_dir.mkdir(parents=True)
+    (output_dir / "report.json").write_text("{}", encoding="utf-8")
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    cancel = threading.Event()
+    cancel.set()
+    problems: list[dict[str, Any]] = []
+
+    assert _mirror_output_dir_to_workspace(output_dir, {"GITHUB_WORKSPACE": str(workspace)}, problems, cancel) is None
+
+    assert not (workspace / ".cihub").exists()
+    assert problems == []
+
+
+def test_run_ci_records_side_effects(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    output_dir = tmp_path / "out" / ".cihub"
+    output_dir.mkdir(parents=True)
+    config = {
+        "language": "python",
+        "repo": {"owner": "owner", "name": "repo"},
+        "python": {"tools": {"pytest": {"enabled": True}}},
+        "reports": {
+            "github_summary": {"enabled": False},
+            "codecov": {"enabled": True, "fail_ci_on_error": True},
+        },
+    }
+    report = {"results": {}, "tool_metrics": {}, "repository": "owner/repo", "branch": "main"}
+    validation = mock.MagicMock(errors=[], warnings=[])
+    notified: list[bool] = []
+
+    def fake_upload(files: list[Path], fail_ci_on_error: bool, problems: list[dict[str, Any]]) -> None:
+        time.sleep(0.3)
+        problems.append({"severity": "error", "message": "Codecov upload failed", "code": "CIHUB-CI-CODECOV-FAILED"})
+
+    def fake_notify(success: bool, config: dict[str, Any], report: dict[str, Any], problems: list, env: Any) -> None:
+        time.sleep(0.3)
+        notified.append(success)
+
+    monkeypatch.setattr("cihub.services.ci_engine.load_ci_config", lambda *args, **kwargs: config)
+    monkeypatch.setattr("cihub.services.ci_engine.python_tools._run_python_tools", lambda *a, **k: ({}, {}, {}))
+    monkeypatch.setattr("cihub.core.languages.python.build_python_report", lambda *a, **k: report)
+    monkeypatch.setattr("cihub.services.ci_engine.gates._evaluate_python_gates", lambda *a, **k: [])
+    monkeypatch.setattr("cihub.services.ci_engine.render_summary", lambda *a, **k: "summary")
+    monkeypatch.setattr("cihub.services.report_validator.validate_against_schema", lambda *a, **k: [])
+    monkeypatch.setattr("cihub.services.report_validator.validate_report", lambda *a, **k: validation)
+    monkeypatch.setattr("cihub.services.ci_engine._run_codecov_upload", fake_upload)
+    monkeypatch.setattr("cihub.services.ci_engine._notify", fake_notify)
+
+    start = time.monotonic()
+    result = run_ci(repo, output_dir=output_dir, env={"GITHUB_WORKSPACE": str(workspace)})
+    elapsed = time.monotonic() - start
+
+    side_effects = result.data["side_effects"]
+    assert set(side_effects) == {"codecov", "mirror", "notify"}
+    assert side_effects["codecov"]["status"] == "error" and side_effects["notify"]["status"] == "ok"
+    assert elapsed >= 0.6  # the notification waits for the upload
+    # The codecov error fails the run, and the notification says so
+    assert notified == [False]
+    assert result.exit_code == EXIT_FAILURE
+    mirrored = workspace / ".cihub" / "report.json"
+    assert result.report_path == mirrored
+    assert mirrored.stat().st_ino == (output_dir / "report.json").stat().st_ino
@@ -0,0 +1,69 @@
+"""Tests for run_ci tracing spans.
+
+Tests cover:
+- With tracing active, run_ci records config loading, each tool, report building,
+  gates, validation and every post-run side effect as nested spans
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from cihub.ci_runner import ToolResult
+from cihub.services.ci_engine import run_ci
+from cihub.utils.tracing import start_tracing, stop_tracing
+
+
+def test_run_ci_records_phase_spans(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / ".ci-hub.yml").write_text(
+        "language: python\nrepo:\n  owner: owner\n  name: repo\npython:\n  tools:\n    pytest:\n      enabled: true\n",
+        encoding="utf-8",
+    )
+    report = {"results": {}, "tool_metrics": {}, "repository": "owner/repo", "branch": "main"}
+
+    def fake_pytest(workdir: Path, output_dir: Path, *args: Any) -> ToolResult:
+        return ToolResult(tool="pytest", ran=True, success=True)
+
+    monkeypatch.setattr("cihub.core.languages.python.get_runners", lambda language: {"pytest": fake_pytest})
+    monkeypatch.setattr("cihub.core.languages.python.build_python_report", lambda *a, **k: report)
+    monkeypatch.setattr("cihub.services.ci_engine.gates._evaluate_python_gates", lambda *a, **k: [])
+    monkeypatch.setattr("cihub.services.ci_engine.render_summary", lambda *a, **k: "summary")
+    monkeypatch.setattr("cihub.services.report_validator.validate_against_schema", lambda *a, **k: [])
+    monkeypatch.setattr(
+        "cihub.services.report_validator.validate_report", lambda *a, **k: mock.MagicMock(errors=[], warnings=[])
+    )
+    monkeypatch.setattr("cihub.services.ci_engine._run_codecov_upload", lambda *a, **k: None)
+    monkeypatch.setattr("cihub.services.ci_engine._notify", lambda *a, **k: None)
+
+    tracer = start_tracing()
+    try:
+        run_ci(repo, output_dir=tmp_path / "out", env={})
+    finally:
+        stop_tracing()
+
+    phases = tracer.phases()
+    expected = [
+        "config.load",
+        "tools.run",
+        "tool.pytest",
+        "report.build",
+        "gates.evaluate",
+        "report.write",
+        "summary.render",
+        "report.validate",
+        "side_effects",
+    ]
+    assert [name for name in phases if name in expected] == expected
+    assert {"side_effect.codecov", "side_effect.mirror", "side_effect.notify"} <= set(phases)
+    events = {event["name"]: event for event in tracer.chrome_trace()["traceEvents"] if event["ph"] == "X"}
+    tools, pytest_span = events["tools.run"], events["tool.pytest"]
+    assert tools["ts"] <= pytest_span["ts"] <= pytest_span["ts"] + pytest_span["dur"] <= tools["ts"] + tools["dur"]
+    assert tools["args"] == {"language": "python"}
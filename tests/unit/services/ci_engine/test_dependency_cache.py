@@ -0,0 +1,164 @@
+"""Tests for the dependency install cache (cihub/services/ci_engine/dependency_cache.py).
+
+Tests cover:
+- Unchanged Python dependency files and environment skip pip; edits or a changed environment reinstall
+- Failed installs are not cached; `dependencies.cache: false` disables the stamps and passes config validation
+- Maven multi-module installs are skipped only while the artifacts are in the local repository
+- The outcome travels on the run context into report environment.dependency_cache and validates
+- `cihub report build` picks up the outcome that `cihub ci` left next to the report
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cihub.ci_runner import ToolResult
+from cihub.commands.report.helpers import _load_dependency_cache
+from cihub.config.paths import PathConfig
+from cihub.config.schema import validate_config
+from cihub.core.ci_report import DEPENDENCY_CACHE_FILE, RunContext, build_python_report
+from cihub.services.ci_engine import dependency_cache, java_tools, python_tools
+from cihub.services.ci_engine.dependency_cache import DependencyCache, maven_install_key
+from cihub.services.report_validator import validate_against_schema
+from cihub.utils import hub_root
+
+
+@pytest.fixture()
+def python_project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / "requirements.txt").write_text("requests\n", encoding="utf-8")
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'demo'\n", encoding="utf-8")
+    monkeypatch.setattr(python_tools, "python_environment_digest", lambda: "env-1")
+    return tmp_path
+
+
+def _install(
+    monkeypatch: pytest.MonkeyPatch, workdir: Path, config: dict[str, Any] | None = None, fail: bool = False
+) -> tuple[dict[str, Any] | None, list[str]]:
+    labels: list[str] = []
+
+    def fake_run(cmd: list[str], cwd: Path, label: str, problems: list[dict[str, Any]]) -> bool:
+        labels.append(label)
+        return not fail
+
+    monkeypatch.setattr(python_tools, "_run_dep_command", fake_run)
+    return python_tools._install_python_dependencies(config or {}, workdir, []), labels
+
+
+class TestPythonInstallCache:
+    def test_unchanged_inputs_skip_pip(self, monkeypatch: pytest.MonkeyPatch, python_project: Path) -> None:
+        first, labels = _install(monkeypatch, python_project)
+        assert first is not None and first["status"] == "miss"
+        assert labels == ["requirements.txt", "pyproject.toml [dev]"]
+
+        second, labels = _install(monkeypatch, python_project)
+        assert second is not None and second["status"] == "hit"
+        assert labels == []
+        assert second["seconds_saved"] == DependencyCache.load(python_project).entries["python"]["seconds"]
+
+    def test_edited_requirements_or_changed_environment_reinstall(
+        self, monkeypatch: pytest.MonkeyPatch, python_project: Path
+    ) -> None:
+        _install(monkeypatch, python_project)
+        (python_project / "requirements.txt").write_text("requests\nrich\n", encoding="utf-8")
+        outcome, labels = _install(monkeypatch, python_project)
+        assert outcome is not None and outcome["status"] == "miss" and labels
+
+        monkeypatch.setattr(python_tools, "python_environment_digest", lambda: "env-2")
+        outcome, labels = _install(monkeypatch, python_project)
+        assert outcome is not None and outcome["status"] == "miss" and labels
+
+    def test_failures_are_not_cached(self, monkeypatch: pytest.MonkeyPatch, python_project: Path) -> None:
+        _install(monkeypatch, python_project, fail=True)
+        outcome, labels = _install(monkeypatch, python_project)
+        assert outcome is not None and outcome["status"] == "miss" and labels
+
+    def test_cache_can_be_disabled(self, monkeypatch: pytest.MonkeyPatch, python_project: Path) -> None:
+        config = {"python": {"dependencies": {"cache": False}}}
+        _install(monkeypatch, python_project, config)
+        outcome, labels = _install(monkeypatch, python_project, config)
+        assert outcome is not None and outcome["status"] == "disabled" and labels
+        assert not (python_project / dependency_cache.DEPS_CACHE_PATH).exists()
+
+    def test_off_switch_is_valid_config(self) -> None:
+        config = {
+            "language": "python",
+            "repo": {"owner": "acme", "name": "app"},
+            "python": {"dependencies": {"cache": False, "commands": ["pip install -e ."]}},
+            "java": {"dependencies": {"cache": False}},
+        }
+        assert validate_config(config, PathConfig(root=str(hub_root()))) == []
+
+
+class TestMavenInstallCache:
+    def test_skipped_while_artifacts_installed(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        workdir = tmp_path / "repo"
+        (workdir / "core" / "src" / "main" / "java").mkdir(parents=True)
+        (workdir / "pom.xml").write_text(
+            "<project><groupId>com.acme</groupId><artifactId>app</artifactId><version>1.0</version>"
+            "<modules><module>core</module></modules></project>",
+            encoding="utf-8",
+        )
+        source = workdir / "core" / "src" / "main" / "java" / "App.java"
+        source.write_text("class App {}\n", encoding="utf-8")
+        local_repo = tmp_path / "m2"
+        monkeypatch.setenv("MAVEN_OPTS", f"-Dmaven.repo.local={local_repo}")
+        installs: list[Path] = []
+
+        def fake_install(path: Path, output_dir: Path) -> ToolResult:
+            installs.append(path)
+            (local_repo / "com" / "acme" / "app" / "1.0").mkdir(parents=True, exist_ok=True)
+            return ToolResult(tool="maven-install", ran=True, success=True)
+
+        monkeypatch.setattr(java_tools, "run_maven_install", fake_install)
+
+        def run() -> dict[str, Any]:
+            return java_tools._maven_install_cached({}, workdir, tmp_path, tmp_path, [])
+
+        assert run()["status"] == "miss"
+        assert run()["status"] == "hit"
+        assert len(installs) == 1
+
+        key = maven_install_key(workdir)
+        source.write_text("class App { int x; }\n", encoding="utf-8")
+        assert maven_install_key(workdir) != key
+        assert run()["status"] == "miss"
+
+        (local_repo / "com" / "acme" / "app" / "1.0").rmdir()
+        assert run()["status"] == "miss"
+        assert len(installs) == 3
+
+
+class TestReportField:
+    def test_outcome_in_environment(self) -> None:
+        context = RunContext(
+            repository="acme/app",
+            branch="main",
+            run_id=None,
+            run_number=None,
+            commit="a" * 40,
+            correlation_id=None,
+            workflow_ref=None,
+            workdir=".",
+            build_tool=None,
+            retention_days=None,
+            project_type=None,
+            docker_compose_file=None,
+            docker_health_endpoint=None,
+            dependency_cache={"status": "hit", "seconds": 0.01, "seconds_saved": 42.5},
+        )
+        tool_results = {"ruff": {"metrics": {"ruff_errors": 0}}}
+        report = build_python_report({}, tool_results, {"ruff": True}, {"ruff": True}, {"ruff": True}, {}, context)
+
+        assert report["environment"]["dependency_cache"]["seconds_saved"] == 42.5
+        assert report["tool_evidence"] == {"ruff": True}
+        assert validate_against_schema(report) == []
+
+    def test_report_build_loads_outcome(self, tmp_path: Path) -> None:
+        assert _load_dependency_cache(tmp_path) is None
+        (tmp_path / DEPENDENCY_CACHE_FILE).write_text('{"status": "miss", "seconds": 3.0}', encoding="utf-8")
+        assert _load_dependency_cache(tmp_path) == {"status": "miss", "seconds": 3.0}
@@ -0,0 +1,177 @@
+"""Tests for the Docker health waiter and compose log capture.
+
+Tests cover:
+- All published ports are probed concurrently; a port that hangs does not delay a healthy one
+- Once one port is healthy the others get a short grace period for their own time-to-healthy
+- A port that never answers (no health endpoint) does not hold the wait to the full budget
+- Per-port time-to-healthy, with exponential backoff while a service starts
+- Timeouts when no port becomes healthy
+- run_docker reports time-to-healthy metrics and streams compose logs to disk
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import http.server
+import socket
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cihub.core.ci_runner import docker_tools, shared
+
+
+class _HealthHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        server: Any = self.server
+        server.hits += 1
+        status = 200 if time.monotonic() >= server.healthy_at else 503
+        self.send_response(status)
+        self.end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - http.server signature
+        return
+
+
+def _serve(healthy_after: float = 0.0) -> Any:
+    server: Any = http.server.ThreadingHTTPServer(("localhost", 0), _HealthHandler)
+    server.daemon_threads = True
+    server.hits = 0
+    server.healthy_at = time.monotonic() + healthy_after
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture()
+def servers() -> Iterator[list[Any]]:
+    started: list[Any] = []
+    yield started
+    for server in started:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture()
+def stuck_port() -> Iterator[int]:
+    """A port that accepts connections but never answers."""
+    sock = socket.socket()
+    sock.bind(("localhost", 0))
+    sock.listen(8)
+    yield sock.getsockname()[1]
+    sock.close()
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(docker_tools, "HEALTH_CHECK_INITIAL_DELAY_SECONDS", 0.05)
+    monkeypatch.setattr(docker_tools, "HEALTH_CHECK_INTERVAL_SECONDS", 0.4)
+    monkeypatch.setattr(docker_tools, "HEALTH_CHECK_HTTP_TIMEOUT_SECONDS", 3)
+    monkeypatch.setattr(docker_tools, "HEALTH_CHECK_GRACE_SECONDS", 1.5)
+
+
+class TestWaitForPorts:
+    def test_stuck_port_does_not_delay_healthy_port(self, servers: list[Any], stuck_port: int) -> None:
+        servers.append(_serve())
+        healthy_port = servers[0].server_address[1]
+
+        start = time.monotonic()
+        times = docker_tools._wait_for_ports([stuck_port, healthy_port], "/health", 1.5)
+        elapsed = time.monotonic() - start
+
+        assert times[stuck_port] is None
+        # Sequential probing would spend the full HTTP timeout on the stuck port first
+        assert times[healthy_port] is not None and times[healthy_port] < 1
+        # The stuck probe is cut off at the budget, not the longer HTTP timeout
+        assert elapsed < docker_tools.HEALTH_CHECK_HTTP_TIMEOUT_SECONDS
+
+    def test_every_port_gets_its_own_time(self, servers: list[Any]) -> None:
+        servers.extend([_serve(), _serve(healthy_after=0.6)])
+        fast, slow = (server.server_address[1] for server in servers)
+
+        start = time.monotonic()
+        times = docker_tools._wait_for_ports([fast, slow], "/health", 10)
+
+        assert times[fast] is not None and times[fast] < 0.5
+        assert times[slow] is not None and 0.6 <= times[slow] < 2
+        # Returns once both are healthy rather than waiting out the budget
+        assert time.monotonic() - start < 3
+
+    def test_dead_port_only_gets_grace_period(self, servers: list[Any]) -> None:
+        servers.append(_serve())
+        healthy = servers[0].server_address[1]
+        with socket.socket() as sock:
+            sock.bind(("localhost", 0))
+            dead = sock.getsockname()[1]
+
+        start = time.monotonic()
+        times = docker_tools._wait_for_ports([healthy, dead], "/health", 30)
+        elapsed = time.monotonic() - start
+
+        assert times[healthy] is not None and times[dead] is None
+        assert elapsed < docker_tools.HEALTH_CHECK_GRACE_SECONDS + 1
+
+    def test_time_to_healthy_with_backoff(self, servers: list[Any]) -> None:
+        servers.append(_serve(healthy_after=0.6))
+        port = servers[0].server_address[1]
+
+        times = docker_tools._wait_for_ports([port, port], "/health", 10)
+
+        assert list(times) == [port]
+        assert times[port] is not None and 0.6 <= times[port] < 2
+        # Backoff 0.05, 0.1, 0.2, 0.4, ... needs only a handful of probes to cover 0.6s
+        assert servers[0].hits <= 6
+
+    def test_timeout_without_healthy_port(self, servers: list[Any]) -> None:
+        servers.append(_serve(healthy_after=60))
+        port = servers[0].server_address[1]
+
+        start = time.monotonic()
+        assert docker_tools._wait_for_ports([port], "/health", 0.5) == {port: None}
+        assert time.monotonic() - start < 1.5
+        assert docker_tools._wait_for_health([port], "/health", 0) is False
+        assert docker_tools._wait_for_ports([], "/health", 5) == {}
+
+
+class TestRunDockerHealth:
+    def test_metrics_and_streamed_logs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "docker-compose.yml").write_text(
+            "services:\n  app:\n    ports: ['8080:80']\n  db:\n    ports: ['5432:5432']\n", encoding="utf-8"
+        )
+        output_dir = tmp_path / "out"
+        commands: list[list[str]] = []
+        run_to_file = shared._run_command_to_file
+
+        def fake_tool_command(tool: str, cmd: list[str], workdir: Path, out: Path, **_: Any) -> Any:
+            commands.append(cmd)
+            return shared.subprocess.CompletedProcess(cmd, 0, "", "")
+
+        # Stand in for `docker compose logs` with a process that writes a lot of output
+        def fake_logs(cmd: list[str], workdir: Path, log_path: Path, timeout: int | None = None) -> int:
+            script = "import sys\nfor i in range(20000): sys.stdout.write(f'app-1 | line {i}\\n')"
+            return run_to_file([sys.executable, "-c", script], workdir, log_path)
+
+        monkeypatch.setattr(docker_tools, "_resolve_docker_compose_command", lambda: ["docker", "compose"])
+        monkeypatch.setattr(shared, "_run_tool_command", fake_tool_command)
+        monkeypatch.setattr(shared, "_run_command_to_file", fake_logs)
+        monkeypatch.setattr(docker_tools, "_wait_for_ports", lambda ports, endpoint, timeout: {8080: 4.2, 5432: None})
+
+        result = docker_tools.run_docker(tmp_path, output_dir, health_endpoint="health")
+
+        assert result.success is True
+        assert result.metrics["docker_time_to_healthy_seconds"] == 4.2
+        assert result.metrics["docker_port_time_to_healthy"] == {"8080": 4.2, "5432": None}
+        log_lines = (output_dir / "docker-compose.log").read_text(encoding="utf-8").splitlines()
+        assert len(log_lines) == 20000 and log_lines[-1] == "app-1 | line 19999"
+        assert [cmd[-2:] for cmd in commands] == [["up", "-d"], ["down", "--remove-orphans"]]
+
+    def test_missing_logs_command_is_recorded(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "docker-compose.log"
+        code = shared._run_command_to_file(["cihub-no-such-binary"], tmp_path, log_path)
+        assert code == 127
+        assert log_path.read_text(encoding="utf-8")
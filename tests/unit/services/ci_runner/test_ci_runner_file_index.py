@@ -0,0 +1,112 @@
+"""Tests for the report discovery index (cihub/core/ci_runner/file_index.py).
+
+Tests cover:
+- Lookups return what Path.rglob returns for the runners' report patterns
+- Pruned directories (node_modules, .git, ...) are never searched
+- Repeated lookups on an unchanged tree list no directory again
+- Files and directories a tool adds or removes later are picked up by re-listing only what changed
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from cihub.core.ci_runner import file_index as file_index_module
+from cihub.core.ci_runner.file_index import FileIndex, matches
+from cihub.core.ci_runner.shared import _find_files
+
+RUNNER_PATTERNS = [
+    ["target/surefire-reports/*.xml", "target/failsafe-reports/*.xml", "build/test-results/test/*.xml"],
+    ["target/site/jacoco/jacoco.xml", "build/reports/jacoco/test/jacocoTestReport.xml"],
+    ["target/pit-reports/**/mutations.xml", "build/reports/pitest/mutations.xml"],
+    ["checkstyle-result.xml", "target/checkstyle-result.xml", "build/reports/checkstyle/*.xml"],
+    ["spotbugsXml.xml", "target/spotbugsXml.xml", "build/reports/spotbugs/*.xml"],
+    ["pmd.xml", "target/pmd.xml", "build/reports/pmd/main.xml", "build/reports/pmd/*.xml"],
+    ["dependency-check-report.json", "target/dependency-check-report.json"],
+    ["*.xml", "**/*.json"],
+]
+
+
+def _touch(root: Path, rel: str) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("<x/>", encoding="utf-8")
+
+
+@pytest.fixture()
+def build_tree(tmp_path: Path) -> Path:
+    for module in ("core", "api", "web/ui"):
+        _touch(tmp_path, f"{module}/target/surefire-reports/TEST-{module.replace('/', '-')}.xml")
+        _touch(tmp_path, f"{module}/target/site/jacoco/jacoco.xml")
+        _touch(tmp_path, f"{module}/target/pit-reports/202401011200/mutations.xml")
+        _touch(tmp_path, f"{module}/target/checkstyle-result.xml")
+        _touch(tmp_path, f"{module}/target/classes/com/acme/App.class")
+    _touch(tmp_path, "lib/build/test-results/test/TEST-lib.xml")
+    _touch(tmp_path, "lib/build/reports/pmd/main.xml")
+    _touch(tmp_path, "lib/build/reports/spotbugs/main.xml")
+    _touch(tmp_path, "target/dependency-check-report.json")
+    _touch(tmp_path, "pom.xml")
+    return tmp_path
+
+
+def _age_tree(root: Path) -> None:
+    """Give every directory an old mtime, like a build tree finished minutes ago."""
+    for dirpath, _dirnames, _filenames in os.walk(root):
+        os.utime(dirpath, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+
+
+class TestMatchesRglob:
+    @pytest.mark.parametrize("patterns", RUNNER_PATTERNS)
+    def test_same_results_as_rglob(self, build_tree: Path, patterns: list[str]) -> None:
+        expected = sorted({path.resolve() for pattern in patterns for path in build_tree.rglob(pattern)}, key=str)
+        assert FileIndex(build_tree).find(patterns) == expected
+
+    def test_segment_wildcards_do_not_cross_directories(self) -> None:
+        assert matches("a/target/pmd.xml", "target/*.xml")
+        assert not matches("target/sub/pmd.xml", "target/*.xml")
+        assert matches("m/target/pit-reports/x/y/mutations.xml", "target/pit-reports/**/mutations.xml")
+        assert matches("target/pit-reports/mutations.xml", "target/pit-reports/**/mutations.xml")
+
+    def test_pruned_directories_are_skipped(self, build_tree: Path) -> None:
+        _touch(build_tree, "node_modules/pkg/target/pmd.xml")
+        _touch(build_tree, ".git/pmd.xml")
+        assert [path.parent.name for path in _find_files(build_tree, ["pmd.xml", "target/pmd.xml"])] == []
+
+
+class TestIncrementalRefresh:
+    def test_unchanged_tree_is_listed_once(self, build_tree: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(file_index_module, "RACY_WINDOW_NS", 0)
+        _age_tree(build_tree)
+        index = FileIndex(build_tree)
+        index.find(RUNNER_PATTERNS[0])
+        first_walk = index.scans
+
+        for patterns in RUNNER_PATTERNS:
+            index.find(patterns)
+        assert index.scans == first_walk
+
+    def test_new_and_removed_outputs_are_picked_up(self, build_tree: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(file_index_module, "RACY_WINDOW_NS", 0)
+        _age_tree(build_tree)
+        index = FileIndex(build_tree)
+        assert index.find(["pmd.xml", "target/pmd.xml"]) == []
+        walked = index.scans
+
+        _touch(build_tree, "core/target/pmd.xml")  # new file in an existing directory
+        _touch(build_tree, "api/target/pit-reports/202402/mutations.xml")  # new directory
+        (build_tree / "web" / "ui" / "target" / "pit-reports" / "202401011200" / "mutations.xml").unlink()
+
+        assert index.find(["target/pmd.xml"]) == [(build_tree / "core" / "target" / "pmd.xml").resolve()]
+        mutations = index.find(["target/pit-reports/**/mutations.xml"])
+        assert {path.parent.name for path in mutations} == {"202401011200", "202402"}
+        assert len(mutations) == 3
+        # Only the touched directories were listed again
+        assert index.scans - walked <= 5
+
+    def test_shared_index_per_workdir(self, build_tree: Path) -> None:
+        assert file_index_module.file_index(build_tree) is file_index_module.file_index(build_tree / ".")
@@ -342,12 +342,16 @@ class TestRunDocker:
         (tmp_path / "docker-compose.yml").write_text("services: {}\n")
 
         mock_up = MagicMock(returncode=0, stdout="up", stderr="")
-        mock_logs = MagicMock(returncode=0, stdout="logs", stderr="")
         mock_down = MagicMock(returncode=0, stdout="down", stderr="")
 
+        def fake_logs(cmd: list[str], workdir: Path, log_path: Path, timeout: int | None = None) -> int:
+            log_path.write_text("logs", encoding="utf-8")
+            return 0
+
         with patch("cihub.core.ci_runner.shared.resolve_executable", return_value="docker"):
-            with patch("cihub.core.ci_runner.shared._run_command", side_effect=[mock_up, mock_logs, mock_down]):
-                result = run_docker(tmp_path, output_dir, compose_file="docker-compose.yml")
+            with patch("cihub.core.ci_runner.shared._run_command", side_effect=[mock_up, mock_down]):
+                with patch("cihub.core.ci_runner.shared._run_command_to_file", side_effect=fake_logs):
+                    result = run_docker(tmp_path, output_dir, compose_file="docker-compose.yml")
 
         assert result.tool == "docker"
         assert result.ran is True
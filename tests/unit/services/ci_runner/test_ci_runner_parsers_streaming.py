@@ -0,0 +1,224 @@
+"""Parity tests for the streaming XML report parsers.
+
+Tests cover:
+- Streaming parsers give the same metrics as whole-document parsing (the
+  previous implementation, kept here as the reference) for JUnit, Cobertura,
+  JaCoCo, PITest, Checkstyle, SpotBugs and PMD reports, including malformed files
+- Worker-process parsing of large report sets matches inline parsing
+- Memory stays bounded on a large PITest report
+- Entity declarations are still rejected
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import tracemalloc
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import defusedxml.ElementTree as ET
+import pytest
+
+from cihub.core.ci_runner import parsers
+from cihub.utils.parallel import process_map
+
+JUNIT_DOCS = {
+    "suite.xml": '<testsuite tests="5" failures="1" errors="1" skipped="1" time="1.5"><testcase name="a"/></testsuite>',
+    "suites.xml": (
+        "<testsuites>"
+        '<testsuite tests="4" failures="1" errors="0" skipped="0" time="0.25">'
+        '<testsuite tests="99" failures="9"/>'  # nested suites are not counted
+        "</testsuite>"
+        '<testsuite tests="3" failures="0" errors="1" skipped="2" time="2"/>'
+        "</testsuites>"
+    ),
+    "empty.xml": "<testsuites/>",
+    "broken.xml": '<testsuite tests="3"><testcase>',
+}
+
+COBERTURA_DOCS = {
+    "coverage.xml": '<coverage line-rate="0.8547" lines-covered="1000" lines-valid="1170"><packages/></coverage>',
+    "total.xml": '<coverage line-rate="0.5" lines-covered="5" lines-total="10"/>',
+    "broken.xml": '<coverage line-rate="0.5"><packages>',
+}
+
+JACOCO_DOCS = {
+    "a.xml": (
+        '<report name="a"><package name="p"><class name="C">'
+        '<counter type="LINE" missed="2" covered="8"/><counter type="BRANCH" missed="1" covered="1"/>'
+        '</class><counter type="LINE" missed="2" covered="8"/></package>'
+        '<counter type="LINE" missed="2" covered="8"/></report>'
+    ),
+    "b.xml": '<report><counter type="LINE" missed="10" covered="30"/></report>',
+    "broken.xml": '<report><counter type="LINE" missed="1" covered="1"/>',
+}
+
+PITEST_DOCS = {
+    "m1.xml": (
+        "<mutations>"
+        + '<mutation status="KILLED"><x/></mutation>' * 7
+        + '<mutation status="SURVIVED"/>' * 2
+        + '<mutation status="NO_COVERAGE"/><mutation status="TIMED_OUT"/>'
+        + "</mutations>"
+    ),
+    "m2.xml": '<mutations><mutation status="KILLED"/></mutations>',
+    "broken.xml": '<mutations><mutation status="KILLED"/>',
+}
+
+STATIC_DOCS = {
+    "checkstyle.xml": '<checkstyle><file name="A"><error line="1"/><error line="2"/></file><file/></checkstyle>',
+    "spotbugs.xml": "<BugCollection><BugInstance/><BugInstance><BugInstance/></BugInstance></BugCollection>",
+    "pmd.xml": "<pmd><file><violation/><violation/><violation/></file></pmd>",
+    "broken.xml": "<pmd><violation/>",
+}
+
+
+def _write(tmp_path: Path, docs: dict[str, str]) -> list[Path]:
+    paths = []
+    for name, text in docs.items():
+        path = tmp_path / name
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+# Reference: the whole-document implementation the streaming parsers replaced.
+def _dom_junit(path: Path) -> dict[str, Any]:
+    try:
+        root = ET.parse(path).getroot()
+    except ET.ParseError:
+        return {"tests_passed": 0, "tests_failed": 0, "tests_skipped": 0, "tests_runtime_seconds": 0.0}
+    suites = list(root) if root.tag.endswith("testsuites") else [root]
+    tests = sum(int(s.attrib.get("tests", 0)) for s in suites)
+    failed = sum(int(s.attrib.get("failures", 0)) + int(s.attrib.get("errors", 0)) for s in suites)
+    skipped = sum(int(s.attrib.get("skipped", 0)) for s in suites)
+    return {
+        "tests_passed": max(tests - failed - skipped, 0),
+        "tests_failed": failed,
+        "tests_skipped": skipped,
+        "tests_runtime_seconds": sum(float(s.attrib.get("time", 0.0)) for s in suites),
+    }
+
+
+def _dom_coverage(path: Path) -> dict[str, Any]:
+    try:
+        root = ET.parse(path).getroot()
+    except ET.ParseError:
+        return {"coverage": 0, "coverage_lines_covered": 0, "coverage_lines_total": 0}
+    return {
+        "coverage": int(round(float(root.attrib.get("line-rate", 0)) * 100)),
+        "coverage_lines_covered": int(root.attrib.get("lines-covered", 0)),
+        "coverage_lines_total": int(root.attrib.get("lines-valid", root.attrib.get("lines-total", 0))),
+    }
+
+
+def _dom_roots(paths: list[Path]) -> list[Any]:
+    roots = []
+    for path in paths:
+        try:
+            roots.append(ET.parse(path).getroot())
+        except ET.ParseError:
+            continue
+    return roots
+
+
+def _dom_jacoco(paths: list[Path]) -> dict[str, Any]:
+    counters = [c for root in _dom_roots(paths) for c in root.iter("counter") if c.attrib.get("type") == "LINE"]
+    covered = sum(int(c.attrib.get("covered", 0)) for c in counters)
+    total = covered + sum(int(c.attrib.get("missed", 0)) for c in counters)
+    return {
+        "coverage": int(round((covered / total) * 100)) if total else 0,
+        "coverage_lines_covered": covered,
+        "coverage_lines_total": total,
+    }
+
+
+def _dom_pitest(paths: list[Path]) -> dict[str, Any]:
+    statuses = [m.attrib.get("status") for root in _dom_roots(paths) for m in root.iter("mutation")]
+    killed = statuses.count("KILLED")
+    survived = statuses.count("SURVIVED")
+    total = killed + survived + statuses.count("NO_COVERAGE")
+    return {
+        "mutation_score": int(round((killed / total) * 100)) if total else 0,
+        "mutation_killed": killed,
+        "mutation_survived": survived,
+    }
+
+
+def _dom_count(tag: str, paths: list[Path]) -> int:
+    return sum(len(list(root.iter(tag))) for root in _dom_roots(paths))
+
+
+class TestStreamingParity:
+    def test_junit(self, tmp_path: Path) -> None:
+        paths = _write(tmp_path, JUNIT_DOCS)
+        for path in paths:
+            assert parsers._parse_junit(path) == _dom_junit(path), path.name
+        expected = [_dom_junit(path) for path in paths]
+        totals = parsers._parse_junit_files(paths)
+        assert totals["tests_passed"] == sum(e["tests_passed"] for e in expected)
+        assert totals["tests_failed"] == sum(e["tests_failed"] for e in expected)
+        assert totals["tests_runtime_seconds"] == pytest.approx(sum(e["tests_runtime_seconds"] for e in expected))
+
+    def test_cobertura(self, tmp_path: Path) -> None:
+        for path in _write(tmp_path, COBERTURA_DOCS):
+            assert parsers._parse_coverage(path) == _dom_coverage(path), path.name
+
+    def test_jacoco_and_pitest(self, tmp_path: Path) -> None:
+        jacoco = _write(tmp_path, JACOCO_DOCS)
+        assert parsers._parse_jacoco_files(jacoco) == _dom_jacoco(jacoco)
+        (tmp_path / "pit").mkdir()
+        pitest = _write(tmp_path / "pit", PITEST_DOCS)
+        assert parsers._parse_pitest_files(pitest) == _dom_pitest(pitest)
+
+    def test_static_analysis(self, tmp_path: Path) -> None:
+        paths = _write(tmp_path, STATIC_DOCS)
+        assert parsers._parse_checkstyle_files(paths) == {"checkstyle_issues": _dom_count("error", paths)}
+        assert parsers._parse_spotbugs_files(paths) == {"spotbugs_issues": _dom_count("BugInstance", paths)}
+        assert parsers._parse_pmd_files(paths) == {"pmd_violations": _dom_count("violation", paths)}
+
+    def test_worker_processes_match_inline(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        jacoco = _write(tmp_path, JACOCO_DOCS)
+        inline = parsers._parse_jacoco_files(jacoco)
+        monkeypatch.setattr(parsers, "PARALLEL_MIN_XML_BYTES", 0)
+        monkeypatch.setattr(parsers, "process_map", partial(process_map, max_workers=2))
+        assert parsers._parse_jacoco_files(jacoco) == inline
+        assert parsers._parse_pmd_files(_write(tmp_path, STATIC_DOCS))["pmd_violations"] == 3
+
+
+class TestBoundedMemory:
+    def test_large_pitest_report(self, tmp_path: Path) -> None:
+        path = tmp_path / "mutations.xml"
+        mutation = (
+            '<mutation detected="true" status="KILLED"><sourceFile>A.java</sourceFile>'
+            "<mutatedClass>com.acme.A</mutatedClass><mutatedMethod>run</mutatedMethod>"
+            "<description>replaced return value</description></mutation>"
+        )
+        with path.open("w", encoding="utf-8") as handle:
+            handle.write("<mutations>")
+            for _ in range(10):
+                handle.write(mutation * 1000)
+            handle.write("</mutations>")
+
+        tracemalloc.start()
+        try:
+            result = parsers._parse_pitest_files([path])
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert result["mutation_killed"] == 10_000
+        # A whole-document parse of this 2 MB file peaks near 10 MB
+        assert peak < 1024 * 1024
+
+
+def test_entities_still_forbidden(tmp_path: Path) -> None:
+    path = tmp_path / "evil.xml"
+    path.write_text(
+        '<?xml version="1.0"?><!DOCTYPE r [<!ENTITY a "aaaa">]><report><counter type="LINE" covered="&a;"/></report>',
+        encoding="utf-8",
+    )
+    with pytest.raises(ValueError):
+        parsers._parse_jacoco_files([path])
@@ -0,0 +1,277 @@
+"""Tests for the host-level security data cache (cihub/core/ci_runner/security_cache.py).
+
+Tests cover:
+- A fresh copy is reused without downloading; a stale or missing one is refreshed once
+- A failed refresh falls back to the previous copy, or to an uncached run
+- Offline mode never downloads and fails fast when the copy is too old
+- The refresh lock is broken only when its holder died or stopped its heartbeat
+- The default root is the private per-user cache; an unsafe one turns the cache off
+- trivy and OWASP (Maven) scan against the shared copy with their updates off; semgrep keeps --config=auto
+- trivy keeps its own scan cache in memory rather than in the shared directory
+- The outcome lands in report environment.security_db and validates
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cihub.core.ci_report import RunContext, build_python_report
+from cihub.core.ci_runner import java_tools, security_cache, security_tools, shared
+from cihub.core.ci_runner.security_cache import STAMP_NAME, prepare_security_db
+from cihub.services.report_validator import validate_against_schema
+
+
+def _use_cache(monkeypatch: pytest.MonkeyPatch, root: Path, **env: str) -> None:
+    monkeypatch.setenv("CIHUB_SECURITY_CACHE_DIR", str(root))
+    for name in ("CIHUB_OFFLINE", "CIHUB_SECURITY_DB_MAX_AGE_HOURS", "CIHUB_SECURITY_DB_OFFLINE_MAX_AGE_HOURS"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+
+def _seed(root: Path, tool: str, artifact: str, age_hours: float) -> None:
+    path = root / tool
+    (path / artifact).parent.mkdir(parents=True, exist_ok=True)
+    (path / artifact).write_text("data", encoding="utf-8")
+    stamp = path / STAMP_NAME
+    stamp.write_text("", encoding="utf-8")
+    then = time.time() - age_hours * 3600
+    os.utime(stamp, (then, then))
+
+
+class _Populate:
+    def __init__(self, artifact: str = "db.bin", ok: bool = True) -> None:
+        self.artifact = artifact
+        self.ok = ok
+        self.calls = 0
+
+    def __call__(self, path: Path) -> bool:
+        self.calls += 1
+        if self.ok:
+            (path / self.artifact).write_text("fresh", encoding="utf-8")
+        return self.ok
+
+
+class TestPrepare:
+    def test_disabled_by_env(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        _use_cache(monkeypatch, tmp_path, CIHUB_SECURITY_CACHE="false")
+        populate = _Populate()
+        assert prepare_security_db("trivy", "db.bin", populate).status == "disabled"
+        assert populate.calls == 0
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_default_root_is_private_user_cache(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.delenv("CIHUB_SECURITY_CACHE_DIR", raising=False)
+        monkeypatch.delenv("CIHUB_SECURITY_CACHE", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        policy = security_cache.security_db_policy()
+        assert policy is not None and policy.root == tmp_path / "cihub" / "security"
+
+        policy.root.chmod(0o777)
+        assert security_cache.security_db_policy() is None
+
+    def test_missing_then_fresh(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        _use_cache(monkeypatch, tmp_path)
+        populate = _Populate()
+
+        first = prepare_security_db("trivy", "db.bin", populate)
+        second = prepare_security_db("trivy", "db.bin", populate)
+
+        assert (first.status, second.status) == ("miss", "hit")
+        assert populate.calls == 1
+        assert second.usable and second.path == tmp_path / "trivy"
+        assert second.age_hours is not None and second.age_hours < 0.1
+        assert not (tmp_path / "trivy.lock").exists()
+
+    def test_stale_copy_refreshed_or_kept(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        _use_cache(monkeypatch, tmp_path, CIHUB_SECURITY_DB_MAX_AGE_HOURS="12")
+        _seed(tmp_path, "semgrep", "db.bin", age_hours=20)
+
+        failed = prepare_security_db("semgrep", "db.bin", _Populate(ok=False))
+        assert failed.status == "stale" and failed.usable
+        assert failed.metrics()["age_hours"] == pytest.approx(20, abs=0.01)
+
+        assert prepare_security_db("semgrep", "db.bin", _Populate()).status == "miss"
+
+    def test_no_copy_and_no_download_runs_uncached(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        _use_cache(monkeypatch, tmp_path)
+        assert prepare_security_db("owasp", "db.bin", _Populate(ok=False)).status == "bypass"
+        db = prepare_security_db("owasp", "db.bin", _Populate(), can_populate=False)
+        assert db.status == "bypass" and not db.usable
+
+    def test_offline(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        _use_cache(monkeypatch, tmp_path, CIHUB_OFFLINE="true", CIHUB_SECURITY_DB_OFFLINE_MAX_AGE_HOURS="48")
+        populate = _Populate()
+
+        assert prepare_security_db("trivy", "db.bin", populate).status == "unavailable"
+        _seed(tmp_path, "trivy", "db.bin", age_hours=30)
+        db = prepare_security_db("trivy", "db.bin", populate)
+        assert (db.status, db.offline, db.usable) == ("stale", True, True)
+        _seed(tmp_path, "trivy", "db.bin", age_hours=72)
+        assert prepare_security_db("trivy", "db.bin", populate).status == "unavailable"
+        assert populate.calls == 0
+
+
+def _hold_lock(tmp_path: Path, pid: int, host: str, heartbeat_age: float) -> Path:
+    lock = tmp_path / "trivy.lock"
+    lock.mkdir()
+    owner = lock / security_cache.LOCK_OWNER_FILE
+    owner.write_text(f"{pid} {host}", encoding="utf-8")
+    then = time.time() - heartbeat_age
+    os.utime(owner, (then, then))
+    os.utime(lock, (then - 7200, then - 7200))
+    return lock
+
+
+class TestLock:
+    def test_long_refresh_with_live_holder_is_kept(self, tmp_path: Path) -> None:
+        # Lock taken two hours ago, but its holder is alive and still beating
+        lock = _hold_lock(tmp_path, os.getpid(), socket.gethostname(), heartbeat_age=5)
+        assert security_cache._lock_is_stale(lock) is False
+
+    def test_dead_holder_on_this_host_is_broken(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        finished = subprocess.run(
+            [sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True
+        )
+        lock = _hold_lock(tmp_path, int(finished.stdout), socket.gethostname(), heartbeat_age=5)
+        monkeypatch.setattr(security_cache, "LOCK_POLL_SECONDS", 0.01)
+        _use_cache(monkeypatch, tmp_path)
+
+        assert security_cache._lock_is_stale(lock) is True
+        assert prepare_security_db("trivy", "db.bin", _Populate()).status == "miss"
+        assert [path.name for path in tmp_path.iterdir() if "lock" in path.name] == []
+
+    def test_other_host_falls_back_to_heartbeat(self, tmp_path: Path) -> None:
+        lock = _hold_lock(tmp_path, 1, "elsewhere", heartbeat_age=security_cache.LOCK_STALE_SECONDS + 60)
+        assert security_cache._lock_is_stale(lock) is True
+
+    def test_holder_keeps_heartbeat(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(security_cache, "LOCK_HEARTBEAT_SECONDS", 0.02)
+        lock = tmp_path / "trivy.lock"
+        owner = lock / security_cache.LOCK_OWNER_FILE
+        with security_cache._populate_lock(tmp_path / "trivy"):
+            assert owner.read_text(encoding="utf-8") == f"{os.getpid()} {socket.gethostname()}"
+            os.utime(owner, (0, 0))
+            deadline = time.monotonic() + 5
+            while owner.stat().st_mtime == 0 and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert time.time() - owner.stat().st_mtime < 60
+        assert not lock.exists()
+        assert not any(thread.name == "cihub-lock-heartbeat" for thread in threading.enumerate())
+
+
+def _capture(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    commands: list[list[str]] = []
+
+    def fake_run(tool: str, cmd: list[str], workdir: Path, output_dir: Path, **_: Any) -> Any:
+        commands.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(shared, "_run_tool_command", fake_run)
+    return commands
+
+
+class TestScanners:
+    def test_trivy_scans_shared_db(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        _use_cache(monkeypatch, tmp_path / "cache")
+        _seed(tmp_path / "cache", "trivy", security_tools.TRIVY_DB_FILE, age_hours=1)
+        commands = _capture(monkeypatch)
+
+        result = security_tools.run_trivy(tmp_path, tmp_path / "out")
+
+        assert commands == [
+            [
+                "trivy",
+                "fs",
+                "--cache-dir",
+                str(tmp_path / "cache" / "trivy"),
+                "--cache-backend",
+                "memory",
+                "--skip-db-update",
+                "--format",
+                "json",
+                "--output",
+                str(tmp_path / "out" / "trivy-report.json"),
+                ".",
+            ]
+        ]
+        assert result.metrics["security_db"]["status"] == "hit"
+
+    def test_semgrep_keeps_registry_config(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        _use_cache(monkeypatch, tmp_path / "cache")
+        commands = _capture(monkeypatch)
+
+        result = security_tools.run_semgrep(tmp_path, tmp_path / "out")
+
+        assert commands[0][:2] == ["semgrep", "--config=auto"]
+        assert "security_db" not in result.metrics
+        assert not (tmp_path / "cache" / "semgrep").exists()
+
+    def test_owasp_refreshes_once_then_reads(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        _use_cache(monkeypatch, tmp_path / "cache")
+        monkeypatch.setenv("NVD_API_KEY", "key")
+        (tmp_path / "out").mkdir()
+        commands: list[list[str]] = []
+
+        def fake_run(tool: str, cmd: list[str], workdir: Path, output_dir: Path, **_: Any) -> Any:
+            commands.append(cmd)
+            data_dir = next((arg.split("=", 1)[1] for arg in cmd if arg.startswith("-DdataDirectory=")), None)
+            if "org.owasp:dependency-check-maven:update-only" in cmd and data_dir:
+                (Path(data_dir) / java_tools.OWASP_DB_FILE).write_text("h2", encoding="utf-8")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        monkeypatch.setattr(shared, "_run_tool_command", fake_run)
+
+        first = java_tools.run_owasp(tmp_path, tmp_path / "out", "maven", use_nvd_api_key=True)
+        second = java_tools.run_owasp(tmp_path, tmp_path / "out", "maven", use_nvd_api_key=True)
+
+        data_dir = tmp_path / "cache" / "owasp"
+        goals = [cmd[3] for cmd in commands]
+        assert goals == [
+            "org.owasp:dependency-check-maven:update-only",
+            "org.owasp:dependency-check-maven:check",
+            "org.owasp:dependency-check-maven:check",
+        ]
+        for cmd in commands[1:]:
+            assert f"-DdataDirectory={data_dir}" in cmd and "-DautoUpdate=false" in cmd
+        assert (first.metrics["security_db"]["status"], second.metrics["security_db"]["status"]) == ("miss", "hit")
+
+
+class TestReportField:
+    def test_outcomes_in_environment(self) -> None:
+        context = RunContext(
+            repository="acme/app",
+            branch="main",
+            run_id=None,
+            run_number=None,
+            commit="a" * 40,
+            correlation_id=None,
+            workflow_ref=None,
+            workdir=".",
+            build_tool=None,
+            retention_days=None,
+            project_type=None,
+            docker_compose_file=None,
+            docker_health_endpoint=None,
+        )
+        tool_results = {
+            "trivy": {"metrics": {"trivy_critical": 0, "security_db": {"status": "hit", "age_hours": 3.5}}},
+            "ruff": {"metrics": {"ruff_errors": 0}},
+        }
+        flags = {"ruff": True, "trivy": True}
+        report = build_python_report({}, tool_results, flags, flags, flags, {}, context)
+
+        assert report["environment"]["security_db"] == {"trivy": {"status": "hit", "age_hours": 3.5}}
+        assert validate_against_schema(report) == []
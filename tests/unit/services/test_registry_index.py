@@ -0,0 +1,143 @@
+"""Tests for indexed registry access (cihub/services/registry/index.py).
+
+Tests cover:
+- Tier/language/tool indexes and lazy entries agree with list_repos()
+- Mutations are journaled and saved with an atomic replace (no-op when unchanged)
+- Bulk tool enable/disable never computes effective thresholds
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cihub.services.registry_service import RegistryIndex, list_repos, load_registry
+
+
+def _registry(count: int = 12) -> dict[str, Any]:
+    repos: dict[str, Any] = {}
+    for i in range(count):
+        language = "python" if i % 2 else "java"
+        tool = "ruff" if language == "python" else "checkstyle"
+        repos[f"repo-{i:03d}"] = {
+            "tier": ["standard", "strict"][i % 2 if i % 3 else 0],
+            "config": {
+                "repo": {"owner": "acme", "name": f"repo-{i}", "language": language},
+                language: {"tools": {tool: {"enabled": bool(i % 4)}}},
+                "thresholds": {"coverage_min": 60 + i},
+            },
+            "overrides": {"max_high_vulns": i} if i % 3 == 0 else {},
+        }
+    repos["legacy"] = {"tier": "standard", "language": "python", "config": {}}
+    return {
+        "schema_version": "cihub-registry-v1",
+        "tiers": {"standard": {}, "strict": {"coverage_min": 90}},
+        "repos": repos,
+    }
+
+
+@pytest.fixture()
+def registry_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "config" / "registry.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps(_registry(), indent=2), encoding="utf-8")
+    monkeypatch.setattr("cihub.services.registry_service.hub_root", lambda: tmp_path)
+    return path
+
+
+class TestIndexes:
+    def test_entries_match_list_repos(self, registry_path: Path) -> None:
+        index = RegistryIndex.load()
+        expected = list_repos(load_registry())
+
+        assert index.names() == [repo["name"] for repo in expected]
+        assert [index.entry(name) for name in index.names()] == expected
+
+    def test_tier_and_language_indexes(self, registry_path: Path) -> None:
+        index = RegistryIndex.load()
+        repos = list_repos(load_registry())
+
+        for tier in ("standard", "strict", "missing"):
+            assert index.by_tier(tier) == [r["name"] for r in repos if r["tier"] == tier]
+        for language in ("python", "java"):
+            assert index.by_language(language) == [r["name"] for r in repos if r["language"] == language]
+
+    def test_tool_index(self, registry_path: Path) -> None:
+        index = RegistryIndex.load()
+        assert index.with_tool("ruff") == ["repo-001", "repo-003", "repo-005", "repo-007", "repo-009", "repo-011"]
+        assert index.with_tool("checkstyle", enabled=False) == ["repo-000", "repo-004", "repo-008"]
+        assert index.tool_enabled("legacy", "ruff") is None
+
+    def test_entries_are_lazy(self, registry_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[str] = []
+        import cihub.services.registry.index as index_module
+
+        original = index_module._repo_list_entry
+
+        def spy(name: str, config: dict[str, Any], tier_defaults: dict[str, Any]) -> dict[str, Any]:
+            calls.append(name)
+            return original(name, config, tier_defaults)
+
+        monkeypatch.setattr(index_module, "_repo_list_entry", spy)
+        index = RegistryIndex.load()
+        index.by_tier("strict")
+        index.entry("repo-002")
+        index.entry("repo-002")
+
+        assert calls == ["repo-002"]
+
+
+class TestMutations:
+    def test_journal_and_atomic_save(self, registry_path: Path) -> None:
+        index = RegistryIndex.load()
+        assert index.set_tool_enabled("repo-000", "checkstyle", True)
+        assert not index.set_tool_enabled("repo-001", "ruff", True)
+        assert [m.repo for m in index.journal] == ["repo-000"]
+        assert index.with_tool("checkstyle", enabled=False) == ["repo-004", "repo-008"]
+
+        assert index.save()
+        assert not index.journal
+        assert not list(registry_path.parent.glob("*.tmp"))
+        saved = registry_path.read_text(encoding="utf-8")
+        assert saved.endswith("}\n")
+        assert json.loads(saved)["repos"]["repo-000"]["config"]["java"]["tools"]["checkstyle"] == {"enabled": True}
+
+    def test_save_without_changes_is_noop(self, registry_path: Path) -> None:
+        before = registry_path.stat().st_mtime_ns
+        assert not RegistryIndex.load().save()
+        assert registry_path.stat().st_mtime_ns == before
+
+    def test_no_language_rejected(self, registry_path: Path) -> None:
+        index = RegistryIndex(
+            {"repos": {"bare": {"tier": "standard"}}}, registry_path=registry_path.parent / "other.json"
+        )
+        with pytest.raises(ValueError, match="no language"):
+            index.set_tool_enabled("bare", "ruff", True)
+
+
+class TestBulkToolCommands:
+    def test_enable_for_all_skips_threshold_computation(
+        self, registry_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from cihub.commands.tool_cmd import _disable_for_all_repos, _enable_for_all_repos
+
+        def fail(*_args: Any, **_kwargs: Any) -> None:
+            raise AssertionError("effective thresholds computed")
+
+        monkeypatch.setattr("cihub.services.registry.query._compute_all_effective_thresholds", fail)
+
+        result = _enable_for_all_repos("ruff")
+        assert result.data["updated"] == ["legacy", *[f"repo-{i:03d}" for i in range(1, 12, 2)]]
+        assert result.files_modified == [str(registry_path)]
+        assert RegistryIndex.load().with_tool("ruff") == result.data["updated"]
+
+        again = _enable_for_all_repos("ruff")
+        assert again.files_modified == []
+
+        _disable_for_all_repos("ruff")
+        assert RegistryIndex.load().with_tool("ruff") == []
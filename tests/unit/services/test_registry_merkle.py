@@ -0,0 +1,153 @@
+"""Tests for Merkle subtree digests and the persisted registry diff cache.
+
+Tests cover:
+- Digests ignore dict key order but not value types or list order
+- NaN and unknown leaf types never prove equality
+- Digest-assisted _diff_objects returns exactly what the plain walk returns
+- A repeated no-drift diff parses no config files and returns the same entries
+- Editing a config file or the registry invalidates the affected cache entries
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from cihub.services.registry import diff as diff_module
+from cihub.services.registry.merkle import DiffCache, TreeDigests
+from cihub.services.registry_service import _diff_objects, compute_diff, sync_to_configs
+
+_leaves = st.one_of(
+    st.none(),
+    st.booleans(),
+    st.integers(-3, 3),
+    st.floats(allow_nan=True, allow_infinity=False, width=16),
+    st.sampled_from(["a", "b", "1"]),
+)
+_keys = st.sampled_from(["a", "b", "c", "d"])
+_trees = st.recursive(
+    _leaves,
+    lambda children: st.one_of(st.lists(children, max_size=3), st.dictionaries(_keys, children, max_size=4)),
+    max_leaves=20,
+)
+
+
+class TestTreeDigests:
+    def test_dict_key_order_is_ignored(self) -> None:
+        digests = TreeDigests()
+        assert digests.same({"a": 1, "b": {"c": [1, 2]}}, {"b": {"c": [1, 2]}, "a": 1})
+
+    @pytest.mark.parametrize(
+        ("left", "right"),
+        [
+            ({"a": 1}, {"a": True}),
+            ({"a": 1}, {"a": 1.0}),
+            ({"a": "1"}, {"a": 1}),
+            ([1, 2], [2, 1]),
+            ([1], (1,)),
+            ({"a": {}}, {"a": []}),
+        ],
+    )
+    def test_types_and_list_order_matter(self, left: Any, right: Any) -> None:
+        assert not TreeDigests().same(left, right)
+
+    def test_nan_and_unknown_types_never_match(self) -> None:
+        nan = float("nan")
+        digests = TreeDigests()
+        assert digests.digest({"a": [nan]}) is None
+        assert not digests.same({"a": nan}, {"a": nan})
+        assert not digests.same({"a": object()}, {"a": object()})
+
+    @settings(max_examples=200, deadline=None)
+    @given(before=_trees, after=_trees)
+    def test_digest_diff_matches_plain_walk(self, before: Any, after: Any) -> None:
+        assert _diff_objects(before, after, digests=TreeDigests()) == _diff_objects(before, after)
+
+    @settings(max_examples=200, deadline=None)
+    @given(tree=st.dictionaries(_keys, _trees, max_size=4), key=_keys, value=_trees)
+    def test_digest_diff_matches_plain_walk_for_edits(self, tree: dict[str, Any], key: str, value: Any) -> None:
+        edited = copy.deepcopy(tree)
+        edited[key] = value
+        assert _diff_objects(tree, edited, digests=TreeDigests()) == _diff_objects(tree, edited)
+
+
+def _registry(coverage_min: int = 80) -> dict[str, Any]:
+    repos = {
+        f"repo-{i}": {
+            "tier": "standard",
+            "config": {"repo": {"owner": "acme", "name": f"repo-{i}", "language": "python"}},
+            "overrides": {"coverage_min": coverage_min},
+        }
+        for i in range(4)
+    }
+    return {"schema_version": "cihub-registry-v1", "tiers": {"standard": {}}, "repos": repos}
+
+
+@pytest.fixture()
+def configs_dir(tmp_path: Path) -> Path:
+    configs = tmp_path / "config" / "repos"
+    configs.mkdir(parents=True)
+    for i in range(4):
+        config = {"repo": {"owner": "acme", "name": f"repo-{i}", "language": "python"}, "language": "python"}
+        (configs / f"repo-{i}.yaml").write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+    # Bring every file in sync with the registry
+    sync_to_configs(_registry(), configs, dry_run=False, max_workers=1)
+    return configs
+
+
+@pytest.fixture()
+def parsed(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    calls: list[Path] = []
+    original = diff_module._load_config_file
+
+    def spy(config_path: Path) -> Any:
+        calls.append(config_path)
+        return original(config_path)
+
+    monkeypatch.setattr(diff_module, "_load_config_file", spy)
+    return calls
+
+
+class TestDiffCache:
+    def test_no_drift_rerun_parses_nothing(self, configs_dir: Path, tmp_path: Path, parsed: list[Path]) -> None:
+        cache_path = tmp_path / "cache.json"
+        uncached = compute_diff(_registry(), configs_dir, max_workers=1)
+        first = compute_diff(_registry(), configs_dir, max_workers=1, cache_path=cache_path)
+        parsed.clear()
+
+        second = compute_diff(_registry(), configs_dir, max_workers=1, cache_path=cache_path)
+
+        assert first == second == uncached
+        assert parsed == []
+        assert DiffCache.load(cache_path).files
+
+    def test_changes_invalidate_entries(self, configs_dir: Path, tmp_path: Path, parsed: list[Path]) -> None:
+        cache_path = tmp_path / "cache.json"
+        compute_diff(_registry(), configs_dir, max_workers=1, cache_path=cache_path)
+        edited = configs_dir / "repo-0.yaml"
+        edited.write_text(edited.read_text(encoding="utf-8").replace("coverage_min: 80", "coverage_min: 10"))
+        parsed.clear()
+
+        diffs = compute_diff(_registry(), configs_dir, max_workers=1, cache_path=cache_path)
+        assert parsed == [edited]
+        assert [(d["repo"], d["field"]) for d in diffs] == [("repo-0", "thresholds.coverage_min")]
+
+        # A registry change re-diffs every repo, from files or from cached keys
+        diffs = compute_diff(_registry(coverage_min=85), configs_dir, max_workers=1, cache_path=cache_path)
+        assert diffs == compute_diff(_registry(coverage_min=85), configs_dir, max_workers=1)
+        assert len(diffs) == 4
+
+    def test_corrupt_cache_is_ignored(self, configs_dir: Path, tmp_path: Path) -> None:
+        cache_path = tmp_path / "cache.json"
+        cache_path.write_text("{not json", encoding="utf-8")
+
+        assert compute_diff(_registry(), configs_dir, max_workers=1, cache_path=cache_path) == []
+        assert DiffCache.load(cache_path).files
@@ -0,0 +1,112 @@
+"""Tests for parallel registry sync/diff and the shared fragment cache.
+
+Tests cover:
+- Pooled sync/diff results equal serial results, in the same order
+- Pooled non-dry-run sync writes the same files as a serial sync
+- Identical config fragments are normalized once and returned as copies
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from cihub.services.registry import diff as diff_module
+from cihub.services.registry_service import compute_diff, sync_to_configs
+
+REPO_COUNT = 24
+
+
+def _registry() -> dict[str, Any]:
+    repos: dict[str, Any] = {}
+    for i in range(REPO_COUNT):
+        language = "python" if i % 2 else "java"
+        repos[f"repo-{i:02d}"] = {
+            "tier": "strict" if i % 3 == 0 else "standard",
+            "config": {
+                "repo": {"owner": "acme", "name": f"repo-{i:02d}", "language": language},
+                language: {"tools": {"ruff" if language == "python" else "checkstyle": bool(i % 4)}},
+            },
+            "overrides": {"coverage_min": 50 + i} if i % 5 == 0 else {},
+        }
+    return {
+        "schema_version": "cihub-registry-v1",
+        "tiers": {"standard": {}, "strict": {"config": {"thresholds": {"coverage_min": 90}}}},
+        "repos": repos,
+    }
+
+
+@pytest.fixture()
+def configs_dir(tmp_path: Path) -> Path:
+    configs = tmp_path / "config" / "repos"
+    configs.mkdir(parents=True)
+    # Every third repo has no file yet (would_create); one file is unparseable.
+    for i in range(REPO_COUNT):
+        if i % 3 == 2:
+            continue
+        language = "python" if i % 2 else "java"
+        config = {
+            "repo": {"owner": "acme", "name": f"repo-{i:02d}", "language": language},
+            "language": language,
+            "thresholds": {"coverage_min": 70},
+        }
+        (configs / f"repo-{i:02d}.yaml").write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+    (configs / "orphan.yaml").write_text("repo: [unclosed\n", encoding="utf-8")
+    return configs
+
+
+class TestParallelParity:
+    def test_diff_matches_serial(self, configs_dir: Path) -> None:
+        serial = compute_diff(_registry(), configs_dir, max_workers=1)
+        pooled = compute_diff(_registry(), configs_dir, max_workers=2)
+
+        assert pooled == serial
+        assert any(d["field"] == "config_file" and d["registry_value"] == "would_create" for d in serial)
+
+    def test_sync_writes_match_serial(self, configs_dir: Path, tmp_path: Path) -> None:
+        pooled_dir = tmp_path / "pooled"
+        shutil.copytree(configs_dir, pooled_dir)
+
+        serial = sync_to_configs(_registry(), configs_dir, dry_run=False, max_workers=1)
+        pooled = sync_to_configs(_registry(), pooled_dir, dry_run=False, max_workers=2)
+
+        assert pooled == serial
+        assert [change["repo"] for change in serial] == sorted(change["repo"] for change in serial)
+        for path in sorted(configs_dir.glob("*.yaml")):
+            assert (pooled_dir / path.name).read_text(encoding="utf-8") == path.read_text(encoding="utf-8")
+
+
+class TestFragmentCache:
+    def test_identical_fragments_normalized_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[dict[str, Any]] = []
+        original = diff_module._normalize_config_fragment_uncached
+
+        def spy(fragment: dict[str, Any]) -> dict[str, Any]:
+            calls.append(fragment)
+            return original(fragment)
+
+        monkeypatch.setattr(diff_module, "_normalize_config_fragment_uncached", spy)
+        monkeypatch.setattr(diff_module, "_FRAGMENT_CACHE", {})
+
+        fragment = {"python": {"tools": {"ruff": True}}}
+        first = diff_module._normalize_config_fragment(fragment)
+        second = diff_module._normalize_config_fragment({"python": {"tools": {"ruff": True}}})
+
+        assert len(calls) == 1
+        assert first == second == {"python": {"tools": {"ruff": {"enabled": True}}}}
+        first["python"]["tools"]["ruff"]["enabled"] = False
+        assert diff_module._normalize_config_fragment(fragment)["python"]["tools"]["ruff"]["enabled"] is True
+
+    def test_value_types_are_distinct_keys(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(diff_module, "_FRAGMENT_CACHE", {})
+        as_int = diff_module._normalize_config_fragment({"thresholds": {"coverage_min": 1}})
+        as_bool = diff_module._normalize_config_fragment({"thresholds": {"coverage_min": True}})
+
+        assert as_int["thresholds"]["coverage_min"] is not True
+        assert as_bool["thresholds"]["coverage_min"] is True
@@ -139,6 +139,8 @@ def test_history_appends_lines(tmp_path: Path) -> None:
     history_path = output_dir / "history.jsonl"
     lines = history_path.read_text(encoding="utf-8").strip().splitlines()
     assert len(lines) == 2
+    # Line format is unchanged from the stdlib default separators
+    assert lines[0] == json.dumps(bundle.history_entry)
 
 
 def test_detect_test_count_regression(tmp_path: Path) -> None:
@@ -0,0 +1,155 @@
+"""Tests for the shared docs corpus index (cihub/utils/docs_corpus.py).
+
+Tests cover:
+- Parsed fields (headings, links, reference defs, fences, checklist, backticks)
+- Directory iteration and root README handling
+- Persisted mtime/size cache reuse and invalidation
+- Cache sharing between different docs directories
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from cihub.utils import docs_corpus
+from cihub.utils.docs_corpus import CORPUS_CACHE_VERSION, DocsCorpus, heading_slug, load_docs_corpus
+
+SAMPLE_DOC = """# Title
+
+## Section One
+
+See [guide](guides/GUIDE.md) and [ext](https://example.com).
+
+- [ ] Open task with `cihub docs audit`
+- [x] Done task
+
+```bash
+# not a heading
+[fenced](missing.md)
+```
+
+[ref]: ../README.md
+"""
+
+
+def _make_repo(tmp_path: Path) -> Path:
+    docs = tmp_path / "docs"
+    (docs / "guides").mkdir(parents=True)
+    (docs / "adr").mkdir()
+    (docs / "INDEX.md").write_text(SAMPLE_DOC, encoding="utf-8")
+    (docs / "guides" / "GUIDE.md").write_text("# Guide\n", encoding="utf-8")
+    (docs / "adr" / "0001-first.md").write_text("# ADR-0001: First\n", encoding="utf-8")
+    (tmp_path / "README.md").write_text("# Root\n", encoding="utf-8")
+    return tmp_path
+
+
+class TestParsing:
+    def test_parsed_fields(self, tmp_path: Path) -> None:
+        repo = _make_repo(tmp_path)
+        corpus = DocsCorpus.load(repo)
+        doc = corpus.get("docs/INDEX.md")
+        assert doc is not None
+
+        assert doc.headings == [(1, "Title", 1), (2, "Section One", 3)]
+        assert doc.links == [("guide", "guides/GUIDE.md"), ("ext", "https://example.com")]
+        assert doc.reference_defs == [("ref", "../README.md")]
+        assert doc.fenced_blocks == [("bash", 10, 13)]
+        assert doc.checklist_items == [
+            (7, False, "Open task with `cihub docs audit`"),
+            (8, True, "Done task"),
+        ]
+        assert (7, "cihub docs audit") in doc.backtick_refs
+        assert doc.line_count == len(SAMPLE_DOC.splitlines())
+
+    def test_heading_slugs_follow_github_rules(self) -> None:
+        assert heading_slug("Part 1: What Claude Code & Codex Use") == "part-1-what-claude-code--codex-use"
+        assert heading_slug("`cihub check` [usage](x.md)") == "cihub-check-usage"
+
+    def test_anchors_include_duplicates_and_html(self, tmp_path: Path) -> None:
+        repo = _make_repo(tmp_path)
+        (repo / "docs" / "A.md").write_text('# Usage\n\n# Usage\n\n<a id="Custom"></a>\n', encoding="utf-8")
+        doc = DocsCorpus.load(repo).get("docs/A.md")
+        assert doc is not None
+        assert doc.anchors == {"usage", "usage-1", "custom"}
+
+    def test_iter_docs_scoping(self, tmp_path: Path) -> None:
+        repo = _make_repo(tmp_path)
+        corpus = DocsCorpus.load(repo)
+
+        all_docs = [doc.rel_path for doc in corpus.iter_docs()]
+        assert "README.md" not in all_docs
+        assert all_docs == sorted(all_docs)
+        assert [doc.rel_path for doc in corpus.iter_docs("docs/guides")] == ["docs/guides/GUIDE.md"]
+        top_level = [doc.rel_path for doc in corpus.iter_docs(repo / "docs", recursive=False)]
+        assert top_level == ["docs/INDEX.md"]
+        assert corpus.get(repo / "README.md") is not None
+
+
+class TestPersistedCache:
+    def test_unchanged_files_restored_from_cache(self, tmp_path: Path) -> None:
+        repo = _make_repo(tmp_path)
+        first = load_docs_corpus(repo)
+        assert first.parsed == 4
+        cache_file = repo / docs_corpus.CORPUS_CACHE_PATH
+        payload = json.loads(cache_file.read_text(encoding="utf-8"))
+        assert payload["version"] == CORPUS_CACHE_VERSION
+
+        second = load_docs_corpus(repo)
+        assert second.parsed == 0
+        assert second.cached == 4
+        assert second.get("docs/INDEX.md") == first.get("docs/INDEX.md")
+
+    def test_modified_file_is_reparsed(self, tmp_path: Path) -> None:
+        repo = _make_repo(tmp_path)
+        load_docs_corpus(repo)
+
+        guide = repo / "docs" / "guides" / "GUIDE.md"
+        guide.write_text("# Guide\n\nSee [index](../INDEX.md).\n", encoding="utf-8")
+        stat = guide.stat()
+        os.utime(guide, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        corpus = load_docs_corpus(repo)
+        assert corpus.parsed == 1
+        doc = corpus.get("docs/guides/GUIDE.md")
+        assert doc is not None
+        assert doc.links == [("index", "../INDEX.md")]
+
+    def test_alternating_docs_dirs_share_the_cache(self, tmp_path: Path) -> None:
+        repo = _make_repo(tmp_path)
+        (repo / "other").mkdir()
+        (repo / "other" / "NOTES.md").write_text("# Notes\n", encoding="utf-8")
+        load_docs_corpus(repo)
+        assert load_docs_corpus(repo, repo / "other").parsed == 1
+
+        cache_file = repo / docs_corpus.CORPUS_CACHE_PATH
+        before = cache_file.stat().st_mtime_ns
+        again = load_docs_corpus(repo)
+        assert again.parsed == 0
+        assert again.cached == 4
+        assert load_docs_corpus(repo, repo / "other").parsed == 0
+        assert load_docs_corpus(repo, repo / "docs" / "guides").parsed == 0
+        assert cache_file.stat().st_mtime_ns == before
+
+    def test_deleted_file_is_dropped_from_cache(self, tmp_path: Path) -> None:
+        repo = _make_repo(tmp_path)
+        load_docs_corpus(repo)
+        (repo / "docs" / "guides" / "GUIDE.md").unlink()
+
+        corpus = load_docs_corpus(repo)
+        assert corpus.parsed == 0
+        cache_file = repo / docs_corpus.CORPUS_CACHE_PATH
+        payload = json.loads(cache_file.read_text(encoding="utf-8"))
+        assert "docs/guides/GUIDE.md" not in payload["files"]
+
+    def test_corrupt_cache_is_ignored(self, tmp_path: Path) -> None:
+        repo = _make_repo(tmp_path)
+        cache_file = repo / docs_corpus.CORPUS_CACHE_PATH
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text("{not json", encoding="utf-8")
+
+        corpus = load_docs_corpus(repo)
+        assert corpus.parsed == 4
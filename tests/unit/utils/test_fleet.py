@@ -0,0 +1,190 @@
+"""Tests for fleet-write helpers (cihub/utils/fleet.py).
+
+Tests cover:
+- git_blob_sha matches `git hash-object`
+- fleet_map keeps input order and bounds concurrency
+- RateBudget bursts up to capacity, then paces; rate-limit errors back off and retry
+- Batched GraphQL lookups map blob SHAs, missing files and unknown repos
+- FleetJournal resumes only matching operations and tolerates torn lines
+- secret_digest is a stable HMAC under a private per-user key, never a plain hash
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from cihub.utils import fleet
+from cihub.utils.fleet import (
+    FleetJournal,
+    RateBudget,
+    budgeted_call,
+    fetch_remote_blob_shas,
+    fleet_map,
+    git_blob_sha,
+    journal_key,
+    secret_digest,
+)
+from cihub.utils.paths import user_cache_dir
+
+
+def test_git_blob_sha_matches_git() -> None:
+    # `printf 'hello\n' | git hash-object --stdin`
+    assert git_blob_sha("hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+
+class TestFleetMap:
+    def test_keeps_order_and_bounds_workers(self) -> None:
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work(item: int) -> int:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01 * (5 - item % 5))
+            with lock:
+                active -= 1
+            return item * 2
+
+        assert fleet_map(work, list(range(12)), max_workers=3) == [i * 2 for i in range(12)]
+        assert 1 < peak <= 3
+
+
+class TestRateBudget:
+    def test_burst_then_paced(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sleeps: list[float] = []
+        monkeypatch.setattr(fleet.time, "sleep", sleeps.append)
+        budget = RateBudget(calls_per_minute=3)
+        for _ in range(5):
+            budget.acquire()
+        assert budget.calls == 5
+        # Three calls fit the burst; the next two queue 20s apart
+        assert len(sleeps) == 2
+        assert sleeps[0] == pytest.approx(20.0, abs=0.5)
+        assert sleeps[1] == pytest.approx(40.0, abs=0.5)
+
+    def test_rate_limit_errors_back_off_and_retry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(fleet.time, "sleep", lambda _seconds: None)
+        budget = RateBudget()
+        attempts: list[int] = []
+
+        def call() -> str:
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise RuntimeError("You have exceeded a secondary rate limit")
+            return "ok"
+
+        assert budgeted_call(budget, call) == "ok"
+        assert len(attempts) == 2
+        assert budget.waited > 0
+
+    def test_other_errors_are_not_retried(self) -> None:
+        attempts: list[int] = []
+
+        def call() -> None:
+            attempts.append(1)
+            raise RuntimeError("Not Found")
+
+        with pytest.raises(RuntimeError):
+            budgeted_call(RateBudget(), call)
+        assert len(attempts) == 1
+
+
+class TestFetchRemoteBlobShas:
+    def test_maps_blobs_missing_files_and_unknown_repos(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        queries: list[str] = []
+
+        def fake_run(cmd: list[str], **kwargs: Any) -> SimpleNamespace:
+            queries.append(json.loads(kwargs["input"])["query"])
+            data = {
+                "r0": {"f0": {"oid": "aaa"}, "f1": None},
+                "r1": None,  # renamed or inaccessible repo
+            }
+            return SimpleNamespace(returncode=1, stdout=json.dumps({"data": data}), stderr="NOT_FOUND")
+
+        monkeypatch.setattr(fleet, "resolve_executable", lambda _name: "gh")
+        monkeypatch.setattr(fleet, "safe_run", fake_run)
+        found = fetch_remote_blob_shas(
+            [("o/one", "main", ["a.yml", "b.yml"]), ("o/gone", "dev", ["a.yml"])],
+        )
+
+        assert len(queries) == 1
+        assert found == {("o/one", "main", "a.yml"): "aaa", ("o/one", "main", "b.yml"): None}
+
+    def test_failed_batches_are_left_to_per_repo_calls(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fake_run(cmd: list[str], **kwargs: Any) -> SimpleNamespace:
+            return SimpleNamespace(returncode=1, stdout="", stderr="HTTP 502")
+
+        monkeypatch.setattr(fleet, "resolve_executable", lambda _name: "gh")
+        monkeypatch.setattr(fleet, "safe_run", fake_run)
+        targets = [(f"o/r{i}", "main", ["a.yml"]) for i in range(5)]
+        assert fetch_remote_blob_shas(targets, batch_size=2) == {}
+
+
+class TestFleetJournal:
+    def test_resume_only_successful_repos(self, tmp_path: Path) -> None:
+        path = tmp_path / "journal.jsonl"
+        key = journal_key("op", ["a", "b"])
+        journal = FleetJournal.load(path, key)
+        journal.record("a", True, {"outcome": {"status": "updated"}})
+        journal.record("b", False, {})
+
+        resumed = FleetJournal.load(path, key)
+        assert resumed.completed("a") == {"repo": "a", "ok": True, "outcome": {"status": "updated"}}
+        assert resumed.completed("b") is None
+
+        resumed.finish(clean=True)
+        assert not path.exists()
+
+    def test_other_operation_and_torn_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "journal.jsonl"
+        journal = FleetJournal.load(path, journal_key("op", 1))
+        journal.record("a", True, {})
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write('{"repo": "b", "ok": tr')  # interrupted mid-write
+
+        assert FleetJournal.load(path, journal_key("op", 1)).entries.keys() == {"a"}
+        assert FleetJournal.load(path, journal_key("op", 2)).entries == {}
+
+
+class TestSecretDigest:
+    def test_stable_keyed_digest(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+        first = secret_digest("ghp_secret")
+
+        assert first is not None and first == secret_digest("ghp_secret")
+        assert first != secret_digest("ghp_other")
+        assert first != hashlib.sha256(b"ghp_secret").hexdigest()
+        key_file = tmp_path / "cache" / "cihub" / fleet.JOURNAL_KEY_FILE
+        assert key_file.stat().st_mode & 0o777 == 0o600
+        assert (tmp_path / "cache" / "cihub").stat().st_mode & 0o777 == 0o700
+
+    def test_other_users_key_changes_digest(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "alice"))
+        alice = secret_digest("ghp_secret")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "bob"))
+        assert secret_digest("ghp_secret") != alice
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_shared_cache_dir_is_refused(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        (tmp_path / "cihub").mkdir(mode=0o777)
+        (tmp_path / "cihub").chmod(0o777)
+
+        with pytest.raises(PermissionError):
+            user_cache_dir()
+        assert secret_digest("ghp_secret") is None
@@ -0,0 +1,60 @@
+"""Tests for versioned JSON cache files (cihub/utils/json_cache.py).
+
+Tests cover:
+- A saved payload round-trips with its version and tags
+- Missing, corrupt, non-object or mismatched-version/tag files load as None
+- A failed write returns False instead of raising
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from cihub.utils.json_cache import load_json_cache, save_json_cache
+
+
+class TestRoundTrip:
+    def test_save_then_load(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache" / "steps.json"
+
+        assert save_json_cache(path, 3, {"steps": {"ruff": "abc"}}, python="3.11")
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {
+            "version": 3,
+            "python": "3.11",
+            "steps": {"ruff": "abc"},
+        }
+        assert load_json_cache(path, 3, python="3.11") == {"version": 3, "python": "3.11", "steps": {"ruff": "abc"}}
+
+
+class TestRejected:
+    @pytest.mark.parametrize(
+        ("text", "version", "tags"),
+        [
+            ("{not json", 1, {}),
+            ("[1, 2]", 1, {}),
+            ('{"version": 1}', 2, {}),
+            ('{"version": 1, "python": "3.10"}', 1, {"python": "3.11"}),
+            ('{"version": 1}', 1, {"python": "3.11"}),
+        ],
+    )
+    def test_unusable_file_loads_as_none(self, tmp_path: Path, text: str, version: int, tags: dict[str, str]) -> None:
+        path = tmp_path / "cache.json"
+        path.write_text(text, encoding="utf-8")
+
+        assert load_json_cache(path, version, **tags) is None
+
+    def test_missing_file_or_path(self, tmp_path: Path) -> None:
+        assert load_json_cache(tmp_path / "absent.json", 1) is None
+        assert load_json_cache(None, 1) is None
+
+    def test_write_failure_returns_false(self, tmp_path: Path) -> None:
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("", encoding="utf-8")
+
+        assert save_json_cache(blocker / "cache.json", 1, {}) is False
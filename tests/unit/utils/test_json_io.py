@@ -0,0 +1,132 @@
+"""Tests for the JSON serialization layer (cihub/utils/json_io.py).
+
+Tests cover:
+- Fast and stdlib paths produce byte-identical pretty and compact output
+- Values orjson encodes differently fall back to the stdlib encoder
+- Types orjson accepts but the stdlib rejects (Enum, UUID) raise like the stdlib
+- Artifact writers use pretty or compact encoding as appropriate
+- Atomic writes use a private temp name per writer and keep the file's mode
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import enum
+import json
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from cihub.types import ToolResult
+from cihub.utils import json_io
+
+_json_values = st.recursive(
+    st.none() | st.booleans() | st.integers() | st.floats(allow_nan=False, allow_infinity=False) | st.text(),
+    lambda children: st.lists(children, max_size=4) | st.dictionaries(st.text(), children, max_size=4),
+    max_leaves=25,
+)
+
+
+def _stdlib(obj: Any, pretty: bool) -> str:
+    return json.dumps(obj, indent=2) if pretty else json.dumps(obj, separators=(",", ":"))
+
+
+class TestParity:
+    @given(_json_values, st.booleans())
+    @settings(max_examples=300, deadline=None)
+    def test_matches_stdlib(self, obj: Any, pretty: bool) -> None:
+        assert json_io.dumps(obj, pretty=pretty) == _stdlib(obj, pretty)
+
+    @pytest.mark.parametrize(
+        "obj",
+        [1e-5, 2.5e-7, 1e16, 12345678901234567.0, 2**70, {"k": "café"}, {1: "int key"}, [], {}],
+    )
+    def test_known_backend_differences_fall_back(self, obj: Any) -> None:
+        for pretty in (True, False):
+            assert json_io.dumps(obj, pretty=pretty) == _stdlib(obj, pretty)
+
+    def test_stdlib_backend_forced_by_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(json_io.BACKEND_ENV, "stdlib")
+        assert json_io.backend_name() == "json"
+        assert json_io.dumps({"a": [1, 2]}) == json.dumps({"a": [1, 2]}, indent=2)
+
+    def test_unserializable_raises_like_stdlib(self) -> None:
+        with pytest.raises(TypeError):
+            json_io.dumps({"path": Path("x")})
+
+    def test_non_native_types_match_stdlib(self) -> None:
+        class Color(enum.Enum):
+            RED = "red"
+
+        class Level(enum.IntEnum):
+            HIGH = 3
+
+        @dataclass
+        class Point:
+            x: int
+
+        for obj in ({"color": Color.RED}, [uuid.UUID(int=1)], {"p": Point(1)}):
+            with pytest.raises(TypeError):
+                json.dumps(obj)
+            for pretty in (True, False):
+                with pytest.raises(TypeError):
+                    json_io.dumps(obj, pretty=pretty)
+        # Subclasses of native types encode as the stdlib does
+        assert json_io.dumps({"level": Level.HIGH}, pretty=False) == '{"level":3}'
+
+    def test_circular_reference_raises_like_stdlib(self) -> None:
+        loop: list[Any] = []
+        loop.append(loop)
+        with pytest.raises(ValueError, match="Circular reference"):
+            json_io.dumps(loop)
+
+    def test_loads_accepts_stdlib_extensions(self) -> None:
+        assert json_io.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        with pytest.raises(json.JSONDecodeError):
+            json_io.loads("{bad")
+
+
+class TestWriters:
+    def test_write_json_pretty_with_newline(self, tmp_path: Path) -> None:
+        path = tmp_path / "nested" / "registry.json"
+        json_io.write_json(path, {"repos": {}}, trailing_newline=True)
+        assert path.read_text(encoding="utf-8") == json.dumps({"repos": {}}, indent=2) + "\n"
+        assert json_io.read_json(path) == {"repos": {}}
+
+    def test_atomic_write_uses_unique_temp_and_keeps_mode(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "registry.json"
+        path.write_text("{}", encoding="utf-8")
+        path.chmod(0o640)
+        temp_names: list[str] = []
+        real_replace = Path.replace
+
+        def spy_replace(self: Path, target: Path) -> Path:
+            temp_names.append(self.name)
+            return real_replace(self, target)
+
+        monkeypatch.setattr(Path, "replace", spy_replace)
+        json_io.write_json(path, {"a": 1}, atomic=True)
+        json_io.write_json(path, {"a": 2}, atomic=True)
+
+        assert json_io.read_json(path) == {"a": 2}
+        assert len(set(temp_names)) == 2
+        assert all(name.startswith(".registry.json.") and name.endswith(".tmp") for name in temp_names)
+        assert path.stat().st_mode & 0o777 == 0o640
+        assert [p.name for p in tmp_path.iterdir()] == ["registry.json"]
+
+    def test_tool_output_is_compact(self, tmp_path: Path) -> None:
+        result = ToolResult(tool="ruff", ran=True, success=True, metrics={"ruff_errors": 0})
+        path = tmp_path / "tool-outputs" / "ruff.json"
+        result.write_json(path)
+
+        text = path.read_text(encoding="utf-8")
+        assert "\n" not in text
+        assert ToolResult.from_payload(json.loads(text)) == result
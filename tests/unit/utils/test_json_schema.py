@@ -0,0 +1,106 @@
+"""Tests for the shared compiled-validator registry (cihub/utils/json_schema.py).
+
+Tests cover:
+- One compiled validator per schema file, rebuilt when the file changes
+- Concurrent first use from worker threads compiles the schema once
+- Error formatting matches the previous per-call Draft7Validator output
+- Config and report validation reuse the cached validators
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from jsonschema import Draft7Validator
+
+from cihub.utils.json_schema import clear_validator_cache, get_validator, load_schema, schema_errors
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "tools": {"type": "object", "properties": {"ruff": {"type": "boolean"}}},
+    },
+    "required": ["name"],
+}
+
+
+@pytest.fixture()
+def schema_path(tmp_path: Path) -> Path:
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(SCHEMA), encoding="utf-8")
+    return path
+
+
+class TestRegistry:
+    def test_validator_compiled_once(self, schema_path: Path) -> None:
+        first = get_validator(schema_path)
+        assert get_validator(schema_path) is first
+        assert load_schema(schema_path) == SCHEMA
+
+    def test_changed_schema_is_recompiled(self, schema_path: Path) -> None:
+        first = get_validator(schema_path)
+        schema_path.write_text(json.dumps({"type": "object", "required": ["other"]}), encoding="utf-8")
+        stat = schema_path.stat()
+        os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = get_validator(schema_path)
+        assert second is not first
+        assert schema_errors(second, {}) == ["<root>: 'other' is a required property"]
+
+    def test_non_object_schema_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "list.json"
+        path.write_text("[]", encoding="utf-8")
+        with pytest.raises(ValueError, match="not a JSON object"):
+            get_validator(path)
+
+    def test_clear_cache(self, schema_path: Path) -> None:
+        first = get_validator(schema_path)
+        clear_validator_cache()
+        assert get_validator(schema_path) is not first
+
+    def test_concurrent_first_use_compiles_once(self, schema_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        clear_validator_cache()
+        barrier = threading.Barrier(8)
+        compiled: list[int] = []
+
+        def counting_validator(schema: dict) -> Draft7Validator:
+            compiled.append(1)
+            return Draft7Validator(schema)
+
+        def first_use(_: int) -> int:
+            barrier.wait()
+            return id(get_validator(schema_path))
+
+        monkeypatch.setattr("cihub.utils.json_schema.Draft7Validator", counting_validator)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            ids = set(pool.map(first_use, range(8)))
+
+        assert len(ids) == 1
+        assert compiled == [1]
+
+
+class TestErrors:
+    def test_messages_match_fresh_validator(self, schema_path: Path) -> None:
+        instance = {"tools": {"ruff": "yes"}}
+        expected = []
+        for err in Draft7Validator(SCHEMA).iter_errors(instance):
+            path = ".".join(str(p) for p in err.path) or "<root>"
+            expected.append(f"{path}: {err.message}")
+
+        assert schema_errors(get_validator(schema_path), instance) == expected
+        assert schema_errors(get_validator(schema_path), {"name": "ok"}) == []
+
+    def test_report_schema_errors_keep_format(self) -> None:
+        from cihub.services.report_validator.schema import validate_against_schema
+
+        errors = validate_against_schema({"schema_version": 2})
+        assert errors
+        assert all(error.startswith("Schema error at '") for error in errors)
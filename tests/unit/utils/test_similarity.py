@@ -0,0 +1,70 @@
+"""Tests for the near-duplicate candidate index (cihub/utils/similarity.py).
+
+Tests cover:
+- Candidate sets never miss a pair a full SequenceMatcher scan would find
+- Empty-string and threshold edge cases
+- Duplicate task grouping through the index
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from cihub.utils.similarity import SimilarityIndex, similarity_ratio
+
+_ALPHABET = st.sampled_from("abcde _-")
+
+
+class TestCandidates:
+    """Candidates must be a superset of all true matches."""
+
+    @given(
+        st.lists(st.text(alphabet=_ALPHABET, max_size=12), min_size=1, max_size=25),
+        st.sampled_from([0.5, 0.7, 0.8, 0.95]),
+    )
+    @settings(max_examples=60, deadline=None)
+    def test_no_true_match_is_missed(self, strings: list[str], threshold: float) -> None:
+        index = SimilarityIndex(strings, threshold)
+        for query in strings:
+            expected = [j for j, other in enumerate(strings) if similarity_ratio(query, other) >= threshold]
+            candidates = index.candidates(query)
+            assert candidates == sorted(candidates)
+            assert set(expected) <= set(candidates)
+
+    def test_filters_unrelated_strings(self) -> None:
+        strings = ["add docs audit command", "add docs audit commands", "zzzz", "qwerty uiop"]
+        index = SimilarityIndex(strings, 0.8)
+        assert index.candidates("add docs audit command") == [0, 1]
+
+    def test_empty_strings_only_match_each_other(self) -> None:
+        index = SimilarityIndex(["", "abc", ""], 0.8)
+        assert index.candidates("") == [0, 2]
+        assert 0 not in index.candidates("abc")
+
+
+class TestCallers:
+    """The index backs duplicate task detection and rename matching."""
+
+    def test_duplicate_groups_match_full_scan(self, tmp_path: Path) -> None:
+        from cihub.commands.docs_audit.consistency import find_duplicate_tasks
+
+        active = tmp_path / "docs" / "development"
+        active.mkdir(parents=True)
+        (active / "MASTER_PLAN.md").write_text(
+            "- [ ] Implement the docs audit command\n"
+            "- [ ] Unrelated task about caching\n"
+            "- [x] Implement the docs audit commands\n"
+            "- [ ] Implement the docs audit command!\n",
+            encoding="utf-8",
+        )
+
+        groups, findings = find_duplicate_tasks(tmp_path)
+
+        assert len(groups) == 1
+        assert [entry.line for entry in groups[0].entries] == [1, 3, 4]
+        assert len(findings) == 1
@@ -0,0 +1,183 @@
+"""Tests for span-based execution tracing (cihub/utils/tracing.py).
+
+Tests cover:
+- Disabled tracing hands back a shared no-op and records nothing
+- Nested spans from several threads become Chrome trace complete events
+- Failing spans are marked; phases aggregate calls and time per span name
+- finish_tracing writes the trace file, stringifying args that are not JSON-native
+- trace_path is per process and honors CIHUB_TRACE_FILE
+- The CLI adds the phase summary to the command result and keeps the trace when a command raises
+"""
+
+# TEST-METRICS:
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cihub.cli import main
+from cihub.utils import tracing
+from cihub.utils.tracing import (
+    finish_tracing,
+    span,
+    start_tracing,
+    stop_tracing,
+    trace_path,
+    traced,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_tracer() -> Iterator[None]:
+    stop_tracing()
+    yield
+    stop_tracing()
+
+
+class TestDisabled:
+    def test_span_is_shared_noop(self) -> None:
+        assert span("tool.pytest") is span("config.load", path="x")
+
+        @traced("config.merge")
+        def merge(a: int, b: int) -> int:
+            return a + b
+
+        assert merge(1, b=2) == 3
+        assert merge.__name__ == "merge"
+        assert stop_tracing() is None
+        assert finish_tracing(Path("unused.json")) is None
+
+
+class TestRecording:
+    def test_nested_spans_across_threads(self) -> None:
+        tracer = start_tracing()
+
+        def worker() -> None:
+            with span("side_effect.notify"):
+                time.sleep(0.01)
+
+        with span("command", command="ci"):
+            with span("tool.pytest"):
+                with span("exec", tool="pytest"):
+                    time.sleep(0.01)
+            thread = threading.Thread(target=worker, name="cihub-notify")
+            thread.start()
+            thread.join()
+
+        events = tracer.chrome_trace()["traceEvents"]
+        spans = {event["name"]: event for event in events if event["ph"] == "X"}
+        threads = {event["args"]["name"] for event in events if event["ph"] == "M"}
+
+        assert list(spans) == ["command", "tool.pytest", "exec", "side_effect.notify"]
+        assert threads == {threading.current_thread().name, "cihub-notify"}
+        outer, inner = spans["command"], spans["exec"]
+        assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+        assert inner["dur"] >= 10_000  # microseconds
+        assert (inner["cat"], inner["args"]) == ("exec", {"tool": "pytest"})
+        assert spans["side_effect.notify"]["tid"] != outer["tid"]
+        assert spans["side_effect.notify"]["cat"] == "side_effect"
+
+    def test_errors_and_phases(self) -> None:
+        tracer = start_tracing()
+
+        @traced("parse")
+        def parse(ok: bool) -> None:
+            if not ok:
+                raise ValueError("bad report")
+
+        parse(True)
+        with pytest.raises(ValueError):
+            parse(False)
+        with span("report.build"):
+            pass
+
+        phases = tracer.phases()
+        assert list(phases) == ["parse", "report.build"]
+        assert phases["parse"]["calls"] == 2
+        failed = [event for event in tracer.chrome_trace()["traceEvents"] if event.get("args", {}).get("error")]
+        assert [event["args"]["error"] for event in failed] == ["ValueError"]
+
+    def test_finish_writes_trace(self, tmp_path: Path) -> None:
+        start_tracing()
+        with span("config.load"):
+            pass
+        path = tmp_path / "nested" / "trace.json"
+
+        summary = finish_tracing(path)
+
+        assert summary is not None and summary["file"] == str(path)
+        assert summary["phases"]["config.load"]["calls"] == 1
+        assert summary["total_ms"] >= summary["phases"]["config.load"]["total_ms"]
+        assert [event["name"] for event in json.loads(path.read_text())["traceEvents"] if event["ph"] == "X"] == [
+            "config.load"
+        ]
+        assert tracing._tracer is None
+
+    def test_finish_stringifies_args(self, tmp_path: Path) -> None:
+        start_tracing()
+        with span("config.load", path=tmp_path):
+            pass
+        path = tmp_path / "trace.json"
+
+        summary = finish_tracing(path)
+
+        assert summary is not None and summary["file"] == str(path)
+        events = json.loads(path.read_text())["traceEvents"]
+        assert [event["args"] for event in events if event["ph"] == "X"] == [{"path": str(tmp_path)}]
+
+    def test_trace_path(self) -> None:
+        pid = os.getpid()
+        assert trace_path("hub-ci badges", env={}) == Path(".cihub") / f"trace-hub-ci-badges-{pid}.json"
+        assert trace_path("ci", env={"CIHUB_TRACE_FILE": "/tmp/t.json"}) == Path("/tmp/t.json")
+        assert trace_path("ci", env={"CIHUB_TRACE_FILE": "/tmp/t-{pid}.json"}) == Path(f"/tmp/t-{pid}.json")
+
+
+class TestCli:
+    def test_trace_summary_in_result(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        trace_file = tmp_path / "trace.json"
+        monkeypatch.setenv("CIHUB_TRACE", "1")
+        monkeypatch.setenv("CIHUB_TRACE_FILE", str(trace_file))
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'x'\n", encoding="utf-8")
+
+        assert main(["detect", "--repo", str(tmp_path), "--json"]) == 0
+
+        payload = json.loads(capsys.readouterr().out)
+        assert payload["artifacts"]["trace"] == str(trace_file)
+        assert payload["data"]["trace"]["phases"]["command"]["calls"] == 1
+        events = json.loads(trace_file.read_text())["traceEvents"]
+        assert any(event["name"] == "command" and event["args"] == {"command": "detect"} for event in events)
+        assert tracing._tracer is None
+
+    def test_trace_kept_when_command_raises(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        trace_file = tmp_path / "trace.json"
+        monkeypatch.setenv("CIHUB_TRACE", "true")
+        monkeypatch.setenv("CIHUB_TRACE_FILE", str(trace_file))
+
+        with mock.patch("cihub.cli.cmd_config", side_effect=RuntimeError("boom")):
+            assert main(["config", "--repo", "test", "show", "--json"]) != 0
+        capsys.readouterr()
+
+        events = json.loads(trace_file.read_text())["traceEvents"]
+        assert [event["args"]["error"] for event in events if event["name"] == "command"] == ["RuntimeError"]
+        assert tracing._tracer is None
+
+    def test_disabled_by_default(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys) -> None:
+        monkeypatch.delenv("CIHUB_TRACE", raising=False)
+        monkeypatch.chdir(tmp_path)
+
+        assert main(["detect", "--repo", str(tmp_path), "--json"]) in (0, 1)
+
+        assert "trace" not in json.loads(capsys.readouterr().out).get("data", {})
+        assert not (tmp_path / ".cihub").exists()